@@ -0,0 +1,66 @@
+"""Benchmarks of the velocity dispersion map of an integral field unit."""
+
+import numpy as np
+
+from lenstronomy.GalKin.galkin import Galkin
+
+
+class GalkinIFUMap(object):
+    """Power-law mass with a Hernquist light profile and Osipkov-Merritt anisotropy
+    observed on a 20x20 IFU grid, convolved with a Gaussian seeing."""
+
+    params = [5]
+    param_names = ["supersampling_factor"]
+
+    def setup(self, supersampling_factor):
+        x_grid, y_grid = np.meshgrid(
+            np.arange(-1.9 * 2, 1.91 * 2, 0.4), np.arange(-1.9 * 2, 1.91 * 2, 0.4)
+        )
+        kwargs_model = {
+            "mass_profile_list": ["PEMD"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_aperture = {
+            "aperture_type": "IFU_grid",
+            "x_grid": x_grid,
+            "y_grid": y_grid,
+        }
+        kwargs_numerics = {
+            "interpol_grid_num": 1000,
+            "log_integration": True,
+            "max_integrate": 1000,
+            "min_integrate": 0.001,
+        }
+        self.galkin = Galkin(
+            kwargs_model,
+            kwargs_aperture,
+            kwargs_psf={"psf_type": "GAUSSIAN", "fwhm": 0.8},
+            kwargs_cosmo={"d_d": 1000, "d_s": 1500, "d_ds": 800},
+            kwargs_numerics=kwargs_numerics,
+            analytic_kinematics=True,
+        )
+        self.kwargs_mass = {
+            "theta_E": 1.0,
+            "gamma": 2.0,
+            "center_x": 0.0,
+            "center_y": 0.0,
+        }
+        self.kwargs_light = {"r_eff": 1.0, "amp": 1.0, "center_x": 0, "center_y": 0}
+        self.kwargs_anisotropy = {"r_ani": 1.5}
+
+    def time_dispersion_map_grid_convolved(self, supersampling_factor):
+        self.galkin.dispersion_map_grid_convolved(
+            self.kwargs_mass,
+            self.kwargs_light,
+            self.kwargs_anisotropy,
+            supersampling_factor=supersampling_factor,
+        )
+
+    def peakmem_dispersion_map_grid_convolved(self, supersampling_factor):
+        self.galkin.dispersion_map_grid_convolved(
+            self.kwargs_mass,
+            self.kwargs_light,
+            self.kwargs_anisotropy,
+            supersampling_factor=supersampling_factor,
+        )
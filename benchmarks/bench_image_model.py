@@ -0,0 +1,125 @@
+"""Benchmarks of the imaging likelihood of a single band."""
+
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+
+from .common import (
+    alternating,
+    kwargs_band,
+    kwargs_epl_shear,
+    kwargs_sersic_lens_light,
+    kwargs_sersic_source,
+    simulate_data,
+)
+
+
+class EPLShearSersic(object):
+    """EPL + external shear lens with an elliptical Sersic source and lens light on
+    100x100 pixels."""
+
+    params = [1, 3]
+    param_names = ["supersampling_factor"]
+
+    def setup(self, supersampling_factor):
+        kwargs_data, kwargs_psf = kwargs_band(num_pix=100, delta_pix=0.05)
+        kwargs_numerics = {"supersampling_factor": supersampling_factor}
+        kwargs_model = {
+            "lens_model_class": LensModel(["EPL", "SHEAR"]),
+            "source_model_class": LightModel(["SERSIC_ELLIPSE"]),
+            "lens_light_model_class": LightModel(["SERSIC_ELLIPSE"]),
+        }
+        data_class = simulate_data(
+            kwargs_data,
+            kwargs_psf,
+            kwargs_numerics,
+            kwargs_lens=kwargs_epl_shear,
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+            **kwargs_model
+        )
+        self.image_model = ImageLinearFit(
+            data_class,
+            PSF(**kwargs_psf),
+            kwargs_numerics=kwargs_numerics,
+            **kwargs_model
+        )
+        self.kwargs_lens = alternating(kwargs_epl_shear, "theta_E", 0.01)
+
+    def time_image(self, supersampling_factor):
+        self.image_model.image(
+            kwargs_lens=next(self.kwargs_lens),
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+        )
+
+    def time_linear_response_matrix(self, supersampling_factor):
+        self.image_model.linear_response_matrix(
+            next(self.kwargs_lens),
+            kwargs_sersic_source,
+            kwargs_sersic_lens_light,
+            kwargs_ps=None,
+        )
+
+    def time_likelihood_data_given_model(self, supersampling_factor):
+        self.image_model.likelihood_data_given_model(
+            kwargs_lens=next(self.kwargs_lens),
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+        )
+
+    def peakmem_linear_response_matrix(self, supersampling_factor):
+        self.image_model.linear_response_matrix(
+            next(self.kwargs_lens),
+            kwargs_sersic_source,
+            kwargs_sersic_lens_light,
+            kwargs_ps=None,
+        )
+
+
+class ShapeletSource(object):
+    """EPL + external shear lens with a Sersic and a shapelet source (n_max=10 to 20,
+    i.e. 66 to 231 shapelet coefficients) on 100x100 pixels."""
+
+    params = [10, 15, 20]
+    param_names = ["n_max"]
+
+    def setup(self, n_max):
+        kwargs_data, kwargs_psf = kwargs_band(num_pix=100, delta_pix=0.05)
+        data_class = simulate_data(
+            kwargs_data,
+            kwargs_psf,
+            lens_model_class=LensModel(["EPL", "SHEAR"]),
+            source_model_class=LightModel(["SERSIC_ELLIPSE"]),
+            kwargs_lens=kwargs_epl_shear,
+            kwargs_source=kwargs_sersic_source,
+        )
+        self.image_model = ImageLinearFit(
+            data_class,
+            PSF(**kwargs_psf),
+            lens_model_class=LensModel(["EPL", "SHEAR"]),
+            source_model_class=LightModel(["SERSIC_ELLIPSE", "SHAPELETS"]),
+        )
+        self.kwargs_source = kwargs_sersic_source + [
+            {"amp": 1, "beta": 0.2, "n_max": n_max, "center_x": 0.05, "center_y": 0}
+        ]
+        self.kwargs_lens = alternating(kwargs_epl_shear, "theta_E", 0.01)
+
+    def time_linear_response_matrix(self, n_max):
+        self.image_model.linear_response_matrix(
+            next(self.kwargs_lens),
+            self.kwargs_source,
+            kwargs_lens_light=None,
+            kwargs_ps=None,
+        )
+
+    def time_image_linear_solve(self, n_max):
+        self.image_model.image_linear_solve(
+            kwargs_lens=next(self.kwargs_lens), kwargs_source=self.kwargs_source
+        )
+
+    def peakmem_image_linear_solve(self, n_max):
+        self.image_model.image_linear_solve(
+            kwargs_lens=next(self.kwargs_lens), kwargs_source=self.kwargs_source
+        )
@@ -0,0 +1,73 @@
+"""Benchmarks of the joint linear inversion of four imaging bands."""
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+import lenstronomy.Util.class_creator as class_creator
+
+from .common import (
+    alternating,
+    kwargs_band,
+    kwargs_epl_shear,
+    kwargs_sersic_lens_light,
+    kwargs_sersic_source,
+    simulate_data,
+)
+
+
+class JointLinearFourBands(object):
+    """EPL + external shear lens with a Sersic source and lens light observed in four
+    bands of 100x100 pixels with different PSFs, with the linear amplitudes solved
+    jointly ('joint-linear')."""
+
+    num_bands = 4
+
+    def setup(self):
+        multi_band_list = []
+        for i in range(self.num_bands):
+            kwargs_data, kwargs_psf = kwargs_band(
+                num_pix=100, delta_pix=0.05, fwhm=0.08 + 0.02 * i
+            )
+            data_class = simulate_data(
+                kwargs_data,
+                kwargs_psf,
+                lens_model_class=LensModel(["EPL", "SHEAR"]),
+                source_model_class=LightModel(["SERSIC_ELLIPSE"]),
+                lens_light_model_class=LightModel(["SERSIC_ELLIPSE"]),
+                kwargs_lens=kwargs_epl_shear,
+                kwargs_source=kwargs_sersic_source,
+                kwargs_lens_light=kwargs_sersic_lens_light,
+            )
+            kwargs_data["image_data"] = data_class.data
+            multi_band_list.append(
+                [kwargs_data, kwargs_psf, {"supersampling_factor": 1}]
+            )
+        kwargs_model = {
+            "lens_model_list": ["EPL", "SHEAR"],
+            "source_light_model_list": ["SERSIC_ELLIPSE"],
+            "lens_light_model_list": ["SERSIC_ELLIPSE"],
+        }
+        self.image_model = class_creator.create_im_sim(
+            multi_band_list, "joint-linear", kwargs_model
+        )
+        self.kwargs_lens = alternating(kwargs_epl_shear, "theta_E", 0.01)
+
+    def time_image_linear_solve(self):
+        self.image_model.image_linear_solve(
+            kwargs_lens=next(self.kwargs_lens),
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+        )
+
+    def time_likelihood_data_given_model(self):
+        self.image_model.likelihood_data_given_model(
+            kwargs_lens=next(self.kwargs_lens),
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+        )
+
+    def peakmem_likelihood_data_given_model(self):
+        self.image_model.likelihood_data_given_model(
+            kwargs_lens=next(self.kwargs_lens),
+            kwargs_source=kwargs_sersic_source,
+            kwargs_lens_light=kwargs_sersic_lens_light,
+        )
@@ -0,0 +1,49 @@
+"""Benchmarks of multi-plane ray-shooting through a main deflector with 100 subhalos."""
+
+import numpy as np
+
+from lenstronomy.LensModel.lens_model import LensModel
+import lenstronomy.Util.util as util
+
+from .common import alternating, kwargs_epl_shear
+
+
+class MultiPlaneSubhalos(object):
+    """EPL + external shear main deflector at z=0.5 with 100 truncated NFW halos spread
+    between z=0.2 and z=1.5 (source at z=2), ray-shot on a 100x100 grid."""
+
+    num_subhalos = 100
+
+    def setup(self):
+        np.random.seed(42)
+        z_subhalos = np.random.uniform(0.2, 1.5, self.num_subhalos)
+        self.lens_model = LensModel(
+            ["EPL", "SHEAR"] + ["TNFW"] * self.num_subhalos,
+            z_source=2.0,
+            lens_redshift_list=[0.5, 0.5] + list(z_subhalos),
+            multi_plane=True,
+        )
+        x_sub, y_sub = np.random.uniform(-2, 2, (2, self.num_subhalos))
+        kwargs_subhalos = [
+            {
+                "Rs": 0.05,
+                "alpha_Rs": 0.002,
+                "r_trunc": 0.2,
+                "center_x": x_sub[i],
+                "center_y": y_sub[i],
+            }
+            for i in range(self.num_subhalos)
+        ]
+        self.kwargs_lens = alternating(
+            kwargs_epl_shear + kwargs_subhalos, "theta_E", 0.01
+        )
+        self.x, self.y = util.make_grid(numPix=100, deltapix=0.05)
+
+    def time_ray_shooting(self):
+        self.lens_model.ray_shooting(self.x, self.y, next(self.kwargs_lens))
+
+    def time_hessian(self):
+        self.lens_model.hessian(self.x, self.y, next(self.kwargs_lens))
+
+    def peakmem_ray_shooting(self):
+        self.lens_model.ray_shooting(self.x, self.y, next(self.kwargs_lens))
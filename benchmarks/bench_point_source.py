@@ -0,0 +1,27 @@
+"""Benchmarks of the lens equation solver for a quadruply imaged point source."""
+
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
+
+from .common import alternating, kwargs_epl_shear
+
+
+class QuadSolver(object):
+    """Image positions of a source inside the diamond caustic of an EPL + external shear
+    lens."""
+
+    params = ["lenstronomy", "analytical"]
+    param_names = ["solver"]
+
+    def setup(self, solver):
+        self.solver = LensEquationSolver(LensModel(["EPL", "SHEAR"]))
+        self.kwargs_lens = alternating(kwargs_epl_shear, "theta_E", 0.01)
+        x_pos, _ = self.solver.image_position_from_source(
+            0.03, 0.02, kwargs_epl_shear, solver=solver
+        )
+        assert len(x_pos) == 4
+
+    def time_image_position_from_source(self, solver):
+        self.solver.image_position_from_source(
+            0.03, 0.02, next(self.kwargs_lens), solver=solver
+        )
@@ -0,0 +1,83 @@
+"""Benchmarks of the iterative PSF reconstruction from the lensed point source
+images."""
+
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
+from lenstronomy.LensModel.lens_model import LensModel
+from lenstronomy.LightModel.light_model import LightModel
+from lenstronomy.PointSource.point_source import PointSource
+from lenstronomy.Workflow.psf_fitting import PsfFitting
+
+from .common import (
+    kwargs_band,
+    kwargs_epl_shear,
+    kwargs_sersic_lens_light,
+    kwargs_sersic_source,
+    simulate_data,
+)
+
+
+class PsfIteration(object):
+    """One PSF iteration of a quadruply imaged quasar (EPL + external shear lens, Sersic
+    source and lens light, 100x100 pixels) starting from a too wide PSF."""
+
+    params = [True, False]
+    param_names = ["new_procedure"]
+
+    def setup(self, new_procedure):
+        kwargs_data, kwargs_psf_true = kwargs_band(
+            num_pix=100, delta_pix=0.05, fwhm=0.15
+        )
+        _, self.kwargs_psf = kwargs_band(num_pix=100, delta_pix=0.05, fwhm=0.2)
+        kwargs_numerics = {
+            "supersampling_factor": 3,
+            "point_source_supersampling_factor": 3,
+        }
+        kwargs_model = {
+            "lens_model_class": LensModel(["EPL", "SHEAR"]),
+            "source_model_class": LightModel(["SERSIC_ELLIPSE"]),
+            "lens_light_model_class": LightModel(["SERSIC_ELLIPSE"]),
+            "point_source_class": PointSource(
+                ["SOURCE_POSITION"],
+                lens_model=LensModel(["EPL", "SHEAR"]),
+                fixed_magnification_list=[True],
+            ),
+        }
+        self.kwargs_params = {
+            "kwargs_lens": kwargs_epl_shear,
+            "kwargs_source": kwargs_sersic_source,
+            "kwargs_lens_light": kwargs_sersic_lens_light,
+            "kwargs_ps": [{"ra_source": 0.03, "dec_source": 0.02, "source_amp": 100}],
+        }
+        data_class = simulate_data(
+            kwargs_data,
+            kwargs_psf_true,
+            kwargs_numerics,
+            **kwargs_model,
+            **self.kwargs_params
+        )
+        image_model = ImageLinearFit(
+            data_class,
+            PSF(**self.kwargs_psf),
+            kwargs_numerics=kwargs_numerics,
+            **kwargs_model
+        )
+        self.psf_fitting = PsfFitting(image_model)
+
+    def time_update_psf(self, new_procedure):
+        self.psf_fitting.update_psf(
+            self.kwargs_psf,
+            self.kwargs_params,
+            stacking_method="median",
+            error_map_radius=0.5,
+            new_procedure=new_procedure,
+        )
+
+    def peakmem_update_psf(self, new_procedure):
+        self.psf_fitting.update_psf(
+            self.kwargs_psf,
+            self.kwargs_params,
+            stacking_method="median",
+            error_map_radius=0.5,
+            new_procedure=new_procedure,
+        )
@@ -0,0 +1,121 @@
+"""Shared settings of the benchmarks.
+
+The benchmarks time the same calls repeatedly. Since the image models cache the response
+of components with unchanged parameters, the benchmarks alternate between two sets of
+non-linear parameters (as a sampler would) such that every call is evaluated.
+"""
+
+import copy
+import itertools
+
+import numpy as np
+
+import lenstronomy.Util.simulation_util as sim_util
+from lenstronomy.Data.imaging_data import ImageData
+from lenstronomy.Data.psf import PSF
+from lenstronomy.ImSim.image_model import ImageModel
+
+
+def kwargs_band(num_pix, delta_pix, fwhm=0.1, background_rms=0.01, exposure_time=100):
+    """Data and PSF keyword arguments of a simulated imaging band with a pixelated PSF.
+
+    :param num_pix: number of pixels per axis
+    :param delta_pix: pixel scale
+    :param fwhm: full width at half maximum of the (Gaussian) PSF
+    :param background_rms: background noise
+    :param exposure_time: exposure time
+    :return: kwargs_data, kwargs_psf
+    """
+    kwargs_data = sim_util.data_configure_simple(
+        num_pix, delta_pix, exposure_time=exposure_time, background_rms=background_rms
+    )
+    psf_gaussian = PSF(
+        psf_type="GAUSSIAN", fwhm=fwhm, pixel_size=delta_pix, truncation=5
+    )
+    kwargs_psf = {
+        "psf_type": "PIXEL",
+        "kernel_point_source": psf_gaussian.kernel_point_source,
+    }
+    return kwargs_data, kwargs_psf
+
+
+def simulate_data(kwargs_data, kwargs_psf, kwargs_numerics=None, **kwargs_model):
+    """Simulates a noisy image of a model.
+
+    :param kwargs_data: data keyword arguments (without image)
+    :param kwargs_psf: PSF keyword arguments
+    :param kwargs_numerics: numerics keyword arguments
+    :param kwargs_model: model classes ('lens_model_class', 'source_model_class',
+        'lens_light_model_class', 'point_source_class') and keyword arguments of
+        ImageModel.image() ('kwargs_lens', 'kwargs_source', ...)
+    :return: ImageData instance with the simulated image
+    """
+    kwargs_classes = {
+        key: value for key, value in kwargs_model.items() if key.endswith("_class")
+    }
+    kwargs_params = {
+        key: value for key, value in kwargs_model.items() if key.startswith("kwargs_")
+    }
+    image_model = ImageModel(
+        ImageData(**kwargs_data),
+        PSF(**kwargs_psf),
+        kwargs_numerics=kwargs_numerics,
+        **kwargs_classes
+    )
+    image = image_model.image(**kwargs_params)
+    np.random.seed(42)
+    image = image + np.random.normal(
+        scale=kwargs_data["background_rms"], size=image.shape
+    )
+    return ImageData(**dict(kwargs_data, image_data=image))
+
+
+def alternating(kwargs_list, key, delta):
+    """Endless iterator over a list of keyword arguments and a copy with one parameter
+    of the first component shifted by delta.
+
+    :param kwargs_list: list of keyword arguments
+    :param key: parameter to shift
+    :param delta: shift of the parameter
+    :return: iterator
+    """
+    kwargs_shifted = copy.deepcopy(kwargs_list)
+    kwargs_shifted[0][key] += delta
+    return itertools.cycle([kwargs_list, kwargs_shifted])
+
+
+kwargs_epl_shear = [
+    {
+        "theta_E": 1.0,
+        "gamma": 2.05,
+        "e1": 0.1,
+        "e2": -0.05,
+        "center_x": 0.0,
+        "center_y": 0.0,
+    },
+    {"gamma1": 0.03, "gamma2": 0.02, "ra_0": 0, "dec_0": 0},
+]
+
+kwargs_sersic_source = [
+    {
+        "amp": 20.0,
+        "R_sersic": 0.3,
+        "n_sersic": 1.5,
+        "e1": 0.05,
+        "e2": 0.1,
+        "center_x": 0.05,
+        "center_y": 0.02,
+    }
+]
+
+kwargs_sersic_lens_light = [
+    {
+        "amp": 50.0,
+        "R_sersic": 0.8,
+        "n_sersic": 3.5,
+        "e1": 0.05,
+        "e2": -0.05,
+        "center_x": 0.0,
+        "center_y": 0.0,
+    }
+]
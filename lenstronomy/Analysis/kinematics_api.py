@@ -76,7 +76,10 @@ class KinematicsAPI(object):
         :param MGE_light: bool, if true performs the MGE for the light distribution
         :param MGE_mass: bool, if true performs the MGE for the mass distribution
         :param kwargs_numerics_galkin: numerical settings for the integrated
-            line-of-sight velocity dispersion
+            line-of-sight velocity dispersion. With 'kwargs_cache_size' > 0 (see
+            NumericKinematics), the Galkin instance is re-used between calls with the
+            same kinematic profiles such that the interpolation tables of previously
+            evaluated keyword arguments are looked up.
         :param kwargs_mge_mass: keyword arguments that go into the MGE decomposition
             routine
         :param kwargs_mge_light: keyword arguments that go into the MGE decomposition
@@ -139,6 +142,7 @@ class KinematicsAPI(object):
         self._MGE_light = MGE_light
         self._MGE_mass = MGE_mass
         self._multi_observations = multi_observations
+        self._galkin_cache = None
 
     def velocity_dispersion(
         self,
@@ -349,6 +353,14 @@ class KinematicsAPI(object):
             "light_profile_list": light_profile_list,
             "anisotropy_model": self._anisotropy_model,
         }
+        reuse_galkin = (
+            self._kwargs_numerics_kin is not None
+            and self._kwargs_numerics_kin.get("kwargs_cache_size", 0) > 0
+        )
+        if reuse_galkin and self._galkin_cache is not None:
+            kwargs_model_cache, galkin = self._galkin_cache
+            if kwargs_model_cache == kwargs_model:
+                return galkin, kwargs_profile, kwargs_light
         if self._multi_observations is True:
             galkin = GalkinMultiObservation(
                 kwargs_model=kwargs_model,
@@ -379,6 +391,8 @@ class KinematicsAPI(object):
                 kwargs_numerics=self._kwargs_numerics_kin,
                 analytic_kinematics=self._analytic_kinematics,
             )
+        if reuse_galkin:
+            self._galkin_cache = (kwargs_model, galkin)
 
         return galkin, kwargs_profile, kwargs_light
 
@@ -643,6 +657,7 @@ class KinematicsAPI(object):
         self._sampling_number = sampling_number
         self._num_kin_sampling = num_kin_sampling
         self._num_psf_sampling = num_psf_sampling
+        self._galkin_cache = None
 
     @staticmethod
     def transform_kappa_ext(sigma_v, kappa_ext=0):
@@ -0,0 +1,249 @@
+__author__ = "sibirrer"
+
+import itertools
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from lenstronomy.Analysis.td_cosmography import TDCosmography
+from lenstronomy.Sampling.Pool.pool import choose_pool
+
+__all__ = ["KinematicsEmulator"]
+
+
+class KinematicsEmulator(object):
+    """Emulator of the dimensionless kinematics J (see
+    TDCosmography.velocity_dispersion_dimension_less()) of a spherical power-law mass
+    profile ('SPP') with a Hernquist light profile for a given aperture, seeing and
+    anisotropy model.
+
+    J is a smooth function of the Einstein radius theta_E, the power-law slope gamma,
+    the half-light radius r_eff and the parameters of the anisotropy model. It is
+    computed once on a regular grid of these parameters (in parallel with the pool of
+    choose_pool()), can be saved to and loaded from disk and is evaluated by (multi-
+    linear or spline) interpolation of ln(J). The settings of the kinematics computation
+    (analytic or numerical, MGE, sampling numbers etc.) are those of the KinematicsAPI
+    class.
+
+    The tabulated values inherit the Monte Carlo noise of the spectral rendering
+    (sampling_number); accuracy() compares the emulator with the direct calculation.
+    """
+
+    _profile_param_names = ["theta_E", "gamma", "r_eff"]
+
+    def __init__(
+        self,
+        z_lens,
+        z_source,
+        kwargs_aperture,
+        kwargs_seeing,
+        anisotropy_model,
+        kwargs_grid,
+        interpolation="linear",
+        **kwargs_kin_api
+    ):
+        """
+
+        :param z_lens: redshift of deflector
+        :param z_source: redshift of source
+        :param kwargs_aperture: aperture keyword arguments (see aperture class in Galkin)
+        :param kwargs_seeing: seeing conditions (see observation class in Galkin)
+        :param anisotropy_model: string, anisotropy model type
+        :param kwargs_grid: dictionary with a 1d array of ascending grid values for
+            'theta_E', 'gamma', 'r_eff' and each parameter of the anisotropy model
+        :param interpolation: interpolation method of scipy's RegularGridInterpolator,
+            e.g. 'linear' or 'cubic' (requires at least 4 grid values per parameter)
+        :param kwargs_kin_api: additional keyword arguments for the KinematicsAPI class
+            instance
+        """
+        for name in self._profile_param_names:
+            if name not in kwargs_grid:
+                raise ValueError("kwargs_grid requires a grid of %s." % name)
+        self._anisotropy_param_names = [
+            name for name in kwargs_grid if name not in self._profile_param_names
+        ]
+        self._param_names = self._profile_param_names + self._anisotropy_param_names
+        self._grid = []
+        for name in self._param_names:
+            grid = np.asarray(kwargs_grid[name], dtype=float)
+            if grid.ndim != 1 or len(grid) < 2 or np.any(np.diff(grid) <= 0):
+                raise ValueError(
+                    "the grid of %s needs to be a strictly ascending 1d array with at "
+                    "least two values." % name
+                )
+            self._grid.append(grid)
+        self._interpolation = interpolation
+        kwargs_model = {
+            "lens_model_list": ["SPP"],
+            "lens_light_model_list": ["HERNQUIST"],
+        }
+        self._td_cosmo = TDCosmography(
+            z_lens,
+            z_source,
+            kwargs_model,
+            kwargs_seeing=kwargs_seeing,
+            kwargs_aperture=kwargs_aperture,
+            anisotropy_model=anisotropy_model,
+            **kwargs_kin_api
+        )
+        self._J_grid = None
+        self._interp = None
+
+    @property
+    def param_names(self):
+        """Names of the emulated parameters in the order of the axes of the grid.
+
+        :return: list of strings
+        """
+        return self._param_names
+
+    @property
+    def J_grid(self):
+        """Tabulated dimensionless kinematics J on the parameter grid.
+
+        :return: numpy array with one axis per parameter (None if not computed)
+        """
+        return self._J_grid
+
+    def J_direct(self, theta_E, gamma, r_eff, **kwargs_anisotropy):
+        """Dimensionless kinematics J computed directly with Galkin.
+
+        :param theta_E: Einstein radius
+        :param gamma: power-law slope of the mass profile
+        :param r_eff: projected half-light radius of the Hernquist light profile
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: J
+        """
+        kwargs_lens = [
+            {"theta_E": theta_E, "gamma": gamma, "center_x": 0, "center_y": 0}
+        ]
+        kwargs_lens_light = [
+            {"amp": 1, "Rs": r_eff * 0.551, "center_x": 0, "center_y": 0}
+        ]
+        return self._td_cosmo.velocity_dispersion_dimension_less(
+            kwargs_lens,
+            kwargs_lens_light,
+            kwargs_anisotropy,
+            r_eff=r_eff,
+            theta_E=theta_E,
+            gamma=gamma,
+        )
+
+    def build(self, mpi=False, processes=1, filename=None):
+        """Tabulates J on the parameter grid.
+
+        :param mpi: bool, if True, distributes the grid points with MPI
+        :param processes: number of processes of the multiprocessing pool
+        :param filename: (optional) file name to save the table (see save())
+        :return: None
+        """
+        points = list(itertools.product(*self._grid))
+        pool = choose_pool(mpi=mpi, processes=processes, use_dill=True)
+        J_list = list(pool.map(self._J_point, points))
+        pool.close()
+        self._set_table(np.reshape(J_list, [len(grid) for grid in self._grid]))
+        if filename is not None:
+            self.save(filename)
+
+    def save(self, filename):
+        """Saves the tabulated J together with the parameter grid (numpy .npz file).
+
+        :param filename: file name
+        :return: None
+        """
+        if self._J_grid is None:
+            raise ValueError("J needs to be tabulated with build() before saving.")
+        kwargs_grid = {
+            "grid_" + name: grid for name, grid in zip(self._param_names, self._grid)
+        }
+        np.savez(
+            filename,
+            J=self._J_grid,
+            param_names=np.array(self._param_names),
+            **kwargs_grid
+        )
+
+    def load(self, filename):
+        """Loads a table of J saved with save(). The parameters and grid need to match
+        the ones of this instance.
+
+        :param filename: file name
+        :return: None
+        """
+        with np.load(filename) as table:
+            param_names = list(table["param_names"])
+            if param_names != self._param_names:
+                raise ValueError(
+                    "parameters %s of the saved table do not match %s."
+                    % (param_names, self._param_names)
+                )
+            for name, grid in zip(self._param_names, self._grid):
+                grid_table = table["grid_" + name]
+                if np.shape(grid_table) != np.shape(grid) or not np.allclose(
+                    grid_table, grid
+                ):
+                    raise ValueError(
+                        "grid of %s of the saved table does not match." % name
+                    )
+            self._set_table(table["J"])
+
+    def J(self, theta_E, gamma, r_eff, **kwargs_anisotropy):
+        """Dimensionless kinematics J interpolated from the table. The arguments can be
+        floats or numpy arrays (broadcast against each other).
+
+        :param theta_E: Einstein radius
+        :param gamma: power-law slope of the mass profile
+        :param r_eff: projected half-light radius of the Hernquist light profile
+        :param kwargs_anisotropy: anisotropy keyword arguments
+        :return: J
+        """
+        if self._interp is None:
+            raise ValueError("J needs to be tabulated with build() or load().")
+        args = [theta_E, gamma, r_eff] + [
+            kwargs_anisotropy[name] for name in self._anisotropy_param_names
+        ]
+        args = np.broadcast_arrays(*args)
+        J = np.exp(self._interp(np.stack(args, axis=-1)))
+        if np.ndim(args[0]) == 0:
+            return float(J[0])
+        return J
+
+    def accuracy(self, num_points=10, seed=None):
+        """Compares the emulator with the direct calculation at random points within the
+        grid.
+
+        :param num_points: number of random points
+        :param seed: (optional) random seed
+        :return: relative errors J_emulator / J_direct - 1 of the points
+        """
+        if seed is not None:
+            np.random.seed(seed)
+        points = np.array(
+            [np.random.uniform(grid[0], grid[-1], num_points) for grid in self._grid]
+        ).T
+        error = np.zeros(num_points)
+        for i, point in enumerate(points):
+            kwargs = dict(zip(self._param_names, point))
+            error[i] = self.J(**kwargs) / self.J_direct(**kwargs) - 1
+        return error
+
+    def _J_point(self, point):
+        """J_direct() of a point of the grid.
+
+        :param point: parameter values in the order of param_names
+        :return: J
+        """
+        return self.J_direct(**dict(zip(self._param_names, point)))
+
+    def _set_table(self, J_grid):
+        """Sets the table of J and its interpolation (in ln J).
+
+        :param J_grid: numpy array with one axis per parameter
+        :return: None
+        """
+        self._J_grid = np.asarray(J_grid, dtype=float)
+        self._interp = RegularGridInterpolator(
+            self._grid,
+            np.log(self._J_grid),
+            method=self._interpolation,
+            bounds_error=True,
+        )
@@ -58,3 +58,16 @@ def conventions_conf():
         conf = yaml.safe_load(file)
         conventions_conf = conf["conventions"]
     return conventions_conf
+
+
+def fft_conf():
+    """
+
+    :return: keyword arguments of the FFT backend of the convolutions ('backend' and
+        'workers'), with the defaults for the settings not present in the yaml file
+    """
+    with open(conf_file) as file:
+        conf = yaml.safe_load(file)
+    kwargs_fft = {"backend": "numpy", "workers": 1}
+    kwargs_fft.update(conf.get("fft", None) or {})
+    return kwargs_fft
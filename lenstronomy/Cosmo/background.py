@@ -1,11 +1,66 @@
 __author__ = "sibirrer"
 
+from collections import OrderedDict
+
 import numpy as np
+from astropy import units
+from astropy.cosmology import Cosmology
+
 import lenstronomy.Util.constants as const
 from lenstronomy.Cosmo.cosmo_interp import CosmoInterp
 
 __all__ = ["Background"]
 
+# angular diameter distances per redshift pair, shared between the Background
+# instances of the same (astropy) cosmology and keyed by its parameters
+_distance_tables = OrderedDict()
+_max_num_tables = 16
+_max_table_size = 100000
+
+
+def _cosmology_key(cosmo):
+    """Hashable key of an astropy cosmology from its class and parameter values.
+
+    :param cosmo: instance of astropy.cosmology (or any other distance class)
+    :return: tuple, or None if the distances are not determined by the parameters (i.e.
+        not an astropy cosmology)
+    """
+    if not isinstance(cosmo, Cosmology):
+        return None
+    names = getattr(cosmo, "__parameters__", None)
+    if names is None:
+        names = tuple(cosmo.parameters)
+    key = [type(cosmo)]
+    for name in names:
+        value = getattr(cosmo, name)
+        if isinstance(value, units.Quantity):
+            value = value.value
+        if value is not None:
+            value = tuple(np.atleast_1d(value).tolist())
+        key.append(value)
+    return tuple(key)
+
+
+def _distance_table(cosmo):
+    """Table of angular diameter distances for the cosmology. Astropy cosmologies with
+    the same parameters share the same table.
+
+    :param cosmo: instance of astropy.cosmology (or any other distance class)
+    :return: dictionary {(z_observer, z_source): angular diameter distance in Mpc}
+    """
+    key = _cosmology_key(cosmo)
+    if key is None:
+        return {}
+    table = _distance_tables.get(key)
+    if table is None:
+        table = {}
+        _distance_tables[key] = table
+        if len(_distance_tables) > _max_num_tables:
+            _distance_tables.popitem(last=False)
+    else:
+        _distance_tables.move_to_end(key)
+    return table
+
 
 class Background(object):
     """Class to compute cosmological distances."""
@@ -29,6 +84,24 @@ class Background(object):
         else:
             self.cosmo = cosmo
 
+    @property
+    def cosmo(self):
+        """
+
+        :return: instance of astropy.cosmology (or CosmoInterp)
+        """
+        return self._cosmo
+
+    @cosmo.setter
+    def cosmo(self, cosmo):
+        """Sets the cosmology. The tabulated distances are kept if the cosmological
+        parameters do not change.
+
+        :param cosmo: instance of astropy.cosmology (or CosmoInterp)
+        """
+        self._cosmo = cosmo
+        self._table = _distance_table(cosmo)
+
     @staticmethod
     def a_z(z):
         """Returns scale factor (a_0 = 1) for given redshift.
@@ -39,14 +112,33 @@ class Background(object):
         return 1.0 / (1 + z)
 
     def d_xy(self, z_observer, z_source):
-        """
+        """Angular diameter distance. The distances are tabulated per redshift pair and
+        only the pairs not yet in the table are computed (in a single vectorized call of
+        the cosmology class).
 
-        :param z_observer: observer redshift
-        :param z_source: source redshift
+        :param z_observer: observer redshift (float or numpy array)
+        :param z_source: source redshift (float or numpy array)
         :return: angular diameter distance in units of Mpc
         """
-        D_xy = self.cosmo.angular_diameter_distance_z1z2(z_observer, z_source)
-        return D_xy.value
+        z_observer, z_source = np.broadcast_arrays(
+            np.asarray(z_observer, dtype=float), np.asarray(z_source, dtype=float)
+        )
+        pairs = list(zip(z_observer.ravel().tolist(), z_source.ravel().tolist()))
+        table = self._table
+        values = [table.get(pair) for pair in pairs]
+        missing = list(dict.fromkeys(p for p, v in zip(pairs, values) if v is None))
+        if missing:
+            z1, z2 = np.array(missing).T
+            D_xy = self.cosmo.angular_diameter_distance_z1z2(z1, z2).value
+            computed = dict(zip(missing, np.atleast_1d(D_xy)))
+            if len(table) + len(missing) > _max_table_size:
+                table.clear()
+            table.update(computed)
+            values = [computed[p] if v is None else v for p, v in zip(pairs, values)]
+        D_xy = np.array(values).reshape(z_source.shape)
+        if D_xy.ndim == 0:
+            return D_xy[()]
+        return D_xy
 
     def ddt(self, z_lens, z_source):
         """Time-delay distance.
@@ -105,10 +197,9 @@ class Background(object):
         """
         if z_source_1 == z_source_2:
             return 1
-        ds1 = self.cosmo.angular_diameter_distance(z=z_source_1).value
-        dds1 = self.cosmo.angular_diameter_distance_z1z2(z1=z_lens, z2=z_source_1).value
-        ds2 = self.cosmo.angular_diameter_distance(z=z_source_2).value
-        dds2 = self.cosmo.angular_diameter_distance_z1z2(z1=z_lens, z2=z_source_2).value
+        ds1, dds1, ds2, dds2 = self.d_xy(
+            [0, z_lens, 0, z_lens], [z_source_1, z_source_1, z_source_2, z_source_2]
+        )
         beta = dds1 / ds1 * ds2 / dds2
         return beta
 
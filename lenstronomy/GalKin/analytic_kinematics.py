@@ -114,16 +114,17 @@ class AnalyticKinematics(Anisotropy):
         return a
 
     @classmethod
-    def draw_light(cls, kwargs_light):
+    def draw_light(cls, kwargs_light, n=None):
         """Draws a random light tracer particle from the Hernquist light profile.
 
         :param kwargs_light: keyword argument (list) of the light model
+        :param n: int, number of draws; None for a single draw (returned as floats)
         :return: 3d radius (if possible), 2d projected radius, x-projected coordinate,
             y-projected coordinate
         """
         a = cls._get_hernquist_scale_radius(kwargs_light)
 
-        r = vel_util.draw_hernquist(a)
+        r = vel_util.draw_hernquist(a, size=n)
         R, x, y = vel_util.project2d_random(r)
         return r, R, x, y
 
@@ -419,23 +419,18 @@ class Colin(object):
             raise ValueError(
                 "3d radius is smaller than projected radius! Does not make sense."
             )
-        ua = r_ani / R
-        if ua == 1:
-            k = (1 + 1.0 / u) * np.arccosh(u) - 1.0 / 6 * (8.0 / u + 7) * np.sqrt(
+        ua = np.asarray(r_ani / R, dtype=float)
+        # the three cases ua == 1, ua > 1 and ua < 1 are evaluated element-wise such
+        # that R can be an array
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k_1 = (1 + 1.0 / u) * np.arccosh(u) - 1.0 / 6 * (8.0 / u + 7) * np.sqrt(
                 (u - 1.0) / (u + 1.0)
             )
-        elif ua > 1:
-            k = (
-                0.5 / (ua**2 - 1) * np.sqrt(1 - 1.0 / u**2)
-                + (1.0 + ua / u) * np.arccosh(u)
-                - np.sign(ua - 1)
-                * ua
-                * (ua**2 - 0.5)
-                / np.abs(ua**2 - 1) ** (3.0 / 2)
-                * (1.0 + ua / u)
-                * np.arccosh((ua * u + 1) / (u + ua))
+            arc = np.where(
+                ua > 1,
+                np.arccosh((ua * u + 1) / (u + ua)),
+                np.arccos(np.minimum((ua * u + 1) / (u + ua), 1)),
             )
-        else:  # ua < 1
             k = (
                 0.5 / (ua**2 - 1) * np.sqrt(1 - 1.0 / u**2)
                 + (1.0 + ua / u) * np.arccosh(u)
@@ -444,8 +439,11 @@ class Colin(object):
                 * (ua**2 - 0.5)
                 / np.abs(ua**2 - 1) ** (3.0 / 2)
                 * (1.0 + ua / u)
-                * np.arccos((ua * u + 1) / (u + ua))
+                * arc
             )
+        k = np.where(ua == 1, k_1, k)
+        if np.ndim(k) == 0:
+            return float(k)
         return k
 
     @staticmethod
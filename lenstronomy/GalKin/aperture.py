@@ -50,6 +50,16 @@ class Aperture(object):
         """
         return self._aperture.aperture_select(ra, dec)
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized aperture selection of many photons/rays at once.
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the aperture, False otherwise;
+            array of the (flattened for 'IFU_grid') segment indices
+        """
+        return self._aperture.aperture_select_array(ra, dec)
+
     @property
     def num_segments(self):
         return self._aperture.num_segments
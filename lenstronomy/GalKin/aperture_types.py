@@ -45,6 +45,18 @@ class Slit(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the slit, False otherwise;
+            array of the segment indices
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        bool_select = (np.abs(x) < self._length / 2.0) & (np.abs(y) < self._width / 2.0)
+        return bool_select, np.zeros(np.shape(bool_select), dtype=int)
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -117,6 +129,21 @@ class Frame(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the frame, False otherwise;
+            array of the segment indices
+        """
+        x, y = _rotate(ra, dec, self._center_ra, self._center_dec, self._angle)
+        x, y = np.abs(x), np.abs(y)
+        outer = (x < self._width_outer / 2.0) & (y < self._width_outer / 2.0)
+        inner = (x < self._width_inner / 2.0) & (y < self._width_inner / 2.0)
+        bool_select = outer & ~inner
+        return bool_select, np.zeros(np.shape(bool_select), dtype=int)
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -180,6 +207,18 @@ class Shell(object):
             0,
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the shell, False otherwise;
+            array of the segment indices
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        bool_select = (r >= self._r_in) & (r < self._r_out)
+        return bool_select, np.zeros(np.shape(bool_select), dtype=int)
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -237,6 +276,19 @@ class IFUShells(object):
             ra, dec, self._r_bins, self._center_ra, self._center_dec
         )
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select().
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the shells, False otherwise;
+            array of the segment indices (only meaningful where selected)
+        """
+        r = np.sqrt((ra - self._center_ra) ** 2 + (dec - self._center_dec) ** 2)
+        bool_select = (r >= self._r_bins[0]) & (r < self._r_bins[-1])
+        index = np.searchsorted(self._r_bins, r, side="right") - 1
+        return bool_select, index
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion
@@ -267,6 +319,24 @@ class IFUGrid(object):
         """
         return grid_ifu_select(ra, dec, self._x_grid, self._y_grid)
 
+    def aperture_select_array(self, ra, dec):
+        """Vectorized version of aperture_select() for a regular grid. The segment index
+        (i, j) is returned flattened (i * num_segments[1] + j), i.e. as index of the
+        raveled dispersion map.
+
+        :param ra: angular coordinates of photons/rays (numpy array)
+        :param dec: angular coordinates of photons/rays (numpy array)
+        :return: bool array, True if photon/ray is within the grid, False otherwise;
+            array of the segment indices (only meaningful where selected)
+        """
+        x_pixel_size = self._x_grid[0, 1] - self._x_grid[0, 0]
+        y_pixel_size = self._y_grid[1, 0] - self._y_grid[0, 0]
+        j = np.floor((ra - self._x_grid[0, 0]) / x_pixel_size + 0.5).astype(int)
+        i = np.floor((dec - self._y_grid[0, 0]) / y_pixel_size + 0.5).astype(int)
+        num_i, num_j = self._x_grid.shape
+        bool_select = (i >= 0) & (i < num_i) & (j >= 0) & (j < num_j)
+        return bool_select, i * num_j + j
+
     @property
     def num_segments(self):
         """Number of segments with separate measurements of the velocity dispersion.
@@ -332,3 +402,20 @@ def shell_ifu_select(ra, dec, r_bin, center_ra=0, center_dec=0):
         if (r >= r_bin[i]) and (r < r_bin[i + 1]):
             return True, i
     return False, None
+
+
+def _rotate(ra, dec, center_ra, center_dec, angle):
+    """Coordinates relative to the center in the frame rotated by angle.
+
+    :param ra: angular coordinate of photon/ray
+    :param dec: angular coordinate of photon/ray
+    :param center_ra: center of the aperture
+    :param center_dec: center of the aperture
+    :param angle: orientation angle of the aperture
+    :return: rotated coordinates x, y
+    """
+    ra_ = ra - center_ra
+    dec_ = dec - center_dec
+    x = np.cos(angle) * ra_ + np.sin(angle) * dec_
+    y = -np.sin(angle) * ra_ + np.cos(angle) * dec_
+    return x, y
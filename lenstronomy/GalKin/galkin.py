@@ -4,6 +4,7 @@ from lenstronomy.GalKin.galkin_model import GalkinModel
 import numpy as np
 from scipy.signal import convolve2d
 from scipy.interpolate import interp1d
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Galkin"]
 
@@ -49,6 +50,9 @@ class Galkin(GalkinModel, GalkinObservation):
     conservative to impact too much the computational cost. Reasonable values might depend on the specific problem.
     """
 
+    # maximum number of light draws (or PSF displacements) processed at once
+    _max_num_draws = 10**6
+
     def __init__(
         self,
         kwargs_model,
@@ -79,6 +83,7 @@ class Galkin(GalkinModel, GalkinObservation):
             self, kwargs_aperture=kwargs_aperture, kwargs_psf=kwargs_psf
         )
 
+    @timed
     def dispersion(
         self, kwargs_mass, kwargs_light, kwargs_anisotropy, sampling_number=1000
     ):
@@ -95,19 +100,17 @@ class Galkin(GalkinModel, GalkinObservation):
             distribution
         :return: integrated LOS velocity dispersion in units [km/s]
         """
-        sigma2_IR_sum = 0
-        IR_sum = 0
-        for i in range(0, sampling_number):
-            sigma2_IR, IR = self._draw_one_sigma2(
-                kwargs_mass, kwargs_light, kwargs_anisotropy
-            )
-            sigma2_IR_sum += sigma2_IR
-            IR_sum += IR
-        sigma_s2_average = sigma2_IR_sum / IR_sum
+        r, R = self._draw_light_aperture(kwargs_light, sampling_number)
+        sigma2_IR, IR = self.numerics.sigma_s2(
+            r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        IR = np.broadcast_to(IR, np.shape(sigma2_IR))
+        sigma_s2_average = np.sum(sigma2_IR) / np.sum(IR)
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
         self.numerics.delete_cache()
         return np.sqrt(sigma_s2_average) / 1000.0  # in units of km/s
 
+    @timed
     def dispersion_map(
         self,
         kwargs_mass,
@@ -136,18 +139,29 @@ class Galkin(GalkinModel, GalkinObservation):
         num_segments = self.num_segments
         sigma2_IR_sum = np.zeros(num_segments)
         count_draws = np.zeros(num_segments)
+        # flattened views to accumulate on (IFU grids return flattened indices)
+        sigma2_IR_sum_flat = sigma2_IR_sum.reshape(-1)
+        count_draws_flat = count_draws.reshape(-1)
 
-        for i in range(0, num_kin_sampling):
-            r, R, x, y = self.numerics.draw_light(kwargs_light)
-            sigma2_IR, IR = self.numerics.sigma_s2(
-                r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
-            )
-            for k in range(0, num_psf_sampling):
-                x_, y_ = self.displace_psf(x, y)
-                bool_ap, ifu_index = self.aperture_select(x_, y_)
-                if bool_ap is True:
-                    sigma2_IR_sum[ifu_index] += sigma2_IR
-                    count_draws[ifu_index] += IR
+        r, R, x, y = self.numerics.draw_light(kwargs_light, n=num_kin_sampling)
+        sigma2_IR, IR = self.numerics.sigma_s2(
+            r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        IR = np.broadcast_to(IR, np.shape(sigma2_IR))
+        # each light draw is displaced num_psf_sampling times; the draws are split in
+        # batches to bound the memory
+        num_batch = max(self._max_num_draws // max(num_psf_sampling, 1), 1)
+        for i in range(0, num_kin_sampling, num_batch):
+            x_ = np.repeat(x[i : i + num_batch], num_psf_sampling)
+            y_ = np.repeat(y[i : i + num_batch], num_psf_sampling)
+            x_, y_ = self.displace_psf(x_, y_)
+            bool_ap, ifu_index = self.aperture_select_array(x_, y_)
+            draw_index = np.repeat(
+                np.arange(i, min(i + num_batch, num_kin_sampling)), num_psf_sampling
+            )[bool_ap]
+            ifu_index = ifu_index[bool_ap]
+            np.add.at(sigma2_IR_sum_flat, ifu_index, sigma2_IR[draw_index])
+            np.add.at(count_draws_flat, ifu_index, IR[draw_index])
 
         sigma_s2_average = sigma2_IR_sum / count_draws
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
@@ -244,6 +258,7 @@ class Galkin(GalkinModel, GalkinObservation):
 
         return self.convolution_kernel_grid(psf_x_grid, psf_y_grid)
 
+    @timed
     def dispersion_map_grid_convolved(
         self,
         kwargs_mass,
@@ -357,6 +372,7 @@ class Galkin(GalkinModel, GalkinObservation):
             )
 
         sigma2_grid = sigma_IR_integrated / IR_integrated
+        self.numerics.delete_cache()
 
         # apply unit conversion from arc seconds and deflections to physical velocity
         # dispersion in (km/s)
@@ -382,3 +398,39 @@ class Galkin(GalkinModel, GalkinObservation):
             r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
         )
         return sigma2_IR, IR
+
+    def _draw_light_aperture(self, kwargs_light, num):
+        """Draws light tracer particles from the light distribution that fall in the
+        aperture after displacing with the seeing. The draws are made in batches with
+        the batch size adapted to the acceptance rate of the previous batch.
+
+        :param kwargs_light: deflector light parameters (following lenstronomy light
+            model conventions)
+        :param num: int, number of accepted draws
+        :return: 3d radii, 2d projected radii of the accepted draws (numpy arrays of
+            length num)
+        """
+        r_list, R_list = [], []
+        num_accepted = 0
+        num_draw = num
+        while num_accepted < num:
+            r, R, x, y = self.numerics.draw_light(kwargs_light, n=num_draw)
+            x_, y_ = self.displace_psf(x, y)
+            bool_ap, _ = self.aperture_select_array(x_, y_)
+            r_list.append(r[bool_ap])
+            R_list.append(R[bool_ap])
+            num_new = np.count_nonzero(bool_ap)
+            num_accepted += num_new
+            num_remaining = num - num_accepted
+            # draw the expected number needed (with 10 per cent margin), at most ten
+            # times more than in the previous batch
+            num_draw = int(
+                min(
+                    1.1 * num_remaining * num_draw / max(num_new, 1) + 1,
+                    10 * num_draw,
+                    self._max_num_draws,
+                )
+            )
+        r = np.concatenate(r_list)[:num]
+        R = np.concatenate(R_list)[:num]
+        return r, R
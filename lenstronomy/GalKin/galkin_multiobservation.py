@@ -80,18 +80,22 @@ class GalkinMultiObservation(GalkinModel):
         sigma2_R_sum = np.zeros(self._num_observations)
         count_draws = np.zeros(self._num_observations)
 
-        for i in range(0, num_kin_sampling):
-            r, R, x, y = self.numerics.draw_light(kwargs_light)
-            sigma2_IR, IR = self.numerics.sigma_s2(
-                r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        r, R, x, y = self.numerics.draw_light(kwargs_light, n=num_kin_sampling)
+        sigma2_IR, IR = self.numerics.sigma_s2(
+            r, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        IR = np.broadcast_to(IR, np.shape(sigma2_IR))
+        x_ = np.repeat(x, num_psf_sampling)
+        y_ = np.repeat(y, num_psf_sampling)
+        for obs_index, observation in enumerate(self._observation_list):
+            x_displaced, y_displaced = observation.displace_psf(x_, y_)
+            bool_ap, _ = observation.aperture_select_array(x_displaced, y_displaced)
+            # number of PSF displacements of each light draw falling in the aperture
+            num_select = np.count_nonzero(
+                bool_ap.reshape(num_kin_sampling, num_psf_sampling), axis=1
             )
-            for obs_index, observation in enumerate(self._observation_list):
-                for k in range(0, num_psf_sampling):
-                    x_, y_ = observation.displace_psf(x, y)
-                    bool_ap, _ = observation.aperture_select(x_, y_)
-                    if bool_ap is True:
-                        sigma2_R_sum[obs_index] += sigma2_IR
-                        count_draws[obs_index] += IR
+            sigma2_R_sum[obs_index] += np.sum(num_select * sigma2_IR)
+            count_draws[obs_index] += np.sum(num_select * IR)
 
         sigma_s2_average = sigma2_R_sum / count_draws
         # apply unit conversion from arc seconds and deflections to physical velocity dispersion in (km/s)
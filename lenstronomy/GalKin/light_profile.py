@@ -16,6 +16,9 @@ class LightProfile(object):
      - 2d projected profiles within the 3d integration range (truncated)
     """
 
+    # maximum number of elements of the 2d integration grids evaluated at once
+    _max_num_elements = 2**20
+
     def __init__(
         self,
         profile_list,
@@ -125,7 +128,7 @@ class LightProfile(object):
 
     def _light_2d_finite_single(self, R, kwargs_list):
         """Projected light profile (integrated to FINITE 3d boundaries from the
-        max_interpolate) for a single float number of R.
+        max_interpolate) for a float number (or an array) of R.
 
         :param R: projected 2d radius (between min_interpolate and max_interpolate)
         :param kwargs_list: list of keyword arguments of light profiles (see
@@ -134,19 +137,24 @@ class LightProfile(object):
         """
 
         # here we perform a logarithmic integral
+        R = np.asarray(R, dtype=float)
         stop = np.log10(
             np.maximum(
                 np.sqrt(self._max_interpolate**2 - R**2),
                 self._min_interpolate + 0.00001,
             )
         )
+        # the integration grids of all R are along the last axis
         x = np.logspace(
-            start=np.log10(self._min_interpolate), stop=stop, num=self._interp_grid_num
+            start=np.log10(self._min_interpolate),
+            stop=stop,
+            num=self._interp_grid_num,
+            axis=-1,
         )
-        r_array = np.sqrt(x**2 + R**2)
+        r_array = np.sqrt(x**2 + R[..., np.newaxis] ** 2)
         flux_r = self.light_3d(r_array, kwargs_list)
-        dlog_r = (np.log10(x[2]) - np.log10(x[1])) * np.log(10)
-        flux_r *= dlog_r * x
+        dlog_r = (np.log10(x[..., 2]) - np.log10(x[..., 1])) * np.log(10)
+        flux_r *= dlog_r[..., np.newaxis] * x
 
         # linear integral
         # x = np.linspace(start=self._min_interpolate, stop=np.sqrt(self._max_interpolate ** 2 - R ** 2),
@@ -157,7 +165,7 @@ class LightProfile(object):
         # dr = x[1] - x[0]
         # flux_r *= dr
 
-        flux_R = np.sum(flux_r)
+        flux_R = np.sum(flux_r, axis=-1)
         # perform finite integral
 
         # out = integrate.quad(lambda x: self.light_3d(np.sqrt(R ** 2 + x ** 2), kwargs_circ), self._min_interpolate,
@@ -181,10 +189,15 @@ class LightProfile(object):
         if n <= 1:
             return self._light_2d_finite_single(R, kwargs_circ)
         else:
-            light_2d = np.zeros(n)
-            for i, R_i in enumerate(R):
-                light_2d[i] = self._light_2d_finite_single(R_i, kwargs_circ)
-            return light_2d
+            # integrals of chunks of R are performed at once to bound the memory
+            R = np.atleast_1d(R)
+            num_chunk = max(self._max_num_elements // self._interp_grid_num, 1)
+            return np.concatenate(
+                [
+                    self._light_2d_finite_single(R[i : i + num_chunk], kwargs_circ)
+                    for i in range(0, n, num_chunk)
+                ]
+            )
 
     def draw_light_2d_linear(self, kwargs_list, n=1, new_compute=False):
         """Constructs the CDF and draws from it random realizations of projected radii R
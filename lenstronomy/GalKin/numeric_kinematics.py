@@ -7,11 +7,15 @@ from lenstronomy.GalKin.anisotropy import Anisotropy
 from lenstronomy.GalKin.cosmo import Cosmo
 from lenstronomy.LensModel.single_plane import SinglePlane
 import lenstronomy.GalKin.velocity_util as util
+from lenstronomy.Util.util import frozen_kwargs, kwargs_equal
 
 __all__ = ["NumericKinematics"]
 
 
 class NumericKinematics(Anisotropy):
+    # maximum number of elements of the 2d integration grids evaluated at once
+    _max_num_elements = 2**20
+
     def __init__(
         self,
         kwargs_model,
@@ -22,6 +26,7 @@ class NumericKinematics(Anisotropy):
         min_integrate=0.0001,
         max_light_draw=None,
         lum_weight_int_method=True,
+        kwargs_cache_size=0,
     ):
         """
         What we need:
@@ -37,6 +42,9 @@ class NumericKinematics(Anisotropy):
         :param lum_weight_int_method: bool, luminosity weighted dispersion integral to calculate LOS projected Jean's
          solution. ATTENTION: currently less accurate than 3d solution
         :param min_integrate:
+        :param kwargs_cache_size: int, number of I(R) sigma^2 interpolation tables kept in a lookup keyed on the
+         mass, light and anisotropy keyword arguments, such that repeated evaluations with identical keyword arguments
+         skip the table construction (not affected by delete_cache()). 0 deactivates the lookup.
         """
         mass_profile_list = kwargs_model.get("mass_profile_list")
         light_profile_list = kwargs_model.get("light_profile_list")
@@ -65,6 +73,8 @@ class NumericKinematics(Anisotropy):
         self.cosmo = Cosmo(**kwargs_cosmo)
         self._mass_profile = SinglePlane(mass_profile_list)
         self._lum_weight_int_method = lum_weight_int_method
+        self._kwargs_cache_size = kwargs_cache_size
+        self._kwargs_cache = []
 
     @property
     def lum_weight_int_method(self):
@@ -244,13 +254,17 @@ class NumericKinematics(Anisotropy):
         grav_pot = -const.G * mass_dim / (r * const.arcsec * self.cosmo.dd * const.Mpc)
         return grav_pot
 
-    def draw_light(self, kwargs_light):
+    def draw_light(self, kwargs_light, n=None):
         """
 
         :param kwargs_light: keyword argument (list) of the light model
+        :param n: int, number of draws; None for a single draw (returned as floats)
         :return: 3d radius (if possible), 2d projected radius, x-projected coordinate, y-projected coordinate
         """
-        r = self.lightProfile.draw_light_3d(kwargs_light, n=1)[0]
+        if n is None:
+            r = self.lightProfile.draw_light_3d(kwargs_light, n=1)[0]
+        else:
+            r = self.lightProfile.draw_light_3d(kwargs_light, n=n)
         R, x, y = util.project2d_random(r)
         return r, R, x, y
 
@@ -283,7 +297,39 @@ class NumericKinematics(Anisotropy):
             the parameters.
         :return: integral of A15 in Mamon&Lokas 2005
         """
-        R = max(R, self._min_integrate)
+        R = np.maximum(R, self._min_integrate)
+        R_ = np.atleast_1d(R)
+        # the integrals are performed for chunks of R at once to bound the memory
+        num_chunk = max(self._max_num_elements // self._interp_grid_num, 1)
+        IR_sigma2 = np.concatenate(
+            [
+                self._I_R_sigma2_grid(
+                    R_[i : i + num_chunk], kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                for i in range(0, len(R_), num_chunk)
+            ]
+        )
+        IR = self.lightProfile.light_2d_finite(R_, kwargs_light)
+        IR_sigma2 *= 2 * const.G / (const.arcsec * self.cosmo.dd * const.Mpc)
+        if np.ndim(R) == 0:
+            return IR_sigma2[0], np.atleast_1d(IR)[0]
+        return IR_sigma2, IR
+
+    def _I_R_sigma2_grid(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Integral of A15 in Mamon & Lokas 2005 (in angular units) for an array of R,
+        performed on a 2d grid (R, r) with the integration grid in r along the second
+        axis.
+
+        :param R: 1d numpy array of 2d projected radii (in angular units)
+        :param kwargs_mass: mass model parameters (following lenstronomy lens model
+            conventions)
+        :param kwargs_light: deflector light parameters (following lenstronomy light
+            model conventions)
+        :param kwargs_anisotropy: anisotropy parameters, may vary according to
+            anisotropy type chosen. We refer to the Anisotropy() class for details on
+            the parameters.
+        :return: integral of A15 for each R
+        """
         max_integrate = (
             self._max_integrate
         )  # make sure the integration of the Jeans equation is performed further out than the interpolation
@@ -293,29 +339,32 @@ class NumericKinematics(Anisotropy):
             max_log = np.log10(max_integrate)
             dlogr = (max_log - min_log) / (self._interp_grid_num - 1)
             r_array = np.logspace(
-                min_log + dlogr / 2.0, max_log + dlogr / 2.0, self._interp_grid_num
+                min_log + dlogr / 2.0,
+                max_log + dlogr / 2.0,
+                self._interp_grid_num,
+                axis=-1,
             )
-            dlog_r = (np.log10(r_array[2]) - np.log10(r_array[1])) * np.log(10)
+            dlog_r = (np.log10(r_array[:, 2]) - np.log10(r_array[:, 1])) * np.log(10)
 
             IR_sigma2_ = self._integrand_A15(
-                r_array, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+                r_array, R[:, np.newaxis], kwargs_mass, kwargs_light, kwargs_anisotropy
             )
-            IR_sigma2_dr = IR_sigma2_ * dlog_r * r_array
+            IR_sigma2_dr = IR_sigma2_ * dlog_r[:, np.newaxis] * r_array
         else:
             r_array = np.linspace(
-                start=R, stop=self._max_interpolate, num=self._interp_grid_num
+                start=R, stop=self._max_interpolate, num=self._interp_grid_num, axis=-1
             )
-            dr = r_array[2] - r_array[1]
+            dr = (r_array[:, 2] - r_array[:, 1])[:, np.newaxis]
 
             IR_sigma2_ = self._integrand_A15(
-                r_array + dr / 2.0, R, kwargs_mass, kwargs_light, kwargs_anisotropy
+                r_array + dr / 2.0,
+                R[:, np.newaxis],
+                kwargs_mass,
+                kwargs_light,
+                kwargs_anisotropy,
             )
             IR_sigma2_dr = IR_sigma2_ * dr
-
-        IR_sigma2 = np.sum(IR_sigma2_dr)  # integral from angle to physical scales
-        IR = self.lightProfile.light_2d_finite(R, kwargs_light)
-
-        return IR_sigma2 * 2 * const.G / (const.arcsec * self.cosmo.dd * const.Mpc), IR
+        return np.sum(IR_sigma2_dr, axis=1)
 
     def I_R_sigma2_and_IR(self, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """Return I(R)*sigma^2 equation A15 in Mamon&Lokas 2005 as interpolation in log
@@ -339,30 +388,61 @@ class NumericKinematics(Anisotropy):
         :return: interpolated value of I(R)*sigma^2
         """
         R = np.maximum(R, self._min_integrate)
+        if self._kwargs_cache_size > 0:
+            interp_I_R_sigma2, interp_I_R = self._I_R_sigma2_table_lookup(
+                kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            return interp_I_R_sigma2(np.log(R)), interp_I_R(np.log(R))
 
         if not hasattr(self, "_interp_I_R_sigma2"):
-            min_log = np.log10(self._min_integrate)
-            max_log = np.log10(self._max_integrate)
-            R_array = np.logspace(
-                min_log, max_log, self._interp_grid_num
-            )  # self._interp_grid_num
-            I_R_sigma2_array = []
-            I_R_array = []
-            for R_i in R_array:
-                I_R_sigma2_, IR_ = self._I_R_sigma2(
-                    R_i, kwargs_mass, kwargs_light, kwargs_anisotropy
-                )
-                I_R_sigma2_array.append(I_R_sigma2_)
-                I_R_array.append(IR_)
-
-            self._interp_I_R_sigma2 = interp1d(
-                np.log(R_array), np.array(I_R_sigma2_array), fill_value="extrapolate"
-            )
-            self._interp_I_R = interp1d(
-                np.log(R_array), np.array(I_R_array), fill_value="extrapolate"
+            self._interp_I_R_sigma2, self._interp_I_R = self._I_R_sigma2_table(
+                kwargs_mass, kwargs_light, kwargs_anisotropy
             )
         return self._interp_I_R_sigma2(np.log(R)), self._interp_I_R(np.log(R))
 
+    def _I_R_sigma2_table(self, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Interpolation functions of I(R)*sigma^2 (equation A15 in Mamon&Lokas 2005)
+        and I(R) in log space.
+
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light model keyword arguments
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: interpolation functions of I(R)*sigma^2 and I(R) in ln(R)
+        """
+        min_log = np.log10(self._min_integrate)
+        max_log = np.log10(self._max_integrate)
+        R_array = np.logspace(min_log, max_log, self._interp_grid_num)
+        I_R_sigma2_array, I_R_array = self._I_R_sigma2(
+            R_array, kwargs_mass, kwargs_light, kwargs_anisotropy
+        )
+        interp_I_R_sigma2 = interp1d(
+            np.log(R_array), I_R_sigma2_array, fill_value="extrapolate"
+        )
+        interp_I_R = interp1d(np.log(R_array), I_R_array, fill_value="extrapolate")
+        return interp_I_R_sigma2, interp_I_R
+
+    def _I_R_sigma2_table_lookup(self, kwargs_mass, kwargs_light, kwargs_anisotropy):
+        """Interpolation functions of _I_R_sigma2_table() looked up among the most
+        recently computed ones with identical keyword arguments (computed and added to
+        the lookup otherwise).
+
+        :param kwargs_mass: mass profile keyword arguments
+        :param kwargs_light: light model keyword arguments
+        :param kwargs_anisotropy: stellar anisotropy keyword arguments
+        :return: interpolation functions of I(R)*sigma^2 and I(R) in ln(R)
+        """
+        kwargs = [kwargs_mass, kwargs_light, kwargs_anisotropy]
+        for i, (kwargs_table, table) in enumerate(self._kwargs_cache):
+            if kwargs_equal(kwargs_table, kwargs):
+                # move to the end as the most recently used
+                self._kwargs_cache.append(self._kwargs_cache.pop(i))
+                return table
+        table = self._I_R_sigma2_table(kwargs_mass, kwargs_light, kwargs_anisotropy)
+        self._kwargs_cache.append((frozen_kwargs(kwargs), table))
+        if len(self._kwargs_cache) > self._kwargs_cache_size:
+            self._kwargs_cache.pop(0)
+        return table
+
     def _integrand_A15(self, r, R, kwargs_mass, kwargs_light, kwargs_anisotropy):
         """Integrand of A15 (in log space) in Mamon&Lokas 2005.
 
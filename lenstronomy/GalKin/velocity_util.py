@@ -28,8 +28,9 @@ def displace_PSF_gaussian(x, y, FWHM):
     """
     sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
     sigma_one_direction = sigma
-    x_ = x + np.random.normal() * sigma_one_direction
-    y_ = y + np.random.normal() * sigma_one_direction
+    size = _draw_size(x)
+    x_ = x + np.random.normal(size=size) * sigma_one_direction
+    y_ = y + np.random.normal(size=size) * sigma_one_direction
     return x_, y_
 
 
@@ -57,15 +58,16 @@ def moffat_fwhm_alpha(FWHM, beta):
 
 
 @export
-def draw_moffat_r(FWHM, beta):
+def draw_moffat_r(FWHM, beta, size=None):
     """
 
     :param FWHM: full width at half maximum
     :param beta: Moffat beta parameter
+    :param size: number (or shape) of draws; None for a single draw
     :return: draw from radial Moffat distribution
     """
     alpha = moffat_fwhm_alpha(FWHM, beta)
-    y = draw_cdf_Y(beta)
+    y = draw_cdf_Y(beta, size=size)
     # equation B3 in Berge et al. paper
     X = alpha * np.sqrt((y - 1))
     return X
@@ -81,19 +83,21 @@ def displace_PSF_moffat(x, y, FWHM, beta):
     :param beta: Moffat beta parameter
     :return: displaced ray by PSF
     """
-    X = draw_moffat_r(FWHM, beta)
+    X = draw_moffat_r(FWHM, beta, size=_draw_size(x))
     dx, dy = draw_xy(X)
     return x + dx, y + dy
 
 
 @export
-def draw_cdf_Y(beta):
+def draw_cdf_Y(beta, size=None):
     """Draw c.d.f for Moffat function according to Berge et al. Ufig paper, equation B2
     cdf(Y) = 1-Y**(1-beta)
 
+    :param beta: Moffat beta parameter
+    :param size: number (or shape) of draws; None for a single draw
     :return:
     """
-    x = np.random.uniform(0, 1)
+    x = np.random.uniform(0, 1, size=size)
     return (1 - x) ** (1.0 / (1 - beta))
 
 
@@ -122,24 +126,36 @@ def project2d_random(r):
 def draw_xy(R):
     """
 
-    :param R: projected radius
-    :return:
+    :param R: projected radius (float or numpy array)
+    :return: x, y with a random orientation (independently drawn for each R)
     """
-    phi = np.random.uniform(0, 2 * np.pi)
+    phi = np.random.uniform(0, 2 * np.pi, size=_draw_size(R))
     x = R * np.cos(phi)
     y = R * np.sin(phi)
     return x, y
 
 
 @export
-def draw_hernquist(a):
+def draw_hernquist(a, size=None):
     """
 
     :param a: 0.551*r_eff
+    :param size: number (or shape) of draws; None for a single draw
     :return: realisation of radius of Hernquist luminosity weighting in 3d
     """
-    P = np.random.uniform()  # draws uniform between [0,1)
+    P = np.random.uniform(size=size)  # draws uniform between [0,1)
     r = (
         a * np.sqrt(P) * (np.sqrt(P) + 1) / (1 - P)
     )  # solves analytically to r from P(r)
     return r
+
+
+def _draw_size(x):
+    """Size argument of the numpy random draws matching the shape of x.
+
+    :param x: float or numpy array
+    :return: None for scalars, shape of x otherwise
+    """
+    if np.ndim(x) == 0:
+        return None
+    return np.shape(x)
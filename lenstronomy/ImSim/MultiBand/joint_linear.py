@@ -21,7 +21,20 @@ class JointLinear(MultiLinear):
         kwargs_model,
         compute_bool=None,
         likelihood_mask_list=None,
+        kwargs_wls=None,
+        num_threads=1,
     ):
+        """
+
+        :param multi_band_list: list of imaging band configurations [[kwargs_data, kwargs_psf, kwargs_numerics],[...], ...]
+        :param kwargs_model: model option keyword arguments
+        :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
+        :param likelihood_mask_list: list of likelihood masks (booleans with size of the individual images)
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver
+         (see de_lens.create_wls_solver())
+        :param num_threads: number of threads evaluating the response matrices of the imaging bands concurrently
+         (-1 for all available cores)
+        """
         # TODO: make this raise statement valid
         # if kwargs_model.get('index_source_light_model_list', None) is not None or \
         #        kwargs_model.get('index_lens_light_model_list', None) is not None or \
@@ -33,8 +46,10 @@ class JointLinear(MultiLinear):
             kwargs_model=kwargs_model,
             compute_bool=compute_bool,
             likelihood_mask_list=likelihood_mask_list,
+            num_threads=num_threads,
         )
         self.type = "joint-linear"
+        self._get_param_WLS = de_lens.create_wls_solver(kwargs_wls)
 
     def image_linear_solve(
         self,
@@ -73,7 +88,7 @@ class JointLinear(MultiLinear):
         )
         C_D_response, model_error_list = self.error_response(kwargs_lens, kwargs_ps)
         d = self.data_response
-        param, cov_param, wls_model = de_lens.get_param_WLS(
+        param, cov_param, wls_model = self._get_param_WLS(
             A.T, 1 / C_D_response, d, inv_bool=inv_bool
         )
         wls_list = self._array2image_list(wls_model)
@@ -97,22 +112,30 @@ class JointLinear(MultiLinear):
         :param kwargs_ps:
         :return:
         """
-        A = []
-        for i in range(self._num_bands):
-            if self._compute_bool[i] is True:
-                A_i = self._imageModel_list[i].linear_response_matrix(
-                    kwargs_lens,
-                    kwargs_source,
-                    kwargs_lens_light,
-                    kwargs_ps,
-                    kwargs_extinction,
-                    kwargs_special,
-                )
-                if len(A) == 0:
-                    A = A_i
-                else:
-                    A = np.append(A, A_i, axis=1)
-        return A
+
+        def linear_response_matrix_band(
+            i, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        ):
+            return self._imageModel_list[i].linear_response_matrix(
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                kwargs_extinction,
+                kwargs_special,
+            )
+
+        A_list = self._evaluate_bands(
+            linear_response_matrix_band,
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_ps,
+        )
+        A_list = [A_i for A_i in A_list if A_i is not None]
+        if len(A_list) == 0:
+            return []
+        return np.concatenate(A_list, axis=1)
 
     @property
     def data_response(self):
@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 __all__ = ["MultiDataBase"]
 
 
@@ -5,12 +8,18 @@ class MultiDataBase(object):
     """Base class with definitions that are shared among all variations of modelling
     multiple data sets."""
 
-    def __init__(self, image_model_list, compute_bool=None):
+    def __init__(self, image_model_list, compute_bool=None, num_threads=1):
         """
 
         :param image_model_list: list of ImageModel instances (supporting linear inversions)
         :param compute_bool: list of booleans for each imaging band indicating whether to model it or not.
+        :param num_threads: number of threads evaluating the imaging bands concurrently (-1 for all available
+         cores). The numerically heavy parts (light profiles, convolutions, linear algebra) release the GIL.
         """
+        if num_threads == -1:
+            num_threads = os.cpu_count()
+        self._num_threads = int(num_threads)
+        self._executor = None
         self._num_bands = len(image_model_list)
         if compute_bool is None:
             compute_bool = [True] * self._num_bands
@@ -88,3 +97,82 @@ class MultiDataBase(object):
                 )
                 index += 1
         return residual_list
+
+    def _evaluate_bands(
+        self, func, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+    ):
+        """Calls func(i, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps) for
+        each imaging band i to be computed, concurrently if num_threads > 1.
+
+        The bands write their linear amplitudes into the keyword arguments. In the
+        concurrent evaluation, each band works on its own copy of the keyword argument
+        dictionaries and the written values are copied back in the order of the bands,
+        leaving the keyword arguments in the same state as the sequential evaluation.
+
+        :param func: function of the band index and the keyword argument lists
+        :param kwargs_lens: lens model keyword argument list
+        :param kwargs_source: source model keyword argument list
+        :param kwargs_lens_light: lens light model keyword argument list
+        :param kwargs_ps: point source model keyword argument list
+        :return: list (per band) of the returns of func, None for bands not computed
+        """
+        results = [None] * self._num_bands
+        band_list = [i for i in range(self._num_bands) if self._compute_bool[i] is True]
+        kwargs_all = [kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps]
+        if self._num_threads <= 1 or len(band_list) <= 1:
+            for i in band_list:
+                results[i] = func(i, *kwargs_all)
+            return results
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(self._num_threads, self._num_bands)
+            )
+        kwargs_init = [_copy_kwargs(kwargs) for kwargs in kwargs_all]
+        kwargs_band_list = [
+            [_copy_kwargs(kwargs) for kwargs in kwargs_all] for _ in band_list
+        ]
+        futures = [
+            self._executor.submit(func, i, *kwargs_band)
+            for i, kwargs_band in zip(band_list, kwargs_band_list)
+        ]
+        for i, future in zip(band_list, futures):
+            results[i] = future.result()
+        for kwargs_band in kwargs_band_list:
+            for kwargs, kwargs_i, kwargs_0 in zip(kwargs_all, kwargs_band, kwargs_init):
+                _merge_kwargs(kwargs, kwargs_i, kwargs_0)
+        return results
+
+    def __getstate__(self):
+        # the thread pool is re-created when needed (e.g. in the workers of a pool)
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+
+def _copy_kwargs(kwargs_list):
+    """
+
+    :param kwargs_list: list of keyword argument dictionaries or None
+    :return: list of (shallow) copies of the dictionaries
+    """
+    if kwargs_list is None:
+        return None
+    return [dict(kwargs) for kwargs in kwargs_list]
+
+
+def _merge_kwargs(kwargs_list, kwargs_list_band, kwargs_list_init):
+    """Copies the values written by a band into the keyword arguments.
+
+    :param kwargs_list: list of keyword argument dictionaries to be updated
+    :param kwargs_list_band: copy of kwargs_list the band has been evaluated with
+    :param kwargs_list_init: copy of kwargs_list before the evaluation
+    :return: None
+    """
+    if kwargs_list is None:
+        return
+    for kwargs, kwargs_band, kwargs_init in zip(
+        kwargs_list, kwargs_list_band, kwargs_list_init
+    ):
+        for key, value in kwargs_band.items():
+            if key not in kwargs_init or value is not kwargs_init[key]:
+                kwargs[key] = value
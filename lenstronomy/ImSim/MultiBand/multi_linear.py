@@ -29,6 +29,8 @@ class MultiLinear(MultiDataBase):
         compute_bool=None,
         kwargs_pixelbased=None,
         linear_solver=True,
+        kwargs_wls=None,
+        num_threads=1,
     ):
         """
 
@@ -38,6 +40,9 @@ class MultiLinear(MultiDataBase):
         :param compute_bool: (optional), bool list to indicate which band to be included in the modeling
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver
+         (see de_lens.create_wls_solver())
+        :param num_threads: number of threads evaluating the imaging bands concurrently (-1 for all available cores)
         """
         self.type = "multi-linear"
         imageModel_list = []
@@ -53,9 +58,12 @@ class MultiLinear(MultiDataBase):
                 band_index=band_index,
                 kwargs_pixelbased=kwargs_pixelbased,
                 linear_solver=linear_solver,
+                kwargs_wls=kwargs_wls,
             )
             imageModel_list.append(imageModel)
-        super(MultiLinear, self).__init__(imageModel_list, compute_bool=compute_bool)
+        super(MultiLinear, self).__init__(
+            imageModel_list, compute_bool=compute_bool, num_threads=num_threads
+        )
 
     def image_linear_solve(
         self,
@@ -84,22 +92,32 @@ class MultiLinear(MultiDataBase):
         :return: 1d array of surface brightness pixels of the optimal solution of the
             linear parameters to match the data
         """
+
+        def image_linear_solve_band(
+            i, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        ):
+            return self._imageModel_list[i].image_linear_solve(
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                kwargs_extinction,
+                kwargs_special,
+                inv_bool=inv_bool,
+            )
+
+        result_list = self._evaluate_bands(
+            image_linear_solve_band,
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            kwargs_ps,
+        )
         wls_list, error_map_list, cov_param_list, param_list = [], [], [], []
-        for i in range(self._num_bands):
-            if self._compute_bool[i] is True:
-                wls_model, error_map, cov_param, param = self._imageModel_list[
-                    i
-                ].image_linear_solve(
-                    kwargs_lens,
-                    kwargs_source,
-                    kwargs_lens_light,
-                    kwargs_ps,
-                    kwargs_extinction,
-                    kwargs_special,
-                    inv_bool=inv_bool,
-                )
-            else:
-                wls_model, error_map, cov_param, param = None, None, None, None
+        for result in result_list:
+            if result is None:
+                result = None, None, None, None
+            wls_model, error_map, cov_param, param = result
             wls_list.append(wls_model)
             error_map_list.append(error_map)
             cov_param_list.append(cov_param)
@@ -136,23 +154,32 @@ class MultiLinear(MultiDataBase):
         param_list = []
         if linear_prior is None:
             linear_prior = [None for i in range(self._num_bands)]
-        for i in range(self._num_bands):
-            if self._compute_bool[i] is True:
-                logL_i, param_i = self._imageModel_list[i].likelihood_data_given_model(
-                    kwargs_lens,
-                    kwargs_source,
-                    kwargs_lens_light,
-                    kwargs_ps,
-                    kwargs_extinction,
-                    kwargs_special,
-                    source_marg=source_marg,
-                    linear_prior=linear_prior[i],
-                    check_positive_flux=check_positive_flux,
-                )
+
+        def likelihood_band(
+            i, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        ):
+            return self._imageModel_list[i].likelihood_data_given_model(
+                kwargs_lens,
+                kwargs_source,
+                kwargs_lens_light,
+                kwargs_ps,
+                kwargs_extinction,
+                kwargs_special,
+                source_marg=source_marg,
+                linear_prior=linear_prior[i],
+                check_positive_flux=check_positive_flux,
+            )
+
+        result_list = self._evaluate_bands(
+            likelihood_band, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
+        )
+        for result in result_list:
+            if result is None:
+                param_list.append(None)
+            else:
+                logL_i, param_i = result
                 logL += logL_i
                 param_list.append(param_i)
-            else:
-                param_list.append(None)
         return logL, param_list
 
     def update_linear_kwargs(
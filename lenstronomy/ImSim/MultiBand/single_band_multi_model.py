@@ -1,3 +1,4 @@
+import lenstronomy.ImSim.de_lens as de_lens
 from lenstronomy.ImSim.image_linear_solve import ImageLinearFit
 from lenstronomy.ImSim.image_model import ImageModel
 from lenstronomy.Data.imaging_data import ImageData
@@ -34,6 +35,7 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
         band_index=0,
         kwargs_pixelbased=None,
         linear_solver=True,
+        kwargs_wls=None,
     ):
         """
 
@@ -45,6 +47,8 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver
+         (see de_lens.create_wls_solver())
         """
         self.type = "single-band-multi-model"
         if likelihood_mask_list is None:
@@ -87,8 +91,10 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
 
         if linear_solver:
             imageClass = ImageLinearFit
+            kwargs_linear = {"kwargs_wls": kwargs_wls}
         else:
             imageClass = ImageModel
+            kwargs_linear = {}
 
         imageClass.__init__(
             self,
@@ -102,7 +108,12 @@ class SingleBandMultiModel(ImageLinearFit, ImageModel):
             kwargs_numerics=kwargs_numerics,
             likelihood_mask=likelihood_mask_list[band_index],
             kwargs_pixelbased=kwargs_pixelbased,
+            **kwargs_linear
         )
+        if not linear_solver:
+            # the linear solver can still be called explicitly in likelihood_data_given_model()
+            self.delete_linear_response_cache()
+            self._get_param_WLS = de_lens.create_wls_solver(kwargs_wls)
 
     def image(
         self,
@@ -1,6 +1,6 @@
-from scipy import fftpack, ndimage, signal
+from scipy import ndimage, signal
 import numpy as np
-import threading
+from lenstronomy.ImSim.Numerics.fft_backend import FFTBackend
 import lenstronomy.Util.kernel_util as kernel_util
 import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
@@ -9,13 +9,12 @@ from lenstronomy.Util.package_util import exporter
 
 export, __all__ = exporter()
 
-_rfft_mt_safe = True  # (NumpyVersion(np.__version__) >= '1.9.0.dev-e24486e')
-_rfft_lock = threading.Lock()
-
 
 def _centered(arr, newshape):
-    # Return the center newshape portion of the array.
-    newshape = np.asarray(newshape)
+    # Return the center newshape portion of the array (leading stack axes are kept).
+    newshape = np.concatenate(
+        [np.shape(arr)[: np.ndim(arr) - len(newshape)], newshape]
+    ).astype(int)
     currshape = np.array(arr.shape)
     startind = (currshape - newshape) // 2
     endind = startind + newshape
@@ -27,17 +26,22 @@ def _centered(arr, newshape):
 class PixelKernelConvolution(object):
     """Class to compute convolutions for a given pixelized kernel (fft, grid)"""
 
-    def __init__(self, kernel, convolution_type="fft_static"):
+    def __init__(self, kernel, convolution_type="fft_static", fft_backend=None):
         """
 
         :param kernel: 2d array, convolution kernel
         :param convolution_type: string, 'fft', 'grid', 'fft_static' mode of 2d convolution
+        :param fft_backend: FFT library of the 'fft_static' convolution, 'numpy', 'scipy' or 'pyfftw' (see
+         FFTBackend class). If None, uses the one set in the lenstronomy configuration file.
         """
         self._kernel = kernel
         if convolution_type not in ["fft", "grid", "fft_static"]:
             raise ValueError("convolution_type %s not supported!" % convolution_type)
         self._type = convolution_type
-        self._pre_computed = False
+        self._fft_backend = fft_backend
+        self._fft = FFTBackend(backend=fft_backend)
+        # Fourier transformed kernel and shapes for each image shape
+        self._pre_computed = {}
 
     def pixel_kernel(self, num_pix=None):
         """Access pixelated kernel.
@@ -55,133 +59,98 @@ class PixelKernelConvolution(object):
 
         :return: copy of the class with kernel set to the transpose of original one
         """
-        return PixelKernelConvolution(self._kernel.T, convolution_type=self._type)
+        return PixelKernelConvolution(
+            self._kernel.T,
+            convolution_type=self._type,
+            fft_backend=self._fft_backend,
+        )
 
     def convolution2d(self, image):
         """
 
-        :param image: 2d array (image) to be convolved
+        :param image: 2d array (image) to be convolved, or 3d array of a stack of images
+            (n, nx, ny) which are all convolved with the same kernel
         :return: fft convolution
         """
+        image = np.asarray(image)
         if self._type == "fft":
-            image_conv = signal.fftconvolve(image, self._kernel, mode="same")
+            kernel = self._kernel.reshape(
+                (1,) * (image.ndim - 2) + np.shape(self._kernel)
+            )
+            image_conv = signal.fftconvolve(image, kernel, mode="same", axes=(-2, -1))
         elif self._type == "fft_static":
             image_conv = self._static_fft(image, mode="same")
         elif self._type == "grid":
-            image_conv = signal.convolve2d(image, self._kernel, mode="same")
+            if image.ndim == 2:
+                image_conv = signal.convolve2d(image, self._kernel, mode="same")
+            else:
+                image_conv = np.array(
+                    [
+                        signal.convolve2d(image_i, self._kernel, mode="same")
+                        for image_i in image
+                    ]
+                )
         else:
             raise ValueError("convolution_type %s not supported!" % self._type)
         return image_conv
 
     def _static_fft(self, image, mode="same"):
-        """Scipy fft convolution with saved static fft kernel.
+        """FFT convolution with the Fourier transformed kernel saved for each image
+        shape. A stack of images is transformed in one batched FFT over the last two
+        axes.
 
-        :param image: 2d numpy array to be convolved
-        :return:
+        :param image: 2d numpy array to be convolved (or 3d stack of 2d arrays)
+        :param mode: 'full', 'same' or 'valid' (see scipy.signal.fftconvolve)
+        :return: convolved image(s)
         """
-        in1 = image
-        in1 = np.asarray(in1)
-        if self._pre_computed is False:
-            (
-                self._s1,
-                self._s2,
-                self._complex_result,
-                self._shape,
-                self._fshape,
-                self._fslice,
-                self._sp2,
-            ) = self._static_pre_compute(image)
-            self._pre_computed = True
-        s1, s2, complex_result, shape, fshape, fslice, sp2 = (
-            self._s1,
-            self._s2,
-            self._complex_result,
-            self._shape,
-            self._fshape,
-            self._fslice,
-            self._sp2,
+        in1 = np.asarray(image)
+        s1, s2, complex_result, shape, fshape, fslice, sp2 = self._static_pre_compute(
+            in1
         )
-        # if in1.ndim == in2.ndim == 0:  # scalar inputs
-        #    return in1 * in2
-        # elif not in1.ndim == in2.ndim:
-        #    raise ValueError("in1 and in2 should have the same dimensionality")
-        # elif in1.size == 0 or in2.size == 0:  # empty arrays
-        #    return np.array([])
-
-        # Check that input sizes are compatible with 'valid' mode
-        # if _inputs_swap_needed(mode, s1, s2):
-        # Convolution is commutative; order doesn't have any effect on output
-        # only applicable for 'valid' mode
-        #    in1, s1, in2, s2 = in2, s2, in1, s1
-
-        # Pre-1.9 NumPy FFT routines are not threadsafe.  For older NumPys, make
-        # sure we only call rfftn/irfftn from one thread at a time.
-        if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
-            try:
-                sp1 = np.fft.rfftn(in1, fshape)
-                ret = np.fft.irfftn(sp1 * sp2, fshape)[fslice].copy()
-            finally:
-                if not _rfft_mt_safe:
-                    _rfft_lock.release()
+        if complex_result is False:
+            sp1 = self._fft.rfft2(in1, fshape)
+            ret = self._fft.irfft2(sp1 * sp2, fshape)[(Ellipsis,) + fslice]
         else:
-            # If we're here, it's either because we need a complex result, or we
-            # failed to acquire _rfft_lock (meaning rfftn isn't threadsafe and
-            # is already in use by another thread).  In either case, use the
-            # (threadsafe but slower) SciPy complex-FFT routines instead.
-            sp1 = fftpack.fftn(in1, fshape)
-            ret = fftpack.ifftn(sp1 * sp2)[fslice].copy()
-            if not complex_result:
-                ret = ret.real
+            sp1 = self._fft.fft2(in1, fshape)
+            ret = self._fft.ifft2(sp1 * sp2, fshape)[(Ellipsis,) + fslice]
 
         if mode == "full":
-            return ret
+            return ret.copy()
         elif mode == "same":
-            return _centered(ret, s1)
+            return _centered(ret, s1).copy()
         elif mode == "valid":
-            return _centered(ret, s1 - s2 + 1)
+            return _centered(ret, s1 - s2 + 1).copy()
         else:
             raise ValueError("Acceptable mode flags are 'valid'," " 'same', or 'full'.")
 
     def _static_pre_compute(self, image):
         """Pre-compute Fourier transformed kernel and shape quantities to speed up
-        convolution.
+        convolution. The quantities are computed once per shape (of the last two axes)
+        and data type of the image and then re-used.
 
-        :param image: 2d numpy array
-        :return:
+        :param image: 2d numpy array (or 3d stack of 2d arrays)
+        :return: s1, s2, complex_result, shape, fshape, fslice, sp2
         """
         in1 = image
         in2 = self._kernel
-        s1 = np.array(in1.shape)
+        complex_result = bool(np.iscomplexobj(in1) or np.iscomplexobj(in2))
+        key = (in1.shape[-2:], complex_result)
+        pre_computed = self._pre_computed.get(key)
+        if pre_computed is not None:
+            return pre_computed
+        s1 = np.array(in1.shape[-2:])
         s2 = np.array(in2.shape)
-        complex_result = np.issubdtype(in1.dtype, np.complexfloating) or np.issubdtype(
-            in2.dtype, np.complexfloating
-        )
         shape = s1 + s2 - 1
-
-        # Check that input sizes are compatible with 'valid' mode
-        # if _inputs_swap_needed(mode, s1, s2):
-        # Convolution is commutative; order doesn't have any effect on output
-        # only applicable for 'valid' mode
-        #    in1, s1, in2, s2 = in2, s2, in1, s1
-
-        # Speed up FFT by padding to optimal size for FFTPACK
-        fshape = [fftpack.next_fast_len(int(d)) for d in shape]
+        # speed up the FFT by padding to fast lengths
+        fshape = [self._fft.next_fast_len(d, real=not complex_result) for d in shape]
         fslice = tuple([slice(0, int(sz)) for sz in shape])
-        # Pre-1.9 NumPy FFT routines are not threadsafe.  For older NumPys, make
-        # sure we only call rfftn/irfftn from one thread at a time.
-        if not complex_result and (_rfft_mt_safe or _rfft_lock.acquire(False)):
-            try:
-                sp2 = np.fft.rfftn(in2, fshape)
-            finally:
-                if not _rfft_mt_safe:
-                    _rfft_lock.release()
+        if complex_result is False:
+            sp2 = self._fft.rfft2(in2, fshape)
         else:
-            # If we're here, it's either because we need a complex result, or we
-            # failed to acquire _rfft_lock (meaning rfftn isn't threadsafe and
-            # is already in use by another thread).  In either case, use the
-            # (threadsafe but slower) SciPy complex-FFT routines instead.
-            sp2 = fftpack.fftn(in2, fshape)
-        return s1, s2, complex_result, shape, fshape, fslice, sp2
+            sp2 = self._fft.fft2(in2, fshape)
+        pre_computed = (s1, s2, complex_result, shape, fshape, fslice, sp2)
+        self._pre_computed[key] = pre_computed
+        return pre_computed
 
     def re_size_convolve(self, image_low_res, image_high_res=None):
         """
@@ -239,7 +208,8 @@ class SubgridKernelConvolution(object):
     def convolution2d(self, image):
         """
 
-        :param image: 2d array (high resoluton image) to be convolved and re-sized
+        :param image: 2d array (high resoluton image) to be convolved and re-sized, or
+            3d array of a stack of such images
         :return: convolved image
         """
 
@@ -255,7 +225,8 @@ class SubgridKernelConvolution(object):
     def re_size_convolve(self, image_low_res, image_high_res):
         """
 
-        :param image_high_res: supersampled image/model to be convolved on a regular pixel grid
+        :param image_low_res: regular sampled image/model (or 3d stack thereof)
+        :param image_high_res: supersampled image/model to be convolved on a regular pixel grid (or 3d stack thereof)
         :return: convolved and re-sized image
         """
         image_high_res_conv = self._high_res_conv.convolution2d(image_high_res)
@@ -304,16 +275,21 @@ class MultiGaussianConvolution(object):
     def convolution2d(self, image):
         """2d convolution.
 
-        :param image: 2d numpy array, image to be convolved
-        :return: convolved image, 2d numpy array
+        :param image: 2d numpy array, image to be convolved, or 3d array of a stack of
+            images (n, nx, ny)
+        :return: convolved image, 2d numpy array (or 3d stack)
         """
+        image = np.asarray(image)
+        # no smoothing along the stacking axis
+        sigma_stack = (0,) * (image.ndim - 2)
         image_conv = None
         for i in range(self._num_gaussians):
+            sigma = sigma_stack + (self._sigmas_scaled[i],) * 2
             if image_conv is None:
                 image_conv = (
                     ndimage.gaussian_filter(
                         image,
-                        self._sigmas_scaled[i],
+                        sigma,
                         mode="nearest",
                         truncate=self._truncation,
                     )
@@ -323,7 +299,7 @@ class MultiGaussianConvolution(object):
                 image_conv += (
                     ndimage.gaussian_filter(
                         image,
-                        self._sigmas_scaled[i],
+                        sigma,
                         mode="nearest",
                         truncate=self._truncation,
                     )
@@ -0,0 +1,148 @@
+__author__ = "sibirrer"
+
+import os
+
+import numpy as np
+import scipy.fft
+
+from lenstronomy.Conf import config_loader
+from lenstronomy.Util.package_util import exporter
+
+export, __all__ = exporter()
+
+_supported_backends = ["numpy", "scipy", "pyfftw"]
+_kwargs_fft = config_loader.fft_conf()
+
+
+@export
+class FFTBackend(object):
+    """Two-dimensional (real and complex) FFTs over the last two axes of an array with
+    an exchangeable library:
+
+    - 'numpy': numpy.fft (single-threaded)
+    - 'scipy': scipy.fft, multi-threaded over the leading (stack) axes and the
+      transformed axes with the number of workers
+    - 'pyfftw': FFTW through pyFFTW (if installed). The FFTW plans and their aligned
+      input and output arrays are created once per array shape and re-used.
+
+    The default backend and number of workers are set in the 'fft' section of the
+    lenstronomy configuration file (see Conf/config_loader.py).
+
+    An instance keeps its plans and buffers and is not meant to be shared between
+    threads.
+    """
+
+    def __init__(self, backend=None, workers=None):
+        """
+
+        :param backend: string, 'numpy', 'scipy' or 'pyfftw' (default from the
+            configuration file)
+        :param workers: number of threads of the 'scipy' and 'pyfftw' backends, -1 for
+            all available cores (default from the configuration file)
+        """
+        if backend is None:
+            backend = _kwargs_fft["backend"]
+        if workers is None:
+            workers = _kwargs_fft["workers"]
+        if backend not in _supported_backends:
+            raise ValueError(
+                "FFT backend %s not supported! Choose among %s."
+                % (backend, _supported_backends)
+            )
+        if workers == -1:
+            workers = os.cpu_count()
+        if backend == "pyfftw":
+            try:
+                import pyfftw.builders
+            except ImportError:
+                raise ImportError(
+                    "The 'pyfftw' FFT backend requires pyFFTW to be installed."
+                )
+            self._pyfftw_builders = pyfftw.builders
+            self._plans = {}
+        self._backend = backend
+        self._workers = int(workers)
+
+    @property
+    def backend(self):
+        """
+
+        :return: name of the FFT library
+        """
+        return self._backend
+
+    def rfft2(self, a, s):
+        """Real FFT over the last two axes.
+
+        :param a: real array
+        :param s: shape (2 integers) of the transformed axes after zero-padding
+        :return: complex array
+        """
+        return self._transform("rfftn", a, s)
+
+    def irfft2(self, a, s):
+        """Inverse of rfft2().
+
+        :param a: complex array
+        :param s: shape (2 integers) of the real output over the last two axes
+        :return: real array
+        """
+        return self._transform("irfftn", a, s)
+
+    def fft2(self, a, s):
+        """Complex FFT over the last two axes.
+
+        :param a: array
+        :param s: shape (2 integers) of the transformed axes after zero-padding
+        :return: complex array
+        """
+        return self._transform("fftn", a, s)
+
+    def ifft2(self, a, s):
+        """Inverse of fft2().
+
+        :param a: complex array
+        :param s: shape (2 integers) of the output over the last two axes
+        :return: complex array
+        """
+        return self._transform("ifftn", a, s)
+
+    @staticmethod
+    def next_fast_len(n, real=True):
+        """Smallest length >= n for which the FFT is efficient (products of small prime
+        factors).
+
+        :param n: integer
+        :param real: bool, if True, for real FFTs
+        :return: integer
+        """
+        return scipy.fft.next_fast_len(int(n), real=real)
+
+    def _transform(self, name, a, s):
+        """
+
+        :param name: 'rfftn', 'irfftn', 'fftn' or 'ifftn'
+        :param a: array
+        :param s: shape of the transformed axes
+        :return: transformed array
+        """
+        s = tuple(int(n) for n in s)
+        if self._backend == "numpy":
+            return getattr(np.fft, name)(a, s, axes=(-2, -1))
+        if self._backend == "scipy":
+            return getattr(scipy.fft, name)(a, s, axes=(-2, -1), workers=self._workers)
+        a = np.asarray(a)
+        key = (name, a.shape, a.dtype.str, s)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = getattr(self._pyfftw_builders, name)(
+                a,
+                s=s,
+                axes=(-2, -1),
+                threads=self._workers,
+                planner_effort="FFTW_MEASURE",
+                avoid_copy=False,
+            )
+            self._plans[key] = plan
+        # the output array of a plan is re-used by the next call with the same shape
+        return plan(a).copy()
@@ -8,6 +8,7 @@ from lenstronomy.ImSim.Numerics.point_source_rendering import PointSourceRenderi
 from lenstronomy.Util import util
 from lenstronomy.Util import kernel_util
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Numerics"]
 
@@ -18,6 +19,9 @@ class Numerics(PointSourceRendering):
     The class has two main functions, re_size_convolve() and coordinates_evaluate()
     """
 
+    # maximum number of (supersampled) pixels of a stack of images convolved at once
+    _max_num_elements = 2**22
+
     def __init__(
         self,
         pixel_grid,
@@ -186,6 +190,7 @@ class Numerics(PointSourceRendering):
         else:
             self._high_res_return = False
 
+    @timed
     def re_size_convolve(self, flux_array, unconvolved=False):
         """
 
@@ -206,6 +211,74 @@ class Numerics(PointSourceRendering):
             )
         return image_conv * self._pixel_width**2
 
+    @timed
+    def re_size_convolve_stack(self, flux_arrays, unconvolved=False):
+        """Convolves a stack of flux arrays (e.g. the basis functions of a linear model)
+        at once. For pixelized and Gaussian kernels, the images are convolved in batched
+        calls over chunks of the stack with at most _max_num_elements (supersampled)
+        pixels each, otherwise the images are convolved one by one.
+
+        :param flux_arrays: 2d array (n, len(coordinates_evaluate)), flux values
+            corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n, nx, ny)
+        """
+        if len(flux_arrays) == 0:
+            return np.array([])
+        num_chunk = max(self._max_num_elements // max(len(flux_arrays[0]), 1), 1)
+        image_conv = np.concatenate(
+            [
+                self._re_size_convolve_chunk(
+                    flux_arrays[i : i + num_chunk], unconvolved
+                )
+                for i in range(0, len(flux_arrays), num_chunk)
+            ]
+        )
+        return image_conv * self._pixel_width**2
+
+    def _re_size_convolve_chunk(self, flux_arrays, unconvolved):
+        """Convolves a chunk of the stack of re_size_convolve_stack() (without the pixel
+        area normalization).
+
+        :param flux_arrays: 2d array (n, len(coordinates_evaluate)), flux values
+            corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n, nx, ny)
+        """
+        image_low_res_list, image_high_res_list = [], []
+        for flux_array in flux_arrays:
+            image_low_res, image_high_res_partial = (
+                self._grid.flux_array2image_low_high(
+                    flux_array, high_res_return=self._high_res_return
+                )
+            )
+            image_low_res_list.append(image_low_res)
+            image_high_res_list.append(image_high_res_partial)
+        image_low_res = np.array(image_low_res_list)
+        if self._high_res_return is True:
+            image_high_res = np.array(image_high_res_list)
+        else:
+            image_high_res = None
+        if unconvolved is True or self._psf_type == "NONE":
+            return image_low_res
+        if isinstance(
+            self._conv,
+            (
+                PixelKernelConvolution,
+                SubgridKernelConvolution,
+                MultiGaussianConvolution,
+            ),
+        ):
+            return self._conv.re_size_convolve(image_low_res, image_high_res)
+        return np.array(
+            [
+                self._conv.re_size_convolve(
+                    image_low_res_list[i], image_high_res_list[i]
+                )
+                for i in range(len(image_low_res_list))
+            ]
+        )
+
     @property
     def grid_supersampling_factor(self):
         """
@@ -94,6 +94,18 @@ class NumericsSubFrame(PointSourceRendering):
         )
         return self._complete_frame(image_sub_frame)
 
+    def re_size_convolve_stack(self, flux_arrays, unconvolved=False):
+        """
+
+        :param flux_arrays: 2d array (n, len(coordinates_evaluate)), flux values corresponding to coordinates_evaluate
+        :param unconvolved: boolean, if True, does not apply a convolution
+        :return: convolved images on regular pixel grid, 3d array (n, nx, ny)
+        """
+        images_sub_frame = self._numerics_subframe.re_size_convolve_stack(
+            flux_arrays, unconvolved=unconvolved
+        )
+        return self._complete_frame(images_sub_frame)
+
     @property
     def grid_supersampling_factor(self):
         """
@@ -128,12 +140,14 @@ class NumericsSubFrame(PointSourceRendering):
 
     def _complete_frame(self, image_sub_frame):
         """
-        :param image_sub_frame: 2d numpy array of size of the sub-frame
+        :param image_sub_frame: 2d numpy array of size of the sub-frame (or 3d stack thereof)
         :return: 2d numpy array of size of image with added zeros on their edges
         """
         if self._subframe_calc is True:
-            image = np.zeros((self._nx, self._ny))
+            shape_stack = np.shape(image_sub_frame)[:-2]
+            image = np.zeros(shape_stack + (self._nx, self._ny))
             image[
+                ...,
                 self._x_min_sub : self._x_max_sub + 1,
                 self._y_min_sub : self._y_max_sub + 1,
             ] = image_sub_frame
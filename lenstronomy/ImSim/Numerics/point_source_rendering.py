@@ -1,6 +1,7 @@
 from lenstronomy.Util import image_util
 from lenstronomy.Util import kernel_util
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["PointSourceRendering"]
 
@@ -23,6 +24,7 @@ class PointSourceRendering(object):
         self._supersampling_factor = supersampling_factor
         self._psf = psf
 
+    @timed
     def point_source_rendering(self, ra_pos, dec_pos, amp):
         """
 
@@ -33,29 +35,84 @@ class PointSourceRendering(object):
         """
         subgrid = self._supersampling_factor
         x_pos, y_pos = self._pixel_grid.map_coord2pix(ra_pos, dec_pos)
-        # translate coordinates to higher resolution grid
-        x_pos_subgird = x_pos * subgrid + (subgrid - 1) / 2.0
-        y_pos_subgrid = y_pos * subgrid + (subgrid - 1) / 2.0
-        kernel_point_source_subgrid = self._kernel_supersampled
-        # initialize grid with higher resolution
-        subgrid2d = np.zeros((self._nx * subgrid, self._ny * subgrid))
+        x_pos, y_pos = np.atleast_1d(x_pos), np.atleast_1d(y_pos)
         # add_layer2image
         if len(x_pos) > len(amp):
             raise ValueError(
                 "there are %s images appearing but only %s amplitudes provided!"
                 % (len(x_pos), len(amp))
             )
-        for i in range(len(x_pos)):
-            subgrid2d = image_util.add_layer2image(
-                subgrid2d,
-                x_pos_subgird[i],
-                y_pos_subgrid[i],
-                amp[i] * kernel_point_source_subgrid,
-            )
+        amp = np.asarray(amp, dtype=float)[: len(x_pos)]
+        # translate coordinates to higher resolution grid
+        x_pos_subgird = x_pos * subgrid + (subgrid - 1) / 2.0
+        y_pos_subgrid = y_pos * subgrid + (subgrid - 1) / 2.0
+        kernel_point_source_subgrid = self._kernel_supersampled
+        # initialize grid with higher resolution
+        subgrid2d = np.zeros((self._nx * subgrid, self._ny * subgrid))
+        # all point sources are added in a single scatter-add
+        subgrid2d = image_util.add_layers2image(
+            subgrid2d,
+            x_pos_subgird,
+            y_pos_subgrid,
+            kernel_point_source_subgrid,
+            amp=amp,
+        )
         # re-size grid to data resolution
         grid2d = image_util.re_size(subgrid2d, factor=subgrid)
         return grid2d * subgrid**2
 
+    @timed
+    def point_source_rendering_stack(self, ra_pos_list, dec_pos_list, amp_list):
+        """Renders a stack of images, each with its own set of point sources (e.g. the
+        response of the individual point sources in the linear solver). Equivalent to
+        calling point_source_rendering() for each set, with the sub-pixel shifts of all
+        point sources computed at once and a single scatter-add of all images on the
+        data pixels.
+
+        :param ra_pos_list: list of arrays of RA positions of point sources (one per
+            image)
+        :param dec_pos_list: list of arrays of DEC positions of point sources (one per
+            image)
+        :param amp_list: list of arrays of amplitudes of point sources (one per image)
+        :return: 3d numpy array of shape (len(ra_pos_list), nx, ny) with the rendered
+            images
+        """
+        num_images = len(ra_pos_list)
+        subgrid = self._supersampling_factor
+        num_pos = [len(np.atleast_1d(ra_pos)) for ra_pos in ra_pos_list]
+        for n, amp in zip(num_pos, amp_list):
+            if n > len(np.atleast_1d(amp)):
+                raise ValueError(
+                    "there are %s images appearing but only %s amplitudes provided!"
+                    % (n, len(np.atleast_1d(amp)))
+                )
+        if num_images == 0 or np.sum(num_pos) == 0:
+            return np.zeros((num_images, self._nx, self._ny))
+        ra_pos = np.concatenate([np.atleast_1d(ra) for ra in ra_pos_list])
+        dec_pos = np.concatenate([np.atleast_1d(dec) for dec in dec_pos_list])
+        amp = np.concatenate(
+            [np.atleast_1d(a)[:n].astype(float) for a, n in zip(amp_list, num_pos)]
+        )
+        image_index = np.repeat(np.arange(num_images), num_pos)
+        x_pos, y_pos = self._pixel_grid.map_coord2pix(ra_pos, dec_pos)
+        # translate coordinates to higher resolution grid
+        x_pos_subgrid = x_pos * subgrid + (subgrid - 1) / 2.0
+        y_pos_subgrid = y_pos * subgrid + (subgrid - 1) / 2.0
+        rows, cols, values, layer = image_util.layers2pixels(
+            (self._nx * subgrid, self._ny * subgrid),
+            x_pos_subgrid,
+            y_pos_subgrid,
+            self._kernel_supersampled,
+            amp=amp,
+        )
+        # sum of the supersampled pixels within each data pixel
+        index = (image_index[layer] * self._nx + rows // subgrid) * self._ny
+        index += cols // subgrid
+        images = np.bincount(
+            index, weights=values, minlength=num_images * self._nx * self._ny
+        )
+        return images.reshape(num_images, self._nx, self._ny)
+
     @property
     def _kernel_supersampled(self):
         if not hasattr(self, "_kernel_supersampled_instance"):
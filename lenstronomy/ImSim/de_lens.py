@@ -2,13 +2,17 @@ __author__ = "sibirrer"
 
 import numpy as np
 import sys
+from scipy import linalg
+from scipy.linalg import lapack
 
 from lenstronomy.Util.package_util import exporter
+from lenstronomy.Util.profiling import timed
 
 export, __all__ = exporter()
 
 
 @export
+@timed
 def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     """Returns the parameter values given.
 
@@ -42,6 +46,122 @@ def get_param_WLS(A, C_D_inv, d, inv_bool=True):
     return B, M_inv, image
 
 
+@export
+class WLSCholeskySolver(object):
+    """Weighted linear least square solver based on the normal equations.
+
+    The normal matrix M = A^T C_D^-1 A is symmetric positive definite (for a non-
+    degenerate response) and is solved with a Cholesky factorization. The reciprocal
+    condition number of M is then estimated from the factor with LAPACK (dpocon) and
+    badly conditioned systems fall back to get_param_WLS(). M is formed as W^T W (with W
+    the response A weighted by C_D^-1/2), which lets BLAS use a symmetric rank-k update.
+    The buffer of W is kept for a fixed data and parameter size and the last
+    factorization is re-used when the normal matrix did not change between calls.
+    Optionally, the accumulation of the normal matrix (the O(N_data x N_param^2) part)
+    is done in single precision.
+    """
+
+    def __init__(self, float32=False):
+        """
+
+        :param float32: bool, if True, accumulates the normal matrix in single precision
+            (float32). The factorization itself is done in double precision.
+        """
+        self._dtype = np.float32 if float32 else np.float64
+        self._weighted_response = None
+        self._M = None
+        self._factor = None
+        self._well_conditioned = True
+
+    @timed
+    def get_param_WLS(self, A, C_D_inv, d, inv_bool=True):
+        """Returns the parameter values given. Same conventions as get_param_WLS().
+
+        :param A: response matrix Nd x Ns (Nd = # data points, Ns = # parameters)
+        :param C_D_inv: inverse covariance matrix of the data, Nd x Nd, diagonal form
+        :param d: data array, 1-d Nd
+        :param inv_bool: boolean, whether returning also the inverse matrix or just
+            solve the linear system
+        :return: 1-d array of parameter values, inverse of the normal matrix (or None),
+            model
+        """
+        num_param = np.shape(A)[1]
+        if self._weighted_response is None or np.shape(
+            self._weighted_response
+        ) != np.shape(A):
+            self._weighted_response = np.empty(np.shape(A), dtype=self._dtype)
+        # W = C_D^-1/2 A such that M = W^T W is computed as a symmetric rank-k update
+        np.multiply(
+            A,
+            np.sqrt(C_D_inv, dtype=self._dtype)[:, np.newaxis],
+            out=self._weighted_response,
+            casting="unsafe",
+        )
+        W = self._weighted_response
+        M = np.asarray(W.T.dot(W), dtype=float)
+        R = A.T.dot(np.multiply(C_D_inv, d))
+        factor, well_conditioned = self._cholesky(M)
+        if not well_conditioned:
+            return get_param_WLS(A, C_D_inv, d, inv_bool=inv_bool)
+        if factor is None:
+            B = np.zeros(num_param)
+            M_inv = np.zeros((num_param, num_param)) if inv_bool else None
+        else:
+            B = linalg.cho_solve(factor, R)
+            if inv_bool:
+                M_inv = linalg.cho_solve(factor, np.eye(num_param))
+            else:
+                M_inv = None
+        image = A.dot(B)
+        return B, M_inv, image
+
+    def _cholesky(self, M):
+        """Cholesky factorization of the normal matrix (re-used if M did not change).
+
+        :param M: symmetric normal matrix
+        :return: factorization as used by scipy.linalg.cho_solve (or None if M is not
+            numerically positive definite), bool whether M is well conditioned
+        """
+        if self._M is not None and np.array_equal(M, self._M):
+            return self._factor, self._well_conditioned
+        well_conditioned = True
+        try:
+            factor = linalg.cho_factor(M, lower=True, check_finite=True)
+        except (linalg.LinAlgError, ValueError):
+            factor = None
+        else:
+            # O(N_param^2) estimate of the reciprocal 1-norm condition number of M from
+            # its Cholesky factor
+            rcond, info = lapack.dpocon(factor[0], np.linalg.norm(M, 1), uplo="L")
+            well_conditioned = info == 0 and rcond * 5 >= sys.float_info.epsilon
+        self._M = M
+        self._factor = factor
+        self._well_conditioned = well_conditioned
+        return factor, well_conditioned
+
+
+@export
+def create_wls_solver(kwargs_wls=None):
+    """Creates the weighted linear least square solver specified in kwargs_wls.
+
+    :param kwargs_wls: None or keyword arguments with 'method' ('inverse' (default) or
+        'cholesky') and 'float32' (bool, only for 'cholesky')
+    :return: function or callable with the signature of get_param_WLS()
+    """
+    if kwargs_wls is None:
+        kwargs_wls = {}
+    method = kwargs_wls.get("method", "inverse")
+    if method == "inverse":
+        return get_param_WLS
+    elif method == "cholesky":
+        return WLSCholeskySolver(float32=kwargs_wls.get("float32", False)).get_param_WLS
+    else:
+        raise ValueError(
+            "WLS method %s not supported! Chose either 'inverse' or 'cholesky'."
+            % method
+        )
+
+
 @export
 def marginalisation_const(M_inv):
     """Get marginalisation constant 1/2 log(M_beta) for flat priors.
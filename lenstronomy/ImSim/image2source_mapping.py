@@ -2,6 +2,7 @@ import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.ImSim.multiplane_organizer import MultiPlaneOrganizer
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Image2SourceMapping"]
 
@@ -124,10 +125,9 @@ class Image2SourceMapping(object):
 
     def set_T_ij_arrays(self):
         """Sets the transverse distance arrays for the multi-lens-plane case."""
-        self._T0z_list = []
-
-        for z_stop in self._source_redshift_list:
-            self._T0z_list.append(self._bkg_cosmo.T_xy(0, z_stop))
+        self._T0z_list = list(
+            self._bkg_cosmo.T_xy(0, np.array(self._source_redshift_list))
+        )
 
         z_start = 0
         self._T_ij_start_list = []
@@ -178,6 +178,7 @@ class Image2SourceMapping(object):
         plane."""
         self._T_ij_end_list = T_ij_end_list
 
+    @timed
     def image2source(self, x, y, kwargs_lens, index_source, kwargs_special=None):
         """
         mapping of image plane to source plane coordinates
@@ -308,6 +309,7 @@ class Image2SourceMapping(object):
                     z_start = z_stop
             return flux
 
+    @timed
     def image_flux_split(self, x, y, kwargs_lens, kwargs_source, kwargs_special=None):
         """Computes the surface brightness of all light components at image position (x,
         y)
@@ -3,6 +3,7 @@ import lenstronomy.ImSim.de_lens as de_lens
 from lenstronomy.Util import util
 from lenstronomy.ImSim.Numerics.convolution import PixelKernelConvolution
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["ImageLinearFit"]
 
@@ -28,6 +29,7 @@ class ImageLinearFit(ImageModel):
         likelihood_mask=None,
         psf_error_map_bool_list=None,
         kwargs_pixelbased=None,
+        kwargs_wls=None,
     ):
         """
 
@@ -45,6 +47,8 @@ class ImageLinearFit(ImageModel):
          Indicates whether PSF error map is used for the point source model stated as the index.
         :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver
          (see SLITronomy documentation) being applied to the point sources.
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver
+         (see de_lens.create_wls_solver()), e.g. {'method': 'cholesky', 'float32': False}
         """
         super(ImageLinearFit, self).__init__(
             data_class,
@@ -60,12 +64,16 @@ class ImageLinearFit(ImageModel):
             kwargs_pixelbased=kwargs_pixelbased,
         )
 
+        self.delete_linear_response_cache()
+        self._get_param_WLS = de_lens.create_wls_solver(kwargs_wls)
+
         # prepare to use fft convolution for the natwt linear solver
         if self.Data.likelihood_method() == "interferometry_natwt":
             self._convolution = PixelKernelConvolution(
                 kernel=self.PSF.kernel_point_source
             )
 
+    @timed
     def image_linear_solve(
         self,
         kwargs_lens=None,
@@ -121,7 +129,7 @@ class ImageLinearFit(ImageModel):
                 self, kwargs_lens, kwargs_ps, kwargs_special=kwargs_special
             )
             d = self.data_response
-            param, cov_param, wls_model = de_lens.get_param_WLS(
+            param, cov_param, wls_model = self._get_param_WLS(
                 A.T, 1 / C_D_response, d, inv_bool=inv_bool
             )
             model = self.array_masked2image(wls_model)
@@ -193,6 +201,7 @@ class ImageLinearFit(ImageModel):
         )
         return model, model_error, cov_param, param
 
+    @timed
     def likelihood_data_given_model(
         self,
         kwargs_lens=None,
@@ -324,6 +333,7 @@ class ImageLinearFit(ImageModel):
         num += self.PointSource.num_basis(kwargs_ps, kwargs_lens)
         return num
 
+    @timed
     def linear_response_matrix(
         self,
         kwargs_lens,
@@ -352,20 +362,18 @@ class ImageLinearFit(ImageModel):
         :param unconvolved: bool, if True, computes components without convolution kernel (will not work for point sources)
         :return: response matrix (m x n)
         """
-        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
-
-        source_light_response, n_source = self.source_mapping.image_flux_split(
-            x_grid, y_grid, kwargs_lens, kwargs_source, kwargs_special
-        )
-        extinction = self._extinction.extinction(
-            x_grid,
-            y_grid,
-            kwargs_extinction=kwargs_extinction,
-            kwargs_special=kwargs_special,
+        source_rows = self._source_response_rows(
+            kwargs_lens,
+            kwargs_source,
+            kwargs_extinction,
+            kwargs_special,
+            unconvolved=unconvolved,
         )
-        lens_light_response, n_lens_light = self.LensLightModel.functions_split(
-            x_grid, y_grid, kwargs_lens_light
+        lens_light_rows = self._lens_light_response_rows(
+            kwargs_lens_light, unconvolved=unconvolved
         )
+        n_source = len(source_rows)
+        n_lens_light = len(lens_light_rows)
 
         ra_pos, dec_pos, amp, n_points = self.point_source_linear_response_set(
             kwargs_ps, kwargs_lens, kwargs_special, with_amp=False
@@ -376,41 +384,204 @@ class ImageLinearFit(ImageModel):
         A = np.zeros((num_param, num_response))
         n = 0
         # response of lensed source profile
-        for i in range(0, n_source):
-            image = source_light_response[i]
-
-            # multiply with primary beam before convolution
-            if self._pb is not None:
-                image *= self._pb_1d
-
-            image *= extinction
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
+        for row in source_rows:
+            A[n, :] = row
             n += 1
         # response of deflector light profile (or any other un-lensed extended components)
-        for i in range(0, n_lens_light):
-            image = lens_light_response[i]
-
-            # multiply with primary beam before convolution
-            if self._pb is not None:
-                image *= self._pb_1d
-
-            image = self.ImageNumerics.re_size_convolve(image, unconvolved=unconvolved)
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
+        for row in lens_light_rows:
+            A[n, :] = row
             n += 1
         # response of point sources
-        for i in range(0, n_points):
+        if n_points > 0:
             # raise warnings when primary beam is attempted to be applied for point sources
             if self._pb is not None:
                 raise Warning("Antenna primary beam does not apply to point sources!")
-
-            image = self.ImageNumerics.point_source_rendering(
-                ra_pos[i], dec_pos[i], amp[i]
+            # all point source responses are rendered in one pass
+            images = self.ImageNumerics.point_source_rendering_stack(
+                ra_pos[:n_points], dec_pos[:n_points], amp[:n_points]
             )
-            A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
-            n += 1
+            for image in images:
+                A[n, :] = np.nan_to_num(self.image2array_masked(image), copy=False)
+                n += 1
         return A * self._flux_scaling
 
+    def _convolved_response_rows(self, response, extinction=None, unconvolved=False):
+        """Convolves the (unconvolved) basis functions and maps them on the evaluated
+        data pixels.
+
+        :param response: list of 1d arrays of the basis functions on the numerics grid
+        :param extinction: None or 1d array of the extinction applied before convolution
+        :param unconvolved: bool, if True, does not apply the convolution kernel
+        :return: list of 1d arrays of the rows in the response matrix
+        """
+        if len(response) == 0:
+            return []
+        flux_arrays = np.array(response, dtype=float)
+        # multiply with primary beam before convolution
+        if self._pb is not None:
+            flux_arrays *= self._pb_1d
+        if extinction is not None:
+            flux_arrays *= extinction
+        # all basis functions are convolved in one batched call
+        images = self.ImageNumerics.re_size_convolve_stack(
+            flux_arrays, unconvolved=unconvolved
+        )
+        rows = [
+            np.nan_to_num(self.image2array_masked(image), copy=False)
+            for image in images
+        ]
+        return rows
+
+    def _lens_light_response_rows(self, kwargs_lens_light, unconvolved=False):
+        """Rows of the response matrix of the deflector light (or any other un-lensed
+        extended components). The rows of each light profile are cached and only re-
+        computed when the non-linear parameters of this profile change.
+
+        :param kwargs_lens_light: list of keyword arguments corresponding to different
+            lens light surface brightness profiles
+        :param unconvolved: bool, if True, computes components without convolution
+            kernel
+        :return: list of 1d arrays of the rows in the response matrix
+        """
+        num_profiles = len(self.LensLightModel.profile_type_list)
+        if len(self._lens_light_response_cache) != num_profiles:
+            self._lens_light_response_cache = [None] * num_profiles
+        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
+        rows = []
+        for i in range(num_profiles):
+            key = (
+                unconvolved,
+                util.kwargs_key(kwargs_lens_light[i], ignore=["amp"]),
+            )
+            cache = self._lens_light_response_cache[i]
+            if cache is None or cache[0] != key:
+                response, _ = self.LensLightModel.functions_split(
+                    x_grid, y_grid, kwargs_lens_light, k=i
+                )
+                cache = (
+                    key,
+                    self._convolved_response_rows(response, None, unconvolved),
+                )
+                self._lens_light_response_cache[i] = cache
+            rows += cache[1]
+        return rows
+
+    def _source_response_rows(
+        self,
+        kwargs_lens,
+        kwargs_source,
+        kwargs_extinction=None,
+        kwargs_special=None,
+        unconvolved=False,
+    ):
+        """Rows of the response matrix of the lensed source profiles. The rows are
+        cached and re-computed when the lens, extinction or special parameters change.
+        With a single source plane, the rows are cached per source profile such that
+        only the profiles with changed non-linear parameters are re-evaluated when the
+        lens model is unchanged.
+
+        :param kwargs_lens: list of keyword arguments corresponding to the superposition
+            of different lens profiles
+        :param kwargs_source: list of keyword arguments corresponding to the
+            superposition of different source light profiles
+        :param kwargs_extinction: list of keyword arguments for extinction model
+        :param kwargs_special: list of special keyword arguments
+        :param unconvolved: bool, if True, computes components without convolution
+            kernel
+        :return: list of 1d arrays of the rows in the response matrix
+        """
+        x_grid, y_grid = self.ImageNumerics.coordinates_evaluate
+        num_profiles = len(self.SourceModel.profile_type_list)
+        key_mapping = util.kwargs_key(
+            [unconvolved, kwargs_lens, kwargs_extinction, kwargs_special]
+        )
+        key_source = [
+            util.kwargs_key(kwargs_source[i], ignore=["amp"])
+            for i in range(num_profiles)
+        ]
+        cache = self._source_response_cache
+        mapping_unchanged = cache is not None and cache["key"] == key_mapping
+
+        if self.source_mapping._multi_source_plane is True:
+            if mapping_unchanged and cache["key_source"] == key_source:
+                return cache["rows"]
+            response, _ = self.source_mapping.image_flux_split(
+                x_grid, y_grid, kwargs_lens, kwargs_source, kwargs_special
+            )
+            extinction = self._extinction.extinction(
+                x_grid,
+                y_grid,
+                kwargs_extinction=kwargs_extinction,
+                kwargs_special=kwargs_special,
+            )
+            rows = self._convolved_response_rows(response, extinction, unconvolved)
+            self._source_response_cache = {
+                "key": key_mapping,
+                "key_source": key_source,
+                "rows": rows,
+            }
+            return rows
+
+        if not mapping_unchanged:
+            x_source, y_source = self.source_mapping.image2source(
+                x_grid, y_grid, kwargs_lens, 0, kwargs_special
+            )
+            extinction = self._extinction.extinction(
+                x_grid,
+                y_grid,
+                kwargs_extinction=kwargs_extinction,
+                kwargs_special=kwargs_special,
+            )
+            cache = {
+                "key": key_mapping,
+                "x_source": x_source,
+                "y_source": y_source,
+                "extinction": extinction,
+                "key_source": [None] * num_profiles,
+                "rows_list": [None] * num_profiles,
+            }
+            self._source_response_cache = cache
+        rows = []
+        for i in range(num_profiles):
+            if cache["rows_list"][i] is None or cache["key_source"][i] != key_source[i]:
+                response, _ = self.SourceModel.functions_split(
+                    cache["x_source"], cache["y_source"], kwargs_source, k=i
+                )
+                cache["rows_list"][i] = self._convolved_response_rows(
+                    response, cache["extinction"], unconvolved
+                )
+                cache["key_source"][i] = key_source[i]
+            rows += cache["rows_list"][i]
+        return rows
+
+    def delete_linear_response_cache(self):
+        """Deletes the cached rows of the linear response matrix of the extended surface
+        brightness components.
+
+        :return: None
+        """
+        self._source_response_cache = None
+        self._lens_light_response_cache = []
+
+    def update_psf(self, psf_class):
+        """Update the instance of the class with a new instance of PSF() with a
+        potentially different point spread function.
+
+        :param psf_class: instance of lenstronomy.Data.psf.PSF class
+        :return: no return. Class is updated.
+        """
+        ImageModel.update_psf(self, psf_class)
+        self.delete_linear_response_cache()
+
+    def update_data(self, data_class):
+        """
+
+        :param data_class: instance of Data() class
+        :return: no return. Class is updated.
+        """
+        ImageModel.update_data(self, data_class)
+        self.delete_linear_response_cache()
+
     def update_linear_kwargs(
         self, param, kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps
     ):
@@ -652,13 +823,11 @@ class ImageLinearFit(ImageModel):
         """
         num_of_light, num_of_image_pixel = np.shape(A)
 
-        A_convolved = np.zeros(np.shape(A))
-
-        # convolve each response separately
-        for i in range(num_of_light):
-            A_convolved[i] = util.image2array(
-                self._convolution._static_fft(util.array2image(A[i]), mode="same")
-            )
+        # convolve all responses in one stacked FFT
+        images = np.array([util.array2image(A[i]) for i in range(num_of_light)])
+        A_convolved = np.reshape(
+            self._convolution._static_fft(images, mode="same"), (num_of_light, -1)
+        )
 
         M = np.zeros((num_of_light, num_of_light))
         for i in range(num_of_light):
@@ -9,6 +9,7 @@ from lenstronomy.ImSim.differential_extinction import DifferentialExtinction
 from lenstronomy.Util import util
 
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["ImageModel"]
 
@@ -567,6 +568,7 @@ class ImageModel(object):
         d = self.image2array_masked(self.Data.data)
         return d
 
+    @timed
     def error_response(self, kwargs_lens, kwargs_ps, kwargs_special):
         """Returns the 1d array of the error estimate corresponding to the data
         response.
@@ -33,6 +33,7 @@ class MultiPlaneDecoupled(MultiPlane):
         alpha_y_interp_background=None,
         z_split=None,
         use_jax=False,
+        plane_cache=False,
     ):
         """A class for multiplane lensing in which the deflection angles at certain
         coordinates are fixed through user-specified interpolation functions. These
@@ -66,6 +67,8 @@ class MultiPlaneDecoupled(MultiPlane):
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy. Can also
             be a list of bools, selecting which models in the lens_model_list to use
             from jaxtronomy
+        :param plane_cache: bool, if True, caches the rays at each lens plane of the
+            recursive ray-tracing (see MultiPlaneBase)
         """
         self._alphax_interp_foreground = alpha_x_interp_foreground
         self._alphay_interp_foreground = alpha_y_interp_foreground
@@ -90,6 +93,7 @@ class MultiPlaneDecoupled(MultiPlane):
             distance_ratio_sampling=distance_ratio_sampling,
             cosmology_sampling=cosmology_sampling,
             cosmology_model=cosmology_model,
+            plane_cache=plane_cache,
         )
 
         cosmo_bkg = Background(cosmo)
@@ -36,6 +36,7 @@ class MultiPlane(object):
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
         use_jax=False,
+        plane_cache=False,
     ):
         """
 
@@ -66,6 +67,9 @@ class MultiPlane(object):
         :param cosmology_model: str, name of the cosmology model to use for
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param plane_cache: bool, if True, caches the rays at each lens plane and re-computes repeated ray-tracing
+            of the same rays only from the first lens plane with changed keyword arguments onward
+            (see MultiPlaneBase)
         """
         self.cosmology_sampling = cosmology_sampling
         self.cosmology_model = cosmology_model
@@ -109,6 +113,7 @@ class MultiPlane(object):
             "distance_ratio_sampling": distance_ratio_sampling,
             "cosmology_sampling": cosmology_sampling,
             "cosmology_model": cosmology_model,
+            "plane_cache": plane_cache,
         }
         if z_source_convention is None:
             z_source_convention = z_source
@@ -141,6 +146,7 @@ class MultiPlane(object):
             num_z_interp=num_z_interp,
             profile_kwargs_list=profile_kwargs_list,
             use_jax=use_jax,
+            plane_cache=plane_cache,
         )
         self._z_source = z_source
         self._set_source_distances(z_source)
@@ -2,6 +2,7 @@ import numpy as np
 from lenstronomy.Cosmo.background import Background
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
 import lenstronomy.Util.constants as const
+from lenstronomy.Util import util
 
 __all__ = ["MultiPlaneBase"]
 
@@ -24,6 +25,7 @@ class MultiPlaneBase(ProfileListBase):
         num_z_interp=100,
         profile_kwargs_list=None,
         use_jax=False,
+        plane_cache=False,
     ):
         """
         A description of the recursive multi-plane formalism can be found e.g. here: https://arxiv.org/abs/1312.1536
@@ -38,8 +40,14 @@ class MultiPlaneBase(ProfileListBase):
             profile will be initialized using default settings.
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
+        :param plane_cache: bool, if True, caches the ray positions and angles at each lens plane of the previous
+            call of ray_shooting_partial_comoving(). A repeated call with the same rays only re-computes the planes
+            from the first plane with changed keyword arguments onward. This requires memory of four arrays of the
+            size of the rays per lens plane.
         """
         self._lens_model_list = lens_model_list
+        self._plane_cache = plane_cache
+        self._plane_cache_state = None
 
         if z_interp_stop is None:
             z_interp_stop = z_source_convention
@@ -84,8 +92,9 @@ class MultiPlaneBase(ProfileListBase):
     def set_T_zs_and_T_ijs(self):
         """Set the transverse angular diameter distances between the observer and the
         lens planes and between the lens planes."""
-        z_before = 0
-        T_z = 0
+        self._T_ij_list = []
+        self._T_z_list = []
+        self._plane_cache_state = None
         # Sort redshift for vectorized reduced2physical factor calculation
         if len(self._lens_model_list) < 1:
             self._reduced2physical_factor = []
@@ -95,19 +104,13 @@ class MultiPlaneBase(ProfileListBase):
             self._reduced2physical_factor = self._cosmo_bkg.d_xy(
                 0, self._z_source_convention
             ) / self._cosmo_bkg.d_xy(z_sort, z_source_array)
-
-        self._T_ij_list = []
-        self._T_z_list = []
-        for idex in self._sorted_redshift_index:
-            z_lens = self._lens_redshift_list[idex]
-            if z_before == z_lens:
-                delta_T = 0
-            else:
-                T_z = self._cosmo_bkg.T_xy(0, z_lens)
-                delta_T = self._cosmo_bkg.T_xy(z_before, z_lens)
-            self._T_ij_list.append(delta_T)
-            self._T_z_list.append(T_z)
-            z_before = z_lens
+            # distances of all planes evaluated at once
+            z_before = np.append(0, z_sort[:-1])
+            T_z = self._cosmo_bkg.T_xy(0, z_sort)
+            delta_T = self._cosmo_bkg.T_xy(z_before, z_sort)
+            delta_T[z_before == z_sort] = 0
+            self._T_ij_list = list(delta_T)
+            self._T_z_list = list(T_z)
 
     def set_background_cosmo(self, cosmo):
         """Set the cosmology instance of the background class.
@@ -139,6 +142,7 @@ class MultiPlaneBase(ProfileListBase):
         """List of transverse angular diameter distances between the observer and the
         lens planes."""
         self._T_z_list = T_z_list
+        self._plane_cache_state = None
 
     @property
     def T_ij_list(self):
@@ -149,6 +153,7 @@ class MultiPlaneBase(ProfileListBase):
     def T_ij_list(self, T_ij_list):
         """List of transverse angular diameter distances between the lens planes."""
         self._T_ij_list = T_ij_list
+        self._plane_cache_state = None
 
     def ray_shooting_partial_comoving(
         self,
@@ -195,6 +200,51 @@ class MultiPlaneBase(ProfileListBase):
 
         # NOTE: jax arrays are converted back into regular numpy arrays in cases where use_jax is True.
 
+        steps, z_lens_last = self._ray_steps(
+            z_start, z_stop, include_z_start, T_ij_start
+        )
+        if self._plane_cache is True:
+            key = [x, y, alpha_x, alpha_y, z_start, z_stop, include_z_start, T_ij_start]
+            x, y, alpha_x, alpha_y = self._ray_steps_cached(
+                x, y, alpha_x, alpha_y, steps, kwargs_lens, key
+            )
+        else:
+            for i, delta_T in steps:
+                x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+                alpha_x, alpha_y = self._add_deflection(
+                    x, y, alpha_x, alpha_y, kwargs_lens, i
+                )
+        if T_ij_end is None:
+            if z_lens_last == z_stop:
+                delta_T = 0
+            else:
+                delta_T = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
+        else:
+            delta_T = T_ij_end
+        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
+        return np.asarray(x), np.asarray(y), np.asarray(alpha_x), np.asarray(alpha_y)
+
+    def delete_plane_cache(self):
+        """Deletes the cached ray positions and angles at the lens planes (see the
+        plane_cache option).
+
+        :return: None
+        """
+        self._plane_cache_state = None
+
+    def _ray_steps(self, z_start, z_stop, include_z_start, T_ij_start):
+        """Lens models and transverse distances of the ray-tracing steps from z_start to
+        z_stop (see ray_shooting_partial_comoving()).
+
+        :param z_start: redshift of start of computation
+        :param z_stop: redshift where output is computed
+        :param include_z_start: bool, if True, includes the deflection at z_start
+        :param T_ij_start: transverse angular distance between the starting redshift to
+            the first lens plane to follow (or None)
+        :return: list of (index in sorted redshift convention, delta_T) of the steps,
+            redshift of the last deflector
+        """
+        steps = []
         z_lens_last = z_start
         first_deflector = True
         for i, idex in enumerate(self._sorted_redshift_index):
@@ -215,20 +265,76 @@ class MultiPlaneBase(ProfileListBase):
                     first_deflector = False
                 else:
                     delta_T = self._T_ij_list[i]
+                steps.append((i, delta_T))
+                z_lens_last = z_lens
+        return steps, z_lens_last
+
+    def _ray_steps_cached(self, x, y, alpha_x, alpha_y, steps, kwargs_lens, key):
+        """Ray-tracing steps with the cache of the ray positions and angles after each
+        lens plane. The cached planes are re-used up to the first plane with changed
+        keyword arguments (in sorted redshift order) if the rays and the settings of the
+        call (key) are unchanged.
+
+        :param x: co-moving position [Mpc]
+        :param y: co-moving position [Mpc]
+        :param alpha_x: ray angle at z_start [arcsec]
+        :param alpha_y: ray angle at z_start [arcsec]
+        :param steps: ray-tracing steps, see _ray_steps()
+        :param kwargs_lens: lens model keyword argument list
+        :param key: list of the input rays and settings identifying the call
+        :return: co-moving position and angles after the last step
+        """
+        # group the steps into lens planes (steps with zero distance share the plane)
+        planes = []
+        for i, delta_T in steps:
+            if len(planes) == 0 or delta_T != 0:
+                planes.append([])
+            planes[-1].append((i, delta_T))
+
+        cache = self._plane_cache_state
+        if cache is None or not util.kwargs_equal(cache["key"], key):
+            cache = {"key": util.frozen_kwargs(key), "planes": []}
+        cached_planes = cache["planes"]
+        planes_new = []
+        clean = True
+        from_cache = False
+        for p, plane in enumerate(planes):
+            index_list = [i for i, _ in plane]
+            kwargs_plane = [
+                kwargs_lens[self._sorted_redshift_index[i]] for i in index_list
+            ]
+            clean = (
+                clean
+                and p < len(cached_planes)
+                and cached_planes[p]["index"] == index_list
+                and util.kwargs_equal(cached_planes[p]["kwargs"], kwargs_plane)
+            )
+            if clean:
+                planes_new.append(cached_planes[p])
+                x, y, alpha_x, alpha_y = cached_planes[p]["rays"]
+                from_cache = True
+                continue
+            if from_cache is True:
+                # the ray steps are updated in place
+                x, y = np.copy(x), np.copy(y)
+                from_cache = False
+            for i, delta_T in plane:
                 x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
                 alpha_x, alpha_y = self._add_deflection(
                     x, y, alpha_x, alpha_y, kwargs_lens, i
                 )
-                z_lens_last = z_lens
-        if T_ij_end is None:
-            if z_lens_last == z_stop:
-                delta_T = 0
-            else:
-                delta_T = self._cosmo_bkg.T_xy(z_lens_last, z_stop)
-        else:
-            delta_T = T_ij_end
-        x, y = self._ray_step_add(x, y, alpha_x, alpha_y, delta_T)
-        return np.asarray(x), np.asarray(y), np.asarray(alpha_x), np.asarray(alpha_y)
+            planes_new.append(
+                {
+                    "index": index_list,
+                    "kwargs": util.frozen_kwargs(kwargs_plane),
+                    "rays": tuple(np.copy(r) for r in (x, y, alpha_x, alpha_y)),
+                }
+            )
+        if from_cache is True:
+            x, y, alpha_x, alpha_y = [np.copy(r) for r in (x, y, alpha_x, alpha_y)]
+        cache["planes"] = planes_new
+        self._plane_cache_state = cache
+        return x, y, alpha_x, alpha_y
 
     def ray_shooting_partial(
         self,
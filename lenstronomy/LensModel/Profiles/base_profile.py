@@ -1,3 +1,5 @@
+import numpy as np
+
 __all__ = ["LensProfileBase"]
 
 
@@ -62,6 +64,36 @@ class LensProfileBase(object):
             "hessian definition is not defined in the profile you want to execute."
         )
 
+    def derivatives_add(self, x, y, out, **kwargs):
+        """Adds the deflection angles in place to the arrays in out (used in the fused
+        evaluation of SinglePlane). Profiles can overwrite this definition to accumulate
+        without intermediate arrays.
+
+        :param x: x-coordinate(s) as numpy array
+        :param y: y-coordinate(s) as numpy array
+        :param out: tuple of numpy arrays (f_x, f_y) with the shape of x
+        :param kwargs: keywords of the profile
+        :return: None
+        """
+        f_x, f_y = self.derivatives(x, y, **kwargs)
+        np.add(out[0], f_x, out=out[0])
+        np.add(out[1], f_y, out=out[1])
+
+    def hessian_add(self, x, y, out, **kwargs):
+        """Adds the Hessian matrix in place to the arrays in out (used in the fused
+        evaluation of SinglePlane). Profiles can overwrite this definition to accumulate
+        without intermediate arrays.
+
+        :param x: x-coordinate(s) as numpy array
+        :param y: y-coordinate(s) as numpy array
+        :param out: tuple of numpy arrays (f_xx, f_xy, f_yx, f_yy) with the shape of x
+        :param kwargs: keywords of the profile
+        :return: None
+        """
+        hessian = self.hessian(x, y, **kwargs)
+        for out_i, f_i in zip(out, hessian):
+            np.add(out_i, f_i, out=out_i)
+
     def density_lens(self, *args, **kwargs):
         """Computes the density at 3d radius r given lens model parameterization. The
         integral in the LOS projection of this quantity results in the convergence
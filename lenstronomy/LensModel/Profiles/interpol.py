@@ -37,7 +37,7 @@ class Interpol(LensProfileBase):
         """
 
         :param grid: bool, if True, computes the calculation on a grid
-        :param min_grid_number: minimum numbers of positions to compute the interpolation on a grid, otherwise in a loop
+        :param min_grid_number: minimum numbers of positions to compute the interpolation on a grid, otherwise evaluated at the individual positions
         :param kwargs_spline: keyword arguments for the scipy.interpolate.RectBivariateSpline() interpolation (optional)
          if =None, a default linear interpolation is chosen.
         """
@@ -89,12 +89,7 @@ class Interpol(LensProfileBase):
                 )
                 f_out = util.image2array(f_out)
             else:
-                # n = len(x)
-                f_out = np.zeros(n)
-                for i in range(n):
-                    f_out[i] = self.f_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_
-                    )
+                f_out = self.f_interp(x, y, grid_interp_x, grid_interp_y, f_)
         return f_out
 
     def derivatives(
@@ -150,7 +145,6 @@ class Interpol(LensProfileBase):
                 f_x_out = util.image2array(f_x_out)
                 f_y_out = util.image2array(f_y_out)
             else:
-                # n = len(x)
                 f_x_out = self.f_x_interp(x, y, grid_interp_x, grid_interp_y, f_x)
                 f_y_out = self.f_y_interp(x, y, grid_interp_x, grid_interp_y, f_y)
         return f_x_out, f_y_out
@@ -269,63 +263,63 @@ class Interpol(LensProfileBase):
                 f_yy_out = util.image2array(f_yy_out)
                 f_xy_out = util.image2array(f_xy_out)
             else:
-                # n = len(x)
-                f_xx_out, f_yy_out, f_xy_out = np.zeros(n), np.zeros(n), np.zeros(n)
-                for i in range(n):
-                    f_xx_out[i] = self.f_xx_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_xx
-                    )
-                    f_yy_out[i] = self.f_yy_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_yy
-                    )
-                    f_xy_out[i] = self.f_xy_interp(
-                        x[i], y[i], grid_interp_x, grid_interp_y, f_xy
-                    )
+                f_xx_out = self.f_xx_interp(x, y, grid_interp_x, grid_interp_y, f_xx)
+                f_yy_out = self.f_yy_interp(x, y, grid_interp_x, grid_interp_y, f_yy)
+                f_xy_out = self.f_xy_interp(x, y, grid_interp_x, grid_interp_y, f_xy)
         return f_xx_out, f_xy_out, f_xy_out, f_yy_out
 
     def f_interp(self, x, y, x_grid=None, y_grid=None, f_=None, grid=False):
-        if not hasattr(self, "_f_interp"):
-            self._f_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_, **self._kwargs_spline
-            )
-        return self._f_interp(y, x, grid=grid)
+        return self._spline("f", x_grid, y_grid, f_)(y, x, grid=grid)
 
     def f_x_interp(self, x, y, x_grid=None, y_grid=None, f_x=None, grid=False):
-        if not hasattr(self, "_f_x_interp"):
-            self._f_x_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_x, **self._kwargs_spline
-            )
-        return self._f_x_interp(y, x, grid=grid)
+        return self._spline("f_x", x_grid, y_grid, f_x)(y, x, grid=grid)
 
     def f_y_interp(self, x, y, x_grid=None, y_grid=None, f_y=None, grid=False):
-        if not hasattr(self, "_f_y_interp"):
-            self._f_y_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_y, **self._kwargs_spline
-            )
-        return self._f_y_interp(y, x, grid=grid)
+        return self._spline("f_y", x_grid, y_grid, f_y)(y, x, grid=grid)
 
     def f_xx_interp(self, x, y, x_grid=None, y_grid=None, f_xx=None, grid=False):
-        if not hasattr(self, "_f_xx_interp"):
-            self._f_xx_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_xx, **self._kwargs_spline
-            )
-        return self._f_xx_interp(y, x, grid=grid)
+        return self._spline("f_xx", x_grid, y_grid, f_xx)(y, x, grid=grid)
 
     def f_xy_interp(self, x, y, x_grid=None, y_grid=None, f_xy=None, grid=False):
-        if not hasattr(self, "_f_xy_interp"):
-            self._f_xy_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_xy, **self._kwargs_spline
-            )
-        return self._f_xy_interp(y, x, grid=grid)
+        return self._spline("f_xy", x_grid, y_grid, f_xy)(y, x, grid=grid)
 
     def f_yy_interp(self, x, y, x_grid=None, y_grid=None, f_yy=None, grid=False):
-        if not hasattr(self, "_f_yy_interp"):
-            self._f_yy_interp = scipy.interpolate.RectBivariateSpline(
-                y_grid, x_grid, f_yy, **self._kwargs_spline
-            )
-        return self._f_yy_interp(y, x, grid=grid)
+        return self._spline("f_yy", x_grid, y_grid, f_yy)(y, x, grid=grid)
+
+    def _spline(self, name, x_grid, y_grid, f):
+        """Spline interpolation of a map. The spline is created once per map and re-used
+        as long as the same (identical or equal) grids and map are passed. Splines set
+        with do_interp() are used irrespective of the grids passed.
+
+        :param name: name of the interpolated map ('f', 'f_x', 'f_y', 'f_xx', 'f_xy' or
+            'f_yy')
+        :param x_grid: numpy array (ascending) of the x-direction of the grid
+        :param y_grid: numpy array (ascending) of the y-direction of the grid
+        :param f: 2d numpy array of the map, matching the grids
+        :return: scipy.interpolate.RectBivariateSpline instance
+        """
+        attr = "_" + name + "_interp"
+        grids = (x_grid, y_grid, f)
+        key = getattr(self, attr + "_grids", None)
+        if hasattr(self, attr):
+            if f is None or key is None:
+                return getattr(self, attr)
+            if all(a is b for a, b in zip(key, grids)):
+                return getattr(self, attr)
+            if all(_array_equal(a, b) for a, b in zip(key, grids)):
+                # equal maps in a new object (e.g. deep-copied keyword arguments)
+                setattr(self, attr + "_grids", grids)
+                return getattr(self, attr)
+        spline = scipy.interpolate.RectBivariateSpline(
+            y_grid, x_grid, f, **self._kwargs_spline
+        )
+        setattr(self, attr, spline)
+        setattr(self, attr + "_grids", grids)
+        return spline
 
     def do_interp(self, x_grid, y_grid, f_, f_x, f_y, f_xx=None, f_yy=None, f_xy=None):
+        for name in ["f", "f_x", "f_y", "f_xx", "f_xy", "f_yy"]:
+            setattr(self, "_" + name + "_interp_grids", None)
         self._f_interp = scipy.interpolate.RectBivariateSpline(
             x_grid, y_grid, f_, **self._kwargs_spline
         )
@@ -349,6 +343,18 @@ class Interpol(LensProfileBase):
             )
 
 
+def _array_equal(a, b):
+    """
+
+    :param a: numpy array or None
+    :param b: numpy array or None
+    :return: bool, True if both are None or the arrays have the same shape and values
+    """
+    if a is None or b is None:
+        return a is b
+    return np.shape(a) == np.shape(b) and np.array_equal(a, b)
+
+
 class InterpolScaled(LensProfileBase):
     """Class for handling an interpolated lensing map and has the freedom to scale its
     lensing effect.
@@ -60,6 +60,32 @@ class PointMass(LensProfileBase):
         alpha = theta_E**2 / r
         return alpha * x_ / r, alpha * y_ / r
 
+    def derivatives_add(self, x, y, out, theta_E, center_x=0, center_y=0):
+        """Adds the deflection angles in place to out, see
+        LensProfileBase.derivatives_add()
+
+        :param x: x-coord (in angles)
+        :param y: y-coord (in angles)
+        :param out: tuple of numpy arrays (f_x, f_y) with the shape of x
+        :param theta_E: Einstein radius (in angles)
+        :return: None
+        """
+        if np.ndim(x) == 0:
+            return super(PointMass, self).derivatives_add(
+                x, y, out, theta_E=theta_E, center_x=center_x, center_y=center_y
+            )
+        x_ = np.subtract(x, center_x, dtype=float)
+        y_ = np.subtract(y, center_y, dtype=float)
+        # theta_E**2 / r**2 with r >= r_min
+        r2 = np.multiply(x_, x_)
+        r2 += np.square(y_)
+        np.maximum(r2, self.r_min**2, out=r2)
+        np.divide(theta_E**2, r2, out=r2)
+        x_ *= r2
+        y_ *= r2
+        np.add(out[0], x_, out=out[0])
+        np.add(out[1], y_, out=out[1])
+
     def hessian(self, x, y, theta_E, center_x=0, center_y=0):
         """
 
@@ -83,6 +109,38 @@ class PointMass(LensProfileBase):
         f_xy = -C * 2 * x_ * y_ / r2**2
         return f_xx, f_xy, f_xy, f_yy
 
+    def hessian_add(self, x, y, out, theta_E, center_x=0, center_y=0):
+        """Adds the hessian matrix in place to out, see LensProfileBase.hessian_add()
+
+        :param x: x-coord (in angles)
+        :param y: y-coord (in angles)
+        :param out: tuple of numpy arrays (f_xx, f_xy, f_yx, f_yy) with the shape of x
+        :param theta_E: Einstein radius (in angles)
+        :return: None
+        """
+        if np.ndim(x) == 0:
+            return super(PointMass, self).hessian_add(
+                x, y, out, theta_E=theta_E, center_x=center_x, center_y=center_y
+            )
+        x_ = np.subtract(x, center_x, dtype=float)
+        y_ = np.subtract(y, center_y, dtype=float)
+        x2 = np.square(x_)
+        y2 = np.square(y_)
+        # C / r**4 with r**2 >= r_min**2
+        prefac = x2 + y2
+        np.maximum(prefac, self.r_min**2, out=prefac)
+        np.square(prefac, out=prefac)
+        np.divide(theta_E**2, prefac, out=prefac)
+        y2 -= x2
+        y2 *= prefac
+        x_ *= y_
+        x_ *= prefac
+        x_ *= -2
+        np.add(out[0], y2, out=out[0])
+        np.add(out[1], x_, out=out[1])
+        np.add(out[2], x_, out=out[2])
+        np.subtract(out[3], y2, out=out[3])
+
     def mass_3d_lens(self, r, theta_E):
         """Mass enclosed within a 3d sphere of radius r, however it is just the point
         mass (in angular units).
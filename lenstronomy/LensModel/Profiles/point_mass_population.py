@@ -0,0 +1,116 @@
+__author__ = "sibirrer"
+
+# this file contains a class to compute the summed lensing quantities of a large number of point masses
+# (e.g. a microlensing star field) with a multipole tree code
+
+import numpy as np
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Util.multipole_tree import MultipoleTree
+
+__all__ = ["PointMassPopulation"]
+
+
+class PointMassPopulation(LensProfileBase):
+    """This class computes the summed lensing quantities of a population of point masses
+    (see the PointMass class for the individual profile) with a Barnes-Hut tree code and
+    multipole expansions of distant groups (see MultipoleTree). The Einstein radii and
+    positions are passed as arrays (one entry per point mass). The tree is built at the
+    first call and re-used as long as the parameters do not change.
+
+    The accuracy is set by the opening angle and the order of the multipole expansion.
+    For opening_angle=0, the exact sum is evaluated (with the same result as the
+    corresponding list of 'POINT_MASS' profiles).
+
+    The array-valued parameters are meant to be held fixed (kwargs_fixed) when used in a
+    fit.
+    """
+
+    profile_name = "POINT_MASS_POPULATION"
+    param_names = ["theta_E", "center_x", "center_y"]
+    lower_limit_default = {"theta_E": 0, "center_x": -100, "center_y": -100}
+    upper_limit_default = {"theta_E": 100, "center_x": 100, "center_y": 100}
+
+    def __init__(
+        self, opening_angle=0.5, multipole_order=10, leaf_size=16, num_ray_batch=4096
+    ):
+        """
+
+        :param opening_angle: accuracy parameter of the tree code; a group of point
+            masses of radius r_c at distance d is approximated by its multipole
+            expansion if r_c < opening_angle * d
+        :param multipole_order: order of the multipole expansion
+        :param leaf_size: maximum number of point masses in a leaf of the tree
+        :param num_ray_batch: number of rays traversing the tree at once
+        """
+        self._kwargs_tree = {
+            "opening_angle": opening_angle,
+            "multipole_order": multipole_order,
+            "leaf_size": leaf_size,
+            "num_ray_batch": num_ray_batch,
+            "r_min": 10 ** (-25),
+        }
+        self._tree = None
+        self._kwargs_tree_params = None
+        super(PointMassPopulation, self).__init__()
+
+    def function(self, x, y, theta_E, center_x=0, center_y=0):
+        """
+
+        :param x: x-coord (in angles)
+        :param y: y-coord (in angles)
+        :param theta_E: array of Einstein radii (in angles)
+        :param center_x: array of x-positions of the point masses
+        :param center_y: array of y-positions of the point masses
+        :return: lensing potential
+        """
+        tree = self._get_tree(theta_E, center_x, center_y)
+        return tree.potential(x, y)
+
+    def derivatives(self, x, y, theta_E, center_x=0, center_y=0):
+        """
+
+        :param x: x-coord (in angles)
+        :param y: y-coord (in angles)
+        :param theta_E: array of Einstein radii (in angles)
+        :param center_x: array of x-positions of the point masses
+        :param center_y: array of y-positions of the point masses
+        :return: deflection angle (in angles)
+        """
+        tree = self._get_tree(theta_E, center_x, center_y)
+        return tree.alpha(x, y)
+
+    def hessian(self, x, y, theta_E, center_x=0, center_y=0):
+        """
+
+        :param x: x-coord (in angles)
+        :param y: y-coord (in angles)
+        :param theta_E: array of Einstein radii (in angles)
+        :param center_x: array of x-positions of the point masses
+        :param center_y: array of y-positions of the point masses
+        :return: hessian matrix (in angles)
+        """
+        tree = self._get_tree(theta_E, center_x, center_y)
+        return tree.hessian(x, y)
+
+    def _get_tree(self, theta_E, center_x, center_y):
+        """Returns the tree of the point masses; re-built only when the parameters
+        changed since the previous call.
+
+        :param theta_E: array of Einstein radii (in angles)
+        :param center_x: array of x-positions of the point masses
+        :param center_y: array of y-positions of the point masses
+        :return: MultipoleTree instance
+        """
+        theta_E = np.atleast_1d(np.asarray(theta_E, dtype=float))
+        center_x = np.atleast_1d(np.asarray(center_x, dtype=float))
+        center_y = np.atleast_1d(np.asarray(center_y, dtype=float))
+        params = np.broadcast_arrays(theta_E, center_x, center_y)
+        if self._tree is not None and all(
+            np.array_equal(p, p_) for p, p_ in zip(params, self._kwargs_tree_params)
+        ):
+            return self._tree
+        self._tree = MultipoleTree(
+            params[1], params[2], params[0] ** 2, **self._kwargs_tree
+        )
+        self._kwargs_tree_params = [np.copy(p) for p in params]
+        return self._tree
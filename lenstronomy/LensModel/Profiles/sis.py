@@ -42,6 +42,25 @@ class SIS(LensProfileBase):
         f_y = a * y_shift
         return f_x, f_y
 
+    def derivatives_add(self, x, y, out, theta_E, center_x=0, center_y=0):
+        """Adds df/dx and df/dy in place to out, see
+        LensProfileBase.derivatives_add()"""
+        if np.ndim(x) == 0:
+            return super(SIS, self).derivatives_add(
+                x, y, out, theta_E=theta_E, center_x=center_x, center_y=center_y
+            )
+        x_shift = np.subtract(x, center_x, dtype=float)
+        y_shift = np.subtract(y, center_y, dtype=float)
+        a = np.square(x_shift)
+        a += np.square(y_shift)
+        np.sqrt(a, out=a)
+        # theta_E / R with the deflection set to zero at R = 0
+        np.divide(theta_E, a, out=a, where=a > 0)
+        x_shift *= a
+        y_shift *= a
+        np.add(out[0], x_shift, out=out[0])
+        np.add(out[1], y_shift, out=out[1])
+
     def hessian(self, x, y, theta_E, center_x=0, center_y=0):
         """Returns Hessian matrix of function d^2f/dx^2, d^2/dxdy, d^2/dydx,
         d^f/dy^2."""
@@ -61,6 +80,29 @@ class SIS(LensProfileBase):
         f_xy = -x_shift * y_shift * prefac
         return f_xx, f_xy, f_xy, f_yy
 
+    def hessian_add(self, x, y, out, theta_E, center_x=0, center_y=0):
+        """Adds the Hessian matrix in place to out, see LensProfileBase.hessian_add()"""
+        if np.ndim(x) == 0:
+            return super(SIS, self).hessian_add(
+                x, y, out, theta_E=theta_E, center_x=center_x, center_y=center_y
+            )
+        x_shift = np.subtract(x, center_x, dtype=float)
+        y_shift = np.subtract(y, center_y, dtype=float)
+        prefac = np.square(x_shift)
+        prefac += np.square(y_shift)
+        prefac **= 1.5
+        np.divide(theta_E, prefac, out=prefac, where=prefac > 0)
+        f_ii = np.square(y_shift)
+        f_ii *= prefac
+        np.add(out[0], f_ii, out=out[0])
+        np.square(x_shift, out=f_ii)
+        f_ii *= prefac
+        np.add(out[3], f_ii, out=out[3])
+        x_shift *= y_shift
+        x_shift *= prefac
+        np.subtract(out[1], x_shift, out=out[1])
+        np.subtract(out[2], x_shift, out=out[2])
+
     @staticmethod
     def rho2theta(rho0):
         """Converts 3d density into 2d projected density parameter :param rho0:
@@ -0,0 +1,300 @@
+__author__ = "sibirrer"
+
+# this file contains a class to compute the summed lensing quantities of a population of truncated NFW halos
+# (e.g. a subhalo population) in a single vectorized evaluation
+
+import numpy as np
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.tnfw import TNFW
+
+__all__ = ["TNFWPopulation"]
+
+
+class TNFWPopulation(LensProfileBase):
+    """This class computes the summed lensing quantities of a population of truncated
+    NFW profiles (see the TNFW class for the definition of the individual profile). All
+    halo parameters are passed as arrays of the same length (one entry per halo) and the
+    sum over the halos is evaluated on the (n_halo, n_pixel) product in vectorized form.
+    To bound the memory, the halos are processed in tiles such that at most max_elements
+    halo-pixel pairs are held in memory at a time.
+
+    Replacing N individual 'TNFW' entries in the lens model list by one
+    'TNFW_POPULATION' entry removes the per-profile Python overhead, which dominates the
+    evaluation time for populations of hundreds to thousands of subhalos.
+
+    The array-valued parameters are meant to be held fixed (kwargs_fixed) when used in a
+    fit.
+    """
+
+    profile_name = "TNFW_POPULATION"
+    param_names = ["Rs", "alpha_Rs", "r_trunc", "center_x", "center_y"]
+    lower_limit_default = {
+        "Rs": 0,
+        "alpha_Rs": 0,
+        "r_trunc": 0,
+        "center_x": -100,
+        "center_y": -100,
+    }
+    upper_limit_default = {
+        "Rs": 100,
+        "alpha_Rs": 10,
+        "r_trunc": 100,
+        "center_x": 100,
+        "center_y": 100,
+    }
+
+    def __init__(self, max_elements=2**15):
+        """
+
+        :param max_elements: maximum number of halo-pixel pairs evaluated at once
+            (sets the tile size in the halo direction)
+        """
+        self._tnfw = TNFW()
+        self._s = self._tnfw._s
+        self._max_elements = int(max_elements)
+        super(TNFWPopulation, self).__init__()
+
+    def function(self, x, y, Rs, alpha_Rs, r_trunc, center_x=0, center_y=0):
+        """Lensing potential summed over the population.
+
+        :param x: angular position
+        :param y: angular position
+        :param Rs: array of angular turn over points
+        :param alpha_Rs: array of deflections at Rs
+        :param r_trunc: array of truncation radii
+        :param center_x: array of halo centers
+        :param center_y: array of halo centers
+        :return: lensing potential
+        """
+        shape = np.shape(x)
+        f_ = np.zeros(np.size(x))
+        for x_, y_, Rs_, rho0_, tau_ in self._tiles(
+            x, y, Rs, alpha_Rs, r_trunc, center_x, center_y
+        ):
+            R = np.maximum(np.sqrt(x_**2 + y_**2), self._s * Rs_)
+            X = np.maximum(R / Rs_, self._s)
+            hx = self._tnfw._h(X, tau_)
+            f_ += np.sum(2 * rho0_ * Rs_**3 * hx, axis=0)
+        return _reshape(f_, shape)
+
+    def derivatives(self, x, y, Rs, alpha_Rs, r_trunc, center_x=0, center_y=0):
+        """Deflection angles summed over the population.
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param Rs: array of turn over points in the slope of the NFW profile in angular
+            unit
+        :param alpha_Rs: array of deflections (angular units) at projected Rs
+        :param r_trunc: array of truncation radii (angular units)
+        :param center_x: array of halo centers (in angular units)
+        :param center_y: array of halo centers (in angular units)
+        :return: deflection angle in x, deflection angle in y
+        """
+        shape = np.shape(x)
+        f_x, f_y = np.zeros(np.size(x)), np.zeros(np.size(x))
+        self._alpha_sum(x, y, (f_x, f_y), Rs, alpha_Rs, r_trunc, center_x, center_y)
+        return _reshape(f_x, shape), _reshape(f_y, shape)
+
+    def derivatives_add(self, x, y, out, Rs, alpha_Rs, r_trunc, center_x=0, center_y=0):
+        """Adds the deflection angles in place to out, see
+        LensProfileBase.derivatives_add()
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param out: tuple of numpy arrays (f_x, f_y) with the shape of x
+        :param Rs: array of turn over points in the slope of the NFW profile in angular
+            unit
+        :param alpha_Rs: array of deflections (angular units) at projected Rs
+        :param r_trunc: array of truncation radii (angular units)
+        :param center_x: array of halo centers (in angular units)
+        :param center_y: array of halo centers (in angular units)
+        :return: None
+        """
+        f_x, f_y = np.zeros(np.size(x)), np.zeros(np.size(x))
+        self._alpha_sum(x, y, (f_x, f_y), Rs, alpha_Rs, r_trunc, center_x, center_y)
+        for out_i, f_i in zip(out, (f_x, f_y)):
+            np.add(out_i, f_i.reshape(np.shape(out_i)), out=out_i)
+
+    def hessian(self, x, y, Rs, alpha_Rs, r_trunc, center_x=0, center_y=0):
+        """Hessian matrix summed over the population.
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param Rs: array of turn over points in the slope of the NFW profile in angular
+            unit
+        :param alpha_Rs: array of deflections (angular units) at projected Rs
+        :param r_trunc: array of truncation radii (angular units)
+        :param center_x: array of halo centers (in angular units)
+        :param center_y: array of halo centers (in angular units)
+        :return: Hessian matrix of function d^2f/dx^2, d^2f/dxdy, d^2f/dydx, d^f/dy^2
+        """
+        shape = np.shape(x)
+        f_xx, f_xy, f_yy = [np.zeros(np.size(x)) for _ in range(3)]
+        self._hessian_sum(
+            x, y, (f_xx, f_xy, f_yy), Rs, alpha_Rs, r_trunc, center_x, center_y
+        )
+        f_xx, f_xy, f_yy = [_reshape(f, shape) for f in (f_xx, f_xy, f_yy)]
+        return f_xx, f_xy, f_xy, f_yy
+
+    def hessian_add(self, x, y, out, Rs, alpha_Rs, r_trunc, center_x=0, center_y=0):
+        """Adds the Hessian matrix in place to out, see LensProfileBase.hessian_add()
+
+        :param x: angular position (normally in units of arc seconds)
+        :param y: angular position (normally in units of arc seconds)
+        :param out: tuple of numpy arrays (f_xx, f_xy, f_yx, f_yy) with the shape of x
+        :param Rs: array of turn over points in the slope of the NFW profile in angular
+            unit
+        :param alpha_Rs: array of deflections (angular units) at projected Rs
+        :param r_trunc: array of truncation radii (angular units)
+        :param center_x: array of halo centers (in angular units)
+        :param center_y: array of halo centers (in angular units)
+        :return: None
+        """
+        f_xx, f_xy, f_yy = [np.zeros(np.size(x)) for _ in range(3)]
+        self._hessian_sum(
+            x, y, (f_xx, f_xy, f_yy), Rs, alpha_Rs, r_trunc, center_x, center_y
+        )
+        for out_i, f_i in zip(out, (f_xx, f_xy, f_xy, f_yy)):
+            np.add(out_i, f_i.reshape(np.shape(out_i)), out=out_i)
+
+    def _alpha_sum(self, x, y, out, Rs, alpha_Rs, r_trunc, center_x, center_y):
+        """Accumulates the deflection angles of all halos into the flat arrays in out.
+
+        :param out: tuple of flat numpy arrays (f_x, f_y) of size of x
+        :return: None
+        """
+        f_x, f_y = out
+        for x_, y_, Rs_, rho0_, tau_ in self._tiles(
+            x, y, Rs, alpha_Rs, r_trunc, center_x, center_y
+        ):
+            R = np.maximum(np.sqrt(x_**2 + y_**2), self._s * Rs_)
+            X = np.maximum(R / Rs_, self._s)
+            gx = self._g(X, tau_, self._nfw_F(X), self._tnfw._L(X, tau_))
+            a = 4 * rho0_ * Rs_ * gx / X**2
+            f_x += np.sum(a * x_, axis=0)
+            f_y += np.sum(a * y_, axis=0)
+
+    def _hessian_sum(self, x, y, out, Rs, alpha_Rs, r_trunc, center_x, center_y):
+        """Accumulates the independent Hessian components of all halos into the flat
+        arrays in out.
+
+        :param out: tuple of flat numpy arrays (f_xx, f_xy, f_yy) of size of x
+        :return: None
+        """
+        f_xx, f_xy, f_yy = out
+        for x_, y_, Rs_, rho0_, tau_ in self._tiles(
+            x, y, Rs, alpha_Rs, r_trunc, center_x, center_y
+        ):
+            R = np.maximum(np.sqrt(x_**2 + y_**2), self._s * Rs_)
+            X = np.maximum(R / Rs_, self._s)
+            Fx = self._nfw_F(X)
+            Lx = self._tnfw._L(X, tau_)
+            F_tau = self._F(X, tau_, Fx, Lx)
+            kappa = 2 * rho0_ * Rs_ * F_tau
+            gx = self._g(X, tau_, Fx, Lx)
+            a = 2 * rho0_ * Rs_ * (2 * gx / X**2 - F_tau) / R**2
+            gamma1 = a * (y_**2 - x_**2)
+            f_xx += np.sum(kappa + gamma1, axis=0)
+            f_yy += np.sum(kappa - gamma1, axis=0)
+            f_xy -= np.sum(2 * a * x_ * y_, axis=0)
+
+    def _tiles(self, x, y, Rs, alpha_Rs, r_trunc, center_x, center_y):
+        """Generator over tiles of halos; yields the coordinates relative to the halo
+        centers with shape (n_tile, n_pixel) and the halo parameters with shape (n_tile,
+        1).
+
+        :return: x_, y_, Rs, rho0, tau of the tile
+        """
+        x = np.ravel(np.asarray(x, dtype=float))
+        y = np.ravel(np.asarray(y, dtype=float))
+        Rs = np.atleast_1d(np.asarray(Rs, dtype=float))
+        alpha_Rs = np.atleast_1d(np.asarray(alpha_Rs, dtype=float))
+        r_trunc = np.atleast_1d(np.asarray(r_trunc, dtype=float))
+        num_halo = len(Rs)
+        center_x = np.broadcast_to(np.asarray(center_x, dtype=float), (num_halo,))
+        center_y = np.broadcast_to(np.asarray(center_y, dtype=float), (num_halo,))
+        if not len(alpha_Rs) == len(r_trunc) == num_halo:
+            raise ValueError(
+                "Rs, alpha_Rs and r_trunc need to have the same length, got %s, %s "
+                "and %s." % (num_halo, len(alpha_Rs), len(r_trunc))
+            )
+        rho0 = self._tnfw.alpha2rho0(alpha_Rs=alpha_Rs, Rs=Rs)
+        tau = r_trunc / Rs
+        num_tile = max(1, self._max_elements // max(len(x), 1))
+        for i in range(0, num_halo, num_tile):
+            s = slice(i, i + num_tile)
+            yield (
+                x[None, :] - center_x[s, None],
+                y[None, :] - center_y[s, None],
+                Rs[s, None],
+                rho0[s, None],
+                tau[s, None],
+            )
+
+    @staticmethod
+    def _nfw_F(x):
+        """Same as TNFW.F() for arrays, evaluated with both branches in place of index
+        masks (which are slow on the two-dimensional tiles).
+
+        :param x: R/Rs (>= TNFW._s)
+        :return: NFW function F(x)
+        """
+        s = np.sqrt(np.abs(x**2 - 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nfwvals = np.where(x < 1, np.arctanh(s), np.arctan(s)) / s
+        nfwvals[x == 1] = 1
+        return nfwvals
+
+    @staticmethod
+    def _g(x, tau, Fx, Lx):
+        """Same as TNFW._g() with the NFW function F(x) and the logarithm L(x, tau) pre-
+        computed and broadcasting support for an array of tau.
+
+        :param x: R/Rs (>= TNFW._s)
+        :param tau: r_trunc/Rs
+        :param Fx: TNFW.F(x)
+        :param Lx: TNFW._L(x, tau)
+        """
+        t2 = tau**2
+        return (
+            t2
+            * (t2 + 1) ** -2
+            * (
+                (t2 + 1 + 2 * (x**2 - 1)) * Fx
+                + tau * np.pi
+                + (t2 - 1) * np.log(tau)
+                + np.sqrt(t2 + x**2) * (-np.pi + Lx * (t2 - 1) / tau)
+            )
+        )
+
+    @staticmethod
+    def _F(x, tau, Fx, Lx):
+        """Same as TNFW._F() with the NFW function F(x) and the logarithm L(x, tau) pre-
+        computed and broadcasting support for an array of tau.
+
+        :param x: R/Rs (>= TNFW._s)
+        :param tau: r_trunc/Rs
+        :param Fx: TNFW.F(x)
+        :param Lx: TNFW._L(x, tau)
+        """
+        t2 = tau**2
+        a = t2 * (t2 + 1) ** -2
+        x2_1 = np.where(x == 1, 1, x**2 - 1)
+        b = (t2 + 1) * np.where(x == 1, 1.0 / 3, (1 - Fx) / x2_1)
+        sqrt_t2_x2 = np.sqrt(t2 + x**2)
+        d = -np.pi / sqrt_t2_x2
+        e = (t2 - 1) / (tau * sqrt_t2_x2) * Lx
+        return a * (b + 2 * Fx + d + e)
+
+
+def _reshape(f, shape):
+    """Returns the flat array f in the shape of the input coordinates (a float for
+    scalar input).
+
+    :param f: flat numpy array
+    :param shape: shape of the input coordinates
+    :return: f in shape
+    """
+    if shape == ():
+        return f[0]
+    return f.reshape(shape)
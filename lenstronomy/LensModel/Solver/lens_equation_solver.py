@@ -5,6 +5,7 @@ import lenstronomy.Util.util as util
 import lenstronomy.Util.image_util as image_util
 from scipy.optimize import minimize
 from lenstronomy.LensModel.Solver.epl_shear_solver import solve_lenseq_pemd
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["LensEquationSolver"]
 
@@ -30,6 +31,8 @@ class LensEquationSolver(object):
             lenstronomy.LensModel.lens_model
         """
         self.lensModel = lensModel
+        self._z_source = None
+        self.delete_warm_start_cache()
 
     def change_source_redshift(self, z_source=None):
         """Change source redshift in solver.
@@ -38,8 +41,19 @@ class LensEquationSolver(object):
         :type z_source: float or None
         :return: updated lens model instance
         """
+        if z_source != self._z_source:
+            self.delete_warm_start_cache()
+            self._z_source = z_source
         self.lensModel.change_source_redshift(z_source=z_source)
 
+    def delete_warm_start_cache(self):
+        """Deletes the image positions saved for warm-starting the lens equation solver
+        (see image_position_lenstronomy() with warm_start=True).
+
+        :return: None
+        """
+        self._warm_start_cache = None
+
     def image_position_stochastic(
         self,
         source_x,
@@ -122,10 +136,15 @@ class LensEquationSolver(object):
         verbose=False,
         x_center=0,
         y_center=0,
+        quadtree=False,
     ):
         """Finds pixels in the image plane possibly hosting a solution of the lens
         equation, for the given source position and lens model.
 
+        With quadtree=True, the search starts on a coarse grid and only subdivides cells
+        whose (linearized) mapping into the source plane can contain the source
+        position. The final resolution is min_distance, as for the uniform grid.
+
         :param sourcePos_x: source position in units of angle
         :param sourcePos_y: source position in units of angle
         :param kwargs_lens: lens model parameters as keyword arguments
@@ -136,6 +155,8 @@ class LensEquationSolver(object):
         :param verbose: bool, if True, prints some useful information for the user
         :param x_center: float, center of the window to search for point sources
         :param y_center: float, center of the window to search for point sources
+        :param quadtree: bool, if True, performs a hierarchical (quadtree) search
+            instead of ray-shooting the full grid
         :returns: (approximate) angular position of (multiple) images ra_pos, dec_pos in
             units of angles, related ray-traced source displacements and pixel width
         :raises: AttributeError, KeyError
@@ -143,6 +164,16 @@ class LensEquationSolver(object):
         kwargs_lens = self.lensModel.set_static(kwargs_lens)
         # compute number of pixels to cover the search window with the required min_distance
         numPix = int(round(search_window / min_distance) + 0.5)
+        if quadtree:
+            return self._candidate_solutions_quadtree(
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                numPix,
+                min_distance,
+                x_center,
+                y_center,
+            )
         x_grid, y_grid = util.make_grid(numPix, min_distance)
         x_grid += x_center
         y_grid += y_center
@@ -157,6 +188,78 @@ class LensEquationSolver(object):
 
         return x_mins, y_mins, delta_map, pixel_width
 
+    def _candidate_solutions_quadtree(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        numPix,
+        min_distance,
+        x_center,
+        y_center,
+        num_pix_start=16,
+        safety_factor=2,
+    ):
+        """Hierarchical candidate search. Cells are refined by a factor of 2 per level
+        until the resolution of min_distance is reached. A cell is refined only if the
+        source position lies within the source-plane extent of the cell, estimated from
+        the largest singular value of the lensing Jacobian at the cell center (times a
+        safety factor accounting for the variation of the Jacobian within the cell).
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param numPix: number of pixels per axis of the finest grid covering the search
+            window
+        :param min_distance: resolution of the finest grid
+        :param x_center: float, center of the window to search for point sources
+        :param y_center: float, center of the window to search for point sources
+        :param num_pix_start: minimum number of cells per axis of the coarsest grid
+        :param safety_factor: factor applied on the linearized source-plane extent of a
+            cell
+        :return: same as candidate_solutions()
+        """
+        num_levels = max(int(np.floor(np.log2(numPix / num_pix_start))), 0)
+        numPix_coarse = int(np.ceil(numPix / 2**num_levels))
+        numPix_fine = numPix_coarse * 2**num_levels
+        cell_size = min_distance * 2**num_levels
+        x_cells, y_cells = util.make_grid(numPix_coarse, cell_size)
+        x_cells += x_center
+        y_cells += y_center
+        for _ in range(num_levels):
+            x_mapped, y_mapped = self.lensModel.ray_shooting(
+                x_cells, y_cells, kwargs_lens
+            )
+            f_xx, f_xy, f_yx, f_yy = self.lensModel.hessian(
+                x_cells, y_cells, kwargs_lens
+            )
+            sigma_max = _max_singular_value(1 - f_xx, -f_xy, -f_yx, 1 - f_yy)
+            delta = util.displaceAbs(x_mapped, y_mapped, sourcePos_x, sourcePos_y)
+            # half of the cell diagonal mapped into the source plane
+            select = delta <= safety_factor * sigma_max * cell_size / np.sqrt(2)
+            x_cells, y_cells = x_cells[select], y_cells[select]
+            cell_size /= 2.0
+            offset = cell_size / 2.0
+            x_cells = np.concatenate(
+                [x_cells - offset, x_cells + offset, x_cells - offset, x_cells + offset]
+            )
+            y_cells = np.concatenate(
+                [y_cells - offset, y_cells - offset, y_cells + offset, y_cells + offset]
+            )
+        x_mapped, y_mapped = self.lensModel.ray_shooting(x_cells, y_cells, kwargs_lens)
+        # place the finest cells on the full grid, leaving un-refined cells at infinity
+        x_grid, y_grid = util.make_grid(numPix_fine, min_distance)
+        x_grid += x_center
+        y_grid += y_center
+        absmapped = np.full(numPix_fine**2, np.inf)
+        i = np.round((x_cells - x_grid[0]) / min_distance).astype(int)
+        j = np.round((y_cells - y_grid[0]) / min_distance).astype(int)
+        absmapped[j * numPix_fine + i] = util.displaceAbs(
+            x_mapped, y_mapped, sourcePos_x, sourcePos_y
+        )
+        x_mins, y_mins, delta_map = util.local_minima_2d(absmapped, x_grid, y_grid)
+        return x_mins, y_mins, delta_map, min_distance
+
     def image_position_analytical(
         self,
         x,
@@ -245,6 +348,7 @@ class LensEquationSolver(object):
             y_mins = y_mins[mag >= magnification_limit]
         return x_mins, y_mins
 
+    @timed
     def image_position_from_source(
         self, sourcePos_x, sourcePos_y, kwargs_lens, solver="lenstronomy", **kwargs
     ):
@@ -293,12 +397,23 @@ class LensEquationSolver(object):
         num_random=0,
         non_linear=False,
         magnification_limit=None,
+        warm_start=False,
+        warm_start_tolerance=0.001,
+        quadtree=False,
     ):
         """Finds image position  given source position and lens model. The solver first
         samples does a grid search in the lens plane, and the grid points that are
         closest to the supplied source position are fed to a specialized gradient-based
         root finder that finds the exact solutions. Works with all lens models.
 
+        With warm_start=True, the solutions of the previous call are used as starting
+        points of the root finder (without grid search) if the source position and all
+        the lens model parameters differ by less than warm_start_tolerance from the
+        last call that performed the full grid search. The grid search is performed
+        when any of the warm-started solutions fails the required precision or two of
+        them merge. Note that images appearing within the tolerance (e.g. a source
+        crossing a caustic) are not found in the warm-started calls.
+
         :param sourcePos_x: source position in units of angle
         :param sourcePos_y: source position in units of angle
         :param kwargs_lens: lens model parameters as keyword arguments
@@ -323,10 +438,41 @@ class LensEquationSolver(object):
             Hessian computation
         :param magnification_limit: None or float, if set will only return image
             positions that have an abs(magnification) larger than this number
+        :param warm_start: bool, if True, re-uses the solutions of the previous call as
+            starting points of the root finder when the source position and lens model
+            changed by less than warm_start_tolerance
+        :param warm_start_tolerance: maximum absolute difference in the source position
+            and each lens model parameter (in their respective units) to the last full
+            grid search for which the warm start is applied
+        :param quadtree: bool, if True, uses the hierarchical (quadtree) grid search
+            (see candidate_solutions())
         :returns: (exact) angular position of (multiple) images ra_pos, dec_pos in units
             of angle
         :raises: AttributeError, KeyError
         """
+        if warm_start:
+            settings = (
+                min_distance,
+                search_window,
+                precision_limit,
+                num_iter_max,
+                x_center,
+                y_center,
+                non_linear,
+                quadtree,
+            )
+            x_mins, y_mins = self._warm_start_solutions(
+                sourcePos_x,
+                sourcePos_y,
+                kwargs_lens,
+                settings,
+                warm_start_tolerance,
+                verbose=verbose,
+            )
+            if x_mins is not None:
+                return self._select_image_positions(
+                    x_mins, y_mins, kwargs_lens, arrival_time_sort, magnification_limit
+                )
         # find pixels in the image plane possibly hosting a solution of the lens equation, related source distances and
         # pixel width
         x_mins, y_mins, delta_map, pixel_width = self.candidate_solutions(
@@ -338,6 +484,7 @@ class LensEquationSolver(object):
             verbose,
             x_center,
             y_center,
+            quadtree=quadtree,
         )
         if verbose:
             print(
@@ -391,6 +538,32 @@ class LensEquationSolver(object):
         y_mins = y_mins[solver_precision <= precision_limit]
         # find redundant solutions within the min_distance criterion
         x_mins, y_mins = image_util.findOverlap(x_mins, y_mins, min_distance)
+        if warm_start:
+            self._warm_start_cache = {
+                "settings": settings,
+                "source_x": sourcePos_x,
+                "source_y": sourcePos_y,
+                "kwargs_lens": copy.deepcopy(kwargs_lens),
+                "x_image": x_mins,
+                "y_image": y_mins,
+            }
+        return self._select_image_positions(
+            x_mins, y_mins, kwargs_lens, arrival_time_sort, magnification_limit
+        )
+
+    def _select_image_positions(
+        self, x_mins, y_mins, kwargs_lens, arrival_time_sort, magnification_limit
+    ):
+        """Sorts the solutions of the lens equation and applies the magnification limit.
+
+        :param x_mins: x-coordinates of the solutions
+        :param y_mins: y-coordinates of the solutions
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param arrival_time_sort: bool, if True, sorts image position in arrival time
+        :param magnification_limit: None or float, if set will only return image
+            positions that have an abs(magnification) larger than this number
+        :return: x_mins, y_mins
+        """
         if arrival_time_sort:
             x_mins, y_mins = self.sort_arrival_times(x_mins, y_mins, kwargs_lens)
         if magnification_limit is not None:
@@ -400,6 +573,65 @@ class LensEquationSolver(object):
         self.lensModel.set_dynamic()
         return x_mins, y_mins
 
+    def _warm_start_solutions(
+        self,
+        sourcePos_x,
+        sourcePos_y,
+        kwargs_lens,
+        settings,
+        warm_start_tolerance,
+        verbose=False,
+    ):
+        """Solves the lens equation starting from the solutions of the previous call.
+
+        :param sourcePos_x: source position in units of angle
+        :param sourcePos_y: source position in units of angle
+        :param kwargs_lens: lens model parameters as keyword arguments
+        :param settings: tuple of the solver settings (min_distance, search_window,
+            precision_limit, num_iter_max, x_center, y_center, non_linear, quadtree)
+        :param warm_start_tolerance: maximum absolute difference in the source position
+            and each lens model parameter to the last full grid search
+        :param verbose: bool, if True, prints some useful information for the user
+        :return: x_mins, y_mins of the solutions or None, None if the warm start is not
+            applicable or failed
+        """
+        cache = self._warm_start_cache
+        if (
+            cache is None
+            or len(cache["x_image"]) == 0
+            or cache["settings"] != settings
+            or np.abs(sourcePos_x - cache["source_x"]) > warm_start_tolerance
+            or np.abs(sourcePos_y - cache["source_y"]) > warm_start_tolerance
+            or not _kwargs_close(
+                kwargs_lens, cache["kwargs_lens"], warm_start_tolerance
+            )
+        ):
+            return None, None
+        min_distance, _, precision_limit, num_iter_max, _, _, non_linear, _ = settings
+        kwargs_lens = self.lensModel.set_static(kwargs_lens)
+        x_mins, y_mins, solver_precision = self._find_gradient_decent(
+            cache["x_image"],
+            cache["y_image"],
+            sourcePos_x,
+            sourcePos_y,
+            kwargs_lens,
+            precision_limit,
+            num_iter_max,
+            verbose=verbose,
+            min_distance=min_distance,
+            non_linear=non_linear,
+        )
+        x_mins = x_mins[solver_precision <= precision_limit]
+        y_mins = y_mins[solver_precision <= precision_limit]
+        x_mins, y_mins = image_util.findOverlap(x_mins, y_mins, min_distance)
+        if len(x_mins) != len(cache["x_image"]):
+            if verbose:
+                print("Warm start failed, performing the full grid search.")
+            self.lensModel.set_dynamic()
+            return None, None
+        cache["x_image"], cache["y_image"] = x_mins, y_mins
+        return x_mins, y_mins
+
     def _find_gradient_decent(
         self,
         x_min,
@@ -689,6 +921,49 @@ class LensEquationSolver(object):
         return x_mins, y_mins
 
 
+def _max_singular_value(a_11, a_12, a_21, a_22):
+    """Largest singular value of (an array of) 2x2 matrices.
+
+    :param a_11: matrix element [0, 0]
+    :param a_12: matrix element [0, 1]
+    :param a_21: matrix element [1, 0]
+    :param a_22: matrix element [1, 1]
+    :return: largest singular value
+    """
+    frobenius2 = a_11**2 + a_12**2 + a_21**2 + a_22**2
+    det = a_11 * a_22 - a_12 * a_21
+    return np.sqrt(
+        (frobenius2 + np.sqrt(np.maximum(frobenius2**2 - 4 * det**2, 0))) / 2.0
+    )
+
+
+def _kwargs_close(kwargs_list, kwargs_list_ref, tolerance):
+    """Checks whether two lists of keyword arguments have the same keys and all values
+    differ by less than the tolerance.
+
+    :param kwargs_list: list of keyword arguments
+    :param kwargs_list_ref: list of keyword arguments to compare with
+    :param tolerance: maximum absolute difference of each value
+    :return: bool
+    """
+    if len(kwargs_list) != len(kwargs_list_ref):
+        return False
+    for kwargs, kwargs_ref in zip(kwargs_list, kwargs_list_ref):
+        if kwargs.keys() != kwargs_ref.keys():
+            return False
+        for key, value in kwargs.items():
+            value_ref = kwargs_ref[key]
+            try:
+                if np.shape(value) != np.shape(value_ref) or not np.all(
+                    np.abs(np.asarray(value) - np.asarray(value_ref)) <= tolerance
+                ):
+                    return False
+            except TypeError:
+                if value != value_ref:
+                    return False
+    return True
+
+
 def analytical_lens_model_support(lens_model_list):
     """Checks whether analytical solver can be used.
 
@@ -0,0 +1,300 @@
+__author__ = "sibirrer"
+
+import numpy as np
+
+__all__ = ["MultipoleTree"]
+
+
+class MultipoleTree(object):
+    """Barnes-Hut tree code with complex multipole expansions to compute the summed
+    lensing potential, deflection and Hessian of a large number of point masses.
+
+    In complex notation z = x + i y, the deflection of point masses with weights
+    m_i = theta_E_i^2 is conj(alpha)(z) = sum_i m_i / (z - z_i). For a group of point
+    masses with (mass-weighted) center z_c and radius r_c (largest distance of a
+    member to z_c), the sum is expanded as
+
+    .. math::
+        \\sum_i \\frac{m_i}{z - z_i} = \\sum_{k=0}^{p} \\frac{Q_k}{(z - z_c)^{k+1}}, \\quad Q_k = \\sum_i m_i (z_i - z_c)^k
+
+    with a relative truncation error of order (r_c / |z - z_c|)^(p+1). The point
+    masses are sorted into a quadtree (along their Morton order) and a group is
+    approximated by its multipole expansion when r_c < opening_angle * |z - z_c|,
+    otherwise its sub-groups (or for leaves, its members) are evaluated. The traversal
+    is vectorized over all rays of a batch, level by level of the tree.
+
+    For opening_angle=0, the direct sum is evaluated.
+    """
+
+    _max_depth = 16
+
+    def __init__(
+        self,
+        center_x,
+        center_y,
+        mass,
+        opening_angle=0.5,
+        multipole_order=6,
+        leaf_size=16,
+        num_ray_batch=4096,
+        r_min=10 ** (-25),
+    ):
+        """
+
+        :param center_x: x-positions of the point masses
+        :param center_y: y-positions of the point masses
+        :param mass: weights of the point masses (theta_E**2 in angular units)
+        :param opening_angle: accuracy parameter; a group of radius r_c at distance d
+            is approximated by its multipole expansion if r_c < opening_angle * d
+        :param multipole_order: order p of the multipole expansion
+        :param leaf_size: maximum number of point masses in a leaf of the tree
+        :param num_ray_batch: number of rays traversing the tree at once (bounds the
+            memory of the interaction lists)
+        :param r_min: minimal distance to a point mass (as in the PointMass profile)
+        """
+        self._opening_angle = opening_angle
+        self._order = int(multipole_order)
+        self._leaf_size = max(int(leaf_size), 1)
+        self._num_ray_batch = int(num_ray_batch)
+        self._r_min = r_min
+        z = np.asarray(center_x, dtype=float) + 1j * np.asarray(center_y, dtype=float)
+        z = np.atleast_1d(z)
+        mass = np.broadcast_to(np.asarray(mass, dtype=float), z.shape)
+        self._build(z, mass)
+
+    def potential(self, x, y):
+        """Lensing potential sum_i m_i ln|z - z_i|.
+
+        :param x: x-coordinates of the rays
+        :param y: y-coordinates of the rays
+        :return: lensing potential
+        """
+        f_ = self._evaluate(x, y, mode="potential")
+        return f_.real
+
+    def alpha(self, x, y):
+        """Deflection angles.
+
+        :param x: x-coordinates of the rays
+        :param y: y-coordinates of the rays
+        :return: f_x, f_y
+        """
+        g = self._evaluate(x, y, mode="alpha")
+        return g.real, -g.imag
+
+    def hessian(self, x, y):
+        """Hessian matrix (the convergence is zero away from the point masses).
+
+        :param x: x-coordinates of the rays
+        :param y: y-coordinates of the rays
+        :return: f_xx, f_xy, f_yx, f_yy
+        """
+        dg = self._evaluate(x, y, mode="hessian")
+        f_xx = dg.real
+        f_xy = -dg.imag
+        return f_xx, f_xy, f_xy, -f_xx
+
+    def _build(self, z, mass):
+        """Builds the quadtree along the Morton order of the point masses and computes
+        the multipole moments of all nodes.
+
+        :param z: complex positions of the point masses
+        :param mass: weights of the point masses
+        :return: None
+        """
+        num = len(z)
+        depth = self._max_depth
+        x_min, y_min = np.min(z.real), np.min(z.imag)
+        size = max(np.max(z.real) - x_min, np.max(z.imag) - y_min)
+        if size <= 0:
+            size = 1.0
+        scale = (2**depth - 1) / size
+        ix = ((z.real - x_min) * scale).astype(np.uint64)
+        iy = ((z.imag - y_min) * scale).astype(np.uint64)
+        code = _spread_bits(ix) | (_spread_bits(iy) << np.uint64(1))
+        order = np.argsort(code, kind="stable")
+        self._z = z[order]
+        self._mass = mass[order]
+        code = code[order]
+
+        # nodes are appended level by level; the children of a node are consecutive
+        start, end = [np.array([0])], [np.array([num])]
+        child_first, child_num = [], []
+        num_node = 1
+        level_nodes_start, level_nodes_end = start[0], end[0]
+        for level in range(depth):
+            split = level_nodes_end - level_nodes_start > self._leaf_size
+            child_first_level = np.zeros(len(split), dtype=int)
+            child_num_level = np.zeros(len(split), dtype=int)
+            if not np.any(split):
+                child_first.append(child_first_level)
+                child_num.append(child_num_level)
+                break
+            idx, owner = _ranges(level_nodes_start[split], level_nodes_end[split])
+            key = code[idx] >> np.uint64(2 * (depth - level - 1))
+            boundary = np.ones(len(idx), dtype=bool)
+            boundary[1:] = (owner[1:] != owner[:-1]) | (key[1:] != key[:-1])
+            boundary = np.nonzero(boundary)[0]
+            children_start = idx[boundary]
+            children_end = idx[np.append(boundary[1:], len(idx)) - 1] + 1
+            children_owner = owner[boundary]
+            counts = np.bincount(children_owner, minlength=np.count_nonzero(split))
+            child_num_level[split] = counts
+            child_first_level[split] = num_node + np.cumsum(counts) - counts
+            child_first.append(child_first_level)
+            child_num.append(child_num_level)
+            start.append(children_start)
+            end.append(children_end)
+            num_node += len(children_start)
+            level_nodes_start, level_nodes_end = children_start, children_end
+        else:
+            child_first.append(np.zeros(len(level_nodes_start), dtype=int))
+            child_num.append(np.zeros(len(level_nodes_start), dtype=int))
+        self._start = np.concatenate(start)
+        self._end = np.concatenate(end)
+        self._child_first = np.concatenate(child_first)
+        self._child_num = np.concatenate(child_num)
+
+        # multipole moments of the nodes around their mass-weighted centers
+        idx, owner = _ranges(self._start, self._end)
+        counts = self._end - self._start
+        group = np.cumsum(counts) - counts  # first entry of each node in idx
+        z_idx, m_idx = self._z[idx], self._mass[idx]
+        m_node = np.add.reduceat(m_idx, group)
+        z_mean = np.add.reduceat(z_idx, group) / counts
+        mz_node = np.add.reduceat(m_idx * z_idx, group)
+        positive = m_node > 0
+        self._center = np.where(
+            positive, mz_node / np.where(positive, m_node, 1), z_mean
+        )
+        d = z_idx - self._center[owner]
+        self._radius = np.maximum.reduceat(np.abs(d), group)
+        moments = np.empty((self._order + 1, len(self._start)), dtype=complex)
+        d_k = m_idx.astype(complex)
+        for k in range(self._order + 1):
+            moments[k] = np.add.reduceat(d_k, group)
+            d_k = d_k * d
+        self._moments = moments
+
+    def _evaluate(self, x, y, mode):
+        """Traverses the tree for all rays and sums the contributions.
+
+        :param x: x-coordinates of the rays
+        :param y: y-coordinates of the rays
+        :param mode: 'potential', 'alpha' or 'hessian'
+        :return: complex array with the shape of x; the potential (real part), the
+            conjugate deflection f_x - i f_y or its derivative f_xx - i f_xy
+        """
+        shape = np.shape(x)
+        z = np.ravel(np.asarray(x, dtype=float) + 1j * np.asarray(y, dtype=float))
+        result = np.zeros(len(z), dtype=complex)
+        for i in range(0, len(z), self._num_ray_batch):
+            z_batch = z[i : i + self._num_ray_batch]
+            result[i : i + self._num_ray_batch] = self._evaluate_batch(z_batch, mode)
+        if shape == ():
+            return result[0]
+        return result.reshape(shape)
+
+    def _evaluate_batch(self, z, mode):
+        """Evaluation of one batch of rays, see _evaluate()
+
+        :param z: complex positions of the rays
+        :param mode: 'potential', 'alpha' or 'hessian'
+        :return: complex array of the size of z
+        """
+        num_ray = len(z)
+        real = np.zeros(num_ray)
+        imag = np.zeros(num_ray)
+        ray = np.arange(num_ray)
+        node = np.zeros(num_ray, dtype=int)
+        while len(ray) > 0:
+            w = z[ray] - self._center[node]
+            accept = self._radius[node] < self._opening_angle * np.abs(w)
+            if np.any(accept):
+                f = self._multipole(w[accept], node[accept], mode)
+                real += np.bincount(ray[accept], weights=f.real, minlength=num_ray)
+                imag += np.bincount(ray[accept], weights=f.imag, minlength=num_ray)
+                ray, node = ray[~accept], node[~accept]
+            leaf = self._child_num[node] == 0
+            if np.any(leaf):
+                idx, owner = _ranges(self._start[node[leaf]], self._end[node[leaf]])
+                ray_leaf = ray[leaf][owner]
+                f = self._direct(z[ray_leaf] - self._z[idx], self._mass[idx], mode)
+                real += np.bincount(ray_leaf, weights=f.real, minlength=num_ray)
+                imag += np.bincount(ray_leaf, weights=f.imag, minlength=num_ray)
+                ray, node = ray[~leaf], node[~leaf]
+            first = self._child_first[node]
+            node, owner = _ranges(first, first + self._child_num[node])
+            ray = ray[owner]
+        return real + 1j * imag
+
+    def _multipole(self, w, node, mode):
+        """Multipole expansion of the nodes.
+
+        :param w: complex separation of the rays to the node centers
+        :param node: node indices
+        :param mode: 'potential', 'alpha' or 'hessian'
+        :return: complex contributions
+        """
+        moments = self._moments[:, node]
+        u = 1 / w
+        f = np.zeros(len(w), dtype=complex)
+        if mode == "alpha":
+            # sum_k Q_k u^(k+1) in Horner form
+            for k in range(self._order, -1, -1):
+                f = (f + moments[k]) * u
+        elif mode == "hessian":
+            # -sum_k (k+1) Q_k u^(k+2)
+            for k in range(self._order, -1, -1):
+                f = (f + (k + 1) * moments[k]) * u
+            f = -f * u
+        else:
+            # Q_0 log(w) - sum_k>=1 Q_k u^k / k
+            for k in range(self._order, 0, -1):
+                f = (f + moments[k] / k) * u
+            f = moments[0].real * np.log(np.abs(w)) - f
+        return f
+
+    def _direct(self, w, mass, mode):
+        """Direct contribution of individual point masses (with the minimal distance
+        r_min as in the PointMass profile).
+
+        :param w: complex separation of the rays to the point masses
+        :param mass: weights of the point masses
+        :param mode: 'potential', 'alpha' or 'hessian'
+        :return: complex contributions
+        """
+        r2 = np.maximum(w.real**2 + w.imag**2, self._r_min**2)
+        if mode == "alpha":
+            return mass * np.conj(w) / r2
+        elif mode == "hessian":
+            return -mass * np.conj(w) ** 2 / r2**2
+        return 0.5 * mass * np.log(r2) + 0j
+
+
+def _ranges(starts, ends):
+    """Concatenated index ranges [starts[i], ends[i]) and the index i they belong to.
+
+    :param starts: numpy array of start indices
+    :param ends: numpy array of end indices
+    :return: indices, owners
+    """
+    counts = ends - starts
+    owner = np.repeat(np.arange(len(starts)), counts)
+    offsets = np.cumsum(counts) - counts
+    idx = np.arange(np.sum(counts)) + np.repeat(starts - offsets, counts)
+    return idx, owner
+
+
+def _spread_bits(v):
+    """Interleaves the lower 16 bits of v with zeros (for the Morton order).
+
+    :param v: numpy array of type uint64
+    :return: numpy array of type uint64
+    """
+    v = v & np.uint64(0x0000FFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v
@@ -42,6 +42,7 @@ class LensModel(object):
         cosmology_sampling=False,
         cosmology_model="FlatLambdaCDM",
         use_jax=False,
+        plane_cache=False,
     ):
         """
 
@@ -80,6 +81,9 @@ class LensModel(object):
         :param use_jax: bool, if True, uses deflector profiles from jaxtronomy.
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
             Only supported for MultiPlane(), MultiPlaneDecoupled(), and SinglePlane() at the moment
+        :param plane_cache: bool (only employed in multi-plane mode), if True, caches the rays at each lens plane
+            such that repeated ray-tracing of the same rays is only re-computed from the first lens plane with
+            changed keyword arguments onward
         """
         self.lens_model_list = lens_model_list
         self.z_lens = z_lens
@@ -203,6 +207,7 @@ class LensModel(object):
                     cosmology_sampling=cosmology_sampling,
                     cosmology_model=cosmology_model,
                     use_jax=use_jax,
+                    plane_cache=plane_cache,
                 )
                 self.type = "MultiPlane"
 
@@ -8,6 +8,9 @@ __all__ = ["LensModelExtensions"]
 class LensModelExtensions(object):
     """Class with extension routines not part of the LensModel core routines."""
 
+    # maximal number of rays traced in one call in magnification_finite_adaptive()
+    _num_ray_batch = 2**15
+
     def __init__(self, lensModel):
         """
         :param lensModel: instance of the LensModel() class, or with same functionalities.
@@ -52,6 +55,8 @@ class LensModelExtensions(object):
         tracks the surface brightness of the lensed image. The aperture size is initially quite small,
         and increases in size until the flux inside of it (and hence the magnification) converges. The orientation of
         the elliptical aperture is computed from the magnification tensor evaluated at the image coordinate.
+        The apertures of all images grow together; at each step only the pixels in the new annuli of the images that
+        have not converged yet are ray-traced, in a single (batched) call to the lens model.
 
         If for whatever reason you prefer a circular aperture to the elliptical approximation using the hessian
         eigenvectors, you can just set axis_ratio = 1.
@@ -97,75 +102,118 @@ class LensModelExtensions(object):
 
         minimum_magnification = 1e-5
 
-        magnifications = []
-
-        for xi, yi in zip(x_image, y_image):
-            if axis_ratio == 1:
-                grid_r = np.hypot(grid_x_0, grid_y_0)
-            else:
-                w1, w2, v11, v12, v21, v22 = self.hessian_eigenvectors(
-                    xi, yi, kwargs_lens
-                )
-                _v = [np.array([v11, v12]), np.array([v21, v22])]
-                _w = [abs(w1), abs(w2)]
-                if use_largest_eigenvalue:
-                    idx = int(np.argmax(_w))
-                else:
-                    idx = int(np.argmin(_w))
-                v = _v[idx]
-
-                rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
-                grid_x, grid_y = util.rotate(grid_x_0, grid_y_0, rotation_angle)
-
-                if axis_ratio == 0:
-                    sort = np.argsort(_w)
-                    q = _w[sort[0]] / _w[sort[1]]
-                    grid_r = np.hypot(grid_x, grid_y / q).ravel()
-                else:
-                    grid_r = np.hypot(grid_x, grid_y / axis_ratio).ravel()
+        grid_r_list = [
+            self._magnification_adaptive_grid_r(
+                xi,
+                yi,
+                grid_x_0,
+                grid_y_0,
+                kwargs_lens,
+                axis_ratio,
+                use_largest_eigenvalue,
+            )
+            for xi, yi in zip(x_image, y_image)
+        ]
 
-            flux_array = np.zeros_like(grid_x_0)
-            step = step_size * grid_radius_arcsec
+        num_image = len(grid_r_list)
+        flux = np.zeros(num_image)
+        magnifications = np.zeros(num_image)
+        step = step_size * grid_radius_arcsec
 
-            r_min = 0
-            if fixed_aperture_size:
-                r_max = grid_radius_arcsec
-            else:
-                r_max = step
-            magnification_current = 0.0
-
-            while True:
-                flux_array = self._magnification_adaptive_iteration(
-                    flux_array,
-                    xi,
-                    yi,
-                    grid_x_0,
-                    grid_y_0,
-                    grid_r,
-                    r_min,
-                    r_max,
-                    self._lensModel,
+        r_min = 0
+        if fixed_aperture_size:
+            r_max = grid_radius_arcsec
+        else:
+            r_max = step
+        # the apertures of all images that have not converged yet grow together and the
+        # pixels of their annuli are ray-traced in a single call
+        active = np.arange(num_image)
+        while len(active) > 0:
+            x_annulus, y_annulus, num_annulus = [], [], []
+            for i in active:
+                grid_r = grid_r_list[i]
+                inds = np.where((grid_r >= r_min) & (grid_r < r_max))[0]
+                x_annulus.append(grid_x_0[inds] + x_image[i])
+                y_annulus.append(grid_y_0[inds] + y_image[i])
+                num_annulus.append(len(inds))
+            x_annulus = np.concatenate(x_annulus)
+            y_annulus = np.concatenate(y_annulus)
+            flux_in_pixels = np.zeros(len(x_annulus))
+            for k in range(0, len(x_annulus), self._num_ray_batch):
+                beta_x, beta_y = self._lensModel.ray_shooting(
+                    x_annulus[k : k + self._num_ray_batch],
+                    y_annulus[k : k + self._num_ray_batch],
                     kwargs_lens,
-                    source_model,
-                    kwargs_source,
                 )
-                new_magnification = np.sum(flux_array) * grid_resolution**2
+                flux_in_pixels[k : k + self._num_ray_batch] = (
+                    source_model.surface_brightness(beta_x, beta_y, kwargs_source)
+                )
+            owner = np.repeat(np.arange(len(active)), num_annulus)
+            flux[active] += np.bincount(
+                owner, weights=flux_in_pixels, minlength=len(active)
+            )
+            magnification_current = magnifications[active]
+            new_magnification = flux[active] * grid_resolution**2
+            magnifications[active] = new_magnification
+
+            if r_max >= grid_radius_arcsec:
+                break
+            with np.errstate(divide="ignore", invalid="ignore"):
                 diff = (
                     abs(new_magnification - magnification_current) / new_magnification
                 )
+            converged = (diff < tol) & (new_magnification > minimum_magnification)
+            active = active[~converged]
+            r_min += step
+            r_max += step
 
-                if r_max >= grid_radius_arcsec:
-                    break
-                elif diff < tol and new_magnification > minimum_magnification:
-                    break
-                else:
-                    r_min += step
-                    r_max += step
-                    magnification_current = new_magnification
+        return magnifications
 
-            magnifications.append(new_magnification)
+    def _magnification_adaptive_grid_r(
+        self,
+        x_image,
+        y_image,
+        grid_x_0,
+        grid_y_0,
+        kwargs_lens,
+        axis_ratio,
+        use_largest_eigenvalue,
+    ):
+        """(Elliptical) radius of the ray tracing grid around an image, with the
+        orientation of the ellipse set by the eigenvectors of the hessian matrix.
 
-        return np.array(magnifications)
+        :param x_image: image x coordinate
+        :param y_image: image y coordinate
+        :param grid_x_0: x coordinates of the grid relative to the image
+        :param grid_y_0: y coordinates of the grid relative to the image
+        :param kwargs_lens: keyword arguments for the lens model
+        :param axis_ratio: the axis ratio of the ellipse (see
+            magnification_finite_adaptive)
+        :param use_largest_eigenvalue: bool; if True, then the major axis of the ellipse
+            is aligned with the eigenvector corresponding to the largest eigenvalue
+        :return: radius of the grid coordinates
+        """
+        if axis_ratio == 1:
+            return np.hypot(grid_x_0, grid_y_0)
+        w1, w2, v11, v12, v21, v22 = self.hessian_eigenvectors(
+            x_image, y_image, kwargs_lens
+        )
+        _v = [np.array([v11, v12]), np.array([v21, v22])]
+        _w = [abs(w1), abs(w2)]
+        if use_largest_eigenvalue:
+            idx = int(np.argmax(_w))
+        else:
+            idx = int(np.argmin(_w))
+        v = _v[idx]
+
+        rotation_angle = np.arctan(v[1] / v[0]) - np.pi / 2
+        grid_x, grid_y = util.rotate(grid_x_0, grid_y_0, rotation_angle)
+
+        if axis_ratio == 0:
+            sort = np.argsort(_w)
+            q = _w[sort[0]] / _w[sort[1]]
+            return np.hypot(grid_x, grid_y / q).ravel()
+        return np.hypot(grid_x, grid_y / axis_ratio).ravel()
 
     @staticmethod
     def _magnification_adaptive_iteration(
@@ -349,46 +397,20 @@ class LensModelExtensions(object):
         x_grid_init = util.array2image(x_grid_init)
         y_grid_init = util.array2image(y_grid_init)
 
-        ra_crit_list = []
-        dec_crit_list = []
-        # iterate through original triangles and return ra_crit, dec_crit list
-        for i in range(numPix - 1):
-            for j in range(numPix - 1):
-                edge1 = [x_grid_init[i, j], y_grid_init[i, j], mag_init[i, j]]
-                edge2 = [
-                    x_grid_init[i + 1, j + 1],
-                    y_grid_init[i + 1, j + 1],
-                    mag_init[i + 1, j + 1],
-                ]
-                edge_90_1 = [
-                    x_grid_init[i, j + 1],
-                    y_grid_init[i, j + 1],
-                    mag_init[i, j + 1],
-                ]
-                edge_90_2 = [
-                    x_grid_init[i + 1, j],
-                    y_grid_init[i + 1, j],
-                    mag_init[i + 1, j],
-                ]
-                ra_crit, dec_crit = self._tiling_crit(
-                    edge1,
-                    edge2,
-                    edge_90_1,
-                    max_order=max_order,
-                    kwargs_lens=kwargs_lens,
-                )
-                ra_crit_list += ra_crit  # list addition
-                dec_crit_list += dec_crit  # list addition
-                ra_crit, dec_crit = self._tiling_crit(
-                    edge1,
-                    edge2,
-                    edge_90_2,
-                    max_order=max_order,
-                    kwargs_lens=kwargs_lens,
-                )
-                ra_crit_list += ra_crit  # list addition
-                dec_crit_list += dec_crit  # list addition
-        return np.array(ra_crit_list), np.array(dec_crit_list)
+        def _corners(di, dj):
+            # [ra, dec, magnification] of the corners (i + di, j + dj) of all cells
+            cells = slice(di, numPix - 1 + di), slice(dj, numPix - 1 + dj)
+            return np.array(
+                [x_grid_init[cells], y_grid_init[cells], mag_init[cells]]
+            ).reshape(3, -1)
+
+        # the two triangles of each cell with the long axis from (i, j) to (i + 1, j + 1)
+        edge1 = np.repeat(_corners(0, 0), 2, axis=1)
+        edge2 = np.repeat(_corners(1, 1), 2, axis=1)
+        edge_90 = _interleave(_corners(0, 1), _corners(1, 0))
+        return self._tiling_crit(
+            edge1, edge2, edge_90, max_order=max_order, kwargs_lens=kwargs_lens
+        )
 
     def caustic_area(self, kwargs_lens, kwargs_caustic_num, index_vertices=0):
         """Computes the area inside a connected caustic curve.
@@ -420,59 +442,51 @@ class LensModelExtensions(object):
         return a
 
     def _tiling_crit(self, edge1, edge2, edge_90, max_order, kwargs_lens):
-        """Tiles a rectangular triangle and compares the signs of the magnification.
-
-        :param edge1: [ra_coord, dec_coord, magnification]
-        :param edge2: [ra_coord, dec_coord, magnification]
-        :param edge_90: [ra_coord, dec_coord, magnification]
+        """Tiles rectangular triangles and compares the signs of the magnification at
+        their corners. Triangles with a sign change are split along their long axis
+        until the maximal order is reached, with one magnification call for all
+        triangles of an order.
+
+        :param edge1: [ra_coords, dec_coords, magnifications] of the first corners of
+            the long axis of the triangles
+        :param edge2: [ra_coords, dec_coords, magnifications] of the second corners of
+            the long axis of the triangles
+        :param edge_90: [ra_coords, dec_coords, magnifications] of the corners with the
+            right angle
         :param max_order: maximal order to fold triangle
         :param kwargs_lens: lens model keyword argument list
-        :return:
+        :return: ra_crit, dec_crit; centers of the smallest triangles with a sign change
         """
-        ra_1, dec_1, mag_1 = edge1
-        ra_2, dec_2, mag_2 = edge2
-        ra_3, dec_3, mag_3 = edge_90
-        sign_list = np.sign([mag_1, mag_2, mag_3])
-        if (
-            sign_list[0] == sign_list[1] and sign_list[0] == sign_list[2]
-        ):  # if all signs are the same
-            return [], []
-        else:
-            # split triangle along the long axis
-            # execute tiling twice
-            # add ra_crit and dec_crit together
-            # if max depth has been reached, return the mean value in the triangle
+        while True:
+            sign_1 = np.sign(edge1[2])
+            select = (sign_1 != np.sign(edge2[2])) | (sign_1 != np.sign(edge_90[2]))
+            edge1, edge2 = edge1[:, select], edge2[:, select]
+            edge_90 = edge_90[:, select]
             max_order -= 1
-            if max_order <= 0:
-                return [(ra_1 + ra_2 + ra_3) / 3], [(dec_1 + dec_2 + dec_3) / 3]
-            else:
-                # split triangle
-                ra_90_ = (
-                    ra_1 + ra_2
-                ) / 2  # find point in the middle of the long axis to split triangle
-                dec_90_ = (dec_1 + dec_2) / 2
-                mag_90_ = self._lensModel.magnification(ra_90_, dec_90_, kwargs_lens)
-                edge_90_ = [ra_90_, dec_90_, mag_90_]
-                ra_crit, dec_crit = self._tiling_crit(
-                    edge1=edge_90,
-                    edge2=edge1,
-                    edge_90=edge_90_,
-                    max_order=max_order,
-                    kwargs_lens=kwargs_lens,
-                )
-                ra_crit_2, dec_crit_2 = self._tiling_crit(
-                    edge1=edge_90,
-                    edge2=edge2,
-                    edge_90=edge_90_,
-                    max_order=max_order,
-                    kwargs_lens=kwargs_lens,
-                )
-                ra_crit += ra_crit_2
-                dec_crit += dec_crit_2
+            if max_order <= 0 or edge1.shape[1] == 0:
+                # if max depth has been reached, return the mean value in the triangle
+                ra_crit, dec_crit, _ = (edge1 + edge2 + edge_90) / 3
                 return ra_crit, dec_crit
+            # split triangles at the point in the middle of the long axis; the two
+            # children are kept next to each other to preserve the order of the points
+            ra_90_ = (edge1[0] + edge2[0]) / 2
+            dec_90_ = (edge1[1] + edge2[1]) / 2
+            mag_90_ = self._lensModel.magnification(ra_90_, dec_90_, kwargs_lens)
+            edge_90_ = np.array([ra_90_, dec_90_, mag_90_])
+            edge1, edge2, edge_90 = (
+                _interleave(edge_90, edge_90),
+                _interleave(edge1, edge2),
+                _interleave(edge_90_, edge_90_),
+            )
 
     def critical_curve_caustics(
-        self, kwargs_lens, compute_window=5, grid_scale=0.01, center_x=0, center_y=0
+        self,
+        kwargs_lens,
+        compute_window=5,
+        grid_scale=0.01,
+        center_x=0,
+        center_y=0,
+        start_scale=None,
     ):
         """
 
@@ -481,20 +495,38 @@ class LensModelExtensions(object):
         :param grid_scale: numerical grid spacing of the computation of the critical curves
         :param center_x: float, center of the window to compute critical curves and caustics
         :param center_y: float, center of the window to compute critical curves and caustics
+        :param start_scale: (optional) float, grid spacing of a coarse grid on which the inverse magnification is
+         computed first (rounded to an odd multiple of grid_scale). Only the cells of the coarse grid with a sign change (and their neighbours) are then refined
+         to grid_scale. Critical curves that do not cross the edges of the coarse grid cells may be missed.
         :return: lists of ra and dec arrays corresponding to different disconnected critical curves and their caustic counterparts
 
         """
-        num_pix = int(compute_window / grid_scale)
-        if num_pix % 2 == 1:
-            num_pix += 1
-        x_grid_high_res, y_grid_high_res = util.make_grid(
-            num_pix, deltapix=grid_scale, subgrid_res=1
-        )
-        x_grid_high_res += center_x
-        y_grid_high_res += center_y
-        mag_high_res = util.array2image(
-            self._lensModel.magnification(x_grid_high_res, y_grid_high_res, kwargs_lens)
-        )
+        if start_scale is None or start_scale < 2 * grid_scale:
+            num_pix = int(compute_window / grid_scale)
+            if num_pix % 2 == 1:
+                num_pix += 1
+            x_grid_high_res, y_grid_high_res = util.make_grid(
+                num_pix, deltapix=grid_scale, subgrid_res=1
+            )
+            x_grid_high_res += center_x
+            y_grid_high_res += center_y
+            mag_high_res = util.array2image(
+                self._lensModel.magnification(
+                    x_grid_high_res, y_grid_high_res, kwargs_lens
+                )
+            )
+            inv_mag_high_res = 1 / mag_high_res
+        else:
+            # odd numbers of cells and of points per cell such that, as above, the
+            # grid has an even number of points and does not include its center
+            num_refine = int(round(start_scale / grid_scale))
+            num_refine += 1 - num_refine % 2
+            num_cell = int(np.ceil((compute_window / grid_scale - 1) / num_refine))
+            num_cell += 1 - num_cell % 2
+            num_pix = num_cell * num_refine + 1
+            inv_mag_high_res = self._inverse_magnification_refined(
+                kwargs_lens, num_cell, num_refine, grid_scale, center_x, center_y
+            )
 
         ra_crit_list = []
         dec_crit_list = []
@@ -504,7 +536,7 @@ class LensModelExtensions(object):
         # Import moved here to avoid import-time exception if skimage is missing
         from skimage.measure import find_contours
 
-        paths = find_contours(1 / mag_high_res, 0.0)
+        paths = find_contours(inv_mag_high_res, 0.0)
 
         for i, v in enumerate(paths):
             # x, y changed because of skimage conventions
@@ -523,6 +555,82 @@ class LensModelExtensions(object):
             dec_caustic_list.append(dec_caustics)
         return ra_crit_list, dec_crit_list, ra_caustic_list, dec_caustic_list
 
+    def _inverse_magnification_refined(
+        self, kwargs_lens, num_cell, num_refine, grid_scale, center_x, center_y
+    ):
+        """Inverse magnification on a regular grid of num_cell * num_refine + 1 points
+        per axis. It is computed on the coarse grid of every num_refine'th point first
+        and only the coarse cells with a sign change, and their neighbours, are
+        evaluated on the full grid (in a single Hessian call). All other points are
+        bilinearly interpolated from the coarse grid, which preserves the sign.
+
+        :param kwargs_lens: lens model keyword argument list
+        :param num_cell: number of coarse grid cells per axis
+        :param num_refine: number of grid points per coarse cell and axis
+        :param grid_scale: grid spacing of the full grid
+        :param center_x: center of the grid
+        :param center_y: center of the grid
+        :return: 2d array of the inverse magnification
+        """
+        num_pix = num_cell * num_refine + 1
+        coords = (np.arange(num_pix) - (num_pix - 1) / 2.0) * grid_scale
+        x_coarse, y_coarse = np.meshgrid(
+            coords[::num_refine] + center_x, coords[::num_refine] + center_y
+        )
+        inv_mag_coarse = self._inverse_magnification(
+            x_coarse.flatten(), y_coarse.flatten(), kwargs_lens
+        ).reshape(num_cell + 1, num_cell + 1)
+
+        # coarse cells with a sign change and their neighbours
+        positive = inv_mag_coarse > 0
+        corners = [
+            positive[:-1, :-1],
+            positive[1:, :-1],
+            positive[:-1, 1:],
+            positive[1:, 1:],
+        ]
+        cell_change = np.any(corners, axis=0) & ~np.all(corners, axis=0)
+        cell_change = np.pad(cell_change, 1)
+        cell_refine = np.zeros((num_cell, num_cell), dtype=bool)
+        for i in range(3):
+            for j in range(3):
+                cell_refine |= cell_change[i : i + num_cell, j : j + num_cell]
+
+        # bilinear interpolation of the coarse grid
+        index = np.arange(num_pix)
+        cell = np.minimum(index // num_refine, num_cell - 1)
+        t = (index - cell * num_refine) / num_refine
+        rows = (
+            inv_mag_coarse[cell] * (1 - t)[:, None]
+            + inv_mag_coarse[cell + 1] * t[:, None]
+        )
+        inv_mag = rows[:, cell] * (1 - t) + rows[:, cell + 1] * t
+
+        # points of the refined cells (points on a cell edge belong to both cells)
+        cell_low = np.maximum((index - 1) // num_refine, 0)
+        select = (
+            cell_refine[np.ix_(cell_low, cell_low)]
+            | cell_refine[np.ix_(cell_low, cell)]
+            | cell_refine[np.ix_(cell, cell_low)]
+            | cell_refine[np.ix_(cell, cell)]
+        )
+        x_grid, y_grid = np.meshgrid(coords + center_x, coords + center_y)
+        inv_mag[select] = self._inverse_magnification(
+            x_grid[select], y_grid[select], kwargs_lens
+        )
+        return inv_mag
+
+    def _inverse_magnification(self, x, y, kwargs_lens):
+        """Determinant of the lensing Jacobian, i.e. the inverse magnification.
+
+        :param x: x-positions
+        :param y: y-positions
+        :param kwargs_lens: lens model keyword argument list
+        :return: inverse magnification
+        """
+        f_xx, f_xy, f_yx, f_yy = self._lensModel.hessian(x, y, kwargs_lens)
+        return (1 - f_xx) * (1 - f_yy) - f_xy * f_yx
+
     def hessian_eigenvectors(self, x, y, kwargs_lens, diff=None):
         """Computes magnification eigenvectors at position (x, y)
 
@@ -949,3 +1057,13 @@ class LensModelExtensions(object):
             "curvature": curvature,
         }
         return kwargs_arc
+
+
+def _interleave(a, b):
+    """Interleaves the columns of two arrays of the same shape.
+
+    :param a: 2d numpy array
+    :param b: 2d numpy array
+    :return: 2d numpy array with the columns a[:, 0], b[:, 0], a[:, 1], b[:, 1], ...
+    """
+    return np.stack([a, b], axis=-1).reshape(len(a), -1)
@@ -75,6 +75,7 @@ _SUPPORTED_MODELS = [
     "PJAFFE",
     "PJAFFE_ELLIPSE_POTENTIAL",
     "POINT_MASS",
+    "POINT_MASS_POPULATION",
     "PSEUDO_DPL",
     "SERSIC",
     "SERSIC_ELLIPSE_GAUSS_DEC",
@@ -97,6 +98,7 @@ _SUPPORTED_MODELS = [
     "TABULATED_DEFLECTIONS",
     "TNFW",
     "TNFWC",
+    "TNFW_POPULATION",
     "TNFW_ELLIPSE_POTENTIAL",
     "TRIPLE_CHAMELEON",
     "ULDM",
@@ -653,6 +655,12 @@ def lens_class(
         from lenstronomy.LensModel.Profiles.point_mass import PointMass
 
         return PointMass(**profile_kwargs)
+    elif lens_type == "POINT_MASS_POPULATION":
+        from lenstronomy.LensModel.Profiles.point_mass_population import (
+            PointMassPopulation,
+        )
+
+        return PointMassPopulation(**profile_kwargs)
     elif lens_type == "PSEUDO_DPL":
         from lenstronomy.LensModel.Profiles.pseudo_double_powerlaw import (
             PseudoDoublePowerlaw,
@@ -755,6 +763,10 @@ def lens_class(
         from lenstronomy.LensModel.Profiles.tnfw import TNFW
 
         return TNFW(**profile_kwargs)
+    elif lens_type == "TNFW_POPULATION":
+        from lenstronomy.LensModel.Profiles.tnfw_population import TNFWPopulation
+
+        return TNFWPopulation(**profile_kwargs)
     elif lens_type == "TNFWC":
         from lenstronomy.LensModel.Profiles.nfw_core_truncated import TNFWC
 
@@ -2,6 +2,7 @@ __author__ = "sibirrer"
 
 import numpy as np
 from lenstronomy.LensModel.profile_list_base import ProfileListBase
+from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
 
 __all__ = ["SinglePlane"]
 
@@ -29,6 +30,7 @@ class SinglePlane(ProfileListBase):
             Can also be a list of bools, selecting which models in the lens_model_list to use from jaxtronomy
         """
         self._alpha_scaling = alpha_scaling
+        self._buffers = {}
         ProfileListBase.__init__(
             self,
             lens_model_list=lens_model_list,
@@ -37,6 +39,13 @@ class SinglePlane(ProfileListBase):
             z_source_convention=z_source_convention,
             use_jax=use_jax,
         )
+        # profiles with a dedicated in-place accumulation (see LensProfileBase)
+        self._derivatives_add_list = [
+            _overrides(func, "derivatives_add") for func in self.func_list
+        ]
+        self._hessian_add_list = [
+            _overrides(func, "hessian_add") for func in self.func_list
+        ]
 
     def ray_shooting(self, x, y, kwargs, k=None):
         """Maps image to source position (inverse deflection).
@@ -113,19 +122,24 @@ class SinglePlane(ProfileListBase):
         :param k: only evaluate the k-th lens model
         :return: deflectionangles in units of arcsec
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
+        x = _float_array(x)
+        y = _float_array(y)
         # NOTE: jax arrays are converted back into regular numpy arrays in cases where use_jax is True.
         if isinstance(k, int):
             f_x, f_y = self.func_list[k].derivatives(x, y, **kwargs[k])
             return np.asarray(f_x), np.asarray(f_y)
         bool_list = self._bool_list(k)
-        f_x, f_y = np.zeros_like(x), np.zeros_like(x)
+        # profiles accumulate in place in buffers re-used for the same grid shape
+        out = self._zero_buffers("alpha", np.shape(x), 2)
+        f_x, f_y = out
         for i, func in enumerate(self.func_list):
             if bool_list[i] is True:
-                f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
-                f_x += f_x_i
-                f_y += f_y_i
+                if self._derivatives_add_list[i]:
+                    func.derivatives_add(x, y, out, **kwargs[i])
+                else:
+                    f_x_i, f_y_i = func.derivatives(x, y, **kwargs[i])
+                    f_x += f_x_i
+                    f_y += f_y_i
 
         return (
             np.asarray(f_x) * self._alpha_scaling,
@@ -144,8 +158,8 @@ class SinglePlane(ProfileListBase):
         :param k: only evaluate the k-th lens model
         :return: f_xx, f_xy, f_yx, f_yy components
         """
-        x = np.array(x, dtype=float)
-        y = np.array(y, dtype=float)
+        x = _float_array(x)
+        y = _float_array(y)
 
         # NOTE: jax arrays are converted back into regular numpy arrays in cases where use_jax is True.
         if isinstance(k, int):
@@ -158,19 +172,18 @@ class SinglePlane(ProfileListBase):
             )
 
         bool_list = self._bool_list(k)
-        f_xx, f_xy, f_yx, f_yy = (
-            np.zeros_like(x),
-            np.zeros_like(x),
-            np.zeros_like(x),
-            np.zeros_like(x),
-        )
+        out = self._zero_buffers("hessian", np.shape(x), 4)
+        f_xx, f_xy, f_yx, f_yy = out
         for i, func in enumerate(self.func_list):
             if bool_list[i] is True:
-                f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
-                f_xx += f_xx_i
-                f_xy += f_xy_i
-                f_yx += f_yx_i
-                f_yy += f_yy_i
+                if self._hessian_add_list[i]:
+                    func.hessian_add(x, y, out, **kwargs[i])
+                else:
+                    f_xx_i, f_xy_i, f_yx_i, f_yy_i = func.hessian(x, y, **kwargs[i])
+                    f_xx += f_xx_i
+                    f_xy += f_xy_i
+                    f_yx += f_yx_i
+                    f_yy += f_yy_i
         return (
             np.asarray(f_xx) * self._alpha_scaling,
             np.asarray(f_xy) * self._alpha_scaling,
@@ -178,6 +191,32 @@ class SinglePlane(ProfileListBase):
             np.asarray(f_yy) * self._alpha_scaling,
         )
 
+    def _zero_buffers(self, name, shape, num):
+        """Output buffers of the fused evaluation, allocated once per grid shape. The
+        buffers are set to zero and must not be returned to the user (they are over-
+        written in the next call). Note that this makes a single instance not thread-
+        safe.
+
+        :param name: name of the quantity
+        :param shape: shape of the coordinate arrays
+        :param num: number of arrays
+        :return: list of num zero-valued arrays of the given shape
+        """
+        buffers = self._buffers.get(name)
+        if buffers is None or buffers[0].shape != shape:
+            buffers = [np.zeros(shape) for _ in range(num)]
+            self._buffers[name] = buffers
+        else:
+            for buffer in buffers:
+                buffer.fill(0)
+        return buffers
+
+    def __getstate__(self):
+        # the output buffers are not needed to be transferred (e.g. to other processes)
+        state = self.__dict__.copy()
+        state["_buffers"] = {}
+        return state
+
     def change_redshift_scaling(self, alpha_scaling):
         """
 
@@ -272,3 +311,26 @@ class SinglePlane(ProfileListBase):
                 density_i = func.density_lens(r, **kwargs_i)
                 density += density_i
         return density
+
+
+def _float_array(x):
+    """Float numpy array of x, without copying contiguous float64 arrays.
+
+    :param x: float, list or numpy array
+    :return: numpy array
+    """
+    if isinstance(x, np.ndarray) and x.dtype == np.float64 and x.flags.c_contiguous:
+        return x
+    return np.array(x, dtype=float)
+
+
+def _overrides(func, name):
+    """Whether a lens profile instance overwrites a definition of LensProfileBase.
+
+    :param func: lens profile instance
+    :param name: name of the definition
+    :return: bool
+    """
+    if not isinstance(func, LensProfileBase):
+        return False
+    return getattr(type(func), name) is not getattr(LensProfileBase, name)
@@ -4,6 +4,7 @@ __author__ = "sibirrer"
 
 import numpy as np
 from lenstronomy.LightModel.light_model_base import LightModelBase
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["LinearBasis"]
 
@@ -18,6 +19,7 @@ class LinearBasis(LightModelBase):
         """
         super(LinearBasis, self).__init__(**kwargs)
 
+    @timed
     def functions_split(self, x, y, kwargs_list, k=None):
         """Split model in different components.
 
@@ -1,6 +1,7 @@
 import numpy as np
 import copy
 from lenstronomy.PointSource.point_source_cached import PointSourceCached
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["PointSource"]
 
@@ -240,6 +241,7 @@ class PointSource(object):
             y_source_list.append(y_source)
         return x_source_list, y_source_list
 
+    @timed
     def image_position(
         self,
         kwargs_ps,
@@ -1,5 +1,6 @@
 from lenstronomy.LensModel.lens_model_extensions import LensModelExtensions
 import numpy as np
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["FluxRatioLikelihood"]
 
@@ -65,6 +66,7 @@ class FluxRatioLikelihood(object):
             point_source_redshift_list = [None] * num_point_sources
         self._point_source_redshift_list = point_source_redshift_list
 
+    @timed
     def logL(self, ra_image_list, dec_image_list, kwargs_lens, kwargs_special):
         """
 
@@ -1,5 +1,6 @@
 import numpy as np
 from lenstronomy.Util import class_creator
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["ImageLikelihood"]
 
@@ -19,6 +20,8 @@ class ImageLikelihood(object):
         check_positive_flux=False,
         kwargs_pixelbased=None,
         linear_solver=True,
+        kwargs_wls=None,
+        num_threads_bands=1,
     ):
         """
 
@@ -36,6 +39,10 @@ class ImageLikelihood(object):
          (see SLITronomy documentation)
         :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
          that they get overwritten by the linear solver solution.
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver, e.g.
+         {'method': 'cholesky', 'float32': False} (see de_lens.create_wls_solver())
+        :param num_threads_bands: number of threads evaluating the imaging bands concurrently in the 'multi-linear'
+         and 'joint-linear' settings (-1 for all available cores)
         """
         self.imSim = class_creator.create_im_sim(
             multi_band_list,
@@ -45,12 +52,15 @@ class ImageLikelihood(object):
             image_likelihood_mask_list=image_likelihood_mask_list,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            kwargs_wls=kwargs_wls,
+            num_threads=num_threads_bands,
         )
         self._model_type = self.imSim.type
         self._source_marg = source_marg
         self._linear_prior = linear_prior
         self._check_positive_flux = check_positive_flux
 
+    @timed
     def logL(
         self,
         kwargs_lens=None,
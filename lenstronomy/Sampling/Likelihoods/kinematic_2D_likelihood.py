@@ -2,6 +2,7 @@ import numpy as np
 from scipy import signal
 from lenstronomy.Util.kin_sampling_util import KinNNImageAlign
 from lenstronomy.Sampling.Likelihoods import kinematic_NN_call
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["KinLikelihood"]
 
@@ -105,6 +106,7 @@ class KinLikelihood(object):
         else:
             return np.nan
 
+    @timed
     def logL(self, kwargs_lens, kwargs_lens_light, kwargs_special, verbose=False):
         """Calculates Log likelihood from 2D kinematic likelihood.
 
@@ -9,6 +9,7 @@ from lenstronomy.LensModel.Solver.lens_equation_solver import LensEquationSolver
 
 
 import warnings
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["PositionLikelihood"]
 
@@ -87,6 +88,7 @@ class PositionLikelihood(object):
             dec_image_list = []
         self._ra_image_list, self._dec_image_list = ra_image_list, dec_image_list
 
+    @timed
     def logL(self, kwargs_lens, kwargs_ps, kwargs_special, verbose=False):
         """
 
@@ -1,5 +1,6 @@
 import numpy as np
 from lenstronomy.Util.prob_density import KDE1D
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["PriorLikelihood"]
 
@@ -111,6 +112,7 @@ class PriorLikelihood(object):
             kde_list.append(KDE1D(values=samples))
         return kde_list
 
+    @timed
     def logL(
         self,
         kwargs_lens=None,
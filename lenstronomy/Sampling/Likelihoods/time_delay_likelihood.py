@@ -1,6 +1,7 @@
 import numpy as np
 import lenstronomy.Util.constants as const
 from lenstronomy.Util.cosmo_util import get_astropy_cosmology
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["TimeDelayLikelihood"]
 
@@ -91,6 +92,7 @@ class TimeDelayLikelihood(object):
 
         self._measurement_bool_list = time_delay_measurement_bool_list
 
+    @timed
     def logL(self, kwargs_lens, kwargs_ps, kwargs_cosmo):
         """Routine to compute the log likelihood of the time-delay distance.
 
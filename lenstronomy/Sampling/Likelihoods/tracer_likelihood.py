@@ -1,5 +1,6 @@
 import numpy as np
 from lenstronomy.Util import class_creator
+from lenstronomy.Util.profiling import timed
 
 
 class TracerLikelihood(object):
@@ -29,6 +30,7 @@ class TracerLikelihood(object):
             tracer_data, kwargs_model, tracer_likelihood_mask=tracer_likelihood_mask
         )
 
+    @timed
     def logL(
         self,
         kwargs_tracer_source,
@@ -3,18 +3,30 @@ this file is taken from schwimmbad (https://github.com/adrn/schwimmbad) and an e
 to replace the multiprocessing with the multiprocess dependence as for multi-threading, multiprocessing is
 not supporting dill (only pickle) which is required.
 
-The class also extends with a ``is_master()`` definition
+The class also extends with a ``is_master()`` definition and with the option to
+install a function (e.g. the likelihood) once in each worker process at start-up, with
+its large numpy arrays in shared memory (see ``SharedFunction``).
 
 """
 
 # Standard library
 
+import io
+import uuid
 import signal
 import functools
+import dill
+import numpy as np
 import multiprocess
+from multiprocess import shared_memory
 from multiprocess.pool import Pool
 
-__all__ = ["MultiPool"]
+__all__ = ["MultiPool", "SharedFunction"]
+
+# functions installed in this process by the MultiPool initializer, by key
+_shared_functions = {}
+# shared memory blocks attached in this process (kept open for the arrays using them)
+_shared_blocks = []
 
 
 def _initializer_wrapper(actual_initializer, *rest):
@@ -28,6 +40,124 @@ def _initializer_wrapper(actual_initializer, *rest):
         actual_initializer(*rest)
 
 
+def _shared_function_initializer(key, payload, actual_initializer, *rest):
+    """Installs the shared function (serialized with its large arrays in shared memory)
+    in the worker process before calling the actual initializer.
+
+    :param key: key of the shared function
+    :param payload: serialized function, see _dumps_shared()
+    :param actual_initializer: initializer of the pool (or None)
+    :param rest: arguments of the actual initializer
+    """
+    _shared_functions[key] = _loads_shared(payload)
+    if actual_initializer is not None:
+        actual_initializer(*rest)
+
+
+class SharedFunction(object):
+    """Picklable reference to a function installed in the worker processes of a
+    MultiPool at start-up.
+
+    Only the key of the function is pickled, such that mapping a SharedFunction over a
+    pool sends the arguments (e.g. parameter vectors) but not the function and its data.
+    In the process that created the pool, the function itself is called.
+    """
+
+    def __init__(self, key, function=None):
+        """
+
+        :param key: key of the function installed in the workers
+        :param function: the function itself (in the master process)
+        """
+        self._key = key
+        self._function = function
+
+    def __getstate__(self):
+        return {"key": self._key}
+
+    def __setstate__(self, state):
+        self._key = state["key"]
+        self._function = None
+
+    def __call__(self, *args, **kwargs):
+        function = self._function
+        if function is None:
+            function = _shared_functions[self._key]
+        return function(*args, **kwargs)
+
+
+class _SharedMemoryPickler(dill.Pickler):
+    """Dill pickler that copies numpy arrays above a minimal size into shared memory
+    blocks and only pickles a reference to them."""
+
+    def __init__(self, file, min_bytes, blocks):
+        """
+
+        :param file: file-like object to pickle into
+        :param min_bytes: minimal size of an array to be shared
+        :param blocks: list the new shared memory blocks are appended to
+        """
+        super(_SharedMemoryPickler, self).__init__(file)
+        self._min_bytes = min_bytes
+        self._blocks = blocks
+        self._references = {}
+
+    def persistent_id(self, obj):
+        if (
+            type(obj) is not np.ndarray
+            or obj.nbytes < self._min_bytes
+            or obj.dtype.hasobject
+            or obj.dtype.fields is not None
+        ):
+            return None
+        if id(obj) not in self._references:
+            block = shared_memory.SharedMemory(create=True, size=obj.nbytes)
+            np.ndarray(obj.shape, dtype=obj.dtype, buffer=block.buf)[...] = obj
+            self._blocks.append(block)
+            # the array is kept referenced such that its id is not re-used
+            self._references[id(obj)] = (
+                obj,
+                (block.name, obj.shape, obj.dtype.str),
+            )
+        return self._references[id(obj)][1]
+
+
+class _SharedMemoryUnpickler(dill.Unpickler):
+    """Dill unpickler that maps the arrays pickled by _SharedMemoryPickler as read-only
+    views of the shared memory blocks."""
+
+    def persistent_load(self, pid):
+        name, shape, dtype = pid
+        block = shared_memory.SharedMemory(name=name)
+        _shared_blocks.append(block)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        return array
+
+
+def _dumps_shared(obj, min_bytes):
+    """Serializes an object with its numpy arrays of at least min_bytes in shared
+    memory.
+
+    :param obj: object to serialize
+    :param min_bytes: minimal size of an array to be shared
+    :return: serialized object, list of shared memory blocks created
+    """
+    buffer = io.BytesIO()
+    blocks = []
+    _SharedMemoryPickler(buffer, min_bytes, blocks).dump(obj)
+    return buffer.getvalue(), blocks
+
+
+def _loads_shared(payload):
+    """Deserializes an object serialized with _dumps_shared().
+
+    :param payload: serialized object
+    :return: object
+    """
+    return _SharedMemoryUnpickler(io.BytesIO(payload)).load()
+
+
 class CallbackWrapper(object):
     def __init__(self, callback):
         self.callback = callback
@@ -45,8 +175,17 @@ class MultiPool(Pool):
     """
 
     wait_timeout = 3600
+    # minimal size in bytes of the arrays of the shared function put in shared memory
+    _shared_memory_min_bytes = 2**16
 
-    def __init__(self, processes=None, initializer=None, initargs=(), **kwargs):
+    def __init__(
+        self,
+        processes=None,
+        initializer=None,
+        initargs=(),
+        shared_function=None,
+        **kwargs
+    ):
         """
 
         :param processes: The number of worker processes to use; defaults to the number of CPUs.
@@ -55,13 +194,53 @@ class MultiPool(Pool):
         :type initializer: callable, optional
         :param initargs: Arguments for ``initializer``; it will be called as ``initializer(*initargs)``.
         :type initargs: iterable, optional
+        :param shared_function: If specified, a callable (e.g. the likelihood) that is serialized once and installed
+         in each worker process when it starts. Its numpy arrays larger than 64 kB are placed in (read-only) shared
+         memory. Mapping ``self.shared_function`` over the pool then only sends the arguments to the workers.
+        :type shared_function: callable, optional
         :param kwargs: Extra arguments passed to the :class:`multiprocessing.pool.Pool` superclass.
         """
+        self._shared_function = None
+        self._shared_blocks = []
+        if shared_function is not None:
+            key = uuid.uuid4().hex
+            payload, self._shared_blocks = _dumps_shared(
+                shared_function, self._shared_memory_min_bytes
+            )
+            initializer = functools.partial(
+                _shared_function_initializer, key, payload, initializer
+            )
+            self._shared_function = SharedFunction(key, shared_function)
         new_initializer = functools.partial(_initializer_wrapper, initializer)
         super(MultiPool, self).__init__(processes, new_initializer, initargs, **kwargs)
         self.size = self._processes
         self.rank = 0
 
+    @property
+    def shared_function(self):
+        """Picklable reference to the function installed in the workers (None if no
+        shared_function was given).
+
+        :return: SharedFunction instance or None
+        """
+        return self._shared_function
+
+    def close(self):
+        super(MultiPool, self).close()
+        self._release_shared_memory()
+
+    def terminate(self):
+        super(MultiPool, self).terminate()
+        self._release_shared_memory()
+
+    def _release_shared_memory(self):
+        """Unlinks the shared memory blocks of the shared function (the workers keep
+        their mappings until they exit)."""
+        for block in self._shared_blocks:
+            block.close()
+            block.unlink()
+        self._shared_blocks = []
+
     def is_master(self):
         return self.rank == 0
 
@@ -39,7 +39,7 @@ _VERBOSE = 5
 __all__ = ["choose_pool"]
 
 
-def choose_pool(mpi=False, processes=1, **kwargs):
+def choose_pool(mpi=False, processes=1, shared_function=None, **kwargs):
     """Extends the capabilities of the schwimmbad.choose_pool method.
 
     It handles the `use_dill` parameters in kwargs, that would otherwise raise an error when processes > 1.
@@ -58,6 +58,10 @@ def choose_pool(mpi=False, processes=1, **kwargs):
         :class:`~schwimmbad.multiprocessing.MultiPool`, with this number of
         processes. By default, ``processes=1``, will use them:class:`~schwimmbad.serial.SerialPool`.
     :type processes: int, optional
+    :param shared_function: (optional) callable that the multiprocessing pool installs once in each worker process
+        with its large arrays in shared memory (see :class:`~lenstronomy.Sampling.Pool.multiprocessing.MultiPool`);
+        ignored by the MPI and serial pools.
+    :type shared_function: callable, optional
     :param kwargs: Any additional kwargs are passed in to the pool class initializer selected by the arguments.
     :type kwargs: keyword arguments
     """
@@ -91,7 +95,7 @@ def choose_pool(mpi=False, processes=1, **kwargs):
             # schwimmbad MultiPool does not support dill so we remove this option from the kwargs
             _ = kwargs.pop("use_dill")
         log.info("Running with MultiPool on {0} cores".format(processes))
-        return MultiPool(processes=processes, **kwargs)
+        return MultiPool(processes=processes, shared_function=shared_function, **kwargs)
 
     else:
         log.info("Running with SerialPool")
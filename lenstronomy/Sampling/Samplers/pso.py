@@ -6,6 +6,8 @@
 from copy import copy
 from math import floor
 import math
+import os
+import pickle
 import numpy as np
 from tqdm import tqdm
 
@@ -33,7 +35,15 @@ class ParticleSwarmOptimizer(object):
     """
 
     def __init__(
-        self, func, low, high, particle_count=25, pool=None, args=None, kwargs=None
+        self,
+        func,
+        low,
+        high,
+        particle_count=25,
+        pool=None,
+        args=None,
+        kwargs=None,
+        vectorize=False,
     ):
         """
 
@@ -53,16 +63,24 @@ class ParticleSwarmOptimizer(object):
         :param kwargs: keyword arguments to send to `func`. The function
         will be called as `func(x, *args, **kwargs)`
         :type kwargs: `dict`
+        :param vectorize: if True, `func` takes a 2d array of shape (n_particles,
+            n_param) and returns an array of the log likelihoods of all particles. The
+            swarm is then evaluated with one call (or one call per pool worker).
+        :type vectorize: bool
         """
         self.low = [l for l in low]
         self.high = [h for h in high]
         self.particleCount = particle_count
         self.pool = pool
+        self._vectorize = vectorize
 
         self.param_count = len(self.low)
 
         self.swarm = self._init_swarm()
         self.global_best = Particle.create(self.param_count)
+        # number of completed iterations of the swarm and iteration to resume from
+        self._iteration = 0
+        self._resume_iteration = 0
 
         self.func = _FunctionWrapper(func, args, kwargs)
 
@@ -135,8 +153,10 @@ class ParticleSwarmOptimizer(object):
         :type verbose: boolean
         """
 
-        self._get_fitness(self.swarm)
-        i = 0
+        i = self._resume_iteration
+        self._resume_iteration = 0
+        if i == 0:
+            self._get_fitness(self.swarm)
         while True:
             for particle in self.swarm:
                 if self.global_best.fitness < particle.fitness:
@@ -195,14 +215,14 @@ class ParticleSwarmOptimizer(object):
                 ).tolist()
 
             self._get_fitness(self.swarm)
+            i += 1
+            self._iteration = i
 
             swarm = []
             for particle in self.swarm:
                 swarm.append(particle.copy())
             yield swarm
 
-            i += 1
-
     def optimize(
         self,
         max_iter=1000,
@@ -213,6 +233,7 @@ class ParticleSwarmOptimizer(object):
         m=1e-3,
         n=1e-2,
         early_stop_tolerance=None,
+        checkpoint_filename=None,
     ):
         """Run the optimization and return a full list of optimization outputs.
 
@@ -225,13 +246,19 @@ class ParticleSwarmOptimizer(object):
         :param n: stop criterion, difference between norm of the particle
          vector and norm of the global best
         :param early_stop_tolerance: will terminate at the given value (should be specified as a chi^2)
+        :param checkpoint_filename: (optional) file name where the state of the swarm is saved after each iteration.
+         If the file exists, the optimization resumes from the iteration saved in it.
         """
         log_likelihood_list = []
         vel_list = []
         pos_list = []
+        if checkpoint_filename is not None and os.path.exists(checkpoint_filename):
+            log_likelihood_list, pos_list, vel_list = self._load_state(
+                checkpoint_filename
+            )
 
-        num_iter = 0
-        with tqdm(total=max_iter) as pbar:
+        num_iter = len(log_likelihood_list)
+        with tqdm(total=max_iter, initial=num_iter) as pbar:
             for _ in self.sample(
                 max_iter, c1, c2, p, m, n, early_stop_tolerance, verbose
             ):
@@ -239,6 +266,10 @@ class ParticleSwarmOptimizer(object):
                 vel_list.append(self.global_best.velocity)
                 pos_list.append(self.global_best.position)
                 num_iter += 1
+                if checkpoint_filename is not None:
+                    self._save_state(
+                        checkpoint_filename, [log_likelihood_list, pos_list, vel_list]
+                    )
 
                 if verbose and self.is_master():
                     pbar.update(1)
@@ -247,6 +278,55 @@ class ParticleSwarmOptimizer(object):
 
         return self.global_best.position, [log_likelihood_list, pos_list, vel_list]
 
+    def _save_state(self, filename, chain):
+        """Saves the state of the swarm (particles with their velocities and personal
+        bests, global best, iteration and random state) and the chain of the global
+        best. The file is replaced atomically such that an interruption while writing
+        does not corrupt the previous state.
+
+        :param filename: file name of the checkpoint
+        :param chain: [lnlikelihood, positions, velocities] of the global best after
+            each iteration
+        :return: None
+        """
+        if not self.is_master():
+            return
+        state = {
+            "iteration": self._iteration,
+            "swarm": self.swarm,
+            "global_best": self.global_best,
+            "chain": chain,
+            "random_state": np.random.get_state(),
+        }
+        filename_temp = filename + ".tmp"
+        with open(filename_temp, "wb") as f:
+            pickle.dump(state, f)
+        os.replace(filename_temp, filename)
+
+    def _load_state(self, filename):
+        """Restores the state of the swarm saved with _save_state().
+
+        :param filename: file name of the checkpoint
+        :return: [lnlikelihood, positions, velocities] of the global best after each
+            saved iteration
+        """
+        with open(filename, "rb") as f:
+            state = pickle.load(f)
+        swarm = state["swarm"]
+        if len(swarm) != self.particleCount or any(
+            len(particle.position) != self.param_count for particle in swarm
+        ):
+            raise ValueError(
+                "The swarm saved in %s does not match %s particles with %s parameters."
+                % (filename, self.particleCount, self.param_count)
+            )
+        self.swarm = swarm
+        self.global_best = state["global_best"]
+        self._iteration = state["iteration"]
+        self._resume_iteration = state["iteration"]
+        np.random.set_state(state["random_state"])
+        return state["chain"]
+
     def _get_fitness(self, swarm):
         """Set fitness (probability) of the particles in swarm.
 
@@ -256,16 +336,36 @@ class ParticleSwarmOptimizer(object):
         :rtype:
         """
         position = [particle.position for particle in swarm]
-        if self.pool is None:
-            map_func = map
+        if self._vectorize is True:
+            ln_probability = self._get_fitness_vectorized(position)
         else:
-            map_func = self.pool.map
-        ln_probability = list(map_func(self.func, position))
+            if self.pool is None:
+                map_func = map
+            else:
+                map_func = self.pool.map
+            ln_probability = list(map_func(self.func, position))
 
         for i, particle in enumerate(swarm):
             particle.fitness = ln_probability[i]
             particle.position = position[i]
 
+    def _get_fitness_vectorized(self, position):
+        """Evaluates the fitness of all particles with a vectorized function. With a
+        pool, the swarm is split into one chunk per worker.
+
+        :param position: positions of the particles
+        :type position: list of lists
+        :return: log likelihoods of the particles
+        :rtype: numpy array
+        """
+        position = np.array(position, dtype=float)
+        num_chunks = 1 if self.pool is None else max(getattr(self.pool, "size", 1), 1)
+        if num_chunks == 1:
+            return np.atleast_1d(self.func(position))
+        chunks = np.array_split(position, min(num_chunks, len(position)))
+        ln_probability = list(self.pool.map(self.func, chunks))
+        return np.concatenate([np.atleast_1d(ln_p) for ln_p in ln_probability])
+
     def _converged(self, it, p, m, n):
         """Check for convergence.
 
@@ -9,6 +9,7 @@ from lenstronomy.Sampling.Likelihoods.prior_likelihood import PriorLikelihood
 from lenstronomy.Sampling.Likelihoods.kinematic_2D_likelihood import KinLikelihood
 import lenstronomy.Util.class_creator as class_creator
 import numpy as np
+from lenstronomy.Util.profiling import Profiler, timed
 
 __all__ = ["LikelihoodModule"]
 
@@ -70,11 +71,14 @@ class LikelihoodModule(object):
         prior_special_lognormal=None,
         custom_logL_addition=None,
         kwargs_pixelbased=None,
+        kwargs_wls=None,
+        num_threads_bands=1,
         kinematic_2d_likelihood=False,
         kin_lens_idx=0,
         kin_lens_light_idx=0,
         tracer_likelihood=False,
         tracer_likelihood_mask=None,
+        profiling=False,
     ):
         """Initializing class.
 
@@ -120,9 +124,17 @@ class LikelihoodModule(object):
             kwargs_extinction) and returns a logL (punishing) value.
         :param kwargs_pixelbased: keyword arguments with various settings related to the
             pixel-based solver (see SLITronomy documentation)
+        :param kwargs_wls: keyword arguments of the weighted linear least square solver
+            of the imaging likelihood, e.g. {'method': 'cholesky', 'float32': False}
+            (see lenstronomy.ImSim.de_lens.create_wls_solver())
+        :param num_threads_bands: number of threads evaluating the imaging bands
+            concurrently in the 'multi-linear' and 'joint-linear' settings (-1 for all
+            available cores)
         :param kinematic_2d_likelihood: bool, option to compute the kinematic likelihood
         :param tracer_likelihood: option to perform likelihood on tracer quantity
             derived from imaging or spectroscopy
+        :param profiling: bool, if True, records the wall time and number of calls of
+            the stages of the likelihood evaluations (see profiler)
         """
         # TODO unpack also tracer model from kwargs_data
         (
@@ -167,6 +179,10 @@ class LikelihoodModule(object):
         self._flux_ratio_likelihood = flux_ratio_likelihood
         self._tracer_likelihood = tracer_likelihood
         self._kinematic_2D_likelihood = kinematic_2d_likelihood
+        if profiling is True:
+            self._profiler = Profiler()
+        else:
+            self._profiler = None
         if kwargs_flux_compute is None:
             kwargs_flux_compute = {}
         linear_solver = self.param.linear_solver
@@ -184,6 +200,8 @@ class LikelihoodModule(object):
             "check_positive_flux": check_positive_flux,
             "kwargs_pixelbased": kwargs_pixelbased,
             "linear_solver": linear_solver,
+            "kwargs_wls": kwargs_wls,
+            "num_threads_bands": num_threads_bands,
         }
         self._kwargs_image_sim = {
             "multi_band_list": multi_band_list,
@@ -255,6 +273,15 @@ class LikelihoodModule(object):
         kwargs_imaging = {**self._kwargs_image_likelihood, **self._kwargs_image_sim}
         return kwargs_imaging
 
+    @property
+    def profiler(self):
+        """Profiler recording the stages of the likelihood evaluations of this instance
+        (in the process calling logL() or logL_batch()).
+
+        :return: Profiler instance, or None if profiling=False
+        """
+        return self._profiler
+
     def _class_instances(
         self,
         kwargs_model,
@@ -331,6 +358,7 @@ class LikelihoodModule(object):
     def __call__(self, a):
         return self.logL(a)
 
+    @timed
     def logL(self, args, verbose=False):
         """Routine to compute X2 given variable parameters for a MCMC/PSO chain.
 
@@ -341,6 +369,9 @@ class LikelihoodModule(object):
         :type verbose: boolean
         :returns: log likelihood of the data given the model (natural logarithm)
         """
+        if self._profiler is not None and self._profiler.active is False:
+            with self._profiler:
+                return self.logL(args, verbose=verbose)
         if self._check_bounds is True:
             penalty, bound_hit = self.check_bounds(
                 args, self._lower_limit, self._upper_limit, verbose=verbose
@@ -351,6 +382,40 @@ class LikelihoodModule(object):
         kwargs_return = self.param.args2kwargs(args)
         return self.log_likelihood(kwargs_return, verbose=verbose)
 
+    @timed
+    def logL_batch(self, args_list, verbose=False):
+        """Log likelihood of a stack of parameter vectors (e.g. all walkers of an
+        ensemble sampler or all particles of a swarm) evaluated in a single call.
+
+        The hard bounds are checked for all samples at once and only the samples within
+        the bounds are passed through the model evaluation.
+
+        :param args_list: ordered parameter values that are being sampled
+        :type args_list: 2d numpy array of shape (n_samples, n_param)
+        :param verbose: if True, makes print statements about individual likelihood
+            components
+        :type verbose: boolean
+        :returns: log likelihoods of the samples (natural logarithm)
+        :rtype: numpy array of length n_samples
+        """
+        if self._profiler is not None and self._profiler.active is False:
+            with self._profiler:
+                return self.logL_batch(args_list, verbose=verbose)
+        args_list = np.atleast_2d(args_list)
+        logL_list = np.full(len(args_list), -(10.0**18))
+        if self._check_bounds is True:
+            bound_hit = self.check_bounds_batch(
+                args_list, self._lower_limit, self._upper_limit
+            )
+        else:
+            bound_hit = np.zeros(len(args_list), dtype=bool)
+        index = np.where(~bound_hit)[0]
+        kwargs_return_list = self.param.args2kwargs_batch(args_list[index])
+        for i, kwargs_return in zip(index, kwargs_return_list):
+            logL_list[i] = self.log_likelihood(kwargs_return, verbose=verbose)
+        return logL_list
+
+    @timed
     def log_likelihood(self, kwargs_return, verbose=False):
         """
 
@@ -455,6 +520,20 @@ class LikelihoodModule(object):
                 return penalty, bound_hit
         return penalty, bound_hit
 
+    @staticmethod
+    def check_bounds_batch(args_list, lowerLimit, upperLimit):
+        """Checks for a stack of parameter vectors whether they have left their bounds.
+
+        :param args_list: 2d array of shape (n_samples, n_param)
+        :param lowerLimit: lower bounds of the parameters
+        :param upperLimit: upper bounds of the parameters
+        :return: bool array of length n_samples, True where any bound is hit
+        """
+        args_list = np.atleast_2d(args_list)
+        lowerLimit = np.asarray(lowerLimit, dtype=float)
+        upperLimit = np.asarray(upperLimit, dtype=float)
+        return np.any((args_list < lowerLimit) | (args_list > upperLimit), axis=1)
+
     @property
     def num_data(self):
         """
@@ -0,0 +1,296 @@
+"""This module provides a pre-computed (compiled) map between the flat array of sampled
+arguments and the keyword argument lists of the parameter classes.
+
+This is for internal use of the Param class. Reading out the arguments with the
+get_params() methods of the individual parameter classes walks through all model
+components and parameter names and their special cases for every call. The layout
+records once which entry (or slice) of the argument array ends up in which keyword
+argument, such that the read-out becomes a copy of the fixed keyword arguments and a
+gather from the argument array.
+"""
+
+__author__ = "sibirrer"
+__all__ = ["ParamLayout"]
+
+import copy
+
+import numpy as np
+
+
+class _GroupLayout(object):
+    """Layout of a single parameter class (e.g. the lens or the source parameters)."""
+
+    def __init__(self, get_params, kwargs_fixed, single, isolate, impose_bound):
+        """
+
+        :param get_params: function get_params(args, i) of the parameter class
+        :param kwargs_fixed: list of fixed keyword arguments (or a single keyword
+            argument dictionary if single=True)
+        :param single: bool, if True, the parameter class returns a single keyword
+            argument dictionary instead of a list
+        :param isolate: bool, if True, the mutable fixed values and the sampled arrays
+            are copied in each read-out (such that the returned keyword arguments do
+            not share memory with the fixed keyword arguments or the argument array)
+        :param impose_bound: bool, if True, get_params(args, i, impose_bound=True) is
+            called when the arguments are read out by the parameter class itself
+        """
+        self.get_params = get_params
+        self.single = single
+        self.isolate = isolate
+        self.impose_bound = impose_bound
+        self.compiled = False
+        self.start = 0
+        self.end = 0
+        self.templates = []
+        self.mutable_fixed = []
+        self.scalars = []
+        self.slices = []
+        if single:
+            self._kwargs_fixed = [kwargs_fixed]
+        else:
+            self._kwargs_fixed = kwargs_fixed
+
+    def compile(
+        self, args_probe, i, log_names=None, kwargs_lower=None, kwargs_upper=None
+    ):
+        """Reads out the probe arguments (the index of each entry) once and records
+        where each sampled argument is placed.
+
+        :param args_probe: numpy array with the index of each entry as value
+        :param i: index of the first argument of this parameter class
+        :param log_names: list (per model component) of parameter names sampled in log10
+        :param kwargs_lower: lower bounds imposed on the sampled arguments (dictionary,
+            only for single=True)
+        :param kwargs_upper: upper bounds imposed on the sampled arguments (dictionary,
+            only for single=True)
+        :return: list of log10 sampled indexes, list of (index, lower bound, upper
+            bound) imposed; None if the read-out can not be expressed as a gather
+        """
+        kwargs_list, i_end = self.get_params(args_probe, i)
+        self.start, self.end = i, i_end
+        if self.single:
+            kwargs_list = [kwargs_list]
+        log_index, bounds = [], []
+        templates, mutable_fixed, scalars, slices = [], [], [], []
+        j = i
+        for k, kwargs in enumerate(kwargs_list):
+            kwargs_fixed = self._kwargs_fixed[k]
+            template = {}
+            for name, value in kwargs.items():
+                if name in kwargs_fixed:
+                    template[name] = value
+                    if isinstance(value, (np.ndarray, list, dict)):
+                        mutable_fixed.append((k, name))
+                    continue
+                if isinstance(value, np.ndarray) and value.ndim == 1:
+                    num = len(value)
+                    if not np.array_equal(value, np.arange(j, j + num)):
+                        return None
+                    index = list(range(j, j + num))
+                    slices.append((k, name, j, j + num))
+                elif np.ndim(value) == 0 and not isinstance(value, (list, dict)):
+                    is_log = log_names is not None and name in log_names[k]
+                    if not is_log and value != j:
+                        return None
+                    index = [j]
+                    scalars.append((k, name, j))
+                else:
+                    # special read-out (e.g. solver-constrained shapelet coefficients)
+                    return None
+                # placeholder keeping the order of the keyword arguments
+                template[name] = None
+                if log_names is not None and name in log_names[k]:
+                    log_index += index
+                if kwargs_lower is not None:
+                    lower = np.broadcast_to(
+                        np.asarray(kwargs_lower[name], dtype=float), len(index)
+                    )
+                    upper = np.broadcast_to(
+                        np.asarray(kwargs_upper[name], dtype=float), len(index)
+                    )
+                    bounds += list(zip(index, lower, upper))
+                j += len(index)
+            templates.append(template)
+        if j != i_end:
+            return None
+        self.templates = templates
+        self.mutable_fixed = mutable_fixed
+        self.scalars = scalars
+        self.slices = slices
+        self.compiled = True
+        return log_index, bounds
+
+    def read(self, values, args):
+        """
+
+        :param values: argument array with the log10 and bound transforms applied
+        :param args: argument array as sampled
+        :return: keyword argument list (or dictionary if single=True)
+        """
+        if self.compiled is False:
+            if self.impose_bound is True:
+                kwargs_list, _ = self.get_params(args, self.start, impose_bound=True)
+            else:
+                kwargs_list, _ = self.get_params(args, self.start)
+            if self.isolate is True:
+                kwargs_list = copy.deepcopy(kwargs_list)
+            return kwargs_list
+        kwargs_list = [template.copy() for template in self.templates]
+        if self.isolate is True:
+            for k, name in self.mutable_fixed:
+                kwargs_list[k][name] = copy.deepcopy(kwargs_list[k][name])
+            for k, name, start, end in self.slices:
+                kwargs_list[k][name] = values[start:end].copy()
+        else:
+            for k, name, start, end in self.slices:
+                kwargs_list[k][name] = values[start:end]
+        for k, name, index in self.scalars:
+            kwargs_list[k][name] = values[index]
+        if self.single:
+            return kwargs_list[0]
+        return kwargs_list
+
+
+class ParamLayout(object):
+    """Pre-computed map between the flat argument array and the keyword arguments of a
+    sequence of parameter classes.
+
+    Parameter classes (or model components) with a read-out that can not be expressed as
+    a gather (e.g. the shapelet lens coefficients constrained by the lens equation
+    solver) keep being read out by their own get_params() method.
+    """
+
+    def __init__(self, num_param):
+        """
+
+        :param num_param: number of sampled arguments
+        """
+        self._num_param = int(num_param)
+        self._groups = []
+        self._i = 0
+        self._log_index = []
+        self._bound_index = []
+        self._lower = np.zeros(0)
+        self._upper = np.zeros(0)
+
+    def add_group(
+        self,
+        get_params,
+        kwargs_fixed,
+        single=False,
+        isolate=False,
+        log_names=None,
+        kwargs_lower=None,
+        kwargs_upper=None,
+    ):
+        """Adds the next parameter class in the order of the argument array.
+
+        :param get_params: function get_params(args, i) of the parameter class returning
+            (keyword arguments, index after the read-out)
+        :param kwargs_fixed: list of fixed keyword arguments (or a single dictionary if
+            single=True)
+        :param single: bool, if True, the parameter class returns a single keyword
+            argument dictionary instead of a list
+        :param isolate: bool, if True, the returned keyword arguments do not share
+            mutable objects with the fixed keyword arguments or the argument array
+        :param log_names: list (per model component) of parameter names sampled in
+            log10, i.e. 10**arg is returned
+        :param kwargs_lower: lower bounds imposed on the sampled arguments (dictionary,
+            only for single=True). If set, get_params() needs to support the
+            impose_bound keyword argument.
+        :param kwargs_upper: upper bounds imposed on the sampled arguments (dictionary,
+            only for single=True)
+        :return: None
+        """
+        group = _GroupLayout(
+            get_params,
+            kwargs_fixed,
+            single=single,
+            isolate=isolate,
+            impose_bound=kwargs_lower is not None,
+        )
+        args_probe = np.arange(self._num_param, dtype=float)
+        try:
+            result = group.compile(
+                args_probe,
+                self._i,
+                log_names=log_names,
+                kwargs_lower=kwargs_lower,
+                kwargs_upper=kwargs_upper,
+            )
+        except (KeyError, IndexError, TypeError, ValueError):
+            # the read-out fails for the probe (e.g. inconsistent settings); the
+            # get_params() method of the class raises the error when called
+            result = None
+        if result is None:
+            group.compiled = False
+            group.start = self._i
+            try:
+                _, group.end = get_params(args_probe, self._i)
+            except (KeyError, IndexError, TypeError, ValueError):
+                group.end = self._i
+        else:
+            log_index, bounds = result
+            self._log_index += log_index
+            if bounds:
+                index, lower, upper = zip(*bounds)
+                self._bound_index += list(index)
+                self._lower = np.append(self._lower, lower)
+                self._upper = np.append(self._upper, upper)
+        self._i = group.end
+        self._groups.append(group)
+
+    @property
+    def num_compiled(self):
+        """
+
+        :return: number of parameter classes read out with the pre-computed layout
+        """
+        return int(np.sum([group.compiled for group in self._groups]))
+
+    def _transform(self, args):
+        """Applies the log10 sampling and the bounds to the sampled arguments.
+
+        :param args: numpy array (n_param) or (n_samples, n_param)
+        :return: transformed copy of args (or args itself without transforms)
+        """
+        if not self._log_index and not self._bound_index:
+            return args
+        values = np.array(args, dtype=float)
+        if self._log_index:
+            # scalar power as in the read-out of the parameter classes (the vectorized
+            # power can differ in the last digit)
+            for row in np.reshape(values, (-1, values.shape[-1])):
+                for j in self._log_index:
+                    row[j] = 10 ** row[j]
+        if self._bound_index:
+            index = self._bound_index
+            values[..., index] = np.minimum(
+                np.maximum(values[..., index], self._lower), self._upper
+            )
+        return values
+
+    def read(self, args):
+        """Reads out the keyword arguments of all parameter classes.
+
+        :param args: numpy array of sampled arguments
+        :return: list of keyword arguments (one entry per parameter class), index after
+            the read-out
+        """
+        values = self._transform(args)
+        return [group.read(values, args) for group in self._groups], self._i
+
+    def read_batch(self, args_list):
+        """Reads out the keyword arguments of a stack of argument arrays. The log10
+        sampling and the bounds are applied to all samples at once.
+
+        :param args_list: 2d numpy array of shape (n_samples, n_param)
+        :return: list (per sample) of lists of keyword arguments (one entry per
+            parameter class)
+        """
+        args_list = np.atleast_2d(args_list)
+        values_list = self._transform(args_list)
+        return [
+            [group.read(values, args) for group in self._groups]
+            for values, args in zip(values_list, args_list)
+        ]
@@ -9,6 +9,8 @@ from lenstronomy.LensModel.lens_param import LensParam
 from lenstronomy.LightModel.light_param import LightParam
 from lenstronomy.PointSource.point_source_param import PointSourceParam
 from lenstronomy.Sampling.special_param import SpecialParam
+from lenstronomy.Sampling.param_layout import ParamLayout
+from lenstronomy.Util.profiling import timed
 
 __all__ = ["Param"]
 
@@ -505,6 +507,51 @@ class Param(object):
                     " source position in the image plane is not valid!"
                 )
         self._linear_solver = linear_solver
+        self._layout = self._compile_layout()
+
+    def _compile_layout(self):
+        """Pre-computes the map between the argument array and the keyword arguments of
+        the parameter classes (see ParamLayout class) in the order of args2kwargs().
+
+        :return: ParamLayout instance
+        """
+        try:
+            num_param, _ = self.num_param()
+        except ValueError:
+            # inconsistent settings raise when the arguments are read out
+            num_param = 0
+        layout = ParamLayout(num_param)
+        # the lens and source keyword arguments are updated by the constraints and
+        # are not meant to share mutable objects with the fixed arguments
+        layout.add_group(
+            self.lensParams.get_params,
+            self.lensParams.kwargs_fixed,
+            isolate=True,
+            log_names=self.lensParams.kwargs_logsampling,
+        )
+        layout.add_group(
+            self.sourceParams.get_params, self.sourceParams.kwargs_fixed, isolate=True
+        )
+        layout.add_group(
+            self.lensLightParams.get_params, self.lensLightParams.kwargs_fixed
+        )
+        layout.add_group(
+            self.pointSourceParams.get_params, self.pointSourceParams.kwargs_fixed
+        )
+        layout.add_group(
+            self.specialParams.get_params,
+            self.specialParams.kwargs_fixed,
+            single=True,
+            kwargs_lower=self.specialParams.lower_limit,
+            kwargs_upper=self.specialParams.upper_limit,
+        )
+        layout.add_group(
+            self.extinctionParams.get_params, self.extinctionParams.kwargs_fixed
+        )
+        layout.add_group(
+            self.tracerSourceParams.get_params, self.tracerSourceParams.kwargs_fixed
+        )
+        return layout
 
     @property
     def num_point_source_images(self):
@@ -522,6 +569,7 @@ class Param(object):
         """
         return self._linear_solver
 
+    @timed
     def args2kwargs(self, args, bijective=False, jax=False):
         """
 
@@ -533,10 +581,38 @@ class Param(object):
         :param jax: Always False unless this function is being called from jaxtronomy, in which case set to True.
         :return: keyword arguments sorted in lenstronomy conventions
         """
-        i = 0
         if jax is False:
             args = np.atleast_1d(args)
-
+            kwargs_list, _ = self._layout.read(args)
+        else:
+            kwargs_list = self._get_params(args)
+        return self._update_constraints(*kwargs_list, bijective=bijective)
+
+    @timed
+    def args2kwargs_batch(self, args_list, bijective=False):
+        """Args2kwargs() of a stack of argument arrays (e.g. all walkers of an ensemble
+        sampler). The log10 sampling and the bounds of the arguments are applied to all
+        samples at once.
+
+        :param args_list: 2d numpy array of shape (n_samples, n_param)
+        :param bijective: boolean, see args2kwargs()
+        :return: list of keyword arguments sorted in lenstronomy conventions (one per
+            sample)
+        """
+        return [
+            self._update_constraints(*kwargs_list, bijective=bijective)
+            for kwargs_list in self._layout.read_batch(args_list)
+        ]
+
+    def _get_params(self, args):
+        """Reads out the arguments with the get_params() methods of the individual
+        parameter classes (without the pre-computed layout).
+
+        :param args: tuple of parameter values
+        :return: kwargs_lens, kwargs_source, kwargs_lens_light, kwargs_ps,
+            kwargs_special, kwargs_extinction, kwargs_tracer_source
+        """
+        i = 0
         kwargs_lens, i = self.lensParams.get_params(args, i)
         kwargs_source, i = self.sourceParams.get_params(args, i)
         kwargs_lens_light, i = self.lensLightParams.get_params(args, i)
@@ -544,6 +620,34 @@ class Param(object):
         kwargs_special, i = self.specialParams.get_params(args, i, impose_bound=True)
         kwargs_extinction, i = self.extinctionParams.get_params(args, i)
         kwargs_tracer_source, i = self.tracerSourceParams.get_params(args, i)
+        return (
+            copy.deepcopy(kwargs_lens),
+            copy.deepcopy(kwargs_source),
+            kwargs_lens_light,
+            kwargs_ps,
+            kwargs_special,
+            kwargs_extinction,
+            kwargs_tracer_source,
+        )
+
+    def _update_constraints(
+        self,
+        kwargs_lens,
+        kwargs_source,
+        kwargs_lens_light,
+        kwargs_ps,
+        kwargs_special,
+        kwargs_extinction,
+        kwargs_tracer_source,
+        bijective=False,
+    ):
+        """Applies the joint parameters, the lens scaling and the solver to the keyword
+        arguments read out from the sampled arguments. The lens and source keyword
+        arguments are updated in place.
+
+        :param bijective: boolean, see args2kwargs()
+        :return: keyword arguments sorted in lenstronomy conventions
+        """
         self._update_lens_model(kwargs_special)
         # update lens_light joint parameters
         kwargs_lens_light = self._update_lens_light_joint_with_point_source(
@@ -567,8 +671,9 @@ class Param(object):
         kwargs_lens = self._update_joint_param(
             kwargs_lens, kwargs_lens, self._joint_lens_with_lens
         )
-
-        kwargs_lens = self.update_lens_scaling(kwargs_special, kwargs_lens)
+        lens_scaling = self._mass_scaling or self._general_scaling
+        if lens_scaling:
+            kwargs_lens = self.update_lens_scaling(kwargs_special, kwargs_lens)
         # update point source constraint solver
         if self._solver is True:
             x_pos, y_pos = kwargs_ps[0]["ra_image"], kwargs_ps[0]["dec_image"]
@@ -585,7 +690,7 @@ class Param(object):
             kwargs_source, kwargs_tracer_source, self._joint_source_light_with_tracer
         )
         # optional revert lens_scaling for bijective
-        if bijective is True:
+        if bijective is True and lens_scaling:
             kwargs_lens = self.update_lens_scaling(
                 kwargs_special, kwargs_lens, inverse=True
             )
@@ -706,7 +811,25 @@ class Param(object):
             from image to source plane
         """
         kwargs_source_copy = copy.deepcopy(kwargs_source)
-        for i, kwargs in enumerate(kwargs_source_copy):
+        return self._image2source_plane(
+            kwargs_source_copy,
+            kwargs_lens,
+            kwargs_special=kwargs_special,
+            image_plane=image_plane,
+        )
+
+    def _image2source_plane(
+        self, kwargs_source, kwargs_lens, kwargs_special=None, image_plane=False
+    ):
+        """Same as image2source_plane() but updates kwargs_source in place.
+
+        :param kwargs_source: source light model keyword argument list
+        :param kwargs_lens: lens model keyword argument list
+        :param image_plane: boolean, if True, does not up map image plane parameters to
+            source plane
+        :return: kwargs_source with mapped position arguments
+        """
+        for i, kwargs in enumerate(kwargs_source):
             if self._image_plane_source_list[i] is True and not image_plane:
                 if "center_x" in kwargs:
                     x_mapped, y_mapped = self._image2SourceMapping.image2source(
@@ -718,7 +841,7 @@ class Param(object):
                     )
                     kwargs["center_x"] = x_mapped
                     kwargs["center_y"] = y_mapped
-        return kwargs_source_copy
+        return kwargs_source
 
     def _update_source_joint_with_point_source(
         self,
@@ -736,9 +859,9 @@ class Param(object):
         :param kwargs_special: special keyword arguments
         :param image_plane: boolean, if True, does not up map image plane parameters to
             source plane
-        :return: updated source light model keyword arguments
+        :return: updated source light model keyword arguments (updated in place)
         """
-        kwargs_source_list = self.image2source_plane(
+        kwargs_source_list = self._image2source_plane(
             kwargs_source_list,
             kwargs_lens_list,
             image_plane=image_plane,
@@ -70,6 +70,9 @@ class Sampler(object):
         mpi=False,
         print_key="PSO",
         verbose=True,
+        vectorize=False,
+        shared_memory=False,
+        checkpoint_filename=None,
     ):
         """Return the best fit for the lens model on catalogue basis with particle swarm
         optimizer.
@@ -86,6 +89,14 @@ class Sampler(object):
         :param mpi: bool, if True, makes instance of MPIPool to allow for MPI execution
         :param print_key: string, prints the process name in the progress bar (optional)
         :param verbose: suppress or turn on print statements
+        :param vectorize: if True, evaluates the swarm with
+            LikelihoodModule.logL_batch() (one call per iteration or one call per pool
+            worker) instead of one call per particle
+        :param shared_memory: if True and threadCount > 1, the likelihood is installed
+            once in each worker process with its large arrays in shared memory and only
+            the parameter vectors are sent to the workers
+        :param checkpoint_filename: (optional) file name where the state of the swarm is
+            saved after each iteration; if it exists, the PSO resumes from it
         :return: kwargs_result (of best fit), [lnlikelihood of samples, positions of
             samples, velocity of samples])
         """
@@ -98,13 +109,22 @@ class Sampler(object):
             lower_start = np.maximum(lower_start, self.lower_limit)
             upper_start = np.minimum(upper_start, self.upper_limit)
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        if vectorize is True:
+            func = self.chain.logL_batch
+        else:
+            func = self.chain.logL
+        pool, func_pool = self._choose_pool(mpi, threadCount, func, shared_memory)
 
         if mpi is True and pool.is_master():
             print("MPI option chosen for PSO.")
 
         pso = ParticleSwarmOptimizer(
-            self.chain.logL, lower_start, upper_start, n_particles, pool=pool
+            func_pool,
+            lower_start,
+            upper_start,
+            n_particles,
+            pool=pool,
+            vectorize=vectorize,
         )
 
         if init_pos is None:
@@ -117,9 +137,15 @@ class Sampler(object):
 
         time_start = time.time()
 
-        result, [log_likelihood_list, pos_list, vel_list] = pso.optimize(
-            n_iterations, verbose=verbose
-        )
+        try:
+            result, [log_likelihood_list, pos_list, vel_list] = pso.optimize(
+                n_iterations,
+                verbose=verbose,
+                checkpoint_filename=checkpoint_filename,
+            )
+        finally:
+            if func_pool is not func:
+                pool.close()
 
         if pool.is_master():
             kwargs_return = self.chain.param.args2kwargs(result)
@@ -134,6 +160,7 @@ class Sampler(object):
                 self._print_result(result=result)
                 time_end = time.time()
                 print(time_end - time_start, "time used for ", print_key)
+                self._print_profile()
                 print("===================")
         return result, [log_likelihood_list, pos_list, vel_list]
 
@@ -150,6 +177,8 @@ class Sampler(object):
         initpos=None,
         backend_filename=None,
         start_from_backend=False,
+        vectorize=False,
+        shared_memory=False,
     ):
         """Run MCMC with emcee. For details, please have a look at the documentation of
         the emcee packager.
@@ -177,6 +206,12 @@ class Sampler(object):
         :param start_from_backend: if True, start from the state saved in `backup_filename`.
          Otherwise, create a new backup file with name `backup_filename` (any already existing file is overwritten!).
         :type start_from_backend: bool
+        :param vectorize: if True, the walkers are evaluated with LikelihoodModule.logL_batch() (one call per step
+         or one call per pool worker) instead of one call per walker.
+        :type vectorize: bool
+        :param shared_memory: if True and threadCount > 1, the likelihood is installed once in each worker process
+         with its large arrays in shared memory and only the walker positions are sent to the workers
+        :type shared_memory: bool
         :return: samples, ln likelihood value of samples
         :rtype: numpy 2d array, numpy 1d array
         """
@@ -192,7 +227,13 @@ class Sampler(object):
                 size=n_walkers,
             )
 
-        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        if vectorize is True:
+            log_prob_fn = self.chain.logL_batch
+        else:
+            log_prob_fn = self.chain.logL
+        pool, log_prob_fn_pool = self._choose_pool(
+            mpi, threadCount, log_prob_fn, shared_memory
+        )
 
         if backend_filename is not None:
             backend = emcee.backends.HDFBackend(
@@ -222,11 +263,26 @@ class Sampler(object):
 
         time_start = time.time()
 
+        if vectorize is True:
+            sampler_fn = self._batch_over_pool(log_prob_fn_pool, pool)
+            sampler_pool = None
+        else:
+            sampler_fn = log_prob_fn_pool
+            sampler_pool = pool
         sampler = emcee.EnsembleSampler(
-            n_walkers, num_param, self.chain.logL, pool=pool, backend=backend
+            n_walkers,
+            num_param,
+            sampler_fn,
+            pool=sampler_pool,
+            backend=backend,
+            vectorize=vectorize,
         )
 
-        sampler.run_mcmc(initpos, n_run_eff, progress=progress)
+        try:
+            sampler.run_mcmc(initpos, n_run_eff, progress=progress)
+        finally:
+            if log_prob_fn_pool is not log_prob_fn:
+                pool.close()
         flat_samples = sampler.get_chain(discard=n_burn, thin=1, flat=True)
         dist = sampler.get_log_prob(flat=True, discard=n_burn, thin=1)
         if pool.is_master():
@@ -236,6 +292,7 @@ class Sampler(object):
             print("Sampling iterations (in current run):", n_run_eff)
             time_end = time.time()
             print(time_end - time_start, "time taken for MCMC sampling")
+            self._print_profile()
         return flat_samples, dist
 
     def mcmc_zeus(
@@ -370,10 +427,16 @@ class Sampler(object):
 
         pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
 
+        if vectorize is True:
+            logprob_fn = self._batch_over_pool(self.chain.logL_batch, pool)
+            pool = None
+        else:
+            logprob_fn = self.chain.logL
+
         sampler = zeus.EnsembleSampler(
             nwalkers=n_walkers,
             ndim=num_param,
-            logprob_fn=self.chain.logL,
+            logprob_fn=logprob_fn,
             moves=moves,
             tune=tune,
             tolerance=tolerance,
@@ -395,6 +458,8 @@ class Sampler(object):
         flat_samples = sampler.get_chain(flat=True, thin=1, discard=n_burn)
 
         dist = sampler.get_log_prob(flat=True, thin=1, discard=n_burn)
+        if verbose:
+            self._print_profile()
 
         return flat_samples, dist
 
@@ -410,3 +475,76 @@ class Sampler(object):
         print(kwargs_return.get("kwargs_ps", None), "point source result")
         print(kwargs_return.get("kwargs_tracer_source", None), "tracer source result")
         print(kwargs_return.get("kwargs_special", None), "special param result")
+
+    def _print_profile(self):
+        """Prints the timing report of the likelihood stages if the likelihood module
+        was created with profiling=True.
+
+        :return: None
+        """
+        profiler = getattr(self.chain, "profiler", None)
+        if profiler is not None:
+            print(profiler.report())
+
+    @staticmethod
+    def _batch_over_pool(func, pool):
+        """Vectorized function for emcee and zeus, which do not use their pool when
+        vectorize=True. With a parallel pool, each batch is split into one chunk per
+        worker.
+
+        :param func: vectorized function to be evaluated on the pool
+        :param pool: pool of the sampling
+        :return: vectorized function
+        """
+        if getattr(pool, "size", 1) > 1:
+            return _PoolBatchFunction(func, pool)
+        return func
+
+    @staticmethod
+    def _choose_pool(mpi, threadCount, func, shared_memory):
+        """Pool of the sampling and the function to be mapped over it.
+
+        :param mpi: bool, if True, makes instance of MPIPool
+        :param threadCount: number of threads (only applied if mpi=False)
+        :param func: function (likelihood) to be evaluated by the pool
+        :param shared_memory: bool, if True, a multiprocessing pool installs func in its
+            workers once (see MultiPool) and the returned function only references it
+        :return: pool, function to be mapped over the pool
+        """
+        if shared_memory is True and mpi is False and threadCount != 1:
+            pool = choose_pool(
+                mpi=mpi, processes=threadCount, use_dill=True, shared_function=func
+            )
+            return pool, pool.shared_function
+        pool = choose_pool(mpi=mpi, processes=threadCount, use_dill=True)
+        return pool, func
+
+
+class _PoolBatchFunction(object):
+    """Vectorized likelihood that splits each batch of positions into one chunk per pool
+    worker.
+
+    emcee and zeus evaluate a vectorized likelihood in the main process and ignore their
+    pool, so the chunks are mapped over the pool here instead.
+    """
+
+    def __init__(self, func, pool):
+        """
+
+        :param func: vectorized function taking a 2d array (num positions, num param)
+        :param pool: pool with a map() and (optionally) a size attribute
+        """
+        self._func = func
+        self._pool = pool
+        self._num_chunks = max(getattr(pool, "size", 1), 1)
+
+    def __call__(self, positions):
+        """
+
+        :param positions: 2d array of shape (num positions, num param)
+        :return: 1d array of the function values of the positions
+        """
+        positions = np.asarray(positions, dtype=float)
+        chunks = np.array_split(positions, min(self._num_chunks, len(positions)))
+        values = list(self._pool.map(self._func, chunks))
+        return np.concatenate([np.atleast_1d(value) for value in values])
@@ -359,6 +359,8 @@ def create_im_sim(
     band_index=0,
     kwargs_pixelbased=None,
     linear_solver=True,
+    kwargs_wls=None,
+    num_threads=1,
 ):
     """
 
@@ -376,6 +378,9 @@ def create_im_sim(
     :param kwargs_pixelbased: keyword arguments with various settings related to the pixel-based solver (see SLITronomy documentation)
     :param linear_solver: bool, if True (default) fixes the linear amplitude parameters 'amp' (avoid sampling) such
      that they get overwritten by the linear solver solution.
+    :param kwargs_wls: keyword arguments of the weighted linear least square solver (see de_lens.create_wls_solver())
+    :param num_threads: number of threads evaluating the imaging bands concurrently ('multi-linear' and
+     'joint-linear' only, -1 for all available cores)
     :return: MultiBand class instance
     """
     if linear_solver is False and multi_band_type not in [
@@ -396,6 +401,8 @@ def create_im_sim(
             compute_bool=bands_compute,
             likelihood_mask_list=image_likelihood_mask_list,
             linear_solver=linear_solver,
+            kwargs_wls=kwargs_wls,
+            num_threads=num_threads,
         )
     elif multi_band_type == "joint-linear":
         from lenstronomy.ImSim.MultiBand.joint_linear import JointLinear
@@ -405,6 +412,8 @@ def create_im_sim(
             kwargs_model,
             compute_bool=bands_compute,
             likelihood_mask_list=image_likelihood_mask_list,
+            kwargs_wls=kwargs_wls,
+            num_threads=num_threads,
         )
     elif multi_band_type == "single-band":
         from lenstronomy.ImSim.MultiBand.single_band_multi_model import (
@@ -418,6 +427,7 @@ def create_im_sim(
             band_index=band_index,
             kwargs_pixelbased=kwargs_pixelbased,
             linear_solver=linear_solver,
+            kwargs_wls=kwargs_wls,
         )
     else:
         raise ValueError("type %s is not supported!" % multi_band_type)
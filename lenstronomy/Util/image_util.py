@@ -81,6 +81,99 @@ def add_layer2image_int(grid2d, x_pos, y_pos, kernel):
     return new
 
 
+@export
+def shift_kernel_linear(kernel, shift_x, shift_y):
+    """Copies of a kernel shifted by sub-pixel offsets with linear interpolation. Each
+    copy is the same as ndimage.shift(kernel, shift=[shift_y, shift_x], order=1) (up to
+    numerical precision), i.e. pixels interpolated from outside the kernel are set to
+    zero.
+
+    :param kernel: 2d array
+    :param shift_x: array of shifts along the x-axis (columns) with abs(shift_x) <= 1
+    :param shift_y: array of shifts along the y-axis (rows) with abs(shift_y) <= 1
+    :return: 3d array of the shifted kernels with shape (len(shift_x), k_rows, k_cols)
+    """
+    kernel = np.asarray(kernel, dtype=float)
+    kernel_pad = np.pad(kernel, 1)
+    # shift along the rows
+    t = np.asarray(shift_y, dtype=float)[:, None, None]
+    w_prev, w_next = np.maximum(t, 0), np.maximum(-t, 0)
+    shifted = (
+        (1 - w_prev - w_next) * kernel
+        + w_prev * kernel_pad[:-2, 1:-1]
+        + w_next * kernel_pad[2:, 1:-1]
+    )
+    shifted[:, 0, :] *= t[:, 0, :] <= 0
+    shifted[:, -1, :] *= t[:, 0, :] >= 0
+    # shift along the columns
+    t = np.asarray(shift_x, dtype=float)[:, None, None]
+    w_prev, w_next = np.maximum(t, 0), np.maximum(-t, 0)
+    shifted_pad = np.pad(shifted, ((0, 0), (0, 0), (1, 1)))
+    shifted = (
+        (1 - w_prev - w_next) * shifted
+        + w_prev * shifted_pad[:, :, :-2]
+        + w_next * shifted_pad[:, :, 2:]
+    )
+    shifted[:, :, 0] *= t[:, :, 0] <= 0
+    shifted[:, :, -1] *= t[:, :, 0] >= 0
+    return shifted
+
+
+@export
+def layers2pixels(shape, x_pos, y_pos, kernel, amp=None):
+    """Pixels covered by a kernel added at many (sub-pixel) positions on an image (see
+    add_layer2image() with order=1). All sub-pixel shifts are computed at once.
+
+    :param shape: shape (rows, columns) of the image
+    :param x_pos: array of x-positions (pixel coordinate) of the centers of the layers
+    :param y_pos: array of y-positions (pixel coordinate) of the centers of the layers
+    :param kernel: the layer to be added to the image (odd dimensions)
+    :param amp: array of amplitudes of the layers (optional)
+    :return: row and column indexes of the pixels, values added to the pixels, index of
+        the layer (position) of each entry; only the pixels within the image are
+        returned
+    """
+    k_rows, k_cols = np.shape(kernel)
+    if k_rows % 2 == 0 or k_cols % 2 == 0:
+        raise ValueError("kernel dimensions must be odd")
+    x_pos = np.atleast_1d(np.asarray(x_pos, dtype=float))
+    y_pos = np.atleast_1d(np.asarray(y_pos, dtype=float))
+    x_int = np.round(x_pos).astype(int)
+    y_int = np.round(y_pos).astype(int)
+    values = shift_kernel_linear(kernel, x_pos - x_int, y_pos - y_int)
+    if amp is not None:
+        values *= np.asarray(amp, dtype=float)[:, None, None]
+    rows = y_int[:, None, None] + np.arange(k_rows)[None, :, None] - (k_rows - 1) // 2
+    cols = x_int[:, None, None] + np.arange(k_cols)[None, None, :] - (k_cols - 1) // 2
+    rows, cols = np.broadcast_arrays(rows, cols)
+    inside = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+    layer = np.broadcast_to(np.arange(len(x_pos))[:, None, None], rows.shape)
+    return rows[inside], cols[inside], values[inside], layer[inside]
+
+
+@export
+def add_layers2image(grid2d, x_pos, y_pos, kernel, amp=None):
+    """Adds a kernel at many positions on the grid2d image with linearly interpolated
+    sub-pixel shifts. Equivalent to calling add_layer2image() (order=1) for each
+    position, but with the shifts computed at once and a single scatter-add.
+
+    :param grid2d: 2d pixel grid (i.e. image)
+    :param x_pos: array of x-positions (pixel coordinate) of the centers of the layers
+    :param y_pos: array of y-positions (pixel coordinate) of the centers of the layers
+    :param kernel: the layer to be added to the image (odd dimensions)
+    :param amp: array of amplitudes of the layers (optional)
+    :return: image with added layers
+    """
+    num_rows, num_cols = np.shape(grid2d)
+    rows, cols, values, _ = layers2pixels(
+        (num_rows, num_cols), x_pos, y_pos, kernel, amp=amp
+    )
+    layers = np.bincount(
+        rows * num_cols + cols, weights=values, minlength=num_rows * num_cols
+    )
+    return grid2d + layers.reshape(num_rows, num_cols)
+
+
 @export
 def add_background(image, sigma_bkd):
     """Generates background noise to image. To generate a noisy image with background
@@ -217,7 +310,7 @@ def coordInImage(x_coord, y_coord, num_pix, deltapix):
 def re_size(image, factor=1):
     """Re-sizes image with nx x ny to nx/factor x ny/factor.
 
-    :param image: 2d image with shape (nx,ny)
+    :param image: 2d image with shape (nx,ny) or stack of images with shape (n, nx, ny)
     :param factor: integer >=1
     :return:
     """
@@ -226,9 +319,14 @@ def re_size(image, factor=1):
     elif factor == 1:
         return image
     f = int(factor)
-    nx, ny = np.shape(image)
+    nx, ny = np.shape(image)[-2:]
     if int(nx / f) == nx / f and int(ny / f) == ny / f:
-        small = image.reshape([int(nx / f), f, int(ny / f), f]).mean(3).mean(1)
+        shape_stack = list(np.shape(image)[:-2])
+        small = (
+            image.reshape(shape_stack + [int(nx / f), f, int(ny / f), f])
+            .mean(-1)
+            .mean(-2)
+        )
         return small
     else:
         raise ValueError(
@@ -0,0 +1,179 @@
+__author__ = "sibirrer"
+"""Opt-in instrumentation of the likelihood evaluation.
+
+Methods along the likelihood hot path (ray-shooting, light profile evaluation,
+convolution, the weighted linear least square solver, the lens equation solver, the
+kinematics and the individual likelihood terms) are decorated with timed(). As long as
+no Profiler is active, the decorator only adds a single check to each call. Within an
+active Profiler (used as a context manager), the wall time and the number of calls of
+each decorated method are recorded:
+
+    profiler = Profiler()
+    with profiler:
+        likelihood.logL(args)
+    print(profiler.report())
+
+The times are inclusive (a stage contains the time of the stages called from it). Only
+the calls within the process that activated the profiler are recorded, i.e. the
+evaluations within the workers of a multiprocessing or MPI pool are not included.
+"""
+
+import functools
+import threading
+import time
+
+__all__ = ["Profiler", "timed"]
+
+# profilers currently active and the call depth of the decorated methods per thread
+_active_profilers = []
+_thread_state = threading.local()
+# guards the records of calls from concurrent threads (e.g. imaging bands)
+_lock = threading.Lock()
+
+
+def timed(func):
+    """Decorator recording the wall time and the number of calls of a function or method
+    in the active Profiler instances. The stage is named after the qualified name of the
+    function (class name and method name, or module name and function name).
+
+    :param func: function or method
+    :return: decorated function
+    """
+    if "." in func.__qualname__:
+        name = func.__qualname__
+    else:
+        name = func.__module__.rsplit(".", 1)[-1] + "." + func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _active_profilers:
+            return func(*args, **kwargs)
+        depth = getattr(_thread_state, "depth", 0)
+        _thread_state.depth = depth + 1
+        time_start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            time_used = time.perf_counter() - time_start
+            _thread_state.depth = depth
+            for profiler in _active_profilers:
+                profiler.add(name, time_used, outermost=depth == 0)
+
+    return wrapper
+
+
+class Profiler(object):
+    """Records the wall time and number of calls of the methods decorated with timed()
+    while it is active (as a context manager)."""
+
+    def __init__(self):
+        self._stats = {}
+        self._total_time = 0
+        self._num_calls = 0
+        self._active = False
+        self._thread_id = None
+
+    def __enter__(self):
+        if self._active is True:
+            raise ValueError("The profiler is already active.")
+        self._active = True
+        self._thread_id = threading.get_ident()
+        _active_profilers.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_profilers.remove(self)
+        self._active = False
+
+    def __getstate__(self):
+        # a copy of an active profiler (e.g. in a pool worker) is not active
+        state = self.__dict__.copy()
+        state["_active"] = False
+        return state
+
+    @property
+    def active(self):
+        """
+
+        :return: bool, True while the profiler records
+        """
+        return self._active
+
+    def add(self, name, time_used, outermost=False):
+        """Records a call of a stage.
+
+        :param name: name of the stage
+        :param time_used: wall time of the call [s]
+        :param outermost: bool, True if the call is not nested in another timed call
+            (only counted in the total time if made in the thread that activated the
+            profiler)
+        :return: None
+        """
+        with _lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = [1, time_used]
+            else:
+                stats[0] += 1
+                stats[1] += time_used
+            if outermost is True and threading.get_ident() == self._thread_id:
+                self._total_time += time_used
+                self._num_calls += 1
+
+    def reset(self):
+        """Deletes all records.
+
+        :return: None
+        """
+        self._stats = {}
+        self._total_time = 0
+        self._num_calls = 0
+
+    @property
+    def stats(self):
+        """Number of calls and wall time of the recorded stages.
+
+        :return: dictionary {stage name: {'calls': int, 'time': float [s]}}
+        """
+        return {
+            name: {"calls": stats[0], "time": stats[1]}
+            for name, stats in self._stats.items()
+        }
+
+    @property
+    def total_time(self):
+        """
+
+        :return: wall time [s] of the outermost timed calls (not nested in other timed
+            calls), e.g. of the likelihood evaluations
+        """
+        return self._total_time
+
+    @property
+    def num_calls(self):
+        """
+
+        :return: number of outermost timed calls
+        """
+        return self._num_calls
+
+    def report(self):
+        """Table of the recorded stages sorted by their wall time.
+
+        :return: string
+        """
+        lines = [
+            "Profile of %s calls in %.3f s (inclusive times):"
+            % (self._num_calls, self._total_time),
+            "%-60s %10s %12s %14s %9s"
+            % ("stage", "calls", "time [s]", "per call [ms]", "fraction"),
+        ]
+        for name, (calls, time_used) in sorted(
+            self._stats.items(), key=lambda item: -item[1][1]
+        ):
+            fraction = time_used / self._total_time if self._total_time > 0 else 0
+            lines.append(
+                "%-60s %10d %12.4f %14.4f %8.1f%%"
+                % (name, calls, time_used, time_used / calls * 1000, fraction * 100)
+            )
+        return "\n".join(lines)
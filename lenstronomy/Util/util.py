@@ -3,6 +3,7 @@ __author__ = "Simon Birrer"
 
 import numpy as np
 import itertools
+import zlib
 from lenstronomy.Util.numba_util import jit
 from lenstronomy.Util.package_util import exporter
 
@@ -775,3 +776,121 @@ def area(vs):
         x0 = x1
         y0 = y1
     return abs(a)
+
+
+@export
+def frozen_kwargs(kwargs, ignore=None):
+    """Copy of (nested) keyword arguments that is not affected by later in-place changes
+    of the input, such that it can be compared against the arguments of later calls.
+
+    :param kwargs: keyword argument dictionary, list thereof or value
+    :param ignore: list of top-level keys to be ignored
+    :return: frozen copy of kwargs
+    """
+    if isinstance(kwargs, dict):
+        if ignore is None:
+            ignore = []
+        return {
+            key: frozen_kwargs(value)
+            for key, value in kwargs.items()
+            if key not in ignore
+        }
+    if isinstance(kwargs, (list, tuple)):
+        return [frozen_kwargs(value) for value in kwargs]
+    if isinstance(kwargs, np.ndarray):
+        return kwargs.copy()
+    return kwargs
+
+
+@export
+def kwargs_equal(kwargs_1, kwargs_2):
+    """Checks whether two frozen keyword arguments (see frozen_kwargs()) are equal.
+
+    :param kwargs_1: frozen keyword arguments
+    :param kwargs_2: frozen keyword arguments
+    :return: bool
+    """
+    if isinstance(kwargs_1, dict) or isinstance(kwargs_2, dict):
+        if not (isinstance(kwargs_1, dict) and isinstance(kwargs_2, dict)):
+            return False
+        if kwargs_1.keys() != kwargs_2.keys():
+            return False
+        return all(kwargs_equal(kwargs_1[key], kwargs_2[key]) for key in kwargs_1)
+    if isinstance(kwargs_1, (list, tuple)) or isinstance(kwargs_2, (list, tuple)):
+        if not (
+            isinstance(kwargs_1, (list, tuple)) and isinstance(kwargs_2, (list, tuple))
+        ):
+            return False
+        if len(kwargs_1) != len(kwargs_2):
+            return False
+        return all(kwargs_equal(a, b) for a, b in zip(kwargs_1, kwargs_2))
+    if isinstance(kwargs_1, np.ndarray) or isinstance(kwargs_2, np.ndarray):
+        return bool(np.array_equal(kwargs_1, kwargs_2))
+    try:
+        return bool(kwargs_1 == kwargs_2)
+    except ValueError:
+        return False
+
+
+@export
+def kwargs_key(kwargs, ignore=None):
+    """Light-weight key of (nested) keyword arguments that can be compared with ==
+    against the key of later calls. Unlike frozen_kwargs(), arrays are not copied but
+    represented by a reference, their shape, dtype and a checksum, such that a
+    comparison against unchanged arrays does not compare (or copy) their elements.
+
+    :param kwargs: keyword argument dictionary, list thereof or value
+    :param ignore: list of top-level keys to be ignored
+    :return: key of kwargs
+    """
+    if isinstance(kwargs, dict):
+        if ignore is None:
+            ignore = []
+        return {
+            key: kwargs_key(value) for key, value in kwargs.items() if key not in ignore
+        }
+    if isinstance(kwargs, (list, tuple)):
+        return tuple(kwargs_key(value) for value in kwargs)
+    if isinstance(kwargs, np.ndarray):
+        return _ArrayKey(kwargs)
+    return kwargs
+
+
+class _ArrayKey(object):
+    """Array in a key of kwargs_key().
+
+    Two keys are equal if the shapes, dtypes and checksums agree and either both refer
+    to the same array or the arrays are element-wise equal.
+    """
+
+    __slots__ = ("_array", "_shape", "_dtype", "_checksum")
+
+    def __init__(self, array):
+        """
+
+        :param array: numpy array
+        """
+        if array.dtype.hasobject:
+            # no buffer to compute a checksum of, the elements are copied instead
+            self._array = array.copy()
+            self._checksum = None
+        else:
+            self._array = array
+            self._checksum = zlib.crc32(np.ascontiguousarray(array))
+        self._shape = array.shape
+        self._dtype = array.dtype
+
+    def __eq__(self, other):
+        if not isinstance(other, _ArrayKey):
+            return False
+        if (
+            self._shape != other._shape
+            or self._dtype != other._dtype
+            or self._checksum != other._checksum
+        ):
+            return False
+        if self._array is other._array and self._checksum is not None:
+            return True
+        return bool(np.array_equal(self._array, other._array))
+
+    __hash__ = None
@@ -1,4 +1,6 @@
 import copy
+import os
+import pickle
 
 from lenstronomy.Workflow.psf_fitting import PsfFitting
 from lenstronomy.Workflow.alignment_matching import AlignmentFitting
@@ -80,17 +82,46 @@ class FittingSequence(object):
         """
         return self._updateManager.fixed_kwargs
 
-    def fit_sequence(self, fitting_list):
+    def fit_sequence(self, fitting_list, checkpoint_filename=None):
         """
 
         :param fitting_list: list of [['string', {kwargs}], ..] with 'string being the specific fitting option and
          kwargs being the arguments passed to this option
+        :param checkpoint_filename: (optional) file name of a checkpoint. If set, the state of the FittingSequence
+         (parameter state, PSF iterations, MCMC samples to re-use) is saved after each step of the fitting_list and
+         the output of each step in the chain_list is saved once to checkpoint_filename + '_chain_<index>.pkl'.
+         The samples of emcee steps are streamed to the HDF5 file checkpoint_filename + '_<step>.h5' (a given
+         backend_filename is used as specified in mcmc() instead) and the state of the swarm of PSO steps is saved
+         after each iteration to checkpoint_filename + '_<step>.pkl'. If the checkpoint exists, the fitting sequence
+         resumes from it: the completed steps are skipped and an interrupted emcee or PSO step continues from its last
+         saved iteration.
+         Interrupted steps of the other samplers (e.g. zeus and the nested samplers) restart from their beginning.
         :return: fitting results
         """
         chain_list = []
+        num_steps_done = 0
+        # number of outputs of the chain_list saved in the files of the checkpoint
+        self._num_chains_saved = 0
+        if checkpoint_filename is not None and os.path.exists(checkpoint_filename):
+            num_steps_done, chain_list = self._load_checkpoint(
+                checkpoint_filename, fitting_list
+            )
         for i, fitting in enumerate(fitting_list):
+            if i < num_steps_done:
+                continue
             fitting_type = fitting[0]
             kwargs = fitting[1]
+            if checkpoint_filename is not None and fitting_type in [
+                "MCMC",
+                "emcee",
+            ]:
+                kwargs = self._emcee_checkpoint_kwargs(
+                    checkpoint_filename + "_%s.h5" % i, **kwargs
+                )
+            if checkpoint_filename is not None and fitting_type == "PSO":
+                kwargs = dict(kwargs)
+                if kwargs.get("checkpoint_filename") is None:
+                    kwargs["checkpoint_filename"] = checkpoint_filename + "_%s.pkl" % i
 
             if fitting_type in [
                 "PSO",
@@ -206,9 +237,151 @@ class FittingSequence(object):
                     "'psf_iteration', 'restart', 'update_settings', 'calibrate_images' or "
                     "'align_images'".format(fitting_type)
                 )
+            if checkpoint_filename is not None:
+                self._save_checkpoint(
+                    checkpoint_filename, fitting_list[: i + 1], chain_list
+                )
 
         return chain_list
 
+    # attributes of the class instance stored in the checkpoints of fit_sequence()
+    _checkpoint_attributes = [
+        "kwargs_data_joint",
+        "multi_band_list",
+        "multi_band_type",
+        "_updateManager",
+        "_mcmc_init_samples",
+        "_psf_iteration_memory",
+        "_psf_iteration_index",
+    ]
+
+    def _save_checkpoint(self, filename, fitting_list_done, chain_list):
+        """Saves the state of the class instance after the steps of fitting_list_done.
+        The outputs of the chain_list not yet saved are written once to their own files.
+        The files are replaced atomically such that an interruption while writing does
+        not corrupt the previous checkpoint.
+
+        :param filename: file name of the checkpoint
+        :param fitting_list_done: steps of the fitting_list completed
+        :param chain_list: chain_list of the completed steps
+        :return: None
+        """
+        if not self._is_master():
+            return
+        for index in range(self._num_chains_saved, len(chain_list)):
+            self._dump_atomic(chain_list[index], filename + "_chain_%s.pkl" % index)
+        self._num_chains_saved = len(chain_list)
+        checkpoint = {
+            "fitting_types": [fitting[0] for fitting in fitting_list_done],
+            "num_chains": len(chain_list),
+            "state": {
+                name: getattr(self, name) for name in self._checkpoint_attributes
+            },
+        }
+        self._dump_atomic(checkpoint, filename)
+
+    @staticmethod
+    def _dump_atomic(obj, filename):
+        """Pickles obj to a temporary file which then replaces filename.
+
+        :param obj: object to be pickled
+        :param filename: file name
+        :return: None
+        """
+        filename_temp = filename + ".tmp"
+        with open(filename_temp, "wb") as f:
+            pickle.dump(obj, f)
+        os.replace(filename_temp, filename)
+
+    def _load_checkpoint(self, filename, fitting_list):
+        """Restores the state of the class instance from a checkpoint of fit_sequence().
+
+        :param filename: file name of the checkpoint
+        :param fitting_list: fitting_list of fit_sequence(); the steps completed in the
+            checkpoint need to be the first steps of it
+        :return: number of completed steps, chain_list of the completed steps
+        """
+        with open(filename, "rb") as f:
+            checkpoint = pickle.load(f)
+        fitting_types = checkpoint["fitting_types"]
+        num_steps = len(fitting_types)
+        if fitting_types != [fitting[0] for fitting in fitting_list[:num_steps]]:
+            raise ValueError(
+                "The steps %s of the checkpoint %s do not match the fitting_list."
+                % (fitting_types, filename)
+            )
+        for name, value in checkpoint["state"].items():
+            setattr(self, name, value)
+        chain_list = []
+        for index in range(checkpoint["num_chains"]):
+            with open(filename + "_chain_%s.pkl" % index, "rb") as f:
+                chain_list.append(pickle.load(f))
+        self._num_chains_saved = len(chain_list)
+        if self._verbose:
+            print(
+                "Resuming the fitting sequence from %s after %s completed steps."
+                % (filename, num_steps)
+            )
+        return num_steps, chain_list
+
+    def _emcee_checkpoint_kwargs(
+        self, checkpoint_backend, n_burn, n_run, start_from_backend=False, **kwargs
+    ):
+        """Keyword arguments of an emcee step that stream the samples to the HDF5
+        backend file of the checkpoint and continue from it if it already contains
+        iterations of an interrupted run. A backend_filename given in kwargs is used as
+        specified, i.e. it is only continued with start_from_backend=True.
+
+        :param checkpoint_backend: HDF5 file name of the checkpoint of this step
+        :param n_burn: number of burn-in iterations
+        :param n_run: number of iterations after burn-in
+        :param start_from_backend: bool, see mcmc()
+        :param kwargs: other keyword arguments of mcmc()
+        :return: keyword arguments of mcmc()
+        """
+        import emcee
+
+        kwargs = dict(
+            kwargs, n_burn=n_burn, n_run=n_run, start_from_backend=start_from_backend
+        )
+        if kwargs.get("backend_filename") is not None:
+            return kwargs
+        num_iterations = 0
+        if os.path.exists(checkpoint_backend):
+            backend = emcee.backends.HDFBackend(
+                checkpoint_backend, name="lenstronomy_mcmc_emcee", read_only=True
+            )
+            try:
+                num_iterations = backend.iteration
+            except (KeyError, OSError):
+                num_iterations = 0
+        if num_iterations > 0 and not start_from_backend:
+            # continues the interrupted run with the remaining iterations
+            n_run = max(n_burn + n_run - num_iterations, 0)
+            start_from_backend = True
+            if self._verbose:
+                print(
+                    "Resuming emcee from %s after %s iterations."
+                    % (checkpoint_backend, num_iterations)
+                )
+        kwargs.update(
+            n_run=n_run,
+            backend_filename=checkpoint_backend,
+            start_from_backend=start_from_backend,
+        )
+        return kwargs
+
+    def _is_master(self):
+        """
+
+        :return: bool, False for the MPI processes other than the one of rank 0
+        """
+        if self._mpi is False:
+            return True
+        from mpi4py import MPI
+
+        return MPI.COMM_WORLD.Get_rank() == 0
+
     def best_fit(self, bijective=False):
         """
 
@@ -310,6 +483,8 @@ class FittingSequence(object):
         progress=True,
         backend_filename=None,
         start_from_backend=False,
+        vectorize=False,
+        shared_memory=False,
         **kwargs_zeus
     ):
         """MCMC routine.
@@ -330,6 +505,9 @@ class FittingSequence(object):
         :param start_from_backend: if True, start from the state saved in `backup_filename`.
          O therwise, create a new backup file with name `backup_filename` (any already existing file is overwritten!).
         :type start_from_backend: bool
+        :param vectorize: bool, if True, evaluates all walkers of a step in one call of LikelihoodModule.logL_batch()
+        :param shared_memory: bool, if True and threadCount > 1, the likelihood is installed once in each worker
+         process with its large arrays in shared memory (emcee only)
         :param kwargs_zeus: zeus-specific kwargs
         :return: list of output arguments, e.g. MCMC samples, parameter names, logL distances of all samples specified
          by the specific sampler used
@@ -375,6 +553,7 @@ class FittingSequence(object):
                 progress=progress,
                 initpos=initpos,
                 backend_filename=backend_filename,
+                vectorize=vectorize,
                 **kwargs_zeus
             )
             output = [sampler_type, samples, param_list, dist]
@@ -392,6 +571,8 @@ class FittingSequence(object):
                 initpos=initpos,
                 backend_filename=backend_filename,
                 start_from_backend=start_from_backend,
+                vectorize=vectorize,
+                shared_memory=shared_memory,
             )
             output = [sampler_type, samples, param_list, dist]
 
@@ -399,7 +580,15 @@ class FittingSequence(object):
         return output
 
     def pso(
-        self, n_particles, n_iterations, sigma_scale=1, print_key="PSO", threadCount=1
+        self,
+        n_particles,
+        n_iterations,
+        sigma_scale=1,
+        print_key="PSO",
+        threadCount=1,
+        vectorize=False,
+        shared_memory=False,
+        checkpoint_filename=None,
     ):
         """Particle Swarm Optimization.
 
@@ -409,6 +598,12 @@ class FittingSequence(object):
             width in the initial settings
         :param print_key: string, printed text when executing this routine
         :param threadCount: number of CPU threads. If MPI option is set, threadCount=1
+        :param vectorize: bool, if True, evaluates the swarm with
+            LikelihoodModule.logL_batch()
+        :param shared_memory: bool, if True and threadCount > 1, the likelihood is
+            installed once in each worker process with its large arrays in shared memory
+        :param checkpoint_filename: (optional) file name where the state of the swarm is
+            saved after each iteration; if it exists, the PSO resumes from it
         :return: result of the best fit, the PSO chain of the best fit parameter after
             each iteration [lnlikelihood, parameters, velocities], list of parameters in
             same order as in chain
@@ -441,6 +636,9 @@ class FittingSequence(object):
             mpi=self._mpi,
             print_key=print_key,
             verbose=self._verbose,
+            vectorize=vectorize,
+            shared_memory=shared_memory,
+            checkpoint_filename=checkpoint_filename,
         )
         kwargs_result = param_class.args2kwargs(result, bijective=True)
         return kwargs_result, chain, param_list
@@ -232,6 +232,24 @@ class TestKinematicsAPI(object):
         )
         npt.assert_almost_equal(kwargs_profile["gamma"], 2, decimal=2)
 
+        # re-use of the Galkin instance with the lookup of the interpolation tables
+        kinematicAPI = KinematicsAPI(
+            z_lens,
+            z_source,
+            kwargs_model,
+            kwargs_aperture=kwargs_aperture,
+            kwargs_seeing=kwargs_psf,
+            anisotropy_model=anisotropy_model,
+            kwargs_numerics_galkin={"kwargs_cache_size": 5},
+        )
+        galkin, _, _ = kinematicAPI.galkin_settings(
+            kwargs_lens, kwargs_lens_light, r_eff=1, theta_E=1
+        )
+        galkin_reuse, _, _ = kinematicAPI.galkin_settings(
+            kwargs_lens, kwargs_lens_light, r_eff=1.5, theta_E=1
+        )
+        assert galkin_reuse is galkin
+
     def test_kinematic_light_profile(self):
         z_lens = 0.5
         z_source = 1.5
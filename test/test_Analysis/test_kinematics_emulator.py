@@ -0,0 +1,181 @@
+__author__ = "sibirrer"
+
+import os
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Analysis.kinematics_emulator import KinematicsEmulator
+
+
+class TestKinematicsEmulator(object):
+    def setup_method(self):
+        self.kwargs_aperture = {
+            "aperture_type": "slit",
+            "center_ra": 0,
+            "width": 1,
+            "length": 1,
+            "angle": 0,
+            "center_dec": 0,
+        }
+        self.kwargs_seeing = {"psf_type": "GAUSSIAN", "fwhm": 0.7}
+        self.kwargs_grid = {
+            "theta_E": [0.9, 1.1],
+            "gamma": [1.9, 2.0, 2.1],
+            "r_eff": [0.8, 1.2],
+            "r_ani": [1.0, 3.0],
+        }
+        self.emulator = KinematicsEmulator(
+            z_lens=0.5,
+            z_source=1.5,
+            kwargs_aperture=self.kwargs_aperture,
+            kwargs_seeing=self.kwargs_seeing,
+            anisotropy_model="OM",
+            kwargs_grid=self.kwargs_grid,
+            analytic_kinematics=True,
+            sampling_number=2000,
+        )
+
+    def test_build(self):
+        npt.assert_equal(
+            self.emulator.param_names, ["theta_E", "gamma", "r_eff", "r_ani"]
+        )
+        assert self.emulator.J_grid is None
+        np.random.seed(42)
+        self.emulator.build()
+        npt.assert_equal(self.emulator.J_grid.shape, (2, 3, 2, 2))
+
+        # the interpolation is exact on the grid points
+        J = self.emulator.J(theta_E=1.1, gamma=2.0, r_eff=0.8, r_ani=3.0)
+        npt.assert_almost_equal(J / self.emulator.J_grid[1, 1, 0, 1], 1, decimal=10)
+        assert isinstance(J, float)
+
+        # array evaluation
+        J_array = self.emulator.J(
+            theta_E=np.array([0.9, 1.1]), gamma=2.0, r_eff=0.8, r_ani=3.0
+        )
+        npt.assert_almost_equal(
+            J_array / self.emulator.J_grid[:, 1, 0, 1], [1, 1], decimal=10
+        )
+
+        # J scales with theta_E for the isothermal profile
+        npt.assert_almost_equal(
+            self.emulator.J_grid[1, 1] / self.emulator.J_grid[0, 1],
+            1.1 / 0.9,
+            decimal=1,
+        )
+
+        # comparison with the direct calculation within the Monte Carlo noise
+        error = self.emulator.accuracy(num_points=2, seed=1)
+        assert len(error) == 2
+        npt.assert_array_less(np.abs(error), 0.1)
+
+    def test_save_load(self, tmp_path):
+        filename = os.path.join(tmp_path, "kinematics_emulator.npz")
+        np.random.seed(42)
+        self.emulator.build(filename=filename)
+        emulator = KinematicsEmulator(
+            z_lens=0.5,
+            z_source=1.5,
+            kwargs_aperture=self.kwargs_aperture,
+            kwargs_seeing=self.kwargs_seeing,
+            anisotropy_model="OM",
+            kwargs_grid=self.kwargs_grid,
+            interpolation="linear",
+            analytic_kinematics=True,
+        )
+        emulator.load(filename)
+        npt.assert_almost_equal(emulator.J_grid, self.emulator.J_grid, decimal=15)
+        kwargs = {"theta_E": 1.03, "gamma": 1.95, "r_eff": 1.1, "r_ani": 1.7}
+        npt.assert_almost_equal(emulator.J(**kwargs), self.emulator.J(**kwargs))
+
+
+class TestRaise(object):
+    def setup_method(self):
+        self.kwargs_init = {
+            "z_lens": 0.5,
+            "z_source": 1.5,
+            "kwargs_aperture": {
+                "aperture_type": "slit",
+                "center_ra": 0,
+                "width": 1,
+                "length": 1,
+                "angle": 0,
+                "center_dec": 0,
+            },
+            "kwargs_seeing": {"psf_type": "GAUSSIAN", "fwhm": 0.7},
+            "anisotropy_model": "OM",
+            "analytic_kinematics": True,
+            "sampling_number": 100,
+        }
+
+    def test_raise(self, tmp_path):
+        with pytest.raises(ValueError):
+            KinematicsEmulator(
+                kwargs_grid={"theta_E": [1, 2], "gamma": [1.9, 2.1]}, **self.kwargs_init
+            )
+        with pytest.raises(ValueError):
+            KinematicsEmulator(
+                kwargs_grid={
+                    "theta_E": [1, 2],
+                    "gamma": [2.1, 1.9],
+                    "r_eff": [1, 2],
+                    "r_ani": [1, 2],
+                },
+                **self.kwargs_init
+            )
+        with pytest.raises(ValueError):
+            KinematicsEmulator(
+                kwargs_grid={
+                    "theta_E": [1],
+                    "gamma": [1.9, 2.1],
+                    "r_eff": [1, 2],
+                    "r_ani": [1, 2],
+                },
+                **self.kwargs_init
+            )
+        emulator = KinematicsEmulator(
+            kwargs_grid={
+                "theta_E": [1, 2],
+                "gamma": [1.9, 2.1],
+                "r_eff": [1, 2],
+                "r_ani": [1, 2],
+            },
+            **self.kwargs_init
+        )
+        with pytest.raises(ValueError):
+            emulator.J(theta_E=1, gamma=2, r_eff=1.5, r_ani=1.5)
+        filename = os.path.join(tmp_path, "kinematics_emulator.npz")
+        with pytest.raises(ValueError):
+            emulator.save(filename)
+        emulator.build(filename=filename)
+        # outside of the grid
+        with pytest.raises(ValueError):
+            emulator.J(theta_E=3, gamma=2, r_eff=1.5, r_ani=1.5)
+
+        emulator_other = KinematicsEmulator(
+            kwargs_grid={
+                "theta_E": [1, 3],
+                "gamma": [1.9, 2.1],
+                "r_eff": [1, 2],
+                "r_ani": [1, 2],
+            },
+            **self.kwargs_init
+        )
+        with pytest.raises(ValueError):
+            emulator_other.load(filename)
+        emulator_other = KinematicsEmulator(
+            kwargs_grid={
+                "theta_E": [1, 2],
+                "gamma": [1.9, 2.1],
+                "r_eff": [1, 2],
+                "r_ani": [1, 2, 3],
+            },
+            **self.kwargs_init
+        )
+        with pytest.raises(ValueError):
+            emulator_other.load(filename)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -17,5 +17,11 @@ def test_conventions_conf():
     assert "sersic_major_axis" in conf
 
 
+def test_fft_conf():
+    conf = config_loader.fft_conf()
+    assert conf["backend"] in ["numpy", "scipy", "pyfftw"]
+    assert "workers" in conf
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 import numpy.testing as npt
 
+from lenstronomy.Cosmo import background
 from lenstronomy.Cosmo.background import Background
 
 
@@ -35,6 +37,45 @@ class TestCosmoProp(object):
         d_xy_interp = bkg_interp.d_xy(z_observer=0.1, z_source=0.8)
         npt.assert_almost_equal(d_xy_interp / d_xy, 1, decimal=5)
 
+    def test_d_xy_table(self):
+        from astropy.cosmology import FlatLambdaCDM, LambdaCDM
+
+        z_observer = np.array([0, 0.3, 0.5, 0.5])
+        z_source = np.array([0.8, 1.2, 3.0, 0.5])
+        for cosmo in [
+            FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05),
+            LambdaCDM(H0=70, Om0=0.3, Ode0=0.6),
+        ]:
+            bkg = Background(cosmo=cosmo)
+            d_xy = bkg.d_xy(z_observer, z_source)
+            d_xy_astropy = cosmo.angular_diameter_distance_z1z2(z_observer, z_source)
+            npt.assert_almost_equal(d_xy, d_xy_astropy.value, decimal=10)
+            d_xy_grid = bkg.d_xy(z_observer[:, None], z_source[None, :])
+            assert d_xy_grid.shape == (4, 4)
+            npt.assert_almost_equal(np.diag(d_xy_grid), d_xy, decimal=10)
+            d_xy_scalar = bkg.d_xy(0.3, 1.2)
+            assert np.ndim(d_xy_scalar) == 0
+            npt.assert_almost_equal(d_xy_scalar, d_xy[1], decimal=10)
+
+        # the table is shared between instances of cosmologies with equal parameters
+        bkg = Background(cosmo=FlatLambdaCDM(H0=70, Om0=0.3, Ob0=0.05))
+        assert bkg._table is self.bkg._table
+        assert bkg._table is background._distance_table(self.bkg.cosmo)
+        # and replaced if the parameters change
+        cosmo_new = FlatLambdaCDM(H0=75, Om0=0.3, Ob0=0.05)
+        bkg.cosmo = cosmo_new
+        assert bkg._table is not self.bkg._table
+        npt.assert_almost_equal(
+            bkg.d_xy(0.5, 3.0),
+            cosmo_new.angular_diameter_distance_z1z2(0.5, 3.0).value,
+            decimal=10,
+        )
+
+        bkg_interp = Background(cosmo=cosmo_new, interp=True, num_interp=100, z_stop=10)
+        assert background._cosmology_key(bkg_interp.cosmo) is None
+        assert bkg_interp._table is not bkg._table
+        npt.assert_almost_equal(bkg_interp.d_xy(0.5, 3.0) / bkg.d_xy(0.5, 3), 1, 5)
+
 
 if __name__ == "__main__":
     pytest.main()
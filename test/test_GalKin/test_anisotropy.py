@@ -51,6 +51,21 @@ class TestAnisotropy(object):
         k = anisoClass.K(R, R, **kwargs)
         npt.assert_almost_equal(k, 0, decimal=5)
 
+    def test_K_array_R(self):
+        # projected radii as an array (e.g. on a (R, r) integration grid)
+        r = np.array([[2.0, 3.0], [4.0, 5.0], [1.5, 2.5]])
+        R = np.array([[1.0], [2.0], [0.5]])
+        for anisotropy_type, kwargs in [
+            ("Colin", {"r_ani": 1}),
+            ("OM", {"r_ani": 1}),
+            ("isotropic", {}),
+        ]:
+            anisoClass = Anisotropy(anisotropy_type=anisotropy_type)
+            k = anisoClass.K(r, R, **kwargs)
+            for i in range(len(R)):
+                k_i = anisoClass.K(r[i], R[i, 0], **kwargs)
+                npt.assert_almost_equal(k[i], k_i, decimal=10)
+
     def test_beta(self):
         r = 2.0
 
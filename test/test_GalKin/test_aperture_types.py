@@ -86,6 +86,35 @@ class TestApertureTypes(object):
         )
         assert bool_select is False
 
+    def test_aperture_select_array(self):
+        np.random.seed(42)
+        ra, dec = np.random.uniform(-2, 2, (2, 500))
+        x_grid, y_grid = np.meshgrid(np.linspace(-1, 1, 5), np.linspace(-0.9, 0.9, 4))
+        aperture_list = [
+            aperture_types.Slit(
+                length=2, width=0.5, center_ra=0.1, center_dec=-0.2, angle=0.3
+            ),
+            aperture_types.Frame(
+                width_outer=2, width_inner=1, center_ra=0.1, center_dec=0, angle=0.5
+            ),
+            aperture_types.Shell(r_in=0.5, r_out=1.5, center_ra=0.1, center_dec=0),
+            aperture_types.IFUShells(
+                r_bins=np.linspace(0.2, 1.8, 5), center_ra=0, center_dec=0.1
+            ),
+            aperture_types.IFUGrid(x_grid=x_grid, y_grid=y_grid),
+        ]
+        for aperture in aperture_list:
+            bool_array, index_array = aperture.aperture_select_array(ra, dec)
+            assert len(bool_array) == len(ra)
+            num_segments = aperture.num_segments
+            for i in range(len(ra)):
+                bool_select, index = aperture.aperture_select(ra[i], dec[i])
+                assert bool_array[i] == bool_select
+                if bool_select:
+                    if isinstance(index, tuple):
+                        index = np.ravel_multi_index(index, num_segments)
+                    assert index_array[i] == index
+
 
 if __name__ == "__main__":
     pytest.main()
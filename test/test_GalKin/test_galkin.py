@@ -542,6 +542,37 @@ class TestGalkin(object):
         )
         npt.assert_almost_equal(sigma_v, sigma_v_ifu[0], decimal=-1)
 
+    def test_draw_light_aperture(self):
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        # a small off-center aperture with a low acceptance rate
+        kwargs_aperture = {
+            "aperture_type": "slit",
+            "length": 0.2,
+            "width": 0.2,
+            "center_ra": 2,
+            "center_dec": 0,
+            "angle": 0,
+        }
+        kwargs_psf = {"psf_type": "GAUSSIAN", "fwhm": 0.1}
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        galkin = Galkin(
+            kwargs_model,
+            kwargs_aperture,
+            kwargs_psf,
+            kwargs_cosmo,
+            analytic_kinematics=True,
+        )
+        np.random.seed(42)
+        r, R = galkin._draw_light_aperture(kwargs_light={"r_eff": 1}, num=500)
+        assert len(r) == 500
+        assert len(R) == 500
+        assert np.all(R <= r)
+        npt.assert_almost_equal(np.mean(R), 2, decimal=1)
+
     def test_dispersion_map_grid_convolved(self):
         """Test whether the old and new version using direct PSF convolution provide the
         same answer."""
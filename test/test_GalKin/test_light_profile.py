@@ -297,6 +297,12 @@ class TestLightProfile(object):
         l_R = lightProfile.light_2d(R, kwargs_profile)
         npt.assert_almost_equal(l_R / I_R, 1, decimal=2)
 
+        R = np.array([0.1, 1.0, 3.0])
+        I_R = lightProfile.light_2d_finite(R, kwargs_profile)
+        for i in range(len(R)):
+            I_R_i = lightProfile.light_2d_finite(R[i], kwargs_profile)
+            npt.assert_almost_equal(I_R[i], I_R_i, decimal=10)
+
     def test_del_cache(self):
         lightProfile = LightProfile(profile_list=["HERNQUIST"])
         lightProfile._light_cdf = 1
@@ -512,6 +512,68 @@ class TestMassProfile(object):
         assert hasattr(numeric_kin, "_log_mass_3d") is False
         assert hasattr(numeric_kin, "_interp_jeans_integral") is False
 
+    def test_I_R_sigma2_array(self):
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.1}]
+        kwargs_light = [{"Rs": 0.8, "amp": 1.0}]
+        kwargs_anisotropy = {"r_ani": 1.5}
+        R = np.array([0.00001, 0.1, 1.0, 5.0])
+        for log_integration in [True, False]:
+            numeric_kin = NumericKinematics(
+                kwargs_model, kwargs_cosmo, log_integration=log_integration
+            )
+            I_R_sigma2, I_R = numeric_kin._I_R_sigma2(
+                R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            for i in range(len(R)):
+                I_R_sigma2_i, I_R_i = numeric_kin._I_R_sigma2(
+                    R[i], kwargs_mass, kwargs_light, kwargs_anisotropy
+                )
+                npt.assert_almost_equal(I_R_sigma2[i] / I_R_sigma2_i, 1, decimal=10)
+                npt.assert_almost_equal(I_R[i] / I_R_i, 1, decimal=10)
+
+    def test_kwargs_cache(self):
+        kwargs_cosmo = {"d_d": 1000, "d_s": 1500, "d_ds": 800}
+        kwargs_model = {
+            "mass_profile_list": ["SPP"],
+            "light_profile_list": ["HERNQUIST"],
+            "anisotropy_model": "OM",
+        }
+        kwargs_mass = [{"theta_E": 1.2, "gamma": 2.1}]
+        kwargs_light = [{"Rs": 0.8, "amp": 1.0}]
+        R = np.array([0.1, 1.0])
+        numeric_kin = NumericKinematics(kwargs_model, kwargs_cosmo)
+        numeric_kin_cache = NumericKinematics(
+            kwargs_model, kwargs_cosmo, kwargs_cache_size=2
+        )
+        for r_ani in [1.0, 2.0, 1.0, 3.0]:
+            kwargs_anisotropy = {"r_ani": r_ani}
+            out = numeric_kin.I_R_sigma2_and_IR(
+                R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            out_cache = numeric_kin_cache.I_R_sigma2_and_IR(
+                R, kwargs_mass, kwargs_light, kwargs_anisotropy
+            )
+            npt.assert_almost_equal(out_cache, out, decimal=10)
+            numeric_kin.delete_cache()
+            numeric_kin_cache.delete_cache()
+        # the lookup holds the two most recently used tables
+        assert len(numeric_kin_cache._kwargs_cache) == 2
+        r_ani_cached = [
+            kwargs[2]["r_ani"] for kwargs, _ in numeric_kin_cache._kwargs_cache
+        ]
+        assert r_ani_cached == [1.0, 3.0]
+        table = numeric_kin_cache._kwargs_cache[0][1]
+        table_lookup = numeric_kin_cache._I_R_sigma2_table_lookup(
+            kwargs_mass, kwargs_light, {"r_ani": 1.0}
+        )
+        assert table_lookup is table
+
 
 if __name__ == "__main__":
     pytest.main()
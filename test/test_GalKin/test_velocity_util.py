@@ -46,6 +46,30 @@ class TestVelocityUtil(object):
         # plt.show()
         npt.assert_almost_equal(r_hist, f_moffat, decimal=1)
 
+    def test_draw_arrays(self):
+        np.random.seed(41)
+        n = 10000
+        FWHM = 1
+        x, y = velocity_util.displace_PSF_gaussian(np.zeros(n), np.ones(n), FWHM)
+        assert np.shape(x) == (n,)
+        sigma = FWHM / (2 * np.sqrt(2 * np.log(2)))
+        npt.assert_almost_equal(np.std(x), sigma, decimal=2)
+        npt.assert_almost_equal(np.std(y), sigma, decimal=2)
+        npt.assert_almost_equal(np.mean(y), 1, decimal=2)
+
+        beta = 2.6
+        r = velocity_util.draw_moffat_r(FWHM, beta, size=n)
+        r_draw = [velocity_util.draw_moffat_r(FWHM, beta) for i in range(n)]
+        npt.assert_almost_equal(np.median(r), np.median(r_draw), decimal=1)
+        x, y = velocity_util.displace_PSF_moffat(np.zeros(n), np.zeros(n), FWHM, beta)
+        assert np.shape(x) == (n,)
+        npt.assert_almost_equal(np.median(np.sqrt(x**2 + y**2)), np.median(r), 1)
+
+        a = 0.5
+        r = velocity_util.draw_hernquist(a, size=n)
+        # the half-mass radius of the Hernquist profile is (1 + sqrt(2)) a
+        npt.assert_almost_equal(np.median(r) / ((1 + np.sqrt(2)) * a), 1, decimal=1)
+
     def test_displace_PSF_moffat(self):
         FWHM = 1
         beta = 2.6
@@ -120,6 +120,9 @@ class TestJointLinear(object):
             "lens_light_model_list": lens_light_model_list,
         }
         self.imageModel = JointLinear(multi_band_list, kwargs_model)
+        self.imageModel_threads = JointLinear(
+            multi_band_list, kwargs_model, num_threads=2
+        )
 
     def test_linear_response(self):
         A = self.imageModel.linear_response_matrix(
@@ -131,6 +134,13 @@ class TestJointLinear(object):
         nx, ny = np.shape(A)
         assert nx == 3
         assert ny == 100**2 * 2
+        A_threads = self.imageModel_threads.linear_response_matrix(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+        )
+        npt.assert_almost_equal(A_threads, A, decimal=10)
 
     def test_image_linear_solve(self):
         (
@@ -1,5 +1,8 @@
 __author__ = "sibirrer"
 
+import copy
+import pickle
+
 import numpy.testing as npt
 import pytest
 import numpy as np
@@ -120,6 +123,7 @@ class TestImageModel(object):
             "point_source_model_list": ["SOURCE_POSITION"],
             "fixed_magnification_list": [True],
         }
+        self.multi_band_list, self.kwargs_model = multi_band_list, kwargs_model
         self.imageModel = MultiLinear(
             multi_band_list, kwargs_model, likelihood_mask_list=None, compute_bool=None
         )
@@ -162,6 +166,56 @@ class TestImageModel(object):
         )
         npt.assert_almost_equal(logL - logLmarg, 0, decimal=-2)
 
+    def test_num_threads(self):
+        multi_band_list = self.multi_band_list * 3
+        kwargs_model = dict(
+            self.kwargs_model,
+            source_light_model_list=["SERSIC_ELLIPSE", "SERSIC_ELLIPSE"],
+            index_source_light_model_list=[[0], [1], [0, 1]],
+        )
+        kwargs_source = self.kwargs_source + [dict(self.kwargs_source[0], amp=2)]
+        compute_bool = [True, False, True]
+        image_model = MultiLinear(
+            multi_band_list, kwargs_model, compute_bool=compute_bool
+        )
+        image_model_threads = MultiLinear(
+            multi_band_list, kwargs_model, compute_bool=compute_bool, num_threads=2
+        )
+        kwargs_list = [
+            copy.deepcopy([self.kwargs_lens, kwargs_source, None, self.kwargs_ps])
+            for _ in range(2)
+        ]
+        logL, param = image_model.likelihood_data_given_model(
+            *kwargs_list[0], source_marg=True, check_positive_flux=True
+        )
+        logL_threads, param_threads = image_model_threads.likelihood_data_given_model(
+            *kwargs_list[1], source_marg=True, check_positive_flux=True
+        )
+        npt.assert_almost_equal(logL_threads, logL, decimal=8)
+        assert param_threads[1] is None
+        npt.assert_almost_equal(param_threads[2], param[2], decimal=8)
+        # the linear amplitudes are written as in the sequential evaluation
+        assert kwargs_list[1] == kwargs_list[0]
+        assert kwargs_list[1][1][0]["amp"] != kwargs_source[0]["amp"]
+
+        model, error_map, cov_param, param = image_model.image_linear_solve(
+            self.kwargs_lens, kwargs_source, None, self.kwargs_ps, inv_bool=True
+        )
+        result_threads = image_model_threads.image_linear_solve(
+            self.kwargs_lens, kwargs_source, None, self.kwargs_ps, inv_bool=True
+        )
+        for i in [0, 2]:
+            npt.assert_almost_equal(result_threads[0][i], model[i], decimal=8)
+            npt.assert_almost_equal(result_threads[2][i], cov_param[i], decimal=8)
+        assert result_threads[0][1] is None
+
+        # the thread pool is not pickled
+        image_model_pickled = pickle.loads(pickle.dumps(image_model_threads))
+        logL_pickled, _ = image_model_pickled.likelihood_data_given_model(
+            *kwargs_list[1], source_marg=True
+        )
+        npt.assert_almost_equal(logL_pickled, logL, decimal=8)
+
     def test_numData_evaluate(self):
         numData = self.imageModel.num_data_evaluate
         assert numData == 10000
@@ -29,6 +29,61 @@ class TestPixelKernelConvolution(object):
         image_convolved = pixel_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+    def test_convolve2d_stack(self):
+        kernel = np.zeros((5, 5))
+        kernel[1, 2] = 0.6
+        kernel[2, 2] = 0.3
+        kernel[3, 1] = 0.1
+        stack = np.array([self.model, self.model.T, self.model**2])
+        for convolution_type in ["fft", "fft_static", "grid"]:
+            pixel_conv = PixelKernelConvolution(
+                kernel=kernel, convolution_type=convolution_type
+            )
+            stack_convolved = pixel_conv.convolution2d(stack)
+            assert np.shape(stack_convolved) == np.shape(stack)
+            for i in range(len(stack)):
+                npt.assert_almost_equal(
+                    stack_convolved[i], pixel_conv.convolution2d(stack[i]), decimal=12
+                )
+
+    def test_fft_backend(self):
+        from scipy import signal
+
+        np.random.seed(42)
+        kernel = np.random.random((5, 5))
+        for fft_backend in ["numpy", "scipy"]:
+            pixel_conv = PixelKernelConvolution(kernel=kernel, fft_backend=fft_backend)
+            # different image shapes with the same instance
+            for image in [self.model, np.random.random((12, 17))]:
+                npt.assert_almost_equal(
+                    pixel_conv.convolution2d(image),
+                    signal.fftconvolve(image, kernel, mode="same"),
+                    decimal=12,
+                )
+            stack = np.array([self.model, self.model.T])
+            npt.assert_almost_equal(
+                pixel_conv.convolution2d(stack),
+                [signal.fftconvolve(image, kernel, mode="same") for image in stack],
+                decimal=12,
+            )
+            kernel_complex = kernel + 1j * kernel.T
+            pixel_conv = PixelKernelConvolution(
+                kernel=kernel_complex, fft_backend=fft_backend
+            )
+            npt.assert_almost_equal(
+                pixel_conv.convolution2d(self.model),
+                signal.fftconvolve(self.model, kernel_complex, mode="same"),
+                decimal=12,
+            )
+        pixel_conv_t = PixelKernelConvolution(
+            kernel=kernel, fft_backend="scipy"
+        ).copy_transpose()
+        npt.assert_almost_equal(
+            pixel_conv_t.convolution2d(self.model),
+            signal.fftconvolve(self.model, kernel.T, mode="same"),
+            decimal=12,
+        )
+
     def test_copy_transpose(self):
         kernel = np.zeros((3, 3))
         kernel[1, 1] = 1
@@ -94,6 +149,13 @@ class TestPixelKernelConvolution(object):
         npt.assert_almost_equal(np.sum(model_conv_1d * y), 0, decimal=5)
 
 
+class TestRaise(object):
+    def test_raise(self):
+        kernel = np.ones((3, 3))
+        with pytest.raises(ValueError):
+            PixelKernelConvolution(kernel=kernel, fft_backend="wrong")
+
+
 class TestSubgridKernelConvolution(object):
     def setup_method(self):
         self.supersampling_factor = 3
@@ -142,6 +204,24 @@ class TestSubgridKernelConvolution(object):
         model_conv_static = conv_static.convolution2d(self.model)
         npt.assert_almost_equal(model_conv_static, model_conv_scipy, decimal=3)
 
+    def test_re_size_convolve_stack(self):
+        subgrid_conv = SubgridKernelConvolution(
+            self.kernel_sub,
+            self.supersampling_factor,
+            supersampling_kernel_size=3,
+            convolution_type="fft_static",
+        )
+        stack_sub = np.array([self.model_sub, self.model_sub.T * 2])
+        stack = np.array([self.model, self.model.T * 2])
+        stack_conv = subgrid_conv.re_size_convolve(stack, stack_sub)
+        assert np.shape(stack_conv) == np.shape(stack)
+        for i in range(len(stack)):
+            npt.assert_almost_equal(
+                stack_conv[i],
+                subgrid_conv.re_size_convolve(stack[i], stack_sub[i]),
+                decimal=12,
+            )
+
     def test_convolve2d(self):
         # kernel_supersampled = kernel_util.subgrid_kernel(self.kernel, self.supersampling_factor, odd=True, num_iter=5)
         subgrid_conv = SubgridKernelConvolution(
@@ -211,6 +291,13 @@ class TestMultiGaussianConvolution(object):
         image_convolved = mge_conv.convolution2d(self.model)
         npt.assert_almost_equal(np.sum(image_convolved), np.sum(self.model), decimal=2)
 
+        stack = np.array([self.model, self.model.T**2])
+        stack_convolved = mge_conv.convolution2d(stack)
+        for i in range(len(stack)):
+            npt.assert_almost_equal(
+                stack_convolved[i], mge_conv.convolution2d(stack[i]), decimal=12
+            )
+
 
 class TestMGEConvolution(object):
     def setup_method(self):
@@ -0,0 +1,54 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.ImSim.Numerics.fft_backend import FFTBackend
+
+
+class TestFFTBackend(object):
+    def setup_method(self):
+        np.random.seed(42)
+        self.image = np.random.random((2, 10, 13))
+
+    def test_transforms(self):
+        s = (16, 20)
+        for backend in ["numpy", "scipy"]:
+            fft = FFTBackend(backend=backend, workers=2)
+            assert fft.backend == backend
+            image_ft = fft.rfft2(self.image, s)
+            npt.assert_almost_equal(
+                image_ft, np.fft.rfftn(self.image, s, axes=(-2, -1)), decimal=12
+            )
+            npt.assert_almost_equal(
+                fft.irfft2(image_ft, s)[:, :10, :13], self.image, decimal=12
+            )
+            image_ft = fft.fft2(self.image, s)
+            npt.assert_almost_equal(
+                image_ft, np.fft.fftn(self.image, s, axes=(-2, -1)), decimal=12
+            )
+            npt.assert_almost_equal(
+                fft.ifft2(image_ft, s)[:, :10, :13], self.image, decimal=12
+            )
+
+    def test_next_fast_len(self):
+        assert FFTBackend.next_fast_len(97) == 100
+        assert FFTBackend.next_fast_len(64) == 64
+
+    def test_default(self):
+        fft = FFTBackend(workers=-1)
+        assert fft.backend in ["numpy", "scipy", "pyfftw"]
+
+
+class TestRaise(object):
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            FFTBackend(backend="wrong")
+        try:
+            import pyfftw
+        except ImportError:
+            with pytest.raises(ImportError):
+                FFTBackend(backend="pyfftw")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -388,6 +388,43 @@ class TestNumerics(object):
         delta = (self.image_true * self.psf_norm_factor - image_conv) / self.image_true
         npt.assert_almost_equal(delta[self._conv_pixels_partial], 0, decimal=1)
 
+    def test_re_size_convolve_stack(self):
+        for kwargs_numerics in [
+            self.kwargs_numerics_partial,
+            self.kwargs_numerics_true,
+            self.kwargs_numerics_high_adaptive,
+            self.kwargs_numerics_low_res,
+        ]:
+            image_model = ImageModel(
+                self.pixel_grid,
+                self.psf_class,
+                lens_light_model_class=self.lightModel,
+                kwargs_numerics=kwargs_numerics,
+            )
+            numerics = image_model.ImageNumerics
+            x, y = numerics.coordinates_evaluate
+            flux_arrays = np.array(
+                [
+                    self.lightModel.surface_brightness(x, y, self.kwargs_light),
+                    self.lightModel.surface_brightness(x + 0.1, y, self.kwargs_light),
+                    self.lightModel.surface_brightness(x, y - 0.1, self.kwargs_light),
+                ]
+            )
+            for unconvolved in [False, True]:
+                images = numerics.re_size_convolve_stack(
+                    flux_arrays, unconvolved=unconvolved
+                )
+                for i in range(len(flux_arrays)):
+                    image = numerics.re_size_convolve(
+                        flux_arrays[i], unconvolved=unconvolved
+                    )
+                    npt.assert_almost_equal(images[i], image, decimal=10)
+            # the stack is convolved in chunks of two images
+            images = numerics.re_size_convolve_stack(flux_arrays)
+            numerics._max_num_elements = 2 * len(x)
+            images_chunks = numerics.re_size_convolve_stack(flux_arrays)
+            npt.assert_almost_equal(images_chunks, images, decimal=10)
+
     def test_property_access(self):
         image_model = ImageModel(
             self.pixel_grid,
@@ -58,6 +58,39 @@ class TestPointSourceRendering(object):
         model = self._ps_rendering.point_source_rendering(ra_pos, dec_pos, amp)
         npt.assert_almost_equal(np.sum(model), 2, decimal=8)
 
+    def test_point_source_rendering_stack(self):
+        ra_pos_list = [[0, 1.3], [4.6], []]
+        dec_pos_list = [[1, 0.2], [5.5], []]
+        amp_list = [[1, 2], [3], []]
+        images = self._ps_rendering.point_source_rendering_stack(
+            ra_pos_list, dec_pos_list, amp_list
+        )
+        assert images.shape == (3, 10, 10)
+        for i in range(3):
+            model = self._ps_rendering.point_source_rendering(
+                ra_pos_list[i], dec_pos_list[i], amp_list[i]
+            )
+            npt.assert_almost_equal(images[i], model, decimal=12)
+
+        # supersampled rendering with a wide kernel
+        x, y = np.meshgrid(np.arange(-5, 6), np.arange(-5, 6))
+        kernel = np.exp(-(x**2 + y**2) / 8.0)
+        psf_class = PSF(kernel_point_source=kernel / np.sum(kernel), psf_type="PIXEL")
+        ps_rendering = PointSourceRendering(
+            self._ps_rendering._pixel_grid, supersampling_factor=3, psf=psf_class
+        )
+        images = ps_rendering.point_source_rendering_stack(
+            ra_pos_list, dec_pos_list, amp_list
+        )
+        for i in range(3):
+            model = ps_rendering.point_source_rendering(
+                ra_pos_list[i], dec_pos_list[i], amp_list[i]
+            )
+            npt.assert_almost_equal(images[i], model, decimal=12)
+
+        images = ps_rendering.point_source_rendering_stack([[]], [[]], [[]])
+        npt.assert_almost_equal(images, np.zeros((1, 10, 10)), decimal=12)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
@@ -86,6 +119,8 @@ class TestRaise(unittest.TestCase):
             self._ps_rendering.point_source_rendering(
                 ra_pos=[1, 1], dec_pos=[0, 1], amp=[1]
             )
+        with self.assertRaises(ValueError):
+            self._ps_rendering.point_source_rendering_stack([[1, 1]], [[0, 1]], [[1]])
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 __author__ = "sibirrer"
 
+import sys
+
 import numpy as np
 import numpy.testing as npt
 from lenstronomy.ImSim import de_lens
@@ -52,6 +54,85 @@ class TestDeLens(object):
         npt.assert_almost_equal(result[1], 0, decimal=8)
         npt.assert_almost_equal(image[0], 0, decimal=8)
 
+    def test_wls_cholesky_solver(self):
+        np.random.seed(42)
+        A = np.random.normal(size=(200, 10))
+        C_D_inv = np.random.uniform(0.5, 2, size=200)
+        d = np.random.normal(size=200)
+        B, M_inv, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=True)
+
+        solver = de_lens.WLSCholeskySolver(float32=False)
+        B_chol, M_inv_chol, image_chol = solver.get_param_WLS(
+            A, C_D_inv, d, inv_bool=True
+        )
+        npt.assert_almost_equal(B_chol, B, decimal=10)
+        npt.assert_almost_equal(M_inv_chol, M_inv, decimal=10)
+        npt.assert_almost_equal(image_chol, image, decimal=10)
+
+        # re-using the factorization with a different data vector
+        d_new = np.random.normal(size=200)
+        B, _, _ = de_lens.get_param_WLS(A, C_D_inv, d_new, inv_bool=False)
+        B_chol, M_inv_chol, _ = solver.get_param_WLS(A, C_D_inv, d_new, inv_bool=False)
+        npt.assert_almost_equal(B_chol, B, decimal=10)
+        assert M_inv_chol is None
+
+        # change in the number of parameters
+        B, _, _ = de_lens.get_param_WLS(A[:, :5], C_D_inv, d, inv_bool=False)
+        B_chol, _, _ = solver.get_param_WLS(A[:, :5], C_D_inv, d, inv_bool=False)
+        npt.assert_almost_equal(B_chol, B, decimal=10)
+
+        solver = de_lens.WLSCholeskySolver(float32=True)
+        B, _, _ = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=False)
+        B_chol, _, image_chol = solver.get_param_WLS(A, C_D_inv, d, inv_bool=False)
+        npt.assert_almost_equal(B_chol, B, decimal=4)
+        assert image_chol.dtype == np.float64
+
+    def test_wls_cholesky_stability(self):
+        solver = de_lens.WLSCholeskySolver()
+        A = np.array([[1, 2, 3], [3, 2, 1]]).T
+        C_D_inv = np.array([0, 0, 0])
+        d = np.array([1, 2, 3])
+        result, cov_error, image = solver.get_param_WLS(A, C_D_inv, d)
+        npt.assert_almost_equal(result, 0, decimal=8)
+        npt.assert_almost_equal(cov_error, 0, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+
+        C_D_inv = np.array([1, 1, 1])
+        A = np.array([[1.0, 2.0, 1.0 + 10 ** (-8.9)], [1.0, 2.0, 1.0]]).T
+        result, cov_error, image = solver.get_param_WLS(A, C_D_inv, d, inv_bool=False)
+        npt.assert_almost_equal(result, 0, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+
+        A = np.array([[1, 2, 3], [np.nan, 2, 1]]).T
+        result, cov_error, image = solver.get_param_WLS(A, C_D_inv, d, inv_bool=False)
+        npt.assert_almost_equal(result, 0, decimal=8)
+
+        # nearly singular normal matrix M = L L^T whose Cholesky factor L has a unit
+        # diagonal, such that the diagonal does not reveal the condition number
+        num_param = 30
+        L = np.eye(num_param) - np.tril(np.ones((num_param, num_param)), -1)
+        A = L.T
+        C_D_inv = np.ones(num_param)
+        d = np.ones(num_param)
+        assert np.linalg.cond(A.T.dot(A)) > 5 / sys.float_info.epsilon
+        result, cov_error, image = solver.get_param_WLS(A, C_D_inv, d)
+        result_inv, cov_error_inv, image_inv = de_lens.get_param_WLS(A, C_D_inv, d)
+        npt.assert_almost_equal(result, result_inv, decimal=8)
+        npt.assert_almost_equal(cov_error, cov_error_inv, decimal=8)
+        npt.assert_almost_equal(image, 0, decimal=8)
+
+    def test_create_wls_solver(self):
+        solver = de_lens.create_wls_solver(kwargs_wls=None)
+        assert solver is de_lens.get_param_WLS
+        solver = de_lens.create_wls_solver(kwargs_wls={"method": "cholesky"})
+        A = np.array([[1, 2, 3], [3, 2, 1]]).T
+        C_D_inv = np.array([1, 1, 1])
+        d = np.array([1, 2, 3])
+        result, cov_error, image = solver(A, C_D_inv, d)
+        npt.assert_almost_equal(result, [1, 0], decimal=8)
+        with pytest.raises(ValueError):
+            de_lens.create_wls_solver(kwargs_wls={"method": "wrong"})
+
     def test_marginalisation_const(self):
         A = np.array([[1, 2, 3], [3, 2, 1]]).T
         C_D_inv = np.array([1, 1, 1])
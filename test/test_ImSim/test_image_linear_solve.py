@@ -127,6 +127,35 @@ class TestImageLinearFit(object):
         chi2_reduced = self.imageLinearFit.reduced_chi2(model, error_map)
         npt.assert_almost_equal(chi2_reduced, 1, decimal=1)
 
+    def test_image_linear_solve_cholesky(self):
+        imageLinearFit = ImageLinearFit(
+            self.imageLinearFit.Data,
+            self.imageLinearFit.PSF,
+            self.imageLinearFit.LensModel,
+            self.imageLinearFit.SourceModel,
+            self.imageLinearFit.LensLightModel,
+            self.imageLinearFit.PointSource,
+            kwargs_numerics={"supersampling_factor": 2},
+            kwargs_wls={"method": "cholesky"},
+        )
+        model, _, cov_param, param = self.imageLinearFit.image_linear_solve(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            self.kwargs_ps,
+            inv_bool=True,
+        )
+        model_chol, _, cov_param_chol, param_chol = imageLinearFit.image_linear_solve(
+            self.kwargs_lens,
+            self.kwargs_source,
+            self.kwargs_lens_light,
+            self.kwargs_ps,
+            inv_bool=True,
+        )
+        npt.assert_allclose(param_chol, param, rtol=1e-6)
+        npt.assert_allclose(cov_param_chol, cov_param, rtol=1e-6, atol=1e-12)
+        npt.assert_allclose(model_chol, model, rtol=1e-6, atol=1e-8)
+
     def test_num_param_linear(self):
         num_param_linear = self.imageLinearFit.num_param_linear(
             self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
@@ -141,6 +170,63 @@ class TestImageLinearFit(object):
         assert n == 3
         assert m == 100 * 100
 
+    def test_linear_response_matrix_cache(self):
+        def _A_no_cache(kwargs_lens, kwargs_source, kwargs_lens_light):
+            self.imageLinearFit.delete_linear_response_cache()
+            return self.imageLinearFit.linear_response_matrix(
+                kwargs_lens, kwargs_source, kwargs_lens_light, self.kwargs_ps
+            )
+
+        A = self.imageLinearFit.linear_response_matrix(
+            self.kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        lens_light_cache = self.imageLinearFit._lens_light_response_cache[0]
+
+        # lens-only update re-uses the lens light rows
+        kwargs_lens = [{"theta_E": 1.1, "center_x": 0, "center_y": 0}]
+        A_lens = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        assert self.imageLinearFit._lens_light_response_cache[0] is lens_light_cache
+        assert not np.allclose(A_lens[0], A[0])
+        npt.assert_almost_equal(A_lens[1], A[1], decimal=10)
+
+        # source-only update with an in-place change of the kwargs
+        kwargs_source = [dict(self.kwargs_source[0])]
+        A_lens = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        kwargs_source[0]["R_sersic"] = 0.3
+        kwargs_source[0]["amp"] = 10
+        A_source = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, kwargs_source, self.kwargs_lens_light, self.kwargs_ps
+        )
+        A_source_no_cache = _A_no_cache(
+            kwargs_lens, kwargs_source, self.kwargs_lens_light
+        )
+        npt.assert_almost_equal(A_source[:2], A_source_no_cache[:2], decimal=10)
+        assert not np.allclose(A_source[0], A_lens[0])
+
+        # lens light update
+        kwargs_lens_light = [dict(self.kwargs_lens_light[0], R_sersic=0.2)]
+        A_lens_light = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens, kwargs_source, kwargs_lens_light, self.kwargs_ps
+        )
+        A_lens_light_no_cache = _A_no_cache(
+            kwargs_lens, kwargs_source, kwargs_lens_light
+        )
+        npt.assert_almost_equal(A_lens_light[:2], A_lens_light_no_cache[:2], decimal=10)
+
+        # unconvolved rows are not mixed with convolved rows
+        A_unconvolved = self.imageLinearFit.linear_response_matrix(
+            kwargs_lens,
+            kwargs_source,
+            kwargs_lens_light,
+            self.kwargs_ps,
+            unconvolved=True,
+        )
+        assert not np.allclose(A_unconvolved[1], A_lens_light[1])
+
     def test_linear_param_from_kwargs(self):
         param = self.imageLinearFit.linear_param_from_kwargs(
             self.kwargs_source, self.kwargs_lens_light, self.kwargs_ps
@@ -451,6 +451,83 @@ class TestMultiPlane(object):
         npt.assert_almost_equal(beta_x, beta_x_true, decimal=8)
         npt.assert_almost_equal(beta_y, beta_y_true, decimal=8)
 
+    def test_plane_cache(self):
+        z_source = 1.5
+        # different profile types for separate profile instances
+        lens_model_list = ["POINT_MASS", "SIS", "SIE", "NFW"]
+        redshift_list = [0.1, 0.5, 0.5, 0.7]
+        kwargs_lens = [
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"theta_E": 1, "center_x": 0, "center_y": 0},
+            {"theta_E": 0.1, "e1": 0.1, "e2": 0, "center_x": 0, "center_y": 0.5},
+            {"Rs": 1, "alpha_Rs": 0.2, "center_x": 0.1, "center_y": 0.3},
+        ]
+        lens_model = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+        )
+        lens_model_cache = MultiPlane(
+            z_source=z_source,
+            lens_model_list=lens_model_list,
+            lens_redshift_list=redshift_list,
+            plane_cache=True,
+        )
+        # count the deflection evaluations per lens model
+        num_calls = [0] * len(lens_model_list)
+
+        def _counter(func, k):
+            def derivatives(*args, **kwargs):
+                num_calls[k] += 1
+                return func(*args, **kwargs)
+
+            return derivatives
+
+        func_list = lens_model_cache.multi_plane_base.func_list
+        for k, func in enumerate(func_list):
+            func.derivatives = _counter(func.derivatives, k)
+
+        x, y = np.linspace(-1, 1, 10), np.linspace(1, -0.5, 10)
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_cache, beta_y_cache = lens_model_cache.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_cache, beta_x, decimal=12)
+        npt.assert_almost_equal(beta_y_cache, beta_y, decimal=12)
+        assert num_calls == [1, 1, 1, 1]
+
+        # unchanged arguments: nothing is re-computed
+        beta_x_cache, beta_y_cache = lens_model_cache.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_cache, beta_x, decimal=12)
+        assert num_calls == [1, 1, 1, 1]
+
+        # change of the main deflector: the foreground plane is re-used
+        kwargs_lens[1]["theta_E"] = 1.1
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_cache, beta_y_cache = lens_model_cache.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_cache, beta_x, decimal=12)
+        npt.assert_almost_equal(beta_y_cache, beta_y, decimal=12)
+        assert num_calls == [1, 2, 2, 2]
+
+        # change of the last plane
+        kwargs_lens[3]["alpha_Rs"] = 0.3
+        beta_x, beta_y = lens_model.ray_shooting(x, y, kwargs_lens)
+        beta_x_cache, beta_y_cache = lens_model_cache.ray_shooting(x, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_cache, beta_x, decimal=12)
+        assert num_calls == [1, 2, 2, 3]
+
+        # different rays or distances invalidate the cache
+        beta_x, beta_y = lens_model.ray_shooting(x + 0.1, y, kwargs_lens)
+        beta_x_cache, _ = lens_model_cache.ray_shooting(x + 0.1, y, kwargs_lens)
+        npt.assert_almost_equal(beta_x_cache, beta_x, decimal=12)
+        assert num_calls == [2, 3, 3, 4]
+        lens_model_cache.multi_plane_base.T_ij_list = (
+            lens_model_cache.multi_plane_base.T_ij_list
+        )
+        lens_model_cache.ray_shooting(x + 0.1, y, kwargs_lens)
+        assert num_calls == [3, 4, 4, 5]
+        lens_model_cache.multi_plane_base.delete_plane_cache()
+        lens_model_cache.ray_shooting(x + 0.1, y, kwargs_lens)
+        assert num_calls == [4, 5, 5, 6]
+
     def test_ray_shooting_partial(self):
         z_source = 1.5
         lens_model_list = ["SIS", "SIS", "SIS"]
@@ -1,4 +1,7 @@
 from lenstronomy.LensModel.Profiles.base_profile import LensProfileBase
+from lenstronomy.LensModel.Profiles.sis import SIS
+import numpy as np
+import numpy.testing as npt
 import unittest
 
 
@@ -11,6 +14,22 @@ class TestBaseProfile(object):
         base.set_static()
         base.set_dynamic()
 
+    def test_derivatives_add(self):
+        sis = SIS()
+        x, y = np.array([1.0, 0.5, -2]), np.array([0.3, 0, 1])
+        kwargs = {"theta_E": 1.2, "center_x": 0.1, "center_y": -0.1}
+        out = (np.ones(3), np.ones(3))
+        LensProfileBase.derivatives_add(sis, x, y, out, **kwargs)
+        f_x, f_y = sis.derivatives(x, y, **kwargs)
+        npt.assert_almost_equal(out[0], f_x + 1, decimal=12)
+        npt.assert_almost_equal(out[1], f_y + 1, decimal=12)
+
+        out = (np.ones(3), np.ones(3), np.ones(3), np.ones(3))
+        LensProfileBase.hessian_add(sis, x, y, out, **kwargs)
+        hessian = sis.hessian(x, y, **kwargs)
+        for out_i, f_i in zip(out, hessian):
+            npt.assert_almost_equal(out_i, f_i + 1, decimal=12)
+
 
 class TestRaise(unittest.TestCase):
     def test_raise(self):
@@ -153,6 +153,58 @@ class TestInterpol(object):
         f_true = sis.derivatives(x, y, **kwargs_SIS)
         npt.assert_almost_equal(f_, f_true, decimal=10)
 
+    def test_scattered_positions(self):
+        numPix = 101
+        deltaPix = 0.1
+        x_grid_interp, y_grid_interp = util.make_grid(numPix, deltaPix)
+        sis = SIS()
+        kwargs_SIS = {"theta_E": 1.0, "center_x": 0.5, "center_y": -0.5}
+        f_sis = sis.function(x_grid_interp, y_grid_interp, **kwargs_SIS)
+        f_x_sis, f_y_sis = sis.derivatives(x_grid_interp, y_grid_interp, **kwargs_SIS)
+        f_xx_sis, f_xy_sis, f_yx_sis, f_yy_sis = sis.hessian(
+            x_grid_interp, y_grid_interp, **kwargs_SIS
+        )
+        x_axes, y_axes = util.get_axes(x_grid_interp, y_grid_interp)
+        kwargs_interp = {
+            "grid_interp_x": x_axes,
+            "grid_interp_y": y_axes,
+            "f_": util.array2image(f_sis),
+            "f_x": util.array2image(f_x_sis),
+            "f_y": util.array2image(f_y_sis),
+            "f_xx": util.array2image(f_xx_sis),
+            "f_yy": util.array2image(f_yy_sis),
+            "f_xy": util.array2image(f_xy_sis),
+        }
+        interp_func = Interpol(grid=False)
+        np.random.seed(42)
+        x, y = np.random.uniform(-4, 4, 200), np.random.uniform(-4, 4, 200)
+        f_ = interp_func.function(x, y, **kwargs_interp)
+        f_x, f_y = interp_func.derivatives(x, y, **kwargs_interp)
+        f_xx, f_xy, f_yx, f_yy = interp_func.hessian(x, y, **kwargs_interp)
+        for i in range(len(x)):
+            npt.assert_almost_equal(
+                f_[i], interp_func.function(x[i], y[i], **kwargs_interp), decimal=12
+            )
+            f_x_i, f_y_i = interp_func.derivatives(x[i], y[i], **kwargs_interp)
+            npt.assert_almost_equal(f_x[i], f_x_i, decimal=12)
+            npt.assert_almost_equal(f_y[i], f_y_i, decimal=12)
+            f_xx_i, f_xy_i, _, f_yy_i = interp_func.hessian(x[i], y[i], **kwargs_interp)
+            npt.assert_almost_equal(f_xx[i], f_xx_i, decimal=12)
+            npt.assert_almost_equal(f_xy[i], f_xy_i, decimal=12)
+            npt.assert_almost_equal(f_yy[i], f_yy_i, decimal=12)
+        f_x_true, f_y_true = sis.derivatives(x, y, **kwargs_SIS)
+        npt.assert_almost_equal(f_x, f_x_true, decimal=1)
+
+        # the splines are re-used for equal maps and re-computed for different maps
+        spline = interp_func._f_x_interp
+        kwargs_copy = {key: np.copy(value) for key, value in kwargs_interp.items()}
+        interp_func.derivatives(x, y, **kwargs_copy)
+        assert interp_func._f_x_interp is spline
+        kwargs_scaled = dict(kwargs_interp, f_x=kwargs_interp["f_x"] * 2)
+        f_x_scaled, _ = interp_func.derivatives(x, y, **kwargs_scaled)
+        assert interp_func._f_x_interp is not spline
+        npt.assert_almost_equal(f_x_scaled, 2 * f_x, decimal=12)
+
     def test_hessian_finite_differential(self):
         numPix = 101
         deltaPix = 0.1
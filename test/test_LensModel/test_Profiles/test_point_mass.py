@@ -72,6 +72,26 @@ class TestPointMass(object):
         assert values[3][1] == 0.080000000000000002
         assert values[1][1] == -0.059999999999999998
 
+    def test_derivatives_add(self):
+        x = np.array([1, 3, 4, 0, 0.5])
+        y = np.array([0, 1, 1, 0, -0.2])
+        kwargs = {"theta_E": 1.3, "center_x": 0, "center_y": 0}
+        out = (np.ones(5), np.ones(5))
+        self.pointmass.derivatives_add(x, y, out, **kwargs)
+        f_x, f_y = self.pointmass.derivatives(x, y, **kwargs)
+        npt.assert_almost_equal(out[0], f_x + 1, decimal=12)
+        npt.assert_almost_equal(out[1], f_y + 1, decimal=12)
+
+        out = (np.ones(5), np.ones(5), np.ones(5), np.ones(5))
+        self.pointmass.hessian_add(x, y, out, **kwargs)
+        hessian = self.pointmass.hessian(x, y, **kwargs)
+        for out_i, f_i in zip(out, hessian):
+            npt.assert_almost_equal(out_i, f_i + 1, decimal=12)
+
+        out = (np.array(0.0), np.array(0.0))
+        self.pointmass.derivatives_add(1.0, 0.0, out, **kwargs)
+        npt.assert_almost_equal(out[0], 1.3**2, decimal=12)
+
     def test_mass_3d_lens(self):
         theta_E = 0.5
         r = 5
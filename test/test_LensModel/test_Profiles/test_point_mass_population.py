@@ -0,0 +1,72 @@
+__author__ = "sibirrer"
+
+
+from lenstronomy.LensModel.Profiles.point_mass_population import PointMassPopulation
+from lenstronomy.LensModel.lens_model import LensModel
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+
+class TestPointMassPopulation(object):
+    def setup_method(self):
+        np.random.seed(42)
+        num = 200
+        self.kwargs = {
+            "theta_E": np.random.uniform(0.001, 0.01, num),
+            "center_x": np.random.uniform(-1, 1, num),
+            "center_y": np.random.uniform(-1, 1, num),
+        }
+        self.kwargs_list = [
+            {key: value[i] for key, value in self.kwargs.items()} for i in range(num)
+        ]
+        self.lens_model_sum = LensModel(lens_model_list=["POINT_MASS"] * num)
+        self.x = np.random.uniform(-1, 1, 100)
+        self.y = np.random.uniform(-1, 1, 100)
+
+    def test_exact(self):
+        lens_model = LensModel(
+            lens_model_list=["POINT_MASS_POPULATION"],
+            profile_kwargs_list=[{"opening_angle": 0}],
+        )
+        npt.assert_almost_equal(
+            lens_model.potential(self.x, self.y, [self.kwargs]),
+            self.lens_model_sum.potential(self.x, self.y, self.kwargs_list),
+            decimal=10,
+        )
+        npt.assert_almost_equal(
+            lens_model.alpha(self.x, self.y, [self.kwargs]),
+            self.lens_model_sum.alpha(self.x, self.y, self.kwargs_list),
+            decimal=10,
+        )
+        npt.assert_almost_equal(
+            lens_model.hessian(self.x, self.y, [self.kwargs]),
+            self.lens_model_sum.hessian(self.x, self.y, self.kwargs_list),
+            decimal=8,
+        )
+
+    def test_tree(self):
+        lens_model = LensModel(lens_model_list=["POINT_MASS_POPULATION"])
+        f_x, f_y = lens_model.alpha(self.x, self.y, [self.kwargs])
+        f_x_sum, f_y_sum = self.lens_model_sum.alpha(self.x, self.y, self.kwargs_list)
+        scale = np.max(np.hypot(f_x_sum, f_y_sum))
+        npt.assert_allclose(f_x / scale, f_x_sum / scale, atol=1e-5)
+        npt.assert_allclose(f_y / scale, f_y_sum / scale, atol=1e-5)
+
+    def test_tree_cache(self):
+        profile = PointMassPopulation()
+        profile.derivatives(self.x, self.y, **self.kwargs)
+        tree = profile._tree
+        profile.hessian(self.x, self.y, **self.kwargs)
+        assert profile._tree is tree
+        kwargs = dict(self.kwargs)
+        kwargs["center_x"] = kwargs["center_x"] + 0.1
+        f_x, f_y = profile.derivatives(self.x, self.y, **kwargs)
+        assert profile._tree is not tree
+        f_x_shift, f_y_shift = profile.derivatives(self.x - 0.1, self.y, **self.kwargs)
+        npt.assert_almost_equal(f_x, f_x_shift, decimal=8)
+        npt.assert_almost_equal(f_y, f_y_shift, decimal=8)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -73,6 +73,29 @@ class TestSIS(object):
         npt.assert_almost_equal(values[3][1], 0.28460498941515411, decimal=9)
         npt.assert_almost_equal(values[1][1], -0.094868329805051374, decimal=9)
 
+    def test_derivatives_add(self):
+        x = np.array([1, 3, 4, 0, 0.5])
+        y = np.array([0, 1, 1, 0, -0.2])
+        kwargs = {"theta_E": 1.3, "center_x": 0, "center_y": 0}
+        out = (np.ones(5), np.ones(5))
+        self.SIS.derivatives_add(x, y, out, **kwargs)
+        f_x, f_y = self.SIS.derivatives(x, y, **kwargs)
+        npt.assert_almost_equal(out[0], f_x + 1, decimal=12)
+        npt.assert_almost_equal(out[1], f_y + 1, decimal=12)
+
+        out = (np.ones(5), np.ones(5), np.ones(5), np.ones(5))
+        self.SIS.hessian_add(x, y, out, **kwargs)
+        hessian = self.SIS.hessian(x, y, **kwargs)
+        for out_i, f_i in zip(out, hessian):
+            npt.assert_almost_equal(out_i, f_i + 1, decimal=12)
+
+        out = (np.array(0.0), np.array(0.0))
+        self.SIS.derivatives_add(1.0, 0.0, out, **kwargs)
+        npt.assert_almost_equal(out[0], 1.3, decimal=12)
+        out = (np.array(0.0), np.array(0.0), np.array(0.0), np.array(0.0))
+        self.SIS.hessian_add(0.0, 1.0, out, **kwargs)
+        npt.assert_almost_equal(out[0], 1.3, decimal=12)
+
     def test_theta2rho(self):
         theta_E = 2.0
         rho0 = self.SIS.theta2rho(theta_E)
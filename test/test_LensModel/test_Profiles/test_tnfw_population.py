@@ -0,0 +1,110 @@
+__author__ = "sibirrer"
+
+
+from lenstronomy.LensModel.Profiles.tnfw import TNFW
+from lenstronomy.LensModel.Profiles.tnfw_population import TNFWPopulation
+from lenstronomy.LensModel.lens_model import LensModel
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+
+class TestTNFWPopulation(object):
+    def setup_method(self):
+        self.tnfw = TNFW()
+        # small tile size to test the tiling over halos
+        self.population = TNFWPopulation(max_elements=1000)
+        np.random.seed(42)
+        num_halo = 23
+        self.kwargs = {
+            "Rs": np.random.uniform(0.05, 0.5, num_halo),
+            "alpha_Rs": np.random.uniform(0.001, 0.05, num_halo),
+            "r_trunc": np.random.uniform(0.1, 2, num_halo),
+            "center_x": np.random.uniform(-2, 2, num_halo),
+            "center_y": np.random.uniform(-2, 2, num_halo),
+        }
+        self.x, self.y = np.meshgrid(np.linspace(-2, 2, 20), np.linspace(-2, 2, 15))
+
+    def _sum_tnfw(self, func, x, y):
+        kwargs_list = [
+            {key: value[i] for key, value in self.kwargs.items()}
+            for i in range(len(self.kwargs["Rs"]))
+        ]
+        return np.sum(
+            [getattr(self.tnfw, func)(x, y, **kwargs) for kwargs in kwargs_list],
+            axis=0,
+        )
+
+    def test_function(self):
+        f = self.population.function(self.x, self.y, **self.kwargs)
+        f_sum = self._sum_tnfw("function", self.x, self.y)
+        assert np.shape(f) == np.shape(self.x)
+        npt.assert_almost_equal(f, f_sum, decimal=10)
+
+    def test_derivatives(self):
+        f_x, f_y = self.population.derivatives(self.x, self.y, **self.kwargs)
+        f_x_sum, f_y_sum = self._sum_tnfw("derivatives", self.x, self.y)
+        npt.assert_almost_equal(f_x, f_x_sum, decimal=10)
+        npt.assert_almost_equal(f_y, f_y_sum, decimal=10)
+
+        f_x, f_y = self.population.derivatives(0.3, -0.2, **self.kwargs)
+        f_x_sum, f_y_sum = self._sum_tnfw("derivatives", 0.3, -0.2)
+        npt.assert_almost_equal(f_x, f_x_sum, decimal=10)
+        npt.assert_almost_equal(f_y, f_y_sum, decimal=10)
+
+    def test_hessian(self):
+        hessian = self.population.hessian(self.x, self.y, **self.kwargs)
+        hessian_sum = self._sum_tnfw("hessian", self.x, self.y)
+        for f, f_sum in zip(hessian, hessian_sum):
+            npt.assert_almost_equal(f, f_sum, decimal=10)
+
+        # a coordinate at exactly R = Rs
+        kwargs = {key: value[:1] for key, value in self.kwargs.items()}
+        x = kwargs["center_x"] + kwargs["Rs"]
+        y = kwargs["center_y"]
+        hessian = self.population.hessian(x, y, **kwargs)
+        kwargs_tnfw = {key: value[0] for key, value in kwargs.items()}
+        hessian_tnfw = self.tnfw.hessian(x, y, **kwargs_tnfw)
+        npt.assert_almost_equal(hessian, hessian_tnfw, decimal=10)
+
+    def test_add(self):
+        out = (np.ones_like(self.x), np.zeros_like(self.x))
+        self.population.derivatives_add(self.x, self.y, out, **self.kwargs)
+        f_x, f_y = self.population.derivatives(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(out[0], f_x + 1, decimal=12)
+        npt.assert_almost_equal(out[1], f_y, decimal=12)
+
+        out = tuple(np.zeros_like(self.x) for _ in range(4))
+        self.population.hessian_add(self.x, self.y, out, **self.kwargs)
+        hessian = self.population.hessian(self.x, self.y, **self.kwargs)
+        npt.assert_almost_equal(out, hessian, decimal=12)
+
+    def test_lens_model(self):
+        num_halo = len(self.kwargs["Rs"])
+        lens_model = LensModel(lens_model_list=["TNFW_POPULATION"])
+        lens_model_sum = LensModel(lens_model_list=["TNFW"] * num_halo)
+        kwargs_sum = [
+            {key: value[i] for key, value in self.kwargs.items()}
+            for i in range(num_halo)
+        ]
+        x, y = self.x.flatten(), self.y.flatten()
+        npt.assert_almost_equal(
+            lens_model.alpha(x, y, [self.kwargs]),
+            lens_model_sum.alpha(x, y, kwargs_sum),
+            decimal=10,
+        )
+        npt.assert_almost_equal(
+            lens_model.hessian(x, y, [self.kwargs]),
+            lens_model_sum.hessian(x, y, kwargs_sum),
+            decimal=10,
+        )
+
+    def test_raise(self):
+        kwargs = dict(self.kwargs)
+        kwargs["r_trunc"] = kwargs["r_trunc"][:-1]
+        with npt.assert_raises(ValueError):
+            self.population.derivatives(self.x, self.y, **kwargs)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -50,6 +50,163 @@ class TestLensEquationSolver(object):
         source_x, source_y = lensModel.ray_shooting(x_pos, y_pos, kwargs_lens)
         npt.assert_almost_equal(sourcePos_x, source_x, decimal=10)
 
+    def test_warm_start(self):
+        lensModel = LensModel(["SIE", "SHEAR"])
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {"theta_E": 1.0, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        kwargs_solver = {
+            "min_distance": 0.05,
+            "search_window": 5,
+            "precision_limit": 10 ** (-10),
+            "num_iter_max": 100,
+        }
+        x_pos, y_pos = lensEquationSolver.image_position_from_source(
+            0.05, 0.02, kwargs_lens, warm_start=True, **kwargs_solver
+        )
+        assert len(x_pos) == 4
+        cache = lensEquationSolver._warm_start_cache
+        assert cache is not None
+
+        # small change in source position and lens model re-uses the previous solutions
+        kwargs_lens_new = copy.deepcopy(kwargs_lens)
+        kwargs_lens_new[0]["theta_E"] += 0.0005
+        x_pos_warm, y_pos_warm = lensEquationSolver.image_position_from_source(
+            0.0505, 0.0201, kwargs_lens_new, warm_start=True, **kwargs_solver
+        )
+        assert lensEquationSolver._warm_start_cache["source_x"] == 0.05
+        x_pos_grid, y_pos_grid = lensEquationSolver.image_position_from_source(
+            0.0505, 0.0201, kwargs_lens_new, **kwargs_solver
+        )
+        npt.assert_almost_equal(x_pos_warm, x_pos_grid, decimal=8)
+        npt.assert_almost_equal(y_pos_warm, y_pos_grid, decimal=8)
+        source_x, source_y = lensModel.ray_shooting(
+            x_pos_warm, y_pos_warm, kwargs_lens_new
+        )
+        npt.assert_almost_equal(source_x, 0.0505, decimal=10)
+        npt.assert_almost_equal(source_y, 0.0201, decimal=10)
+
+        # large change triggers the full grid search and a new reference point
+        x_pos, y_pos = lensEquationSolver.image_position_from_source(
+            0.5, 0.0, kwargs_lens, warm_start=True, **kwargs_solver
+        )
+        assert lensEquationSolver._warm_start_cache["source_x"] == 0.5
+        assert len(x_pos) == 2
+
+        # a change in the solver settings does not use the warm start
+        x_pos, y_pos = lensEquationSolver.image_position_from_source(
+            0.5,
+            0.0,
+            kwargs_lens,
+            warm_start=True,
+            min_distance=0.02,
+            search_window=5,
+        )
+        assert lensEquationSolver._warm_start_cache["settings"][0] == 0.02
+        assert len(x_pos) == 2
+
+        # failing warm start falls back to the grid search
+        lensEquationSolver._warm_start_cache["x_image"] = np.array([10.0, 10.2])
+        lensEquationSolver._warm_start_cache["y_image"] = np.array([10.0, 10.2])
+        x_pos_fallback, y_pos_fallback = lensEquationSolver.image_position_from_source(
+            0.5,
+            0.0,
+            kwargs_lens,
+            warm_start=True,
+            min_distance=0.02,
+            search_window=5,
+        )
+        npt.assert_almost_equal(x_pos_fallback, x_pos, decimal=8)
+
+        lensEquationSolver.delete_warm_start_cache()
+        assert lensEquationSolver._warm_start_cache is None
+
+    def test_quadtree(self):
+        lensModel = LensModel(["SPEP", "SIS", "SHEAR"])
+        lensEquationSolver = LensEquationSolver(lensModel)
+        kwargs_lens = [
+            {
+                "theta_E": 1.0,
+                "gamma": 1.9,
+                "e1": 0.2,
+                "e2": -0.03,
+                "center_x": 0.1,
+                "center_y": -0.1,
+            },
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"gamma1": 0.02, "gamma2": -0.01},
+        ]
+        for source_x, source_y in [(0.1, -0.1), (0.05, 0.3), (0.5, 0.4)]:
+            x_pos, y_pos = lensEquationSolver.image_position_from_source(
+                source_x, source_y, kwargs_lens, min_distance=0.02, search_window=5
+            )
+            x_pos_qt, y_pos_qt = lensEquationSolver.image_position_from_source(
+                source_x,
+                source_y,
+                kwargs_lens,
+                min_distance=0.02,
+                search_window=5,
+                quadtree=True,
+            )
+            npt.assert_almost_equal(x_pos_qt, x_pos, decimal=8)
+            npt.assert_almost_equal(y_pos_qt, y_pos, decimal=8)
+
+        x_mins, y_mins, delta_map, pixel_width = lensEquationSolver.candidate_solutions(
+            0.1, -0.1, kwargs_lens, min_distance=0.02, search_window=5
+        )
+        x_mins_qt, y_mins_qt, delta_map_qt, pixel_width_qt = (
+            lensEquationSolver.candidate_solutions(
+                0.1,
+                -0.1,
+                kwargs_lens,
+                min_distance=0.02,
+                search_window=5,
+                quadtree=True,
+            )
+        )
+        npt.assert_almost_equal(pixel_width_qt, pixel_width, decimal=10)
+        # the candidates of the uniform grid close to a solution are recovered
+        for x, y, delta in zip(x_mins, y_mins, delta_map):
+            if delta < 0.02:
+                assert np.min(np.hypot(x_mins_qt - x, y_mins_qt - y)) < 1e-8
+
+        # search window smaller than the starting grid
+        x_mins_qt, y_mins_qt, _, _ = lensEquationSolver.candidate_solutions(
+            0.1, -0.1, kwargs_lens, min_distance=0.2, search_window=2, quadtree=True
+        )
+        assert len(x_mins_qt) > 0
+
+    def test_max_singular_value(self):
+        from lenstronomy.LensModel.Solver.lens_equation_solver import (
+            _max_singular_value,
+        )
+
+        np.random.seed(41)
+        a = np.random.normal(size=(10, 2, 2))
+        sigma = _max_singular_value(a[:, 0, 0], a[:, 0, 1], a[:, 1, 0], a[:, 1, 1])
+        npt.assert_almost_equal(sigma, np.linalg.norm(a, ord=2, axis=(1, 2)))
+
+    def test_kwargs_close(self):
+        from lenstronomy.LensModel.Solver.lens_equation_solver import _kwargs_close
+
+        kwargs = [{"theta_E": 1.0, "grid": np.ones(3), "name": "a"}]
+        kwargs_new = [{"theta_E": 1.0005, "grid": np.ones(3), "name": "a"}]
+        assert _kwargs_close(kwargs, kwargs_new, tolerance=0.001)
+        assert not _kwargs_close(kwargs, kwargs_new, tolerance=0.0001)
+        assert not _kwargs_close(kwargs, kwargs_new + kwargs_new, tolerance=0.001)
+        assert not _kwargs_close(kwargs, [{"theta_E": 1.0}], tolerance=0.001)
+        assert not _kwargs_close(
+            kwargs, [{"theta_E": 1.0, "grid": np.ones(4), "name": "a"}], 0.001
+        )
+        assert not _kwargs_close(
+            kwargs, [{"theta_E": 1.0, "grid": np.ones(3), "name": "b"}], 0.001
+        )
+        assert not _kwargs_close(
+            kwargs, [{"theta_E": np.nan, "grid": np.ones(3), "name": "a"}], 0.001
+        )
+
     def test_nfw(self):
         lens_model_list = ["NFW_ELLIPSE_POTENTIAL", "SIS"]
         lensModel = LensModel(lens_model_list)
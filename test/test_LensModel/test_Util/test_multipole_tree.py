@@ -0,0 +1,90 @@
+from lenstronomy.LensModel.Util.multipole_tree import MultipoleTree
+from lenstronomy.LensModel.Profiles.point_mass import PointMass
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+
+class TestMultipoleTree(object):
+    def setup_method(self):
+        np.random.seed(41)
+        num = 500
+        self.center_x = np.random.uniform(-1, 1, num)
+        self.center_y = np.random.uniform(-1, 1, num)
+        self.theta_E = np.random.uniform(0.001, 0.01, num)
+        self.x = np.random.uniform(-1.5, 1.5, 300)
+        self.y = np.random.uniform(-1.5, 1.5, 300)
+        point_mass = PointMass()
+        self.f_, self.f_x, self.f_y = 0, 0, 0
+        self.f_xx, self.f_xy = 0, 0
+        for theta_E, center_x, center_y in zip(
+            self.theta_E, self.center_x, self.center_y
+        ):
+            self.f_ += point_mass.function(self.x, self.y, theta_E, center_x, center_y)
+            f_x, f_y = point_mass.derivatives(
+                self.x, self.y, theta_E, center_x, center_y
+            )
+            self.f_x, self.f_y = self.f_x + f_x, self.f_y + f_y
+            f_xx, f_xy, _, _ = point_mass.hessian(
+                self.x, self.y, theta_E, center_x, center_y
+            )
+            self.f_xx, self.f_xy = self.f_xx + f_xx, self.f_xy + f_xy
+
+    def test_exact(self):
+        tree = MultipoleTree(
+            self.center_x, self.center_y, self.theta_E**2, opening_angle=0, leaf_size=8
+        )
+        npt.assert_almost_equal(tree.potential(self.x, self.y), self.f_, decimal=12)
+        f_x, f_y = tree.alpha(self.x, self.y)
+        npt.assert_almost_equal(f_x, self.f_x, decimal=12)
+        npt.assert_almost_equal(f_y, self.f_y, decimal=12)
+        f_xx, f_xy, f_yx, f_yy = tree.hessian(self.x, self.y)
+        npt.assert_almost_equal(f_xx, self.f_xx, decimal=10)
+        npt.assert_almost_equal(f_xy, self.f_xy, decimal=10)
+        npt.assert_almost_equal(f_yy, -self.f_xx, decimal=10)
+
+    def test_multipole(self):
+        # the accuracy improves with the order of the multipole expansion
+        errors = []
+        for multipole_order in [2, 6, 12]:
+            tree = MultipoleTree(
+                self.center_x,
+                self.center_y,
+                self.theta_E**2,
+                opening_angle=0.5,
+                multipole_order=multipole_order,
+                leaf_size=4,
+                num_ray_batch=100,
+            )
+            f_x, f_y = tree.alpha(self.x, self.y)
+            error = np.max(np.hypot(f_x - self.f_x, f_y - self.f_y))
+            errors.append(error / np.max(np.hypot(self.f_x, self.f_y)))
+        assert errors[0] > errors[1] > errors[2]
+        assert errors[2] < 10 ** (-5)
+
+        f_ = tree.potential(self.x, self.y)
+        npt.assert_allclose(f_, self.f_, atol=1e-6 * np.max(np.abs(self.f_)))
+        f_xx, f_xy, _, _ = tree.hessian(self.x, self.y)
+        scale = np.max(np.abs(self.f_xx))
+        npt.assert_allclose(f_xx / scale, self.f_xx / scale, atol=1e-4)
+        npt.assert_allclose(f_xy / scale, self.f_xy / scale, atol=1e-4)
+
+    def test_scalar_and_shape(self):
+        tree = MultipoleTree(self.center_x, self.center_y, self.theta_E**2)
+        f_x, f_y = tree.alpha(self.x[0], self.y[0])
+        assert np.ndim(f_x) == 0
+        npt.assert_almost_equal(f_x, self.f_x[0], decimal=6)
+        x, y = self.x.reshape(20, 15), self.y.reshape(20, 15)
+        f_x, f_y = tree.alpha(x, y)
+        assert f_x.shape == (20, 15)
+
+    def test_identical_positions(self):
+        # more point masses than the leaf size at the same position
+        tree = MultipoleTree(np.zeros(40), np.zeros(40), 0.01, leaf_size=4)
+        f_x, f_y = tree.alpha(np.array([1.0, 0.0]), np.array([0.0, 2.0]))
+        npt.assert_almost_equal(f_x, [0.4, 0], decimal=10)
+        npt.assert_almost_equal(f_y, [0, 0.2], decimal=10)
+
+
+if __name__ == "__main__":
+    pytest.main()
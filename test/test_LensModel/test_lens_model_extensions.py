@@ -107,6 +107,70 @@ class TestLensModelExtensions(object):
         mag = lens_model.magnification(ra_crit, dec_crit, kwargs_lens)
         assert np.all(np.abs(mag) > 1000)
 
+        ra_crit, dec_crit = lensModel.critical_curve_tiling(
+            kwargs_lens, compute_window=5, start_scale=0.1, max_order=1
+        )
+        assert len(ra_crit) > 0
+        ra_crit, dec_crit = lensModel.critical_curve_tiling(
+            kwargs_lens,
+            compute_window=0.5,
+            start_scale=0.1,
+            max_order=10,
+            center_x=3,
+            center_y=3,
+        )
+        assert len(ra_crit) == 0
+
+    def test_critical_curves_refined(self):
+        lens_model_list = ["SIE", "SIS", "SHEAR"]
+        kwargs_lens = [
+            {"theta_E": 1, "e1": 0.1, "e2": -0.05, "center_x": 0, "center_y": 0},
+            {"theta_E": 0.05, "center_x": 1.1, "center_y": 0.3},
+            {"gamma1": 0.03, "gamma2": 0.01},
+        ]
+        lens_model = LensModel(lens_model_list)
+        lensModelExtensions = LensModelExtensions(lens_model)
+        kwargs_caustic_num = {"compute_window": 4, "grid_scale": 0.01}
+        (
+            ra_crit_list,
+            dec_crit_list,
+            ra_caustic_list,
+            dec_caustic_list,
+        ) = lensModelExtensions.critical_curve_caustics(
+            kwargs_lens, start_scale=0.1, **kwargs_caustic_num
+        )
+        (
+            ra_crit_list_full,
+            dec_crit_list_full,
+            _,
+            _,
+        ) = lensModelExtensions.critical_curve_caustics(
+            kwargs_lens, **kwargs_caustic_num
+        )
+        assert len(ra_crit_list) == len(ra_crit_list_full)
+        for k in range(len(ra_crit_list)):
+            ra_crit = ra_crit_list[k]
+            dec_crit = dec_crit_list[k]
+            mag = lens_model.magnification(ra_crit, dec_crit, kwargs_lens)
+            assert np.all(np.abs(mag) > 100)
+            # connected curves are closed
+            npt.assert_almost_equal(ra_crit[0], ra_crit[-1], decimal=8)
+            npt.assert_almost_equal(dec_crit[0], dec_crit[-1], decimal=8)
+            ra_caustic, dec_caustic = lens_model.ray_shooting(
+                ra_crit, dec_crit, kwargs_lens
+            )
+            npt.assert_almost_equal(ra_caustic_list[k], ra_caustic, decimal=8)
+            npt.assert_almost_equal(dec_caustic_list[k], dec_caustic, decimal=8)
+
+        area = lensModelExtensions.caustic_area(
+            kwargs_lens, kwargs_caustic_num, index_vertices=0
+        )
+        kwargs_caustic_num["start_scale"] = 0.1
+        area_refined = lensModelExtensions.caustic_area(
+            kwargs_lens, kwargs_caustic_num, index_vertices=0
+        )
+        npt.assert_almost_equal(area_refined / area, 1, decimal=3)
+
     def test_get_magnification_model(self):
         self.kwargs_options = {
             "lens_model_list": ["GAUSSIAN_POTENTIAL"],
@@ -275,6 +339,20 @@ class TestLensModelExtensions(object):
             axis_ratio=1,
         )
 
+        # the images are computed together; this matches the images computed one by one
+        for i in range(len(x_image)):
+            mag_single = extension.magnification_finite_adaptive(
+                x_image[i : i + 1],
+                y_image[i : i + 1],
+                kwargs_lens,
+                source_model,
+                kwargs_source,
+                grid_resolution,
+                grid_radius_arcsec=grid_size,
+                axis_ratio=0,
+            )
+            npt.assert_almost_equal(mag_single[0], mag_adaptive_grid_2[i], decimal=10)
+
         flux_ratios_adaptive_grid_2 = mag_adaptive_grid_2 / max(mag_adaptive_grid_2)
         flux_ratios_adaptive_grid_3 = mag_adaptive_grid_3 / max(mag_adaptive_grid_3)
 
@@ -48,6 +48,48 @@ class TestLensModel(object):
         npt.assert_almost_equal(f_yx, 0.001937, decimal=6)
         npt.assert_almost_equal(f_yy, -0.00581, decimal=6)
 
+    def test_fused_evaluation(self):
+        lens_model_list = ["POINT_MASS", "SIS", "NFW", "SHEAR", "POINT_MASS"]
+        lensModel = SinglePlane(lens_model_list)
+        kwargs = [
+            {"theta_E": 0.1, "center_x": 0.5, "center_y": 0},
+            {"theta_E": 1.0, "center_x": 0, "center_y": 0},
+            {"Rs": 0.5, "alpha_Rs": 0.1, "center_x": -0.3, "center_y": 0.2},
+            {"gamma1": 0.05, "gamma2": -0.02},
+            {"theta_E": 0.05, "center_x": -1, "center_y": 1},
+        ]
+        x, y = np.meshgrid(np.linspace(-2, 2, 10), np.linspace(-2, 2, 10))
+        for x_, y_ in [
+            (x.flatten(), y.flatten()),
+            (x, y),
+            (1.0, 0.5),
+            ([1, 2], [0, 1]),
+        ]:
+            f_x, f_y = lensModel.alpha(x_, y_, kwargs)
+            f_xx, f_xy, f_yx, f_yy = lensModel.hessian(x_, y_, kwargs)
+            f_x_sum, f_y_sum, f_xx_sum, f_yy_sum = 0, 0, 0, 0
+            for k in range(len(lens_model_list)):
+                f_x_k, f_y_k = lensModel.alpha(x_, y_, kwargs, k=k)
+                f_xx_k, _, _, f_yy_k = lensModel.hessian(x_, y_, kwargs, k=k)
+                f_x_sum, f_y_sum = f_x_sum + f_x_k, f_y_sum + f_y_k
+                f_xx_sum, f_yy_sum = f_xx_sum + f_xx_k, f_yy_sum + f_yy_k
+            assert np.shape(f_x) == np.shape(x_)
+            npt.assert_almost_equal(f_x, f_x_sum, decimal=10)
+            npt.assert_almost_equal(f_y, f_y_sum, decimal=10)
+            npt.assert_almost_equal(f_xx, f_xx_sum, decimal=10)
+            npt.assert_almost_equal(f_yy, f_yy_sum, decimal=10)
+
+        # output arrays are not over-written by later calls
+        x_, y_ = x.flatten(), y.flatten()
+        f_x, f_y = lensModel.alpha(x_, y_, kwargs)
+        f_x_copy = np.copy(f_x)
+        lensModel.alpha(x_ + 1, y_, kwargs)
+        npt.assert_equal(f_x, f_x_copy)
+        # input arrays are not modified
+        x_copy = np.copy(x_)
+        lensModel.hessian(x_, y_, kwargs)
+        npt.assert_equal(x_, x_copy)
+
     def test_ray_shooting(self):
         delta_x, delta_y = self.lensModel.ray_shooting(x=1.0, y=1.0, kwargs=self.kwargs)
         assert delta_x == 1 + 0.19470019576785122 / (8 * np.pi)
@@ -72,6 +72,30 @@ class TestPointSource(object):
         npt.assert_almost_equal(x_image_list[1], 1, decimal=8)
         npt.assert_almost_equal(x_image_list[2][0], self.x_pos[0], decimal=8)
 
+    def test_image_position_warm_start(self):
+        point_source = PointSource(
+            point_source_type_list=["SOURCE_POSITION"],
+            lens_model=LensModel(lens_model_list=["SPEP"]),
+            kwargs_lens_eqn_solver={"warm_start": True, "warm_start_tolerance": 0.01},
+        )
+        kwargs_ps = [{"ra_source": self.sourcePos_x, "dec_source": self.sourcePos_y}]
+        x_image_list, y_image_list = point_source.image_position(
+            kwargs_ps=kwargs_ps, kwargs_lens=self.kwargs_lens
+        )
+        npt.assert_almost_equal(np.sort(x_image_list[0]), np.sort(self.x_pos))
+
+        kwargs_ps = [{"ra_source": self.sourcePos_x + 0.001, "dec_source": 0}]
+        x_image_list, y_image_list = point_source.image_position(
+            kwargs_ps=kwargs_ps, kwargs_lens=self.kwargs_lens
+        )
+        solver = point_source._point_source_list[0]._model._solver
+        assert solver._warm_start_cache["source_x"] == self.sourcePos_x
+        x_source, y_source = solver.lensModel.ray_shooting(
+            x_image_list[0], y_image_list[0], self.kwargs_lens
+        )
+        npt.assert_almost_equal(x_source, self.sourcePos_x + 0.001, decimal=8)
+        npt.assert_almost_equal(y_source, 0, decimal=8)
+
     def test_source_position(self):
         x_source_list, y_source_list = self.PointSource.source_position(
             kwargs_ps=self.kwargs_ps, kwargs_lens=self.kwargs_lens
@@ -1,6 +1,19 @@
 import pytest
+import pickle
+import numpy as np
+import numpy.testing as npt
 from lenstronomy.Sampling.Pool.pool import choose_pool
-from lenstronomy.Sampling.Pool.multiprocessing import MultiPool
+from lenstronomy.Sampling.Pool.multiprocessing import MultiPool, SharedFunction
+
+
+class _ArraySum(object):
+    def __init__(self):
+        self.data = np.arange(10**5, dtype=float)
+        self.small = np.ones(3)
+
+    def __call__(self, x):
+        writeable = self.data.flags.writeable
+        return np.sum(self.data) * x + np.sum(self.small), writeable
 
 
 class TestPool(object):
@@ -18,11 +31,36 @@ class TestPool(object):
         assert pool.is_master() is True
         assert isinstance(pool, MultiPool)
 
+        pool = choose_pool(mpi=False, processes=1, shared_function=_ArraySum())
+        assert getattr(pool, "shared_function", None) is None
+
         # NOTE: MPI cannot be tested here (needs to be launched with mpirun)
         # pool = choose_pool(mpi=True, processes=1, use_dill=True)
         # assert pool.is_master() is True
         # assert isinstance(pool, schwimmbad.mpi.MPIPool)
 
+    def test_shared_function(self):
+        func = _ArraySum()
+        pool = choose_pool(mpi=False, processes=2, use_dill=True, shared_function=func)
+        shared_function = pool.shared_function
+        assert isinstance(shared_function, SharedFunction)
+        assert len(pickle.dumps(shared_function)) < 200
+
+        result = pool.map(shared_function, [0, 1, 2])
+        npt.assert_almost_equal(
+            [r[0] for r in result], [func(x)[0] for x in [0, 1, 2]], decimal=8
+        )
+        # the arrays in the workers are read-only views of the shared memory
+        assert not any([r[1] for r in result])
+        # in the master process, the function itself is called
+        assert shared_function(1) == func(1)
+        pool.close()
+        pool.join()
+
+        pool = MultiPool(processes=2)
+        assert pool.shared_function is None
+        pool.terminate()
+
 
 if __name__ == "__main__":
     pytest.main()
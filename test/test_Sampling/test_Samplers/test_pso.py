@@ -156,6 +156,87 @@ class TestParticleSwarmOptimizer(object):
         print(result)
         npt.assert_almost_equal(result[0], 0, decimal=6)
 
+    def test_vectorize(self):
+        np.random.seed(42)
+
+        def ln_probability(x):
+            return -np.sum(np.array(x) ** 2, axis=-1)
+
+        def ln_probability_batch(x_list):
+            assert np.ndim(x_list) == 2
+            return -np.sum(np.array(x_list) ** 2, axis=1)
+
+        pso = ParticleSwarmOptimizer(
+            func=ln_probability_batch,
+            low=[-10, -10],
+            high=[10, 10],
+            particle_count=50,
+            vectorize=True,
+        )
+        pso.set_global_best([1, 1], [0, 0], ln_probability([1, 1]))
+        result, [chi2_list, pos_list, vel_list] = pso.optimize(50, verbose=False)
+        npt.assert_almost_equal(result, [0, 0], decimal=3)
+
+        class _ChunkPool(object):
+            size = 3
+
+            @staticmethod
+            def map(func, iterable):
+                return map(func, iterable)
+
+            @staticmethod
+            def is_master():
+                return True
+
+        pso = ParticleSwarmOptimizer(
+            func=ln_probability_batch,
+            low=[-10, -10],
+            high=[10, 10],
+            particle_count=10,
+            pool=_ChunkPool(),
+            vectorize=True,
+        )
+        pso._get_fitness(pso.swarm)
+        for particle in pso.swarm:
+            npt.assert_almost_equal(
+                particle.fitness, ln_probability(particle.position), decimal=8
+            )
+
+    def test_checkpoint(self, tmp_path):
+        checkpoint_filename = str(tmp_path / "pso.pkl")
+
+        def ln_probability(x):
+            return -np.sum(np.array(x) ** 2)
+
+        def run(max_iter, checkpoint_filename=None):
+            pso = ParticleSwarmOptimizer(
+                func=ln_probability, low=[-10, -10], high=[10, 10], particle_count=20
+            )
+            pso.set_global_best([1, 1], [0, 0], ln_probability([1, 1]))
+            return pso.optimize(
+                max_iter, verbose=False, checkpoint_filename=checkpoint_filename
+            )
+
+        np.random.seed(42)
+        result, chain = run(6)
+
+        # the optimization is interrupted after 2 iterations and resumed from the
+        # saved swarm
+        np.random.seed(42)
+        run(2, checkpoint_filename=checkpoint_filename)
+        np.random.seed(1)
+        result_resume, chain_resume = run(6, checkpoint_filename=checkpoint_filename)
+        npt.assert_almost_equal(result_resume, result, decimal=10)
+        assert len(chain_resume[0]) == 6
+        npt.assert_almost_equal(chain_resume[1], chain[1], decimal=10)
+
+        # the saved swarm needs to match the optimizer
+        pso = ParticleSwarmOptimizer(
+            func=ln_probability, low=[-10], high=[10], particle_count=20
+        )
+        with pytest.raises(ValueError):
+            pso.optimize(6, verbose=False, checkpoint_filename=checkpoint_filename)
+
 
 if __name__ == "__main__":
     pytest.main()
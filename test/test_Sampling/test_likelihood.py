@@ -195,6 +195,74 @@ class TestLikelihoodModule(object):
         num_data_evaluate = self.Likelihood.num_data
         npt.assert_almost_equal(logL / num_data_evaluate, -1 / 2.0, decimal=1)
 
+    def test_logL_batch(self):
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        args_out = np.array(args) + 10**5
+        logL_list = self.Likelihood.logL_batch([args, args, args_out])
+        logL = self.Likelihood.logL(args)
+        assert len(logL_list) == 3
+        npt.assert_almost_equal(logL_list[0], logL, decimal=5)
+        npt.assert_almost_equal(logL_list[1], logL, decimal=5)
+        assert logL_list[2] == -(10**18)
+
+    def test_profiling(self):
+        assert self.Likelihood.profiler is None
+        kwargs_likelihood = {"time_delay_likelihood": True, "profiling": True}
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            **kwargs_likelihood,
+        )
+        args = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+            kwargs_ps=self.kwargs_ps,
+            kwargs_special=self.kwargs_cosmo,
+        )
+        logL = likelihood.logL(args)
+        likelihood.logL_batch([args, args])
+        profiler = likelihood.profiler
+        assert profiler.active is False
+        assert profiler.num_calls == 2
+        stats = profiler.stats
+        assert stats["LikelihoodModule.logL"]["calls"] == 1
+        assert stats["LikelihoodModule.logL_batch"]["calls"] == 1
+        assert stats["LikelihoodModule.log_likelihood"]["calls"] == 3
+        assert stats["ImageLikelihood.logL"]["calls"] == 3
+        assert stats["TimeDelayLikelihood.logL"]["calls"] == 3
+        assert stats["PriorLikelihood.logL"]["calls"] == 3
+        assert "Image2SourceMapping.image2source" in stats
+        assert "Numerics.re_size_convolve_stack" in stats
+        npt.assert_almost_equal(
+            profiler.total_time,
+            stats["LikelihoodModule.logL"]["time"]
+            + stats["LikelihoodModule.logL_batch"]["time"],
+            decimal=10,
+        )
+        assert "ImageLikelihood.logL" in profiler.report()
+        # the profiling does not change the likelihood
+        likelihood_ref = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            time_delay_likelihood=True,
+        )
+        npt.assert_almost_equal(logL, likelihood_ref.logL(args), decimal=8)
+
+    def test_check_bounds_batch(self):
+        bound_hit = self.Likelihood.check_bounds_batch(
+            args_list=[[0, 1], [1, 1], [1, 3]], lowerLimit=[1, 0], upperLimit=[2, 2]
+        )
+        npt.assert_array_equal(bound_hit, [True, False, True])
+
     def test_time_delay_likelihood(self):
         kwargs_likelihood = {
             "time_delay_likelihood": True,
@@ -0,0 +1,92 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.LensModel.lens_param import LensParam
+from lenstronomy.Sampling.param_layout import ParamLayout
+from lenstronomy.Sampling.special_param import SpecialParam
+
+
+class TestParamLayout(object):
+    def setup_method(self):
+        self.lens_param = LensParam(
+            ["SIS", "SHAPELETS_CART"],
+            kwargs_fixed=[{"center_x": 0}, {"beta": 1, "center_x": 0, "center_y": 0}],
+            kwargs_logsampling=[["theta_E"], []],
+            num_shapelet_lens=3,
+        )
+        self.special_param = SpecialParam(Ddt_sampling=True, num_tau0=2)
+        num_lens, _ = self.lens_param.num_param()
+        num_special, _ = self.special_param.num_param()
+        self.num_lens = num_lens
+        self.layout = ParamLayout(num_lens + num_special)
+        self.layout.add_group(
+            self.lens_param.get_params,
+            self.lens_param.kwargs_fixed,
+            isolate=True,
+            log_names=self.lens_param.kwargs_logsampling,
+        )
+        self.layout.add_group(
+            self.special_param.get_params,
+            self.special_param.kwargs_fixed,
+            single=True,
+            kwargs_lower=self.special_param.lower_limit,
+            kwargs_upper=self.special_param.upper_limit,
+        )
+
+    def test_read(self):
+        assert self.layout.num_compiled == 2
+        args = np.array([0.5, 0.1, 0.2, 0.3, 0.4, -10, 5, 2000])
+        (kwargs_lens, kwargs_special), i = self.layout.read(args)
+        assert i == len(args)
+        kwargs_lens_ref, i_lens = self.lens_param.get_params(args, 0)
+        kwargs_special_ref, _ = self.special_param.get_params(
+            args.copy(), i_lens, impose_bound=True
+        )
+        for kwargs, kwargs_ref in zip(kwargs_lens, kwargs_lens_ref):
+            assert list(kwargs) == list(kwargs_ref)
+            for name in kwargs_ref:
+                npt.assert_equal(kwargs[name], kwargs_ref[name])
+        assert kwargs_lens[0]["theta_E"] == 10**0.5
+        npt.assert_equal(kwargs_lens[1]["coeffs"], [0.2, 0.3, 0.4])
+        assert kwargs_special["D_dt"] == 0
+        npt.assert_equal(kwargs_special["tau0_list"], [5, 1000])
+        assert kwargs_special.keys() == kwargs_special_ref.keys()
+        # the arguments are not changed and the sampled arrays are copied
+        assert args[5] == -10
+        kwargs_lens[1]["coeffs"][0] = 1
+        assert args[2] == 0.2
+
+    def test_read_batch(self):
+        args_list = np.random.uniform(0, 1, (4, 8))
+        kwargs_batch = self.layout.read_batch(args_list)
+        assert len(kwargs_batch) == 4
+        for args, kwargs_list in zip(args_list, kwargs_batch):
+            kwargs_list_single, _ = self.layout.read(args)
+            for kwargs, kwargs_single in zip(kwargs_list[0], kwargs_list_single[0]):
+                for name in kwargs_single:
+                    npt.assert_equal(kwargs[name], kwargs_single[name])
+            for name in kwargs_list_single[1]:
+                npt.assert_equal(kwargs_list[1][name], kwargs_list_single[1][name])
+
+    def test_not_compiled(self):
+        # coefficients constrained by the solver are read out by the class itself
+        lens_param = LensParam(
+            ["SHAPELETS_CART"],
+            kwargs_fixed=[{"beta": 1, "center_x": 0, "center_y": 0}],
+            num_shapelet_lens=10,
+            solver_type="SHAPELETS",
+            num_images=4,
+        )
+        layout = ParamLayout(4)
+        layout.add_group(lens_param.get_params, lens_param.kwargs_fixed)
+        assert layout.num_compiled == 0
+        args = np.array([1.0, 2, 3, 4])
+        (kwargs_lens,), i = layout.read(args)
+        assert i == 4
+        kwargs_lens_ref, _ = lens_param.get_params(args, 0)
+        npt.assert_equal(kwargs_lens[0]["coeffs"], kwargs_lens_ref[0]["coeffs"])
+
+
+if __name__ == "__main__":
+    pytest.main()
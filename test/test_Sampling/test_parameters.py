@@ -137,6 +137,59 @@ class TestParam(object):
         assert lens_dict["center_y"] == 0.0
         assert lens_light_dict_list[0]["center_x"] == -0.06
 
+    def test_args2kwargs_batch(self):
+        kwargs_model = {
+            "lens_model_list": ["EPL", "SHEAR", "MULTI_GAUSSIAN"],
+            "source_light_model_list": ["SERSIC_ELLIPSE", "SHAPELETS"],
+            "lens_light_model_list": ["SERSIC"],
+            "point_source_model_list": ["LENSED_POSITION"],
+        }
+        sigma = np.array([1.0, 2.0])
+        param = Param(
+            kwargs_model,
+            kwargs_fixed_lens=[
+                {},
+                {"ra_0": 0, "dec_0": 0},
+                {"sigma": sigma, "amp": np.array([1.0, 0.5])},
+            ],
+            kwargs_fixed_source=[{}, {"n_max": 2}],
+            num_point_source_list=[4],
+            joint_source_with_point_source=[[0, 0]],
+            joint_lens_with_light=[[0, 0, ["center_x", "center_y"]]],
+            log_sampling_lens=[[0, ["theta_E"]]],
+            Ddt_sampling=True,
+            point_source_offset=True,
+            linear_solver=False,
+        )
+        num, names = param.num_param()
+        np.random.seed(42)
+        args_list = np.random.uniform(-0.5, 0.5, (3, num))
+        # out of the bounds of the special parameters
+        args_list[:, names.index("D_dt")] = [-1, 1000, 10**6]
+        kwargs_batch = param.args2kwargs_batch(args_list)
+        assert len(kwargs_batch) == 3
+        for args, kwargs_return in zip(args_list, kwargs_batch):
+            kwargs_single = param.args2kwargs(args)
+            # read-out with the get_params() methods of the parameter classes
+            kwargs_ref = param._update_constraints(*param._get_params(args))
+            for key in kwargs_ref:
+                for kwargs in [kwargs_return, kwargs_single]:
+                    if key == "kwargs_special":
+                        assert kwargs[key].keys() == kwargs_ref[key].keys()
+                        for name in kwargs_ref[key]:
+                            npt.assert_equal(kwargs[key][name], kwargs_ref[key][name])
+                        continue
+                    for k, kwargs_ref_k in enumerate(kwargs_ref[key]):
+                        assert list(kwargs[key][k]) == list(kwargs_ref_k)
+                        for name in kwargs_ref_k:
+                            npt.assert_equal(kwargs[key][k][name], kwargs_ref_k[name])
+        assert kwargs_batch[0]["kwargs_special"]["D_dt"] == 0
+        assert kwargs_batch[2]["kwargs_special"]["D_dt"] == 100000
+        assert kwargs_batch[0]["kwargs_lens"][0]["theta_E"] == 10 ** args_list[0, 0]
+        # the returned lens arguments do not share memory with the fixed arguments
+        kwargs_batch[0]["kwargs_lens"][2]["sigma"][0] = 10
+        assert sigma[0] == 1
+
     def test_get_cosmo(self):
         kwargs_model = {
             "lens_model_list": ["SPEP"],
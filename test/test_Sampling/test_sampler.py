@@ -131,6 +131,9 @@ class TestSampler(object):
             **kwargs_likelihood
         )
         self.sampler = Sampler(likelihoodModule=self.Likelihood)
+        self.kwargs_data_joint = kwargs_data_joint
+        self.kwargs_model = kwargs_model
+        self.kwargs_likelihood = kwargs_likelihood
 
     def test_pso(self):
         n_particles = 2
@@ -148,6 +151,122 @@ class TestSampler(object):
 
         assert len(result) == 16
 
+    def test_pso_vectorize(self):
+        n_particles = 2
+        n_iterations = 2
+        result, chain = self.sampler.pso(
+            n_particles,
+            n_iterations,
+            lower_start=None,
+            upper_start=None,
+            threadCount=1,
+            init_pos=None,
+            mpi=False,
+            print_key="PSO",
+            vectorize=True,
+        )
+        assert len(result) == 16
+
+    def test_pso_shared_memory(self):
+        n_particles = 4
+        n_iterations = 2
+        np.random.seed(42)
+        result, chain = self.sampler.pso(
+            n_particles,
+            n_iterations,
+            threadCount=2,
+            shared_memory=True,
+        )
+        np.random.seed(42)
+        result_serial, chain_serial = self.sampler.pso(
+            n_particles, n_iterations, threadCount=1
+        )
+        np.testing.assert_almost_equal(result, result_serial, decimal=10)
+        np.testing.assert_almost_equal(chain[0], chain_serial[0], decimal=8)
+
+    def test_pso_profiling(self, capsys):
+        likelihood = LikelihoodModule(
+            kwargs_data_joint=self.kwargs_data_joint,
+            kwargs_model=self.kwargs_model,
+            param_class=self.param_class,
+            profiling=True,
+            **self.kwargs_likelihood
+        )
+        sampler = Sampler(likelihoodModule=likelihood)
+        n_particles = 4
+        n_iterations = 2
+        sampler.pso(n_particles, n_iterations)
+        # the initial position and all particles of each iteration (plus the initial
+        # swarm) are evaluated
+        assert likelihood.profiler.num_calls == 1 + n_particles * (n_iterations + 1)
+        assert "ImageLinearFit.image_linear_solve" in capsys.readouterr().out
+
+    def test_mcmc_emcee_vectorize(self):
+        n_walkers = 36
+        n_run = 2
+        n_burn = 2
+        mean_start = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        sigma_start = np.ones_like(mean_start) * 0.1
+        samples, dist = self.sampler.mcmc_emcee(
+            n_walkers, n_run, n_burn, mean_start, sigma_start, vectorize=True
+        )
+        assert len(samples) == n_walkers * n_run
+        assert len(dist) == len(samples)
+
+    def test_mcmc_emcee_vectorize_pool(self):
+        n_walkers = 36
+        n_run = 2
+        n_burn = 0
+        mean_start = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        sigma_start = np.ones_like(mean_start) * 0.1
+        np.random.seed(42)
+        samples, dist = self.sampler.mcmc_emcee(
+            n_walkers,
+            n_run,
+            n_burn,
+            mean_start,
+            sigma_start,
+            threadCount=2,
+            vectorize=True,
+        )
+        np.random.seed(42)
+        samples_serial, dist_serial = self.sampler.mcmc_emcee(
+            n_walkers, n_run, n_burn, mean_start, sigma_start, vectorize=True
+        )
+        np.testing.assert_almost_equal(samples, samples_serial, decimal=10)
+        np.testing.assert_almost_equal(dist, dist_serial, decimal=8)
+
+    def test_batch_over_pool(self):
+        class CountingPool(object):
+            size = 3
+
+            def __init__(self):
+                self.chunk_sizes = []
+
+            def map(self, func, iterable):
+                iterable = list(iterable)
+                self.chunk_sizes += [len(chunk) for chunk in iterable]
+                return map(func, iterable)
+
+        def func(x):
+            return np.sum(x, axis=1)
+
+        pool = CountingPool()
+        batch_func = Sampler._batch_over_pool(func, pool)
+        x = np.arange(20.0).reshape(10, 2)
+        np.testing.assert_almost_equal(batch_func(x), func(x), decimal=10)
+        assert pool.chunk_sizes == [4, 3, 3]
+        # serial pools have no size and the function is used as it is
+        assert Sampler._batch_over_pool(func, choose_pool()) is func
+
     def test_mcmc_emcee(self):
         n_walkers = 36
         n_run = 2
@@ -193,6 +312,30 @@ class TestSampler(object):
 
         os.remove(backup_filename)  # just remove the backup file created above
 
+    def test_mcmc_emcee_shared_memory(self):
+        n_walkers = 36
+        n_run = 2
+        n_burn = 2
+        mean_start = self.param_class.kwargs2args(
+            kwargs_lens=self.kwargs_lens,
+            kwargs_source=self.kwargs_source,
+            kwargs_lens_light=self.kwargs_lens_light,
+        )
+        sigma_start = np.ones_like(mean_start) * 0.1
+        samples, dist = self.sampler.mcmc_emcee(
+            n_walkers,
+            n_run,
+            n_burn,
+            mean_start,
+            sigma_start,
+            threadCount=2,
+            shared_memory=True,
+        )
+        assert len(samples) == n_walkers * n_run
+        assert len(dist) == len(samples)
+        logL = [self.Likelihood.logL(sample) for sample in samples[:3]]
+        np.testing.assert_almost_equal(dist[:3], logL, decimal=8)
+
     def test_mcmc_zeus(self):
         n_walkers = 36
         n_run = 2
@@ -6,6 +6,7 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 import lenstronomy.Util.image_util as image_util
+from scipy import ndimage
 
 
 def test_add_layer2image_odd_odd():
@@ -80,6 +81,43 @@ def test_add_layer2image_int():
     npt.assert_array_equal(added, added_ref)
 
 
+def test_shift_kernel_linear():
+    np.random.seed(42)
+    kernel = np.random.random((7, 9))
+    shift_x = np.array([0, 0.3, -0.2, 0.5, -0.5])
+    shift_y = np.array([0.1, 0, -0.4, -0.5, 0.5])
+    kernels = image_util.shift_kernel_linear(kernel, shift_x, shift_y)
+    assert kernels.shape == (5, 7, 9)
+    for i in range(5):
+        kernel_shifted = ndimage.shift(kernel, shift=[shift_y[i], shift_x[i]], order=1)
+        npt.assert_almost_equal(kernels[i], kernel_shifted, decimal=12)
+
+
+def test_add_layers2image():
+    np.random.seed(42)
+    grid2d = np.random.random((30, 40))
+    kernel = np.random.random((7, 9))
+    # including positions partially and fully outside the image
+    x_pos = np.append(np.random.uniform(-5, 45, 50), [100, -20])
+    y_pos = np.append(np.random.uniform(-5, 35, 50), [10, 10])
+    amp = np.random.random(52)
+    added_ref = grid2d
+    for i in range(52):
+        added_ref = image_util.add_layer2image(
+            added_ref, x_pos[i], y_pos[i], amp[i] * kernel
+        )
+    added = image_util.add_layers2image(grid2d, x_pos, y_pos, kernel, amp=amp)
+    npt.assert_almost_equal(added, added_ref, decimal=12)
+
+    rows, cols, values, layer = image_util.layers2pixels(
+        (30, 40), x_pos, y_pos, kernel, amp=amp
+    )
+    assert np.all(layer < 50)
+    npt.assert_almost_equal(np.sum(values), np.sum(added - grid2d), decimal=8)
+    with pytest.raises(ValueError):
+        image_util.add_layers2image(grid2d, x_pos, y_pos, np.ones((4, 4)))
+
+
 def test_add_background():
     image = np.ones((10, 10))
     sigma_bkgd = 1.0
@@ -370,6 +408,11 @@ def test_re_size():
     grid_same = image_util.re_size(grid, factor=1)
     npt.assert_equal(grid_same, grid)
 
+    grid_stack = np.array([grid, 2 * grid])
+    grid_stack_small = image_util.re_size(grid_stack, factor=2)
+    npt.assert_equal(grid_stack_small[0], grid_small)
+    npt.assert_equal(grid_stack_small[1], 2 * grid_small)
+
 
 def test_stack_images():
     numPix = 10
@@ -0,0 +1,85 @@
+import threading
+
+import numpy.testing as npt
+import pytest
+
+from lenstronomy.Util.profiling import Profiler, timed
+
+
+class _Model(object):
+    @timed
+    def inner(self, x):
+        return x + 1
+
+    @timed
+    def outer(self, x):
+        return self.inner(x) + self.inner(x)
+
+
+@timed
+def _function(x):
+    return 2 * x
+
+
+class TestProfiler(object):
+    def setup_method(self):
+        self.model = _Model()
+
+    def test_inactive(self):
+        profiler = Profiler()
+        assert self.model.outer(1) == 4
+        assert profiler.num_calls == 0
+        assert profiler.stats == {}
+
+    def test_profiler(self):
+        profiler = Profiler()
+        with profiler:
+            assert profiler.active is True
+            assert self.model.outer(1) == 4
+            self.model.outer(1)
+            assert _function(2) == 4
+        assert profiler.active is False
+        self.model.outer(1)
+
+        stats = profiler.stats
+        assert stats["_Model.outer"]["calls"] == 2
+        assert stats["_Model.inner"]["calls"] == 4
+        assert stats["test_profiling._function"]["calls"] == 1
+        assert profiler.num_calls == 3
+        # the total time is the one of the outermost calls
+        npt.assert_almost_equal(
+            profiler.total_time,
+            stats["_Model.outer"]["time"] + stats["test_profiling._function"]["time"],
+            decimal=10,
+        )
+        assert stats["_Model.inner"]["time"] <= stats["_Model.outer"]["time"]
+
+        report = profiler.report()
+        assert "_Model.inner" in report
+        assert report.index("_Model.outer") < report.index("_Model.inner")
+
+        profiler.reset()
+        assert profiler.num_calls == 0
+        assert profiler.total_time == 0
+        assert profiler.stats == {}
+
+    def test_threads(self):
+        profiler = Profiler()
+        with profiler:
+            thread = threading.Thread(target=self.model.outer, args=(1,))
+            thread.start()
+            thread.join()
+            self.model.inner(1)
+        stats = profiler.stats
+        assert stats["_Model.outer"]["calls"] == 1
+        assert stats["_Model.inner"]["calls"] == 3
+        # calls of other threads are not counted in the total
+        assert profiler.num_calls == 1
+
+    def test_raise(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError):
+            with profiler:
+                with profiler:
+                    pass
+        assert profiler.active is False
@@ -550,6 +550,44 @@ def test_area():
     npt.assert_almost_equal(a, np.pi * r**2, decimal=3)
 
 
+def test_frozen_kwargs():
+    kwargs = [{"amp": 1, "x": np.ones(3)}, {"amp": 2, "y": [0, 1]}]
+    kwargs_frozen = util.frozen_kwargs(kwargs)
+    assert util.kwargs_equal(kwargs_frozen, kwargs)
+    kwargs[0]["x"][1] = 2
+    assert not util.kwargs_equal(kwargs_frozen, kwargs)
+    assert util.kwargs_equal(
+        util.frozen_kwargs(kwargs[1], ignore=["amp"]), {"y": [0, 1]}
+    )
+    assert util.kwargs_equal((True, kwargs_frozen), (True, kwargs_frozen))
+    assert not util.kwargs_equal({"x": 1}, {"y": 1})
+    assert not util.kwargs_equal({"x": 1}, [1])
+    assert not util.kwargs_equal([1, 2], [1])
+    assert not util.kwargs_equal([1], 1)
+
+
+def test_kwargs_key():
+    image = np.ones((3, 3))
+    kwargs = [{"amp": 1, "image": image, "scale": 0.1}, {"amp": 2, "y": [0, 1]}]
+    key = util.kwargs_key(kwargs)
+    assert key == util.kwargs_key(kwargs)
+    # the array is referenced and not copied
+    assert key[0]["image"]._array is image
+    # an equal array in a different object gives an equal key
+    kwargs_copy = [{"amp": 1, "image": image.copy(), "scale": 0.1}, kwargs[1]]
+    assert key == util.kwargs_key(kwargs_copy)
+    # in-place changes of the array are detected
+    image[1, 1] = 2
+    assert key != util.kwargs_key(kwargs)
+    assert util.kwargs_key(kwargs) != util.kwargs_key(kwargs_copy)
+    assert util.kwargs_key(kwargs[1], ignore=["amp"]) == {"y": (0, 1)}
+    assert util.kwargs_key(np.ones(3)) != util.kwargs_key(np.ones(4))
+    assert util.kwargs_key(np.ones(3)) != util.kwargs_key(np.ones(3, dtype=int))
+    assert util.kwargs_key(np.ones(3)) != 1
+    kwargs_object = {"x": np.array([None, 1], dtype=object)}
+    assert util.kwargs_key(kwargs_object) == util.kwargs_key(kwargs_object)
+
+
 class TestRaise(unittest.TestCase):
     def test_raise(self):
         with self.assertRaises(ValueError):
@@ -1,6 +1,8 @@
 __author__ = "sibirrer"
 
 import copy
+import os
+import pickle
 
 import pytest
 import numpy.testing as npt
@@ -383,6 +385,126 @@ class TestFittingSequence(object):
         assert "psf_before" in psf_iteration_list[0]
         assert "psf_after" in psf_iteration_list[0]
 
+    def test_fit_sequence_checkpoint(self, tmp_path):
+        checkpoint_filename = os.path.join(tmp_path, "checkpoint.pkl")
+        fitting_list = [
+            ["PSO", {"sigma_scale": 1, "n_particles": 2, "n_iterations": 2}],
+            [
+                "psf_iteration",
+                {
+                    "num_iter": 2,
+                    "psf_iter_factor": 0.5,
+                    "stacking_method": "mean",
+                    "new_procedure": False,
+                },
+            ],
+            ["emcee", {"n_burn": 1, "n_run": 2, "walkerRatio": 2, "progress": False}],
+        ]
+        kwargs_params = copy.deepcopy(self.kwargs_params)
+        kwargs_params["point_source_model"] = [
+            self.kwargs_ps,
+            [{"source_amp": 1}],
+            [{"ra_source": 0, "dec_source": 0}],
+            [{"source_amp": 0}],
+            [{"source_amp": 1000}],
+        ]
+        fittingSequence = FittingSequence(
+            self.kwargs_data_joint,
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            kwargs_params,
+        )
+        chain_list = fittingSequence.fit_sequence(
+            fitting_list, checkpoint_filename=checkpoint_filename
+        )
+        backend_filename = checkpoint_filename + "_2.h5"
+        assert os.path.exists(checkpoint_filename)
+        assert os.path.exists(backend_filename)
+        assert os.path.exists(checkpoint_filename + "_0.pkl")
+        assert os.path.exists(checkpoint_filename + "_chain_1.pkl")
+
+        # resuming from the checkpoint skips all completed steps
+        fittingSequence_resume = FittingSequence(
+            copy.deepcopy(self.kwargs_data_joint),
+            self.kwargs_model,
+            self.kwargs_constraints,
+            self.kwargs_likelihood,
+            kwargs_params,
+        )
+        chain_list_resume = fittingSequence_resume.fit_sequence(
+            fitting_list, checkpoint_filename=checkpoint_filename
+        )
+        assert len(chain_list_resume) == len(chain_list)
+        npt.assert_almost_equal(chain_list_resume[1][1], chain_list[1][1], decimal=10)
+        assert len(fittingSequence_resume.psf_iteration_memory) == 1
+        npt.assert_almost_equal(
+            fittingSequence_resume.multi_band_list[0][1]["kernel_point_source"],
+            fittingSequence.multi_band_list[0][1]["kernel_point_source"],
+            decimal=10,
+        )
+        kwargs_result = fittingSequence.best_fit()
+        kwargs_result_resume = fittingSequence_resume.best_fit()
+        npt.assert_almost_equal(
+            kwargs_result_resume["kwargs_lens"][0]["theta_E"],
+            kwargs_result["kwargs_lens"][0]["theta_E"],
+            decimal=10,
+        )
+
+        # an interrupted emcee step (2 of 4 iterations done) continues from its
+        # samples streamed to the HDF5 backend
+        with open(checkpoint_filename, "rb") as f:
+            checkpoint = pickle.load(f)
+        checkpoint["fitting_types"] = checkpoint["fitting_types"][:2]
+        checkpoint["num_chains"] = 1
+        with open(checkpoint_filename, "wb") as f:
+            pickle.dump(checkpoint, f)
+        fitting_list[2][1]["n_run"] = 3
+        chain_list_resume = fittingSequence_resume.fit_sequence(
+            fitting_list, checkpoint_filename=checkpoint_filename
+        )
+        num_param = fittingSequence_resume.param_class.num_param()[0]
+        samples = chain_list_resume[-1][1]
+        assert len(samples) == 3 * 2 * num_param
+        npt.assert_almost_equal(samples[: 2 * 2 * num_param], chain_list[1][1])
+
+        # the checkpoint needs to match the fitting list
+        fitting_list_other = [["SIMPLEX", {"n_iterations": 2}]]
+        with pytest.raises(ValueError):
+            fittingSequence_resume.fit_sequence(
+                fitting_list_other, checkpoint_filename=checkpoint_filename
+            )
+
+        # an interrupted PSO step (2 of 4 iterations done) continues from its saved
+        # swarm
+        os.remove(checkpoint_filename)
+        fitting_list_pso = [copy.deepcopy(fitting_list[0])]
+        fitting_list_pso[0][1]["n_iterations"] = 4
+        chain_list_pso = fittingSequence_resume.fit_sequence(
+            fitting_list_pso, checkpoint_filename=checkpoint_filename
+        )
+        log_likelihood_list = chain_list_pso[0][1][0]
+        assert len(log_likelihood_list) == 4
+        npt.assert_almost_equal(log_likelihood_list[:2], chain_list[0][1][0])
+
+        # a given backend_filename with iterations is reset with
+        # start_from_backend=False instead of being resumed
+        import emcee
+
+        os.remove(checkpoint_filename)
+        fitting_list_emcee = [copy.deepcopy(fitting_list[2])]
+        fitting_list_emcee[0][1]["n_run"] = 2
+        fitting_list_emcee[0][1]["backend_filename"] = backend_filename
+        fitting_list_emcee[0][1]["start_from_backend"] = False
+        chain_list_emcee = fittingSequence_resume.fit_sequence(
+            fitting_list_emcee, checkpoint_filename=checkpoint_filename
+        )
+        assert len(chain_list_emcee[0][1]) == 2 * 2 * num_param
+        backend = emcee.backends.HDFBackend(
+            backend_filename, name="lenstronomy_mcmc_emcee", read_only=True
+        )
+        assert backend.iteration == 1 + 2
+
     def test_cobaya(self):
         np.random.seed(42)
 